@@ -0,0 +1,181 @@
+#!/usr/bin/python3
+# Run this script from the command-line to measure the overhead that ebay_rest adds to each call.
+
+# The calls go to a stub eBay server on localhost, so the results reflect the client side only,
+# and no eBay credentials are needed.
+
+# Standard library imports
+from contextlib import contextmanager
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+from typing import Callable, Iterator, List
+
+# Third party imports
+
+# Local imports
+from ebay_rest import DateTime
+from ebay_rest.api import commerce_taxonomy
+from ebay_rest.rates import Rates
+from ebay_rest.transport import Transport
+
+# Globals
+CALLS = 500
+RATE_CALLS = 20000  # per thread count
+RESOURCES = 32
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Answer every GET like commerce_taxonomy get_default_category_tree_id does."""
+
+    protocol_version = "HTTP/1.1"  # keep connections alive, as eBay does
+    disable_nagle_algorithm = (
+        True  # otherwise delayed ACKs cap the rate at about 25 calls a second
+    )
+
+    def do_GET(self) -> None:  # noqa: N802
+        body = json.dumps({"categoryTreeId": "0", "categoryTreeVersion": "130"})
+        body = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@contextmanager
+def stub_server() -> Iterator[str]:
+    """Run the stub server in a background thread and yield its base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def make_client(host: str) -> commerce_taxonomy.ApiClient:
+    """Make an ApiClient the way APIPrivate does."""
+    configuration = commerce_taxonomy.Configuration()
+    configuration.host = host
+    configuration.pool_manager = Transport().pool_manager
+    return commerce_taxonomy.ApiClient(configuration)
+
+
+def calls_per_second(call: Callable[[], None], calls: int = CALLS) -> float:
+    """Time a number of calls and return the rate."""
+    call()  # warm up the connection pool
+    start = time.perf_counter()
+    for _ in range(calls):
+        call()
+    return calls / (time.perf_counter() - start)
+
+
+def bench_thread_pool(host: str) -> None:
+    """Compare making an ApiClient per call, with and without the lazy ThreadPool, to sharing one."""
+
+    def eager_pool() -> None:
+        # what every call used to do; touching the pool starts its threads, and __del__ joins them
+        client = make_client(host)
+        _ = client.pool
+        commerce_taxonomy.CategoryTreeApi(client).get_default_category_tree_id(
+            "EBAY_US"
+        )
+
+    def lazy_pool() -> None:
+        client = make_client(host)
+        commerce_taxonomy.CategoryTreeApi(client).get_default_category_tree_id(
+            "EBAY_US"
+        )
+
+    shared_client = make_client(host)
+
+    def shared() -> None:
+        commerce_taxonomy.CategoryTreeApi(shared_client).get_default_category_tree_id(
+            "EBAY_US"
+        )
+
+    print("ApiClient creation, calls per second:")
+    print(
+        f"  new client, eager ThreadPool (before): {calls_per_second(eager_pool):8.0f}"
+    )
+    print(
+        f"  new client, lazy ThreadPool (after):   {calls_per_second(lazy_pool):8.0f}"
+    )
+    print(f"  shared client:                         {calls_per_second(shared):8.0f}")
+
+
+def make_rate_limits() -> List[dict]:
+    """Make a getRateLimits response with RESOURCES resources, whose limits are too high to throttle."""
+    reset = DateTime.to_string(DateTime.now() + timedelta(hours=12))
+    resources = [
+        {
+            "name": f"resource_{i}",
+            "rates": [
+                {
+                    "count": 0,
+                    "limit": 10**9,
+                    "remaining": 10**9,
+                    "reset": reset,
+                    "time_window": 86400,
+                }
+            ],
+        }
+        for i in range(RESOURCES)
+    ]
+    return [
+        {
+            "api_context": "buy",
+            "api_name": "browse",
+            "api_version": "v1",
+            "resources": resources,
+        }
+    ]
+
+
+def bench_rates_contention() -> None:
+    """Measure throttled decrements a second, with threads calling different resources or the same one."""
+    rates = Rates(app_id="benchmark")
+    rates.refresh_developer_analytics(make_rate_limits())
+
+    def run(threads: int, shared: bool) -> float:
+        per_thread = RATE_CALLS // threads
+
+        def work(index: int) -> None:
+            rate_keys = ["resource_0" if shared else f"resource_{index}", ""]
+            for _ in range(per_thread):
+                rates.decrement_rate_throttled("/buy/browse/v1", rate_keys, -1.0)
+
+        workers = [
+            threading.Thread(target=work, args=(i % RESOURCES,)) for i in range(threads)
+        ]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return per_thread * threads / (time.perf_counter() - start)
+
+    print("Rates contention, throttled decrements per second:")
+    print("  threads  different resources  same resource")
+    for threads in (1, 2, 4, 8, 16, 32):
+        print(
+            f"  {threads:7d}  {run(threads, False):19.0f}  {run(threads, True):13.0f}"
+        )
+
+
+def main() -> None:
+    with stub_server() as host:
+        bench_thread_pool(host)
+    bench_rates_contention()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@
 # Perhaps making inhumanly frequent requests triggers eBay's DOS protection system.
 
 # Standard library imports
+import ast
 from dataclasses import dataclass
 import hashlib
 from itertools import groupby
@@ -15,7 +16,17 @@ import re
 import shutil
 import sys
 import time
-from typing import Any, AsyncGenerator, Dict, Iterable, List, Optional, Set, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 # Third party imports
 import aiofiles
@@ -26,7 +37,6 @@ from bs4 import BeautifulSoup
 from chardet import detect
 from urllib.parse import urljoin, urlsplit
 
-
 # Local imports
 
 # Globals
@@ -582,6 +592,7 @@ class Contract:
         await self.patch_generated()
         await self.copy_library()
         await self.fix_imports()
+        await self.generate_model_table()
 
     @staticmethod
     async def get_contract_info(
@@ -1191,8 +1202,46 @@ class Contract:
                     bad_code[:-1]
                     + " and response_data.status != 204:       # ebay_rest patch",
                 )
-                async with aiofiles.open(file_path, mode="w") as f:
-                    await f.write(data)
+            # ThreadPool() starts a thread per CPU, yet only async_req calls use it; so, start it on first use.
+            target = "from multiprocessing.pool import ThreadPool\n"
+            new_code = "import threading  # ebay_rest patch\n"
+            data = data.replace(target, target + new_code, 1)
+            target = "        self.pool = ThreadPool()\n"
+            new_code = (
+                "        self._pool = None  # ebay_rest patch\n"
+                "        self._pool_lock = threading.Lock()  # ebay_rest patch\n"
+            )
+            data = data.replace(target, new_code, 1)
+            target = """    def __del__(self):
+        self.pool.close()
+        self.pool.join()
+"""
+            new_code = """    def __del__(self):
+        if self._pool is not None:  # ebay_rest patch
+            self._pool.close()
+            self._pool.join()
+
+    @property
+    def pool(self):  # ebay_rest patch
+        \"\"\"Thread pool for async_req calls, started on first use\"\"\"
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadPool()
+        return self._pool
+"""
+            data = data.replace(target, new_code, 1)
+            # Let ebay_rest supply a faster deserializer that makes dicts instead of model objects.
+            target = "        return self.__deserialize(data, response_type)\n"
+            new_code = (
+                "        raw_deserializer = getattr(self.configuration, 'raw_deserializer', None)  # ebay_rest patch\n"
+                "        if raw_deserializer is not None:  # ebay_rest patch\n"
+                "            return raw_deserializer(data, response_type)  # ebay_rest patch\n"
+                + target
+            )
+            data = data.replace(target, new_code, 1)
+            async with aiofiles.open(file_path, mode="w") as f:
+                await f.write(data)
 
         # Patch in code for Digital Signatures
         file_path = os.path.join(
@@ -1214,6 +1263,14 @@ class Contract:
             target = "# https pool manager"
             new_code = "\n        self.key_pair = configuration.api_key.get('key_pair', None)  # ebay_rest patch"
             data = data.replace(target, target + new_code, 1)
+            # Use the pool manager shared by all APIs, when one is supplied
+            target = "        if configuration.proxy:\n"
+            new_code = (
+                "        if getattr(configuration, 'pool_manager', None) is not None:  # ebay_rest patch\n"
+                "            self.pool_manager = configuration.pool_manager  # ebay_rest patch\n"
+                "        elif configuration.proxy:\n"
+            )
+            data = data.replace(target, new_code, 1)
             # Replace all pool manager calls with wrapped call
             target = "r = self.pool_manager.request(\n"
             replace_code = "r = signed_request(self.pool_manager, self.key_pair,  # ebay_rest patch\n"
@@ -1381,9 +1438,9 @@ class Contract:
             else:
                 # Get the contract's major version number
                 if "swagger" in data:
-                    (version_major, _version_minor) = data["swagger"].split(".")
+                    version_major, _version_minor = data["swagger"].split(".")
                 elif "openapi" in data:
-                    (version_major, _version_minor, _version_tertiary) = data[
+                    version_major, _version_minor, _version_tertiary = data[
                         "openapi"
                     ].split(".")
                 else:
@@ -1529,6 +1586,120 @@ class Contract:
 
             break
 
+    async def generate_model_table(self) -> None:
+        """
+        Write model_table.py, which tells how to convert the JSON of each of the API's models.
+
+        With it, APIPrivate can give Python-styled dicts without building Swagger model objects.
+        """
+        path = os.path.join(Locations.target_path, self.data.name)
+        models = await Contract.get_model_table(path)
+        response_types = await Contract.get_response_types(path)
+        lines = [
+            "# coding: utf-8",
+            "# This file is made by scripts/generate_code.py, do not edit it manually.",
+            "",
+            "# For each model, a tuple of (JSON key, attribute name, type code) per field.",
+            "# The type code is None when the value needs no conversion, otherwise it is a model name,",
+            '# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.',
+            "MODELS = {",
+        ]
+        for model, fields in models.items():
+            lines.append(f"    {model!r}: (")
+            lines.extend(f"        {field!r}," for field in fields)
+            lines.append("    ),")
+        lines.append("}")
+        lines.extend(
+            [
+                "",
+                "# The type code of each response type that the API's methods deserialize to.",
+                "RESPONSE_TYPES = {",
+            ]
+        )
+        lines.extend(f"    {key!r}: {code!r}," for key, code in response_types.items())
+        lines.append("}")
+        async with aiofiles.open(os.path.join(path, "model_table.py"), mode="w") as f:
+            await f.write("\n".join(lines) + "\n")
+
+    @staticmethod
+    async def get_model_table(path: str) -> Dict[str, Tuple[Tuple[str, str, Any], ...]]:
+        """
+        Read the swagger_types and attribute_map of every model in a generated API package.
+
+        :param path: The path to the generated package.
+        :return: Model names mapped to a tuple of (JSON key, attribute name, type code) per field.
+        """
+        models = dict()
+        models_path = os.path.join(path, "models")
+        for file in sorted(os.listdir(models_path)):
+            if file == "__init__.py" or not file.endswith(".py"):
+                continue
+            async with aiofiles.open(os.path.join(models_path, file)) as f:
+                tree = ast.parse(await f.read())
+            for node in tree.body:
+                if not isinstance(node, ast.ClassDef):
+                    continue
+                tables = dict()
+                table_names = ("attribute_map", "swagger_types")
+                for statement in node.body:
+                    if (
+                        isinstance(statement, ast.Assign)
+                        and len(statement.targets) == 1
+                        and isinstance(statement.targets[0], ast.Name)
+                        and statement.targets[0].id in table_names
+                    ):
+                        tables[statement.targets[0].id] = ast.literal_eval(
+                            statement.value
+                        )
+                if len(tables) == 2:
+                    models[node.name] = tuple(
+                        (
+                            tables["attribute_map"][name],
+                            name,
+                            Contract.get_type_code(swagger_type),
+                        )
+                        for name, swagger_type in tables["swagger_types"].items()
+                    )
+        return dict(sorted(models.items()))
+
+    @staticmethod
+    async def get_response_types(path: str) -> Dict[str, Any]:
+        """
+        Find the response types of the methods in a generated API package.
+
+        :param path: The path to the generated package.
+        :return: Response types, like "list[Image]", mapped to their type codes.
+        """
+        response_types = dict()
+        api_path = os.path.join(path, "api")
+        for file in sorted(os.listdir(api_path)):
+            if file == "__init__.py" or not file.endswith(".py"):
+                continue
+            async with aiofiles.open(os.path.join(api_path, file)) as f:
+                source = await f.read()
+            for swagger_type in re.findall(r"response_type='([^']+)'", source):
+                response_types[swagger_type] = Contract.get_type_code(swagger_type)
+        return dict(sorted(response_types.items()))
+
+    @staticmethod
+    def get_type_code(swagger_type: str) -> Optional[Union[str, Tuple[str, Any]]]:
+        """
+        Condense a Swagger type, like "list[Image]", to the type code used in model_table.py.
+
+        :param swagger_type: A value from the swagger_types of a model.
+        :return: A type code.
+        """
+        if swagger_type.startswith("list["):
+            code = Contract.get_type_code(swagger_type[len("list[") : -1])
+            return None if code is None else ("list", code)
+        if swagger_type.startswith("dict("):
+            code = Contract.get_type_code(swagger_type.split(",", 1)[1][:-1].strip())
+            return None if code is None else ("dict", code)
+        primitive_types = ("bool", "bytearray", "float", "int", "long", "object", "str")
+        if swagger_type in primitive_types:
+            return None
+        return swagger_type
+
     async def get_requirements(self) -> Set[str]:
         """
         Get the library's requirements.
@@ -1561,12 +1732,8 @@ class Contract:
         Get the includes for a library.
         """
         includes = list()
-        includes.append(f"from .{Locations.target_directory} import {self.data.name}")
-        line = (
-            f"from .{Locations.target_directory}.{self.data.name}.rest import ApiException as "
-            f"{await self._camel(self.data.name)}Exception"
-        )
-        includes.append(line)
+        # a stand-in that imports the package on first use, which keeps "import ebay_rest" quick
+        includes.append(f'{self.data.name} = LazyPackage("{self.data.name}")')
         return includes
 
     async def get_methods(self) -> str:
@@ -1834,7 +2001,7 @@ class Contract:
             f" {name}.{await self._camel(module)},"
             f" {name}.ApiClient,"
             f" '{method}',"
-            f" {await self._camel(name)}Exception,"
+            f" {name}.rest.ApiException,"
             f" {security_info.user_access_token},"
             f" ['{resource_name_base}', '{resource_name_module}'],"
         )
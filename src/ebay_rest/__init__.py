@@ -1,4 +1,8 @@
 from .a_p_i import API
+from .a_p_i_async import AsyncAPI
+from .config import Config
 from .date_time import DateTime
 from .error import Error
+from .rate_budget import RateBudget, SQLiteRateBudget
 from .reference import Reference
+from .token_store import FileTokenStore, TokenStore
@@ -3,83 +3,48 @@ from typing import Optional, Union, Dict
 
 # Local imports
 from .a_p_i_private import APIPrivate
+from .config import Config
+from .lazy_package import LazyPackage
+from .rate_budget import RateBudget
+from .token_store import TokenStore
 
 # Don't edit the anchors or in-between; instead, edit and run scripts/generate_code.py.
 # ANCHOR-er_imports-START"
-from .api import buy_browse
-from .api.buy_browse.rest import ApiException as BuyBrowseException
-from .api import buy_deal
-from .api.buy_deal.rest import ApiException as BuyDealException
-from .api import buy_feed
-from .api.buy_feed.rest import ApiException as BuyFeedException
-from .api import buy_marketing
-from .api.buy_marketing.rest import ApiException as BuyMarketingException
-from .api import buy_offer
-from .api.buy_offer.rest import ApiException as BuyOfferException
-from .api import buy_order
-from .api.buy_order.rest import ApiException as BuyOrderException
-from .api import commerce_catalog
-from .api.commerce_catalog.rest import ApiException as CommerceCatalogException
-from .api import commerce_charity
-from .api.commerce_charity.rest import ApiException as CommerceCharityException
-from .api import commerce_identity
-from .api.commerce_identity.rest import ApiException as CommerceIdentityException
-from .api import commerce_media
-from .api.commerce_media.rest import ApiException as CommerceMediaException
-from .api import commerce_message
-from .api.commerce_message.rest import ApiException as CommerceMessageException
-from .api import commerce_notification
-from .api.commerce_notification.rest import (
-    ApiException as CommerceNotificationException,
+buy_browse = LazyPackage("buy_browse")
+buy_deal = LazyPackage("buy_deal")
+buy_feed = LazyPackage("buy_feed")
+buy_marketing = LazyPackage("buy_marketing")
+buy_offer = LazyPackage("buy_offer")
+buy_order = LazyPackage("buy_order")
+commerce_catalog = LazyPackage("commerce_catalog")
+commerce_charity = LazyPackage("commerce_charity")
+commerce_identity = LazyPackage("commerce_identity")
+commerce_media = LazyPackage("commerce_media")
+commerce_message = LazyPackage("commerce_message")
+commerce_notification = LazyPackage("commerce_notification")
+commerce_taxonomy = LazyPackage("commerce_taxonomy")
+commerce_translation = LazyPackage("commerce_translation")
+commerce_vero = LazyPackage("commerce_vero")
+developer_analytics = LazyPackage("developer_analytics")
+developer_client_registration = LazyPackage("developer_client_registration")
+developer_key_management = LazyPackage("developer_key_management")
+sell_account = LazyPackage("sell_account")
+sell_analytics = LazyPackage("sell_analytics")
+sell_compliance = LazyPackage("sell_compliance")
+sell_edelivery_international_shipping = LazyPackage(
+    "sell_edelivery_international_shipping"
 )
-from .api import commerce_taxonomy
-from .api.commerce_taxonomy.rest import ApiException as CommerceTaxonomyException
-from .api import commerce_translation
-from .api.commerce_translation.rest import ApiException as CommerceTranslationException
-from .api import commerce_vero
-from .api.commerce_vero.rest import ApiException as CommerceVeroException
-from .api import developer_analytics
-from .api.developer_analytics.rest import ApiException as DeveloperAnalyticsException
-from .api import developer_client_registration
-from .api.developer_client_registration.rest import (
-    ApiException as DeveloperClientRegistrationException,
-)
-from .api import developer_key_management
-from .api.developer_key_management.rest import (
-    ApiException as DeveloperKeyManagementException,
-)
-from .api import sell_account
-from .api.sell_account.rest import ApiException as SellAccountException
-from .api import sell_analytics
-from .api.sell_analytics.rest import ApiException as SellAnalyticsException
-from .api import sell_compliance
-from .api.sell_compliance.rest import ApiException as SellComplianceException
-from .api import sell_edelivery_international_shipping
-from .api.sell_edelivery_international_shipping.rest import (
-    ApiException as SellEdeliveryInternationalShippingException,
-)
-from .api import sell_feed
-from .api.sell_feed.rest import ApiException as SellFeedException
-from .api import sell_finances
-from .api.sell_finances.rest import ApiException as SellFinancesException
-from .api import sell_fulfillment
-from .api.sell_fulfillment.rest import ApiException as SellFulfillmentException
-from .api import sell_inventory
-from .api.sell_inventory.rest import ApiException as SellInventoryException
-from .api import sell_leads
-from .api.sell_leads.rest import ApiException as SellLeadsException
-from .api import sell_logistics
-from .api.sell_logistics.rest import ApiException as SellLogisticsException
-from .api import sell_marketing
-from .api.sell_marketing.rest import ApiException as SellMarketingException
-from .api import sell_metadata
-from .api.sell_metadata.rest import ApiException as SellMetadataException
-from .api import sell_negotiation
-from .api.sell_negotiation.rest import ApiException as SellNegotiationException
-from .api import sell_recommendation
-from .api.sell_recommendation.rest import ApiException as SellRecommendationException
-from .api import sell_stores
-from .api.sell_stores.rest import ApiException as SellStoresException
+sell_feed = LazyPackage("sell_feed")
+sell_finances = LazyPackage("sell_finances")
+sell_fulfillment = LazyPackage("sell_fulfillment")
+sell_inventory = LazyPackage("sell_inventory")
+sell_leads = LazyPackage("sell_leads")
+sell_logistics = LazyPackage("sell_logistics")
+sell_marketing = LazyPackage("sell_marketing")
+sell_metadata = LazyPackage("sell_metadata")
+sell_negotiation = LazyPackage("sell_negotiation")
+sell_recommendation = LazyPackage("sell_recommendation")
+sell_stores = LazyPackage("sell_stores")
 
 # ANCHOR-er_imports-END"
 
@@ -102,6 +67,16 @@ class API(APIPrivate):
         key_pair: Optional[Union[str, Dict]] = None,
         digital_signatures: bool = False,
         async_req: bool = False,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        raw_json: bool = False,
+        prefetch: int = 0,
+        retry_policy: Optional[Dict] = None,
+        token_store: Optional[TokenStore] = None,
+        background_token_refresh: bool = False,
+        config: Optional[Config] = None,
+        rate_budget: Optional[RateBudget] = None,
+        priority: str = "normal",
     ):
         """
         Instantiate an API object, then use it to call hundreds of eBay APIs.
@@ -139,6 +114,45 @@ class API(APIPrivate):
         :param async_req: When True make asynchronous HTTP requests, defaults to False for synchronous.
                           !!!IGNORE THIS OPTION, THE CODE FOR IT IS INCOMPLETE!!!
 
+        :param pool_maxsize: The most HTTP connections to keep open to each eBay host.
+                             All API objects with the same pool settings share the connections.
+                             Defaults to 10.
+
+        :param keep_alive: When True, send TCP keep-alive probes on idle pooled connections.
+                           Defaults to True.
+
+        :param raw_json: When True, build the results straight from the JSON that eBay returns, which is much
+                         faster than making Swagger objects and converting them. Defaults to False.
+
+        :param prefetch: How many pages a paged method fetches in parallel, ahead of the records being yielded.
+                         Records are still yielded in order. Defaults to 0, fetch each page when it is needed.
+
+        :param retry_policy: Retry failed HTTP requests, with waits that back off. Supply a dict to override
+                             any of Transport.RETRY_POLICY_DEFAULTS; {} accepts all of them, which retries
+                             statuses 429, 500, 502, 503 and 504 for idempotent methods, and waits as long
+                             as eBay's Retry-After header asks. Defaults to None, only retry failed connections.
+
+        :param token_store: Share OAuth tokens with the API objects in other processes, e.g. FileTokenStore(path),
+                            so that a token is minted once for all of them.
+                            Defaults to None, each process gets its own tokens.
+
+        :param background_token_refresh: When True, a background thread renews OAuth tokens before they expire,
+                                         so that calls never wait for a renewal.
+                                         Defaults to False, calls renew tokens when they need to.
+
+        :param config: Instead of path, application, user, header and key_pair, supply a Config made from them,
+                       which is faster because they were loaded and checked in advance.
+
+        :param rate_budget: When throttling, share the remaining counts of calls with the API objects in other
+                            processes, e.g. SQLiteRateBudget(path), so that together they keep to the app_id's
+                            call limits.
+                            Defaults to None, each process counts its own calls.
+
+        :param priority: When throttling, "high", "normal" or "low". When calls are scarce, lower priority calls
+                         wait first, so that higher ones needn't. To give some calls another priority, make a
+                         second API object for them.
+                         Defaults to "normal".
+
         :return: An API object.
         """
         super().__init__(
@@ -151,6 +165,16 @@ class API(APIPrivate):
             key_pair=key_pair,
             digital_signatures=digital_signatures,
             async_req=async_req,
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive,
+            raw_json=raw_json,
+            prefetch=prefetch,
+            retry_policy=retry_policy,
+            token_store=token_store,
+            background_token_refresh=background_token_refresh,
+            config=config,
+            rate_budget=rate_budget,
+            priority=priority,
         )
 
     # Don't edit the anchors or in-between; instead, edit and run scripts/generate_code.py.
@@ -176,7 +200,7 @@ class API(APIPrivate):
             buy_browse.ItemApi,
             buy_browse.ApiClient,
             "check_compatibility",
-            BuyBrowseException,
+            buy_browse.rest.ApiException,
             False,
             ["buy.browse", "item"],
             (content_type, item_id),
@@ -202,7 +226,7 @@ class API(APIPrivate):
             buy_browse.ItemApi,
             buy_browse.ApiClient,
             "get_item",
-            BuyBrowseException,
+            buy_browse.rest.ApiException,
             False,
             ["buy.browse", "item"],
             item_id,
@@ -230,7 +254,7 @@ class API(APIPrivate):
             buy_browse.ItemApi,
             buy_browse.ApiClient,
             "get_item_by_legacy_id",
-            BuyBrowseException,
+            buy_browse.rest.ApiException,
             False,
             ["buy.browse", "item"],
             legacy_item_id,
@@ -256,7 +280,7 @@ class API(APIPrivate):
             buy_browse.ItemApi,
             buy_browse.ApiClient,
             "get_items",
-            BuyBrowseException,
+            buy_browse.rest.ApiException,
             False,
             ["buy.browse", "item"],
             None,
@@ -282,7 +306,7 @@ class API(APIPrivate):
             buy_browse.ItemApi,
             buy_browse.ApiClient,
             "get_items_by_item_group",
-            BuyBrowseException,
+            buy_browse.rest.ApiException,
             False,
             ["buy.browse", "item"],
             item_group_id,
@@ -318,7 +342,7 @@ class API(APIPrivate):
             buy_browse.ItemSummaryApi,
             buy_browse.ApiClient,
             "search",
-            BuyBrowseException,
+            buy_browse.rest.ApiException,
             False,
             ["buy.browse", "item_summary"],
             None,
@@ -351,7 +375,7 @@ class API(APIPrivate):
             buy_browse.ItemSummaryApi,
             buy_browse.ApiClient,
             "search_by_image",
-            BuyBrowseException,
+            buy_browse.rest.ApiException,
             False,
             ["buy.browse", "item_summary"],
             content_type,
@@ -378,7 +402,7 @@ class API(APIPrivate):
             buy_deal.DealItemApi,
             buy_deal.ApiClient,
             "get_deal_items",
-            BuyDealException,
+            buy_deal.rest.ApiException,
             False,
             ["buy.deal", "deal_item"],
             x_ebay_c_marketplace_id,
@@ -403,7 +427,7 @@ class API(APIPrivate):
             buy_deal.EventApi,
             buy_deal.ApiClient,
             "get_event",
-            BuyDealException,
+            buy_deal.rest.ApiException,
             False,
             ["buy.deal", "event"],
             (x_ebay_c_marketplace_id, event_id),
@@ -427,7 +451,7 @@ class API(APIPrivate):
             buy_deal.EventApi,
             buy_deal.ApiClient,
             "get_events",
-            BuyDealException,
+            buy_deal.rest.ApiException,
             False,
             ["buy.deal", "event"],
             x_ebay_c_marketplace_id,
@@ -456,7 +480,7 @@ class API(APIPrivate):
             buy_deal.EventItemApi,
             buy_deal.ApiClient,
             "get_event_items",
-            BuyDealException,
+            buy_deal.rest.ApiException,
             False,
             ["buy.deal", "event_item"],
             (event_ids, x_ebay_c_marketplace_id),
@@ -476,7 +500,7 @@ class API(APIPrivate):
             buy_feed.AccessApi,
             buy_feed.ApiClient,
             "get_access",
-            BuyFeedException,
+            buy_feed.rest.ApiException,
             False,
             ["buy.feed", "access"],
             None,
@@ -497,7 +521,7 @@ class API(APIPrivate):
             buy_feed.FeedTypeApi,
             buy_feed.ApiClient,
             "get_feed_type",
-            BuyFeedException,
+            buy_feed.rest.ApiException,
             False,
             ["buy.feed", "feed_type"],
             feed_type_id,
@@ -521,7 +545,7 @@ class API(APIPrivate):
             buy_feed.FeedTypeApi,
             buy_feed.ApiClient,
             "get_feed_types",
-            BuyFeedException,
+            buy_feed.rest.ApiException,
             False,
             ["buy.feed", "feed_type"],
             None,
@@ -546,7 +570,7 @@ class API(APIPrivate):
             buy_feed.FileApi,
             buy_feed.ApiClient,
             "download_file",
-            BuyFeedException,
+            buy_feed.rest.ApiException,
             False,
             ["buy.feed", "file"],
             (file_id, x_ebay_c_marketplace_id),
@@ -570,7 +594,7 @@ class API(APIPrivate):
             buy_feed.FileApi,
             buy_feed.ApiClient,
             "get_file",
-            BuyFeedException,
+            buy_feed.rest.ApiException,
             False,
             ["buy.feed", "file"],
             (file_id, x_ebay_c_marketplace_id),
@@ -599,7 +623,7 @@ class API(APIPrivate):
             buy_feed.FileApi,
             buy_feed.ApiClient,
             "get_files",
-            BuyFeedException,
+            buy_feed.rest.ApiException,
             False,
             ["buy.feed", "file"],
             (feed_type_id, x_ebay_c_marketplace_id),
@@ -625,7 +649,7 @@ class API(APIPrivate):
             buy_marketing.MerchandisedProductApi,
             buy_marketing.ApiClient,
             "get_merchandised_products",
-            BuyMarketingException,
+            buy_marketing.rest.ApiException,
             False,
             ["buy.marketing", "merchandised_product"],
             (category_id, metric_name),
@@ -649,7 +673,7 @@ class API(APIPrivate):
             buy_offer.BiddingApi,
             buy_offer.ApiClient,
             "get_bidding",
-            BuyOfferException,
+            buy_offer.rest.ApiException,
             True,
             ["buy.offer", "bidding"],
             (item_id, x_ebay_c_marketplace_id),
@@ -675,7 +699,7 @@ class API(APIPrivate):
             buy_offer.BiddingApi,
             buy_offer.ApiClient,
             "place_proxy_bid",
-            BuyOfferException,
+            buy_offer.rest.ApiException,
             True,
             ["buy.offer", "bidding"],
             (x_ebay_c_marketplace_id, content_type, item_id),
@@ -702,7 +726,7 @@ class API(APIPrivate):
             buy_order.GuestCheckoutSessionApi,
             buy_order.ApiClient,
             "apply_guest_coupon",
-            BuyOrderException,
+            buy_order.rest.ApiException,
             False,
             ["buy.order", "guest_checkout_session"],
             (x_ebay_c_marketplace_id, content_type, checkout_session_id),
@@ -727,7 +751,7 @@ class API(APIPrivate):
             buy_order.GuestCheckoutSessionApi,
             buy_order.ApiClient,
             "get_guest_checkout_session",
-            BuyOrderException,
+            buy_order.rest.ApiException,
             False,
             ["buy.order", "guest_checkout_session"],
             (checkout_session_id, x_ebay_c_marketplace_id),
@@ -753,7 +777,7 @@ class API(APIPrivate):
             buy_order.GuestCheckoutSessionApi,
             buy_order.ApiClient,
             "initiate_guest_checkout_session",
-            BuyOrderException,
+            buy_order.rest.ApiException,
             False,
             ["buy.order", "guest_checkout_session"],
             (x_ebay_c_marketplace_id, content_type),
@@ -780,7 +804,7 @@ class API(APIPrivate):
             buy_order.GuestCheckoutSessionApi,
             buy_order.ApiClient,
             "remove_guest_coupon",
-            BuyOrderException,
+            buy_order.rest.ApiException,
             False,
             ["buy.order", "guest_checkout_session"],
             (x_ebay_c_marketplace_id, content_type, checkout_session_id),
@@ -807,7 +831,7 @@ class API(APIPrivate):
             buy_order.GuestCheckoutSessionApi,
             buy_order.ApiClient,
             "update_guest_quantity",
-            BuyOrderException,
+            buy_order.rest.ApiException,
             False,
             ["buy.order", "guest_checkout_session"],
             (x_ebay_c_marketplace_id, content_type, checkout_session_id),
@@ -834,7 +858,7 @@ class API(APIPrivate):
             buy_order.GuestCheckoutSessionApi,
             buy_order.ApiClient,
             "update_guest_shipping_address",
-            BuyOrderException,
+            buy_order.rest.ApiException,
             False,
             ["buy.order", "guest_checkout_session"],
             (x_ebay_c_marketplace_id, content_type, checkout_session_id),
@@ -861,7 +885,7 @@ class API(APIPrivate):
             buy_order.GuestCheckoutSessionApi,
             buy_order.ApiClient,
             "update_guest_shipping_option",
-            BuyOrderException,
+            buy_order.rest.ApiException,
             False,
             ["buy.order", "guest_checkout_session"],
             (x_ebay_c_marketplace_id, content_type, checkout_session_id),
@@ -886,7 +910,7 @@ class API(APIPrivate):
             buy_order.GuestPurchaseOrderApi,
             buy_order.ApiClient,
             "get_guest_purchase_order",
-            BuyOrderException,
+            buy_order.rest.ApiException,
             False,
             ["buy.order", "guest_purchase_order"],
             purchase_order_id,
@@ -908,7 +932,7 @@ class API(APIPrivate):
             commerce_catalog.ProductApi,
             commerce_catalog.ApiClient,
             "get_product",
-            CommerceCatalogException,
+            commerce_catalog.rest.ApiException,
             True,
             ["commerce.catalog", "product"],
             epid,
@@ -937,7 +961,7 @@ class API(APIPrivate):
             commerce_catalog.ProductSummaryApi,
             commerce_catalog.ApiClient,
             "search",
-            CommerceCatalogException,
+            commerce_catalog.rest.ApiException,
             True,
             ["commerce.catalog", "product_summary"],
             None,
@@ -961,7 +985,7 @@ class API(APIPrivate):
             commerce_charity.CharityOrgApi,
             commerce_charity.ApiClient,
             "get_charity_org",
-            CommerceCharityException,
+            commerce_charity.rest.ApiException,
             False,
             ["commerce.charity", "charity_org"],
             (charity_org_id, x_ebay_c_marketplace_id),
@@ -988,7 +1012,7 @@ class API(APIPrivate):
             commerce_charity.CharityOrgApi,
             commerce_charity.ApiClient,
             "get_charity_orgs",
-            CommerceCharityException,
+            commerce_charity.rest.ApiException,
             False,
             ["commerce.charity", "charity_org"],
             x_ebay_c_marketplace_id,
@@ -1008,7 +1032,7 @@ class API(APIPrivate):
             commerce_identity.UserApi,
             commerce_identity.ApiClient,
             "get_user",
-            CommerceIdentityException,
+            commerce_identity.rest.ApiException,
             True,
             ["commerce.identity", "user"],
             None,
@@ -1030,7 +1054,7 @@ class API(APIPrivate):
             commerce_media.DocumentApi,
             commerce_media.ApiClient,
             "create_document",
-            CommerceMediaException,
+            commerce_media.rest.ApiException,
             True,
             ["commerce.media", "document"],
             content_type,
@@ -1054,7 +1078,7 @@ class API(APIPrivate):
             commerce_media.DocumentApi,
             commerce_media.ApiClient,
             "create_document_from_url",
-            CommerceMediaException,
+            commerce_media.rest.ApiException,
             True,
             ["commerce.media", "document"],
             content_type,
@@ -1075,7 +1099,7 @@ class API(APIPrivate):
             commerce_media.DocumentApi,
             commerce_media.ApiClient,
             "get_document",
-            CommerceMediaException,
+            commerce_media.rest.ApiException,
             True,
             ["commerce.media", "document"],
             document_id,
@@ -1100,7 +1124,7 @@ class API(APIPrivate):
             commerce_media.DocumentApi,
             commerce_media.ApiClient,
             "upload_document",
-            CommerceMediaException,
+            commerce_media.rest.ApiException,
             True,
             ["commerce.media", "document"],
             (document_id, content_type),
@@ -1124,7 +1148,7 @@ class API(APIPrivate):
             commerce_media.ImageApi,
             commerce_media.ApiClient,
             "create_image_from_file",
-            CommerceMediaException,
+            commerce_media.rest.ApiException,
             True,
             ["commerce.media", "image"],
             content_type,
@@ -1148,7 +1172,7 @@ class API(APIPrivate):
             commerce_media.ImageApi,
             commerce_media.ApiClient,
             "create_image_from_url",
-            CommerceMediaException,
+            commerce_media.rest.ApiException,
             True,
             ["commerce.media", "image"],
             (body, content_type),
@@ -1169,7 +1193,7 @@ class API(APIPrivate):
             commerce_media.ImageApi,
             commerce_media.ApiClient,
             "get_image",
-            CommerceMediaException,
+            commerce_media.rest.ApiException,
             True,
             ["commerce.media", "image"],
             image_id,
@@ -1191,7 +1215,7 @@ class API(APIPrivate):
             commerce_media.VideoApi,
             commerce_media.ApiClient,
             "create_video",
-            CommerceMediaException,
+            commerce_media.rest.ApiException,
             True,
             ["commerce.media", "video"],
             content_type,
@@ -1212,7 +1236,7 @@ class API(APIPrivate):
             commerce_media.VideoApi,
             commerce_media.ApiClient,
             "get_video",
-            CommerceMediaException,
+            commerce_media.rest.ApiException,
             True,
             ["commerce.media", "video"],
             video_id,
@@ -1240,7 +1264,7 @@ class API(APIPrivate):
             commerce_media.VideoApi,
             commerce_media.ApiClient,
             "upload_video",
-            CommerceMediaException,
+            commerce_media.rest.ApiException,
             True,
             ["commerce.media", "video"],
             (content_type, video_id),
@@ -1264,7 +1288,7 @@ class API(APIPrivate):
             commerce_message.ConversationApi,
             commerce_message.ApiClient,
             "bulk_update_conversation",
-            CommerceMessageException,
+            commerce_message.rest.ApiException,
             False,
             ["commerce.message", "conversation"],
             content_type,
@@ -1290,7 +1314,7 @@ class API(APIPrivate):
             commerce_message.ConversationApi,
             commerce_message.ApiClient,
             "get_conversation",
-            CommerceMessageException,
+            commerce_message.rest.ApiException,
             False,
             ["commerce.message", "conversation"],
             (conversation_id, conversation_type),
@@ -1321,7 +1345,7 @@ class API(APIPrivate):
             commerce_message.ConversationApi,
             commerce_message.ApiClient,
             "get_conversations",
-            CommerceMessageException,
+            commerce_message.rest.ApiException,
             False,
             ["commerce.message", "conversation"],
             conversation_type,
@@ -1343,7 +1367,7 @@ class API(APIPrivate):
             commerce_message.ConversationApi,
             commerce_message.ApiClient,
             "send_message",
-            CommerceMessageException,
+            commerce_message.rest.ApiException,
             False,
             ["commerce.message", "conversation"],
             content_type,
@@ -1367,7 +1391,7 @@ class API(APIPrivate):
             commerce_message.ConversationApi,
             commerce_message.ApiClient,
             "update_conversation",
-            CommerceMessageException,
+            commerce_message.rest.ApiException,
             False,
             ["commerce.message", "conversation"],
             content_type,
@@ -1387,7 +1411,7 @@ class API(APIPrivate):
             commerce_notification.ConfigApi,
             commerce_notification.ApiClient,
             "get_config",
-            CommerceNotificationException,
+            commerce_notification.rest.ApiException,
             False,
             ["commerce.notification", "config"],
             None,
@@ -1409,7 +1433,7 @@ class API(APIPrivate):
             commerce_notification.ConfigApi,
             commerce_notification.ApiClient,
             "update_config",
-            CommerceNotificationException,
+            commerce_notification.rest.ApiException,
             False,
             ["commerce.notification", "config"],
             content_type,
@@ -1433,7 +1457,7 @@ class API(APIPrivate):
             commerce_notification.DestinationApi,
             commerce_notification.ApiClient,
             "create_destination",
-            CommerceNotificationException,
+            commerce_notification.rest.ApiException,
             False,
             ["commerce.notification", "destination"],
             content_type,
@@ -1456,7 +1480,7 @@ class API(APIPrivate):
             commerce_notification.DestinationApi,
             commerce_notification.ApiClient,
             "delete_destination",
-            CommerceNotificationException,
+            commerce_notification.rest.ApiException,
             False,
             ["commerce.notification", "destination"],
             destination_id,
@@ -1479,7 +1503,7 @@ class API(APIPrivate):
             commerce_notification.DestinationApi,
             commerce_notification.ApiClient,
             "get_destination",
-            CommerceNotificationException,
+            commerce_notification.rest.ApiException,
             False,
             ["commerce.notification", "destination"],
             destination_id,
@@ -1501,7 +1525,7 @@ class API(APIPrivate):
             commerce_notification.DestinationApi,
             commerce_notification.ApiClient,
             "get_destinations",
-            CommerceNotificationException,
+            commerce_notification.rest.ApiException,
             False,
             ["commerce.notification", "destination"],
             None,
@@ -1526,7 +1550,7 @@ class API(APIPrivate):
             commerce_notification.DestinationApi,
             commerce_notification.ApiClient,
             "update_destination",
-            CommerceNotificationException,
+            commerce_notification.rest.ApiException,
             False,
             ["commerce.notification", "destination"],
             (content_type, destination_id),
@@ -1549,7 +1573,7 @@ class API(APIPrivate):
             commerce_notification.PublicKeyApi,
             commerce_notification.ApiClient,
             "get_public_key",
-            CommerceNotificationException,
+            commerce_notification.rest.ApiException,
             False,
             ["commerce.notification", "public_key"],
             public_key_id,
@@ -1573,7 +1597,7 @@ class API(APIPrivate):
             commerce_notification.SubscriptionApi,
             commerce_notification.ApiClient,
             "create_subscription",
-            CommerceNotificationException,
+            commerce_notification.rest.ApiException,
             False,
             ["commerce.notification", "subscription"],
             content_type,
@@ -1598,7 +1622,7 @@ class API(APIPrivate):
             commerce_notification.SubscriptionApi,
             commerce_notification.ApiClient,
             "create_subscription_filter",
-            CommerceNotificationException,
+            commerce_notification.rest.ApiException,
             False,
             ["commerce.notification", "subscription"],
             (content_type, subscription_id),
@@ -1621,7 +1645,7 @@ class API(APIPrivate):
             commerce_notification.SubscriptionApi,
             commerce_notification.ApiClient,
             "delete_subscription",
-            CommerceNotificationException,
+            commerce_notification.rest.ApiException,
             False,
             ["commerce.notification", "subscription"],
             subscription_id,
@@ -1645,7 +1669,7 @@ class API(APIPrivate):
             commerce_notification.SubscriptionApi,
             commerce_notification.ApiClient,
             "delete_subscription_filter",
-            CommerceNotificationException,
+            commerce_notification.rest.ApiException,
             False,
             ["commerce.notification", "subscription"],
             (filter_id, subscription_id),
@@ -1668,7 +1692,7 @@ class API(APIPrivate):
             commerce_notification.SubscriptionApi,
             commerce_notification.ApiClient,
             "disable_subscription",
-            CommerceNotificationException,
+            commerce_notification.rest.ApiException,
             False,
             ["commerce.notification", "subscription"],
             subscription_id,
@@ -1691,7 +1715,7 @@ class API(APIPrivate):
             commerce_notification.SubscriptionApi,
             commerce_notification.ApiClient,
             "enable_subscription",
-            CommerceNotificationException,
+            commerce_notification.rest.ApiException,
             False,
             ["commerce.notification", "subscription"],
             subscription_id,
@@ -1714,7 +1738,7 @@ class API(APIPrivate):
             commerce_notification.SubscriptionApi,
             commerce_notification.ApiClient,
             "get_subscription",
-            CommerceNotificationException,
+            commerce_notification.rest.ApiException,
             False,
             ["commerce.notification", "subscription"],
             subscription_id,
@@ -1738,7 +1762,7 @@ class API(APIPrivate):
             commerce_notification.SubscriptionApi,
             commerce_notification.ApiClient,
             "get_subscription_filter",
-            CommerceNotificationException,
+            commerce_notification.rest.ApiException,
             False,
             ["commerce.notification", "subscription"],
             (filter_id, subscription_id),
@@ -1760,7 +1784,7 @@ class API(APIPrivate):
             commerce_notification.SubscriptionApi,
             commerce_notification.ApiClient,
             "get_subscriptions",
-            CommerceNotificationException,
+            commerce_notification.rest.ApiException,
             False,
             ["commerce.notification", "subscription"],
             None,
@@ -1783,7 +1807,7 @@ class API(APIPrivate):
             commerce_notification.SubscriptionApi,
             commerce_notification.ApiClient,
             "test_subscription",
-            CommerceNotificationException,
+            commerce_notification.rest.ApiException,
             False,
             ["commerce.notification", "subscription"],
             subscription_id,
@@ -1808,7 +1832,7 @@ class API(APIPrivate):
             commerce_notification.SubscriptionApi,
             commerce_notification.ApiClient,
             "update_subscription",
-            CommerceNotificationException,
+            commerce_notification.rest.ApiException,
             False,
             ["commerce.notification", "subscription"],
             (content_type, subscription_id),
@@ -1829,7 +1853,7 @@ class API(APIPrivate):
             commerce_notification.TopicApi,
             commerce_notification.ApiClient,
             "get_topic",
-            CommerceNotificationException,
+            commerce_notification.rest.ApiException,
             False,
             ["commerce.notification", "topic"],
             topic_id,
@@ -1851,7 +1875,7 @@ class API(APIPrivate):
             commerce_notification.TopicApi,
             commerce_notification.ApiClient,
             "get_topics",
-            CommerceNotificationException,
+            commerce_notification.rest.ApiException,
             False,
             ["commerce.notification", "topic"],
             None,
@@ -1874,7 +1898,7 @@ class API(APIPrivate):
             commerce_taxonomy.CategoryTreeApi,
             commerce_taxonomy.ApiClient,
             "fetch_item_aspects",
-            CommerceTaxonomyException,
+            commerce_taxonomy.rest.ApiException,
             False,
             ["commerce.taxonomy", "category_tree"],
             category_tree_id,
@@ -1899,7 +1923,7 @@ class API(APIPrivate):
             commerce_taxonomy.CategoryTreeApi,
             commerce_taxonomy.ApiClient,
             "get_category_subtree",
-            CommerceTaxonomyException,
+            commerce_taxonomy.rest.ApiException,
             False,
             ["commerce.taxonomy", "category_tree"],
             (category_id, category_tree_id),
@@ -1923,7 +1947,7 @@ class API(APIPrivate):
             commerce_taxonomy.CategoryTreeApi,
             commerce_taxonomy.ApiClient,
             "get_category_suggestions",
-            CommerceTaxonomyException,
+            commerce_taxonomy.rest.ApiException,
             False,
             ["commerce.taxonomy", "category_tree"],
             (category_tree_id, q),
@@ -1947,7 +1971,7 @@ class API(APIPrivate):
             commerce_taxonomy.CategoryTreeApi,
             commerce_taxonomy.ApiClient,
             "get_category_tree",
-            CommerceTaxonomyException,
+            commerce_taxonomy.rest.ApiException,
             False,
             ["commerce.taxonomy", "category_tree"],
             category_tree_id,
@@ -1971,7 +1995,7 @@ class API(APIPrivate):
             commerce_taxonomy.CategoryTreeApi,
             commerce_taxonomy.ApiClient,
             "get_compatibility_properties",
-            CommerceTaxonomyException,
+            commerce_taxonomy.rest.ApiException,
             False,
             ["commerce.taxonomy", "category_tree"],
             (category_tree_id, category_id),
@@ -1997,7 +2021,7 @@ class API(APIPrivate):
             commerce_taxonomy.CategoryTreeApi,
             commerce_taxonomy.ApiClient,
             "get_compatibility_property_values",
-            CommerceTaxonomyException,
+            commerce_taxonomy.rest.ApiException,
             False,
             ["commerce.taxonomy", "category_tree"],
             (category_tree_id, compatibility_property, category_id),
@@ -2020,7 +2044,7 @@ class API(APIPrivate):
             commerce_taxonomy.CategoryTreeApi,
             commerce_taxonomy.ApiClient,
             "get_default_category_tree_id",
-            CommerceTaxonomyException,
+            commerce_taxonomy.rest.ApiException,
             False,
             ["commerce.taxonomy", "category_tree"],
             marketplace_id,
@@ -2043,7 +2067,7 @@ class API(APIPrivate):
             commerce_taxonomy.CategoryTreeApi,
             commerce_taxonomy.ApiClient,
             "get_expired_categories",
-            CommerceTaxonomyException,
+            commerce_taxonomy.rest.ApiException,
             False,
             ["commerce.taxonomy", "category_tree"],
             category_tree_id,
@@ -2067,7 +2091,7 @@ class API(APIPrivate):
             commerce_taxonomy.CategoryTreeApi,
             commerce_taxonomy.ApiClient,
             "get_item_aspects_for_category",
-            CommerceTaxonomyException,
+            commerce_taxonomy.rest.ApiException,
             False,
             ["commerce.taxonomy", "category_tree"],
             (category_id, category_tree_id),
@@ -2091,7 +2115,7 @@ class API(APIPrivate):
             commerce_translation.LanguageApi,
             commerce_translation.ApiClient,
             "translate",
-            CommerceTranslationException,
+            commerce_translation.rest.ApiException,
             False,
             ["commerce.translation", "language"],
             (body, content_type),
@@ -2114,7 +2138,7 @@ class API(APIPrivate):
             commerce_vero.VeroReasonCodeApi,
             commerce_vero.ApiClient,
             "get_vero_reason_code",
-            CommerceVeroException,
+            commerce_vero.rest.ApiException,
             False,
             ["commerce.vero", "vero_reason_code"],
             vero_reason_code_id,
@@ -2135,7 +2159,7 @@ class API(APIPrivate):
             commerce_vero.VeroReasonCodeApi,
             commerce_vero.ApiClient,
             "get_vero_reason_codes",
-            CommerceVeroException,
+            commerce_vero.rest.ApiException,
             False,
             ["commerce.vero", "vero_reason_code"],
             None,
@@ -2157,7 +2181,7 @@ class API(APIPrivate):
             commerce_vero.VeroReportApi,
             commerce_vero.ApiClient,
             "create_vero_report",
-            CommerceVeroException,
+            commerce_vero.rest.ApiException,
             False,
             ["commerce.vero", "vero_report"],
             content_type,
@@ -2179,7 +2203,7 @@ class API(APIPrivate):
             commerce_vero.VeroReportApi,
             commerce_vero.ApiClient,
             "get_vero_report",
-            CommerceVeroException,
+            commerce_vero.rest.ApiException,
             False,
             ["commerce.vero", "vero_report"],
             vero_report_id,
@@ -2203,7 +2227,7 @@ class API(APIPrivate):
             commerce_vero.VeroReportItemsApi,
             commerce_vero.ApiClient,
             "get_vero_report_items",
-            CommerceVeroException,
+            commerce_vero.rest.ApiException,
             False,
             ["commerce.vero", "vero_report_items"],
             None,
@@ -2225,7 +2249,7 @@ class API(APIPrivate):
             developer_analytics.RateLimitApi,
             developer_analytics.ApiClient,
             "get_rate_limits",
-            DeveloperAnalyticsException,
+            developer_analytics.rest.ApiException,
             False,
             ["developer.analytics", "rate_limit"],
             None,
@@ -2247,7 +2271,7 @@ class API(APIPrivate):
             developer_analytics.UserRateLimitApi,
             developer_analytics.ApiClient,
             "get_user_rate_limits",
-            DeveloperAnalyticsException,
+            developer_analytics.rest.ApiException,
             True,
             ["developer.analytics", "user_rate_limit"],
             None,
@@ -2271,7 +2295,7 @@ class API(APIPrivate):
             developer_client_registration.RegisterApi,
             developer_client_registration.ApiClient,
             "register_client",
-            DeveloperClientRegistrationException,
+            developer_client_registration.rest.ApiException,
             False,
             ["developer.client.registration", "register"],
             (body, content_type),
@@ -2295,7 +2319,7 @@ class API(APIPrivate):
             developer_key_management.SigningKeyApi,
             developer_key_management.ApiClient,
             "create_signing_key",
-            DeveloperKeyManagementException,
+            developer_key_management.rest.ApiException,
             False,
             ["developer.key.management", "signing_key"],
             content_type,
@@ -2318,7 +2342,7 @@ class API(APIPrivate):
             developer_key_management.SigningKeyApi,
             developer_key_management.ApiClient,
             "get_signing_key",
-            DeveloperKeyManagementException,
+            developer_key_management.rest.ApiException,
             False,
             ["developer.key.management", "signing_key"],
             signing_key_id,
@@ -2338,7 +2362,7 @@ class API(APIPrivate):
             developer_key_management.SigningKeyApi,
             developer_key_management.ApiClient,
             "get_signing_keys",
-            DeveloperKeyManagementException,
+            developer_key_management.rest.ApiException,
             False,
             ["developer.key.management", "signing_key"],
             None,
@@ -2358,7 +2382,7 @@ class API(APIPrivate):
             sell_account.PayoutSettingsApi,
             sell_account.ApiClient,
             "get_payout_settings",
-            SellAccountException,
+            sell_account.rest.ApiException,
             True,
             ["sell.account", "payout_settings"],
             None,
@@ -2382,7 +2406,7 @@ class API(APIPrivate):
             sell_account.PayoutSettingsApi,
             sell_account.ApiClient,
             "update_payout_percentage",
-            SellAccountException,
+            sell_account.rest.ApiException,
             True,
             ["sell.account", "payout_settings"],
             content_type,
@@ -2403,7 +2427,7 @@ class API(APIPrivate):
             sell_account.RateTableApi,
             sell_account.ApiClient,
             "get_rate_table",
-            SellAccountException,
+            sell_account.rest.ApiException,
             True,
             ["sell.account", "rate_table"],
             rate_table_id,
@@ -2428,7 +2452,7 @@ class API(APIPrivate):
             sell_account.RateTableApi,
             sell_account.ApiClient,
             "update_shipping_cost",
-            SellAccountException,
+            sell_account.rest.ApiException,
             True,
             ["sell.account", "rate_table"],
             (content_type, rate_table_id),
@@ -2457,7 +2481,7 @@ class API(APIPrivate):
             sell_analytics.CustomerServiceMetricApi,
             sell_analytics.ApiClient,
             "get_customer_service_metric",
-            SellAnalyticsException,
+            sell_analytics.rest.ApiException,
             True,
             ["sell.analytics", "customer_service_metric"],
             (customer_service_metric_type, evaluation_marketplace_id, evaluation_type),
@@ -2477,7 +2501,7 @@ class API(APIPrivate):
             sell_analytics.SellerStandardsProfileApi,
             sell_analytics.ApiClient,
             "find_seller_standards_profiles",
-            SellAnalyticsException,
+            sell_analytics.rest.ApiException,
             True,
             ["sell.analytics", "seller_standards_profile"],
             None,
@@ -2501,7 +2525,7 @@ class API(APIPrivate):
             sell_analytics.SellerStandardsProfileApi,
             sell_analytics.ApiClient,
             "get_seller_standards_profile",
-            SellAnalyticsException,
+            sell_analytics.rest.ApiException,
             True,
             ["sell.analytics", "seller_standards_profile"],
             (cycle, program),
@@ -2525,7 +2549,7 @@ class API(APIPrivate):
             sell_analytics.TrafficReportApi,
             sell_analytics.ApiClient,
             "get_traffic_report",
-            SellAnalyticsException,
+            sell_analytics.rest.ApiException,
             True,
             ["sell.analytics", "traffic_report"],
             None,
@@ -2553,7 +2577,7 @@ class API(APIPrivate):
             sell_compliance.ListingViolationApi,
             sell_compliance.ApiClient,
             "get_listing_violations",
-            SellComplianceException,
+            sell_compliance.rest.ApiException,
             True,
             ["sell.compliance", "listing_violation"],
             (x_ebay_c_marketplace_id, compliance_type),
@@ -2577,7 +2601,7 @@ class API(APIPrivate):
             sell_compliance.ListingViolationSummaryApi,
             sell_compliance.ApiClient,
             "get_listing_violations_summary",
-            SellComplianceException,
+            sell_compliance.rest.ApiException,
             True,
             ["sell.compliance", "listing_violation_summary"],
             x_ebay_c_marketplace_id,
@@ -2602,7 +2626,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.ActualCostsApi,
             sell_edelivery_international_shipping.ApiClient,
             "get_actual_costs",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "actual_costs"],
             None,
@@ -2625,7 +2649,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.AddressPreferenceApi,
             sell_edelivery_international_shipping.ApiClient,
             "create_address_preference",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "address_preference"],
             None,
@@ -2647,7 +2671,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.AddressPreferenceApi,
             sell_edelivery_international_shipping.ApiClient,
             "get_address_preferences",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "address_preference"],
             None,
@@ -2669,7 +2693,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.AgentsApi,
             sell_edelivery_international_shipping.ApiClient,
             "get_agents",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "agents"],
             None,
@@ -2693,7 +2717,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.BatteryQualificationsApi,
             sell_edelivery_international_shipping.ApiClient,
             "get_battery_qualifications",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "battery_qualifications"],
             None,
@@ -2716,7 +2740,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.BundleApi,
             sell_edelivery_international_shipping.ApiClient,
             "cancel_bundle",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "bundle"],
             bundle_id,
@@ -2739,7 +2763,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.BundleApi,
             sell_edelivery_international_shipping.ApiClient,
             "create_bundle",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "bundle"],
             None,
@@ -2762,7 +2786,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.BundleApi,
             sell_edelivery_international_shipping.ApiClient,
             "get_bundle",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "bundle"],
             bundle_id,
@@ -2785,7 +2809,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.BundleApi,
             sell_edelivery_international_shipping.ApiClient,
             "get_bundle_label",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "bundle"],
             bundle_id,
@@ -2808,7 +2832,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.ComplaintApi,
             sell_edelivery_international_shipping.ApiClient,
             "create_complaint",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "complaint"],
             None,
@@ -2831,7 +2855,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.ConsignPreferenceApi,
             sell_edelivery_international_shipping.ApiClient,
             "create_consign_preference",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "consign_preference"],
             None,
@@ -2853,7 +2877,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.ConsignPreferenceApi,
             sell_edelivery_international_shipping.ApiClient,
             "get_consign_preferences",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "consign_preference"],
             None,
@@ -2877,7 +2901,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.DropoffSitesApi,
             sell_edelivery_international_shipping.ApiClient,
             "get_dropoff_sites",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "dropoff_sites"],
             None,
@@ -2900,7 +2924,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.HandoverSheetApi,
             sell_edelivery_international_shipping.ApiClient,
             "get_handover_sheet",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "handover_sheet"],
             tracking_numbers,
@@ -2925,7 +2949,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.LabelsApi,
             sell_edelivery_international_shipping.ApiClient,
             "get_labels",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "labels"],
             tracking_numbers,
@@ -2948,7 +2972,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.PackageApi,
             sell_edelivery_international_shipping.ApiClient,
             "bulk_cancel_packages",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "package"],
             None,
@@ -2971,7 +2995,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.PackageApi,
             sell_edelivery_international_shipping.ApiClient,
             "bulk_confirm_packages",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "package"],
             None,
@@ -2994,7 +3018,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.PackageApi,
             sell_edelivery_international_shipping.ApiClient,
             "bulk_delete_packages",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "package"],
             None,
@@ -3017,7 +3041,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.PackageApi,
             sell_edelivery_international_shipping.ApiClient,
             "cancel_package",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "package"],
             package_id,
@@ -3040,7 +3064,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.PackageApi,
             sell_edelivery_international_shipping.ApiClient,
             "clone_package",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "package"],
             package_id,
@@ -3063,7 +3087,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.PackageApi,
             sell_edelivery_international_shipping.ApiClient,
             "confirm_package",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "package"],
             package_id,
@@ -3086,7 +3110,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.PackageApi,
             sell_edelivery_international_shipping.ApiClient,
             "create_package",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "package"],
             None,
@@ -3109,7 +3133,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.PackageApi,
             sell_edelivery_international_shipping.ApiClient,
             "delete_package",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "package"],
             package_id,
@@ -3132,7 +3156,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.PackageApi,
             sell_edelivery_international_shipping.ApiClient,
             "get_package",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "package"],
             package_id,
@@ -3155,7 +3179,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.PackageApi,
             sell_edelivery_international_shipping.ApiClient,
             "get_packages_by_line_item_id",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "package"],
             order_line_item_id,
@@ -3179,7 +3203,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.ServicesApi,
             sell_edelivery_international_shipping.ApiClient,
             "get_services",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "services"],
             None,
@@ -3202,7 +3226,7 @@ class API(APIPrivate):
             sell_edelivery_international_shipping.TrackingApi,
             sell_edelivery_international_shipping.ApiClient,
             "get_tracking",
-            SellEdeliveryInternationalShippingException,
+            sell_edelivery_international_shipping.rest.ApiException,
             False,
             ["sell.edelivery.international.shipping", "tracking"],
             tracking_number,
@@ -3227,7 +3251,7 @@ class API(APIPrivate):
             sell_feed.CustomerServiceMetricTaskApi,
             sell_feed.ApiClient,
             "create_customer_service_metric_task",
-            SellFeedException,
+            sell_feed.rest.ApiException,
             True,
             ["sell.feed", "customer_service_metric_task"],
             (body, accept_language, content_type),
@@ -3250,7 +3274,7 @@ class API(APIPrivate):
             sell_feed.CustomerServiceMetricTaskApi,
             sell_feed.ApiClient,
             "get_customer_service_metric_task",
-            SellFeedException,
+            sell_feed.rest.ApiException,
             True,
             ["sell.feed", "customer_service_metric_task"],
             task_id,
@@ -3275,7 +3299,7 @@ class API(APIPrivate):
             sell_feed.CustomerServiceMetricTaskApi,
             sell_feed.ApiClient,
             "get_customer_service_metric_tasks",
-            SellFeedException,
+            sell_feed.rest.ApiException,
             True,
             ["sell.feed", "customer_service_metric_task"],
             None,
@@ -3299,7 +3323,7 @@ class API(APIPrivate):
             sell_feed.InventoryTaskApi,
             sell_feed.ApiClient,
             "create_inventory_task",
-            SellFeedException,
+            sell_feed.rest.ApiException,
             True,
             ["sell.feed", "inventory_task"],
             (body, content_type),
@@ -3320,7 +3344,7 @@ class API(APIPrivate):
             sell_feed.InventoryTaskApi,
             sell_feed.ApiClient,
             "get_inventory_task",
-            SellFeedException,
+            sell_feed.rest.ApiException,
             True,
             ["sell.feed", "inventory_task"],
             task_id,
@@ -3346,7 +3370,7 @@ class API(APIPrivate):
             sell_feed.InventoryTaskApi,
             sell_feed.ApiClient,
             "get_inventory_tasks",
-            SellFeedException,
+            sell_feed.rest.ApiException,
             True,
             ["sell.feed", "inventory_task"],
             None,
@@ -3368,7 +3392,7 @@ class API(APIPrivate):
             sell_feed.OrderTaskApi,
             sell_feed.ApiClient,
             "create_order_task",
-            SellFeedException,
+            sell_feed.rest.ApiException,
             True,
             ["sell.feed", "order_task"],
             (body, content_type),
@@ -3389,7 +3413,7 @@ class API(APIPrivate):
             sell_feed.OrderTaskApi,
             sell_feed.ApiClient,
             "get_order_task",
-            SellFeedException,
+            sell_feed.rest.ApiException,
             True,
             ["sell.feed", "order_task"],
             task_id,
@@ -3415,7 +3439,7 @@ class API(APIPrivate):
             sell_feed.OrderTaskApi,
             sell_feed.ApiClient,
             "get_order_tasks",
-            SellFeedException,
+            sell_feed.rest.ApiException,
             True,
             ["sell.feed", "order_task"],
             None,
@@ -3437,7 +3461,7 @@ class API(APIPrivate):
             sell_feed.ScheduleApi,
             sell_feed.ApiClient,
             "create_schedule",
-            SellFeedException,
+            sell_feed.rest.ApiException,
             True,
             ["sell.feed", "schedule"],
             (body, content_type),
@@ -3458,7 +3482,7 @@ class API(APIPrivate):
             sell_feed.ScheduleApi,
             sell_feed.ApiClient,
             "delete_schedule",
-            SellFeedException,
+            sell_feed.rest.ApiException,
             True,
             ["sell.feed", "schedule"],
             schedule_id,
@@ -3479,7 +3503,7 @@ class API(APIPrivate):
             sell_feed.ScheduleApi,
             sell_feed.ApiClient,
             "get_latest_result_file",
-            SellFeedException,
+            sell_feed.rest.ApiException,
             True,
             ["sell.feed", "schedule"],
             schedule_id,
@@ -3500,7 +3524,7 @@ class API(APIPrivate):
             sell_feed.ScheduleApi,
             sell_feed.ApiClient,
             "get_schedule",
-            SellFeedException,
+            sell_feed.rest.ApiException,
             True,
             ["sell.feed", "schedule"],
             schedule_id,
@@ -3523,7 +3547,7 @@ class API(APIPrivate):
             sell_feed.ScheduleApi,
             sell_feed.ApiClient,
             "get_schedule_template",
-            SellFeedException,
+            sell_feed.rest.ApiException,
             True,
             ["sell.feed", "schedule"],
             schedule_template_id,
@@ -3546,7 +3570,7 @@ class API(APIPrivate):
             sell_feed.ScheduleApi,
             sell_feed.ApiClient,
             "get_schedule_templates",
-            SellFeedException,
+            sell_feed.rest.ApiException,
             True,
             ["sell.feed", "schedule"],
             feed_type,
@@ -3569,7 +3593,7 @@ class API(APIPrivate):
             sell_feed.ScheduleApi,
             sell_feed.ApiClient,
             "get_schedules",
-            SellFeedException,
+            sell_feed.rest.ApiException,
             True,
             ["sell.feed", "schedule"],
             feed_type,
@@ -3594,7 +3618,7 @@ class API(APIPrivate):
             sell_feed.ScheduleApi,
             sell_feed.ApiClient,
             "update_schedule",
-            SellFeedException,
+            sell_feed.rest.ApiException,
             True,
             ["sell.feed", "schedule"],
             (body, content_type, schedule_id),
@@ -3620,7 +3644,7 @@ class API(APIPrivate):
             sell_feed.TaskApi,
             sell_feed.ApiClient,
             "create_task",
-            SellFeedException,
+            sell_feed.rest.ApiException,
             True,
             ["sell.feed", "task"],
             (body, x_ebay_c_marketplace_id, content_type),
@@ -3641,7 +3665,7 @@ class API(APIPrivate):
             sell_feed.TaskApi,
             sell_feed.ApiClient,
             "get_input_file",
-            SellFeedException,
+            sell_feed.rest.ApiException,
             True,
             ["sell.feed", "task"],
             task_id,
@@ -3662,7 +3686,7 @@ class API(APIPrivate):
             sell_feed.TaskApi,
             sell_feed.ApiClient,
             "get_result_file",
-            SellFeedException,
+            sell_feed.rest.ApiException,
             True,
             ["sell.feed", "task"],
             task_id,
@@ -3683,7 +3707,7 @@ class API(APIPrivate):
             sell_feed.TaskApi,
             sell_feed.ApiClient,
             "get_task",
-            SellFeedException,
+            sell_feed.rest.ApiException,
             True,
             ["sell.feed", "task"],
             task_id,
@@ -3709,7 +3733,7 @@ class API(APIPrivate):
             sell_feed.TaskApi,
             sell_feed.ApiClient,
             "get_tasks",
-            SellFeedException,
+            sell_feed.rest.ApiException,
             True,
             ["sell.feed", "task"],
             None,
@@ -3732,7 +3756,7 @@ class API(APIPrivate):
             sell_feed.TaskApi,
             sell_feed.ApiClient,
             "upload_file",
-            SellFeedException,
+            sell_feed.rest.ApiException,
             True,
             ["sell.feed", "task"],
             (task_id, content_type),
@@ -3757,7 +3781,7 @@ class API(APIPrivate):
             sell_finances.BillingActivityApi,
             sell_finances.ApiClient,
             "get_billing_activities",
-            SellFinancesException,
+            sell_finances.rest.ApiException,
             True,
             ["sell.finances", "billing_activity"],
             None,
@@ -3781,7 +3805,7 @@ class API(APIPrivate):
             sell_finances.PayoutApi,
             sell_finances.ApiClient,
             "get_payout",
-            SellFinancesException,
+            sell_finances.rest.ApiException,
             True,
             ["sell.finances", "payout"],
             (x_ebay_c_marketplace_id, payout_id),
@@ -3805,7 +3829,7 @@ class API(APIPrivate):
             sell_finances.PayoutApi,
             sell_finances.ApiClient,
             "get_payout_summary",
-            SellFinancesException,
+            sell_finances.rest.ApiException,
             True,
             ["sell.finances", "payout"],
             x_ebay_c_marketplace_id,
@@ -3832,7 +3856,7 @@ class API(APIPrivate):
             sell_finances.PayoutApi,
             sell_finances.ApiClient,
             "get_payouts",
-            SellFinancesException,
+            sell_finances.rest.ApiException,
             True,
             ["sell.finances", "payout"],
             x_ebay_c_marketplace_id,
@@ -3855,7 +3879,7 @@ class API(APIPrivate):
             sell_finances.SellerFundsSummaryApi,
             sell_finances.ApiClient,
             "get_seller_funds_summary",
-            SellFinancesException,
+            sell_finances.rest.ApiException,
             True,
             ["sell.finances", "seller_funds_summary"],
             x_ebay_c_marketplace_id,
@@ -3879,7 +3903,7 @@ class API(APIPrivate):
             sell_finances.TransactionApi,
             sell_finances.ApiClient,
             "get_transaction_summary",
-            SellFinancesException,
+            sell_finances.rest.ApiException,
             True,
             ["sell.finances", "transaction"],
             x_ebay_c_marketplace_id,
@@ -3906,7 +3930,7 @@ class API(APIPrivate):
             sell_finances.TransactionApi,
             sell_finances.ApiClient,
             "get_transactions",
-            SellFinancesException,
+            sell_finances.rest.ApiException,
             True,
             ["sell.finances", "transaction"],
             x_ebay_c_marketplace_id,
@@ -3930,7 +3954,7 @@ class API(APIPrivate):
             sell_finances.TransferApi,
             sell_finances.ApiClient,
             "get_transfer",
-            SellFinancesException,
+            sell_finances.rest.ApiException,
             True,
             ["sell.finances", "transfer"],
             (x_ebay_c_marketplace_id, transfer_id),
@@ -3952,7 +3976,7 @@ class API(APIPrivate):
             sell_fulfillment.OrderApi,
             sell_fulfillment.ApiClient,
             "get_order",
-            SellFulfillmentException,
+            sell_fulfillment.rest.ApiException,
             True,
             ["sell.fulfillment", "order"],
             order_id,
@@ -3977,7 +4001,7 @@ class API(APIPrivate):
             sell_fulfillment.OrderApi,
             sell_fulfillment.ApiClient,
             "get_orders",
-            SellFulfillmentException,
+            sell_fulfillment.rest.ApiException,
             True,
             ["sell.fulfillment", "order"],
             None,
@@ -4001,7 +4025,7 @@ class API(APIPrivate):
             sell_fulfillment.OrderApi,
             sell_fulfillment.ApiClient,
             "issue_refund",
-            SellFulfillmentException,
+            sell_fulfillment.rest.ApiException,
             True,
             ["sell.fulfillment", "order"],
             (content_type, order_id),
@@ -4026,7 +4050,7 @@ class API(APIPrivate):
             sell_fulfillment.PaymentDisputeApi,
             sell_fulfillment.ApiClient,
             "accept_payment_dispute",
-            SellFulfillmentException,
+            sell_fulfillment.rest.ApiException,
             True,
             ["sell.fulfillment", "payment_dispute"],
             (content_type, payment_dispute_id),
@@ -4051,7 +4075,7 @@ class API(APIPrivate):
             sell_fulfillment.PaymentDisputeApi,
             sell_fulfillment.ApiClient,
             "add_evidence",
-            SellFulfillmentException,
+            sell_fulfillment.rest.ApiException,
             True,
             ["sell.fulfillment", "payment_dispute"],
             (content_type, payment_dispute_id),
@@ -4076,7 +4100,7 @@ class API(APIPrivate):
             sell_fulfillment.PaymentDisputeApi,
             sell_fulfillment.ApiClient,
             "contest_payment_dispute",
-            SellFulfillmentException,
+            sell_fulfillment.rest.ApiException,
             True,
             ["sell.fulfillment", "payment_dispute"],
             (content_type, payment_dispute_id),
@@ -4101,7 +4125,7 @@ class API(APIPrivate):
             sell_fulfillment.PaymentDisputeApi,
             sell_fulfillment.ApiClient,
             "fetch_evidence_content",
-            SellFulfillmentException,
+            sell_fulfillment.rest.ApiException,
             True,
             ["sell.fulfillment", "payment_dispute"],
             (payment_dispute_id, evidence_id, file_id),
@@ -4124,7 +4148,7 @@ class API(APIPrivate):
             sell_fulfillment.PaymentDisputeApi,
             sell_fulfillment.ApiClient,
             "get_activities",
-            SellFulfillmentException,
+            sell_fulfillment.rest.ApiException,
             True,
             ["sell.fulfillment", "payment_dispute"],
             payment_dispute_id,
@@ -4147,7 +4171,7 @@ class API(APIPrivate):
             sell_fulfillment.PaymentDisputeApi,
             sell_fulfillment.ApiClient,
             "get_payment_dispute",
-            SellFulfillmentException,
+            sell_fulfillment.rest.ApiException,
             True,
             ["sell.fulfillment", "payment_dispute"],
             payment_dispute_id,
@@ -4174,7 +4198,7 @@ class API(APIPrivate):
             sell_fulfillment.PaymentDisputeApi,
             sell_fulfillment.ApiClient,
             "get_payment_dispute_summaries",
-            SellFulfillmentException,
+            sell_fulfillment.rest.ApiException,
             True,
             ["sell.fulfillment", "payment_dispute"],
             None,
@@ -4199,7 +4223,7 @@ class API(APIPrivate):
             sell_fulfillment.PaymentDisputeApi,
             sell_fulfillment.ApiClient,
             "update_evidence",
-            SellFulfillmentException,
+            sell_fulfillment.rest.ApiException,
             True,
             ["sell.fulfillment", "payment_dispute"],
             (content_type, payment_dispute_id),
@@ -4224,7 +4248,7 @@ class API(APIPrivate):
             sell_fulfillment.PaymentDisputeApi,
             sell_fulfillment.ApiClient,
             "upload_evidence_file",
-            SellFulfillmentException,
+            sell_fulfillment.rest.ApiException,
             True,
             ["sell.fulfillment", "payment_dispute"],
             (payment_dispute_id, content_type),
@@ -4249,7 +4273,7 @@ class API(APIPrivate):
             sell_fulfillment.ShippingFulfillmentApi,
             sell_fulfillment.ApiClient,
             "create_shipping_fulfillment",
-            SellFulfillmentException,
+            sell_fulfillment.rest.ApiException,
             True,
             ["sell.fulfillment", "shipping_fulfillment"],
             (body, content_type, order_id),
@@ -4273,7 +4297,7 @@ class API(APIPrivate):
             sell_fulfillment.ShippingFulfillmentApi,
             sell_fulfillment.ApiClient,
             "get_shipping_fulfillment",
-            SellFulfillmentException,
+            sell_fulfillment.rest.ApiException,
             True,
             ["sell.fulfillment", "shipping_fulfillment"],
             (fulfillment_id, order_id),
@@ -4296,7 +4320,7 @@ class API(APIPrivate):
             sell_fulfillment.ShippingFulfillmentApi,
             sell_fulfillment.ApiClient,
             "get_shipping_fulfillments",
-            SellFulfillmentException,
+            sell_fulfillment.rest.ApiException,
             True,
             ["sell.fulfillment", "shipping_fulfillment"],
             order_id,
@@ -4321,7 +4345,7 @@ class API(APIPrivate):
             sell_inventory.InventoryItemApi,
             sell_inventory.ApiClient,
             "bulk_create_or_replace_inventory_item",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "inventory_item"],
             (body, content_type, content_language),
@@ -4345,7 +4369,7 @@ class API(APIPrivate):
             sell_inventory.InventoryItemApi,
             sell_inventory.ApiClient,
             "bulk_get_inventory_item",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "inventory_item"],
             (body, content_type),
@@ -4369,7 +4393,7 @@ class API(APIPrivate):
             sell_inventory.InventoryItemApi,
             sell_inventory.ApiClient,
             "bulk_update_price_quantity",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "inventory_item"],
             (body, content_type),
@@ -4395,7 +4419,7 @@ class API(APIPrivate):
             sell_inventory.InventoryItemApi,
             sell_inventory.ApiClient,
             "create_or_replace_inventory_item",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "inventory_item"],
             (body, content_language, content_type, sku),
@@ -4416,7 +4440,7 @@ class API(APIPrivate):
             sell_inventory.InventoryItemApi,
             sell_inventory.ApiClient,
             "delete_inventory_item",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "inventory_item"],
             sku,
@@ -4437,7 +4461,7 @@ class API(APIPrivate):
             sell_inventory.InventoryItemApi,
             sell_inventory.ApiClient,
             "get_inventory_item",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "inventory_item"],
             sku,
@@ -4459,7 +4483,7 @@ class API(APIPrivate):
             sell_inventory.InventoryItemApi,
             sell_inventory.ApiClient,
             "get_inventory_items",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "inventory_item"],
             None,
@@ -4485,7 +4509,7 @@ class API(APIPrivate):
             sell_inventory.InventoryItemGroupApi,
             sell_inventory.ApiClient,
             "create_or_replace_inventory_item_group",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "inventory_item_group"],
             (body, content_language, content_type, inventory_item_group_key),
@@ -4508,7 +4532,7 @@ class API(APIPrivate):
             sell_inventory.InventoryItemGroupApi,
             sell_inventory.ApiClient,
             "delete_inventory_item_group",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "inventory_item_group"],
             inventory_item_group_key,
@@ -4531,7 +4555,7 @@ class API(APIPrivate):
             sell_inventory.InventoryItemGroupApi,
             sell_inventory.ApiClient,
             "get_inventory_item_group",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "inventory_item_group"],
             inventory_item_group_key,
@@ -4555,7 +4579,7 @@ class API(APIPrivate):
             sell_inventory.ListingApi,
             sell_inventory.ApiClient,
             "bulk_migrate_listing",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "listing"],
             (body, content_type),
@@ -4581,7 +4605,7 @@ class API(APIPrivate):
             sell_inventory.ListingApi,
             sell_inventory.ApiClient,
             "create_or_replace_sku_location_mapping",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "listing"],
             (body, content_type, listing_id, sku),
@@ -4605,7 +4629,7 @@ class API(APIPrivate):
             sell_inventory.ListingApi,
             sell_inventory.ApiClient,
             "delete_sku_location_mapping",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "listing"],
             (listing_id, sku),
@@ -4629,7 +4653,7 @@ class API(APIPrivate):
             sell_inventory.ListingApi,
             sell_inventory.ApiClient,
             "get_sku_location_mapping",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "listing"],
             (listing_id, sku),
@@ -4654,7 +4678,7 @@ class API(APIPrivate):
             sell_inventory.LocationApi,
             sell_inventory.ApiClient,
             "create_inventory_location",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "location"],
             (body, content_type, merchant_location_key),
@@ -4677,7 +4701,7 @@ class API(APIPrivate):
             sell_inventory.LocationApi,
             sell_inventory.ApiClient,
             "delete_inventory_location",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "location"],
             merchant_location_key,
@@ -4700,7 +4724,7 @@ class API(APIPrivate):
             sell_inventory.LocationApi,
             sell_inventory.ApiClient,
             "disable_inventory_location",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "location"],
             merchant_location_key,
@@ -4723,7 +4747,7 @@ class API(APIPrivate):
             sell_inventory.LocationApi,
             sell_inventory.ApiClient,
             "enable_inventory_location",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "location"],
             merchant_location_key,
@@ -4746,7 +4770,7 @@ class API(APIPrivate):
             sell_inventory.LocationApi,
             sell_inventory.ApiClient,
             "get_inventory_location",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "location"],
             merchant_location_key,
@@ -4768,7 +4792,7 @@ class API(APIPrivate):
             sell_inventory.LocationApi,
             sell_inventory.ApiClient,
             "get_inventory_locations",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "location"],
             None,
@@ -4793,7 +4817,7 @@ class API(APIPrivate):
             sell_inventory.LocationApi,
             sell_inventory.ApiClient,
             "update_inventory_location",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "location"],
             (body, content_type, merchant_location_key),
@@ -4818,7 +4842,7 @@ class API(APIPrivate):
             sell_inventory.OfferApi,
             sell_inventory.ApiClient,
             "bulk_create_offer",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "offer"],
             (body, content_language, content_type),
@@ -4842,7 +4866,7 @@ class API(APIPrivate):
             sell_inventory.OfferApi,
             sell_inventory.ApiClient,
             "bulk_publish_offer",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "offer"],
             (body, content_type),
@@ -4867,7 +4891,7 @@ class API(APIPrivate):
             sell_inventory.OfferApi,
             sell_inventory.ApiClient,
             "create_offer",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "offer"],
             (body, content_language, content_type),
@@ -4888,7 +4912,7 @@ class API(APIPrivate):
             sell_inventory.OfferApi,
             sell_inventory.ApiClient,
             "delete_offer",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "offer"],
             offer_id,
@@ -4910,7 +4934,7 @@ class API(APIPrivate):
             sell_inventory.OfferApi,
             sell_inventory.ApiClient,
             "get_listing_fees",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "offer"],
             content_type,
@@ -4931,7 +4955,7 @@ class API(APIPrivate):
             sell_inventory.OfferApi,
             sell_inventory.ApiClient,
             "get_offer",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "offer"],
             offer_id,
@@ -4956,7 +4980,7 @@ class API(APIPrivate):
             sell_inventory.OfferApi,
             sell_inventory.ApiClient,
             "get_offers",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "offer"],
             None,
@@ -4977,7 +5001,7 @@ class API(APIPrivate):
             sell_inventory.OfferApi,
             sell_inventory.ApiClient,
             "publish_offer",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "offer"],
             offer_id,
@@ -5001,7 +5025,7 @@ class API(APIPrivate):
             sell_inventory.OfferApi,
             sell_inventory.ApiClient,
             "publish_offer_by_inventory_item_group",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "offer"],
             (body, content_type),
@@ -5027,7 +5051,7 @@ class API(APIPrivate):
             sell_inventory.OfferApi,
             sell_inventory.ApiClient,
             "update_offer",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "offer"],
             (body, content_language, content_type, offer_id),
@@ -5048,7 +5072,7 @@ class API(APIPrivate):
             sell_inventory.OfferApi,
             sell_inventory.ApiClient,
             "withdraw_offer",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "offer"],
             offer_id,
@@ -5072,7 +5096,7 @@ class API(APIPrivate):
             sell_inventory.OfferApi,
             sell_inventory.ApiClient,
             "withdraw_offer_by_inventory_item_group",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "offer"],
             (body, content_type),
@@ -5098,7 +5122,7 @@ class API(APIPrivate):
             sell_inventory.ProductCompatibilityApi,
             sell_inventory.ApiClient,
             "create_or_replace_product_compatibility",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "product_compatibility"],
             (body, content_language, content_type, sku),
@@ -5119,7 +5143,7 @@ class API(APIPrivate):
             sell_inventory.ProductCompatibilityApi,
             sell_inventory.ApiClient,
             "delete_product_compatibility",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "product_compatibility"],
             sku,
@@ -5140,7 +5164,7 @@ class API(APIPrivate):
             sell_inventory.ProductCompatibilityApi,
             sell_inventory.ApiClient,
             "get_product_compatibility",
-            SellInventoryException,
+            sell_inventory.rest.ApiException,
             True,
             ["sell.inventory", "product_compatibility"],
             sku,
@@ -5166,7 +5190,7 @@ class API(APIPrivate):
             sell_leads.ClassifiedLeadApi,
             sell_leads.ApiClient,
             "get_all_classified_leads",
-            SellLeadsException,
+            sell_leads.rest.ApiException,
             False,
             ["sell.leads", "classified_lead"],
             content_type,
@@ -5195,7 +5219,7 @@ class API(APIPrivate):
             sell_leads.ClassifiedLeadApi,
             sell_leads.ApiClient,
             "get_classified_leads_by_item_id",
-            SellLeadsException,
+            sell_leads.rest.ApiException,
             False,
             ["sell.leads", "classified_lead"],
             (item_id, content_type),
@@ -5216,7 +5240,7 @@ class API(APIPrivate):
             sell_logistics.ShipmentApi,
             sell_logistics.ApiClient,
             "cancel_shipment",
-            SellLogisticsException,
+            sell_logistics.rest.ApiException,
             True,
             ["sell.logistics", "shipment"],
             shipment_id,
@@ -5241,7 +5265,7 @@ class API(APIPrivate):
             sell_logistics.ShipmentApi,
             sell_logistics.ApiClient,
             "create_from_shipping_quote",
-            SellLogisticsException,
+            sell_logistics.rest.ApiException,
             True,
             ["sell.logistics", "shipment"],
             (body, content_type, x_ebay_c_marketplace_id),
@@ -5265,7 +5289,7 @@ class API(APIPrivate):
             sell_logistics.ShipmentApi,
             sell_logistics.ApiClient,
             "download_label_file",
-            SellLogisticsException,
+            sell_logistics.rest.ApiException,
             True,
             ["sell.logistics", "shipment"],
             (shipment_id, accept),
@@ -5286,7 +5310,7 @@ class API(APIPrivate):
             sell_logistics.ShipmentApi,
             sell_logistics.ApiClient,
             "get_shipment",
-            SellLogisticsException,
+            sell_logistics.rest.ApiException,
             True,
             ["sell.logistics", "shipment"],
             shipment_id,
@@ -5311,7 +5335,7 @@ class API(APIPrivate):
             sell_logistics.ShippingQuoteApi,
             sell_logistics.ApiClient,
             "create_shipping_quote",
-            SellLogisticsException,
+            sell_logistics.rest.ApiException,
             True,
             ["sell.logistics", "shipping_quote"],
             (body, x_ebay_c_marketplace_id, content_type),
@@ -5334,7 +5358,7 @@ class API(APIPrivate):
             sell_logistics.ShippingQuoteApi,
             sell_logistics.ApiClient,
             "get_shipping_quote",
-            SellLogisticsException,
+            sell_logistics.rest.ApiException,
             True,
             ["sell.logistics", "shipping_quote"],
             shipping_quote_id,
@@ -5359,7 +5383,7 @@ class API(APIPrivate):
             sell_marketing.AdApi,
             sell_marketing.ApiClient,
             "bulk_create_ads_by_inventory_reference",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad"],
             (body, content_type, campaign_id),
@@ -5384,7 +5408,7 @@ class API(APIPrivate):
             sell_marketing.AdApi,
             sell_marketing.ApiClient,
             "bulk_create_ads_by_listing_id",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad"],
             (body, content_type, campaign_id),
@@ -5409,7 +5433,7 @@ class API(APIPrivate):
             sell_marketing.AdApi,
             sell_marketing.ApiClient,
             "bulk_delete_ads_by_inventory_reference",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad"],
             (body, content_type, campaign_id),
@@ -5434,7 +5458,7 @@ class API(APIPrivate):
             sell_marketing.AdApi,
             sell_marketing.ApiClient,
             "bulk_delete_ads_by_listing_id",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad"],
             (body, content_type, campaign_id),
@@ -5459,7 +5483,7 @@ class API(APIPrivate):
             sell_marketing.AdApi,
             sell_marketing.ApiClient,
             "bulk_update_ads_bid_by_inventory_reference",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad"],
             (body, content_type, campaign_id),
@@ -5484,7 +5508,7 @@ class API(APIPrivate):
             sell_marketing.AdApi,
             sell_marketing.ApiClient,
             "bulk_update_ads_bid_by_listing_id",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad"],
             (body, content_type, campaign_id),
@@ -5509,7 +5533,7 @@ class API(APIPrivate):
             sell_marketing.AdApi,
             sell_marketing.ApiClient,
             "bulk_update_ads_status",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad"],
             (body, content_type, campaign_id),
@@ -5534,7 +5558,7 @@ class API(APIPrivate):
             sell_marketing.AdApi,
             sell_marketing.ApiClient,
             "bulk_update_ads_status_by_listing_id",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad"],
             (body, content_type, campaign_id),
@@ -5559,7 +5583,7 @@ class API(APIPrivate):
             sell_marketing.AdApi,
             sell_marketing.ApiClient,
             "create_ad_by_listing_id",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad"],
             (body, content_type, campaign_id),
@@ -5584,7 +5608,7 @@ class API(APIPrivate):
             sell_marketing.AdApi,
             sell_marketing.ApiClient,
             "create_ads_by_inventory_reference",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad"],
             (body, content_type, campaign_id),
@@ -5606,7 +5630,7 @@ class API(APIPrivate):
             sell_marketing.AdApi,
             sell_marketing.ApiClient,
             "delete_ad",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad"],
             (ad_id, campaign_id),
@@ -5631,7 +5655,7 @@ class API(APIPrivate):
             sell_marketing.AdApi,
             sell_marketing.ApiClient,
             "delete_ads_by_inventory_reference",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad"],
             (body, content_type, campaign_id),
@@ -5653,7 +5677,7 @@ class API(APIPrivate):
             sell_marketing.AdApi,
             sell_marketing.ApiClient,
             "get_ad",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad"],
             (ad_id, campaign_id),
@@ -5679,7 +5703,7 @@ class API(APIPrivate):
             sell_marketing.AdApi,
             sell_marketing.ApiClient,
             "get_ads",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad"],
             campaign_id,
@@ -5704,7 +5728,7 @@ class API(APIPrivate):
             sell_marketing.AdApi,
             sell_marketing.ApiClient,
             "get_ads_by_inventory_reference",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad"],
             (campaign_id, inventory_reference_id, inventory_reference_type),
@@ -5730,7 +5754,7 @@ class API(APIPrivate):
             sell_marketing.AdApi,
             sell_marketing.ApiClient,
             "update_bid",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad"],
             (body, content_type, ad_id, campaign_id),
@@ -5755,7 +5779,7 @@ class API(APIPrivate):
             sell_marketing.AdGroupApi,
             sell_marketing.ApiClient,
             "create_ad_group",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad_group"],
             (body, content_type, campaign_id),
@@ -5779,7 +5803,7 @@ class API(APIPrivate):
             sell_marketing.AdGroupApi,
             sell_marketing.ApiClient,
             "get_ad_group",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad_group"],
             (ad_group_id, campaign_id),
@@ -5803,7 +5827,7 @@ class API(APIPrivate):
             sell_marketing.AdGroupApi,
             sell_marketing.ApiClient,
             "get_ad_groups",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad_group"],
             campaign_id,
@@ -5829,7 +5853,7 @@ class API(APIPrivate):
             sell_marketing.AdGroupApi,
             sell_marketing.ApiClient,
             "suggest_bids",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad_group"],
             (body, content_type, ad_group_id, campaign_id),
@@ -5855,7 +5879,7 @@ class API(APIPrivate):
             sell_marketing.AdGroupApi,
             sell_marketing.ApiClient,
             "suggest_keywords",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad_group"],
             (content_type, ad_group_id, campaign_id),
@@ -5881,7 +5905,7 @@ class API(APIPrivate):
             sell_marketing.AdGroupApi,
             sell_marketing.ApiClient,
             "update_ad_group",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad_group"],
             (body, content_type, ad_group_id, campaign_id),
@@ -5902,7 +5926,7 @@ class API(APIPrivate):
             sell_marketing.AdReportApi,
             sell_marketing.ApiClient,
             "get_report",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad_report"],
             report_id,
@@ -5924,7 +5948,7 @@ class API(APIPrivate):
             sell_marketing.AdReportMetadataApi,
             sell_marketing.ApiClient,
             "get_report_metadata",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             False,
             ["sell.marketing", "ad_report_metadata"],
             None,
@@ -5949,7 +5973,7 @@ class API(APIPrivate):
             sell_marketing.AdReportMetadataApi,
             sell_marketing.ApiClient,
             "get_report_metadata_for_report_type",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             False,
             ["sell.marketing", "ad_report_metadata"],
             report_type,
@@ -5973,7 +5997,7 @@ class API(APIPrivate):
             sell_marketing.AdReportTaskApi,
             sell_marketing.ApiClient,
             "create_report_task",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad_report_task"],
             (body, content_type),
@@ -5994,7 +6018,7 @@ class API(APIPrivate):
             sell_marketing.AdReportTaskApi,
             sell_marketing.ApiClient,
             "delete_report_task",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad_report_task"],
             report_task_id,
@@ -6015,7 +6039,7 @@ class API(APIPrivate):
             sell_marketing.AdReportTaskApi,
             sell_marketing.ApiClient,
             "get_report_task",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad_report_task"],
             report_task_id,
@@ -6038,7 +6062,7 @@ class API(APIPrivate):
             sell_marketing.AdReportTaskApi,
             sell_marketing.ApiClient,
             "get_report_tasks",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "ad_report_task"],
             None,
@@ -6063,7 +6087,7 @@ class API(APIPrivate):
             sell_marketing.CampaignApi,
             sell_marketing.ApiClient,
             "clone_campaign",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "campaign"],
             (body, content_type, campaign_id),
@@ -6087,7 +6111,7 @@ class API(APIPrivate):
             sell_marketing.CampaignApi,
             sell_marketing.ApiClient,
             "create_campaign",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "campaign"],
             (body, content_type),
@@ -6108,7 +6132,7 @@ class API(APIPrivate):
             sell_marketing.CampaignApi,
             sell_marketing.ApiClient,
             "delete_campaign",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "campaign"],
             campaign_id,
@@ -6129,7 +6153,7 @@ class API(APIPrivate):
             sell_marketing.CampaignApi,
             sell_marketing.ApiClient,
             "end_campaign",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "campaign"],
             campaign_id,
@@ -6152,7 +6176,7 @@ class API(APIPrivate):
             sell_marketing.CampaignApi,
             sell_marketing.ApiClient,
             "find_campaign_by_ad_reference",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "campaign"],
             None,
@@ -6173,7 +6197,7 @@ class API(APIPrivate):
             sell_marketing.CampaignApi,
             sell_marketing.ApiClient,
             "get_campaign",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "campaign"],
             campaign_id,
@@ -6196,7 +6220,7 @@ class API(APIPrivate):
             sell_marketing.CampaignApi,
             sell_marketing.ApiClient,
             "get_campaign_by_name",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "campaign"],
             campaign_name,
@@ -6225,7 +6249,7 @@ class API(APIPrivate):
             sell_marketing.CampaignApi,
             sell_marketing.ApiClient,
             "get_campaigns",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "campaign"],
             None,
@@ -6246,7 +6270,7 @@ class API(APIPrivate):
             sell_marketing.CampaignApi,
             sell_marketing.ApiClient,
             "launch_campaign",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "campaign"],
             campaign_id,
@@ -6267,7 +6291,7 @@ class API(APIPrivate):
             sell_marketing.CampaignApi,
             sell_marketing.ApiClient,
             "pause_campaign",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "campaign"],
             campaign_id,
@@ -6288,7 +6312,7 @@ class API(APIPrivate):
             sell_marketing.CampaignApi,
             sell_marketing.ApiClient,
             "resume_campaign",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "campaign"],
             campaign_id,
@@ -6312,7 +6336,7 @@ class API(APIPrivate):
             sell_marketing.CampaignApi,
             sell_marketing.ApiClient,
             "setup_quick_campaign",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "campaign"],
             (body, content_type),
@@ -6335,7 +6359,7 @@ class API(APIPrivate):
             sell_marketing.CampaignApi,
             sell_marketing.ApiClient,
             "suggest_budget",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "campaign"],
             x_ebay_c_marketplace_id,
@@ -6359,7 +6383,7 @@ class API(APIPrivate):
             sell_marketing.CampaignApi,
             sell_marketing.ApiClient,
             "suggest_items",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "campaign"],
             campaign_id,
@@ -6383,7 +6407,7 @@ class API(APIPrivate):
             sell_marketing.CampaignApi,
             sell_marketing.ApiClient,
             "suggest_max_cpc",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "campaign"],
             (body, content_type),
@@ -6408,7 +6432,7 @@ class API(APIPrivate):
             sell_marketing.CampaignApi,
             sell_marketing.ApiClient,
             "update_ad_rate_strategy",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "campaign"],
             (body, content_type, campaign_id),
@@ -6433,7 +6457,7 @@ class API(APIPrivate):
             sell_marketing.CampaignApi,
             sell_marketing.ApiClient,
             "update_bidding_strategy",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "campaign"],
             (body, content_type, campaign_id),
@@ -6458,7 +6482,7 @@ class API(APIPrivate):
             sell_marketing.CampaignApi,
             sell_marketing.ApiClient,
             "update_campaign_budget",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "campaign"],
             (body, content_type, campaign_id),
@@ -6483,7 +6507,7 @@ class API(APIPrivate):
             sell_marketing.CampaignApi,
             sell_marketing.ApiClient,
             "update_campaign_identification",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "campaign"],
             (body, content_type, campaign_id),
@@ -6508,7 +6532,7 @@ class API(APIPrivate):
             sell_marketing.EmailCampaignApi,
             sell_marketing.ApiClient,
             "create_email_campaign",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "email_campaign"],
             (body, x_ebay_c_marketplace_id, content_type),
@@ -6531,7 +6555,7 @@ class API(APIPrivate):
             sell_marketing.EmailCampaignApi,
             sell_marketing.ApiClient,
             "delete_email_campaign",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "email_campaign"],
             email_campaign_id,
@@ -6554,7 +6578,7 @@ class API(APIPrivate):
             sell_marketing.EmailCampaignApi,
             sell_marketing.ApiClient,
             "get_audiences",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "email_campaign"],
             email_campaign_type,
@@ -6577,7 +6601,7 @@ class API(APIPrivate):
             sell_marketing.EmailCampaignApi,
             sell_marketing.ApiClient,
             "get_email_campaign",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "email_campaign"],
             email_campaign_id,
@@ -6601,7 +6625,7 @@ class API(APIPrivate):
             sell_marketing.EmailCampaignApi,
             sell_marketing.ApiClient,
             "get_email_campaigns",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "email_campaign"],
             None,
@@ -6624,7 +6648,7 @@ class API(APIPrivate):
             sell_marketing.EmailCampaignApi,
             sell_marketing.ApiClient,
             "get_email_preview",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "email_campaign"],
             email_campaign_id,
@@ -6648,7 +6672,7 @@ class API(APIPrivate):
             sell_marketing.EmailCampaignApi,
             sell_marketing.ApiClient,
             "get_email_report",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "email_campaign"],
             (end_date, start_date),
@@ -6673,7 +6697,7 @@ class API(APIPrivate):
             sell_marketing.EmailCampaignApi,
             sell_marketing.ApiClient,
             "update_email_campaign",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "email_campaign"],
             (body, content_type, email_campaign_id),
@@ -6697,7 +6721,7 @@ class API(APIPrivate):
             sell_marketing.ItemPriceMarkdownApi,
             sell_marketing.ApiClient,
             "create_item_price_markdown_promotion",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "item_price_markdown"],
             content_type,
@@ -6720,7 +6744,7 @@ class API(APIPrivate):
             sell_marketing.ItemPriceMarkdownApi,
             sell_marketing.ApiClient,
             "delete_item_price_markdown_promotion",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "item_price_markdown"],
             promotion_id,
@@ -6743,7 +6767,7 @@ class API(APIPrivate):
             sell_marketing.ItemPriceMarkdownApi,
             sell_marketing.ApiClient,
             "get_item_price_markdown_promotion",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "item_price_markdown"],
             promotion_id,
@@ -6768,7 +6792,7 @@ class API(APIPrivate):
             sell_marketing.ItemPriceMarkdownApi,
             sell_marketing.ApiClient,
             "update_item_price_markdown_promotion",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "item_price_markdown"],
             (content_type, promotion_id),
@@ -6792,7 +6816,7 @@ class API(APIPrivate):
             sell_marketing.ItemPromotionApi,
             sell_marketing.ApiClient,
             "create_item_promotion",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "item_promotion"],
             content_type,
@@ -6815,7 +6839,7 @@ class API(APIPrivate):
             sell_marketing.ItemPromotionApi,
             sell_marketing.ApiClient,
             "delete_item_promotion",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "item_promotion"],
             promotion_id,
@@ -6836,7 +6860,7 @@ class API(APIPrivate):
             sell_marketing.ItemPromotionApi,
             sell_marketing.ApiClient,
             "get_item_promotion",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "item_promotion"],
             promotion_id,
@@ -6861,7 +6885,7 @@ class API(APIPrivate):
             sell_marketing.ItemPromotionApi,
             sell_marketing.ApiClient,
             "update_item_promotion",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "item_promotion"],
             (content_type, promotion_id),
@@ -6886,7 +6910,7 @@ class API(APIPrivate):
             sell_marketing.KeywordApi,
             sell_marketing.ApiClient,
             "bulk_create_keyword",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "keyword"],
             (body, content_type, campaign_id),
@@ -6911,7 +6935,7 @@ class API(APIPrivate):
             sell_marketing.KeywordApi,
             sell_marketing.ApiClient,
             "bulk_update_keyword",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "keyword"],
             (body, content_type, campaign_id),
@@ -6936,7 +6960,7 @@ class API(APIPrivate):
             sell_marketing.KeywordApi,
             sell_marketing.ApiClient,
             "create_keyword",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "keyword"],
             (body, content_type, campaign_id),
@@ -6960,7 +6984,7 @@ class API(APIPrivate):
             sell_marketing.KeywordApi,
             sell_marketing.ApiClient,
             "get_keyword",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "keyword"],
             (campaign_id, keyword_id),
@@ -6985,7 +7009,7 @@ class API(APIPrivate):
             sell_marketing.KeywordApi,
             sell_marketing.ApiClient,
             "get_keywords",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "keyword"],
             campaign_id,
@@ -7011,7 +7035,7 @@ class API(APIPrivate):
             sell_marketing.KeywordApi,
             sell_marketing.ApiClient,
             "update_keyword",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "keyword"],
             (body, content_type, campaign_id, keyword_id),
@@ -7035,7 +7059,7 @@ class API(APIPrivate):
             sell_marketing.NegativeKeywordApi,
             sell_marketing.ApiClient,
             "bulk_create_negative_keyword",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "negative_keyword"],
             (body, content_type),
@@ -7059,7 +7083,7 @@ class API(APIPrivate):
             sell_marketing.NegativeKeywordApi,
             sell_marketing.ApiClient,
             "bulk_update_negative_keyword",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "negative_keyword"],
             (body, content_type),
@@ -7083,7 +7107,7 @@ class API(APIPrivate):
             sell_marketing.NegativeKeywordApi,
             sell_marketing.ApiClient,
             "create_negative_keyword",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "negative_keyword"],
             (body, content_type),
@@ -7106,7 +7130,7 @@ class API(APIPrivate):
             sell_marketing.NegativeKeywordApi,
             sell_marketing.ApiClient,
             "get_negative_keyword",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "negative_keyword"],
             negative_keyword_id,
@@ -7131,7 +7155,7 @@ class API(APIPrivate):
             sell_marketing.NegativeKeywordApi,
             sell_marketing.ApiClient,
             "get_negative_keywords",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "negative_keyword"],
             None,
@@ -7156,7 +7180,7 @@ class API(APIPrivate):
             sell_marketing.NegativeKeywordApi,
             sell_marketing.ApiClient,
             "update_negative_keyword",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "negative_keyword"],
             (body, content_type, negative_keyword_id),
@@ -7182,7 +7206,7 @@ class API(APIPrivate):
             sell_marketing.PromotionApi,
             sell_marketing.ApiClient,
             "get_listing_set",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "promotion"],
             promotion_id,
@@ -7209,7 +7233,7 @@ class API(APIPrivate):
             sell_marketing.PromotionApi,
             sell_marketing.ApiClient,
             "get_promotions",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "promotion"],
             marketplace_id,
@@ -7230,7 +7254,7 @@ class API(APIPrivate):
             sell_marketing.PromotionApi,
             sell_marketing.ApiClient,
             "pause_promotion",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "promotion"],
             promotion_id,
@@ -7251,7 +7275,7 @@ class API(APIPrivate):
             sell_marketing.PromotionApi,
             sell_marketing.ApiClient,
             "resume_promotion",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "promotion"],
             promotion_id,
@@ -7279,7 +7303,7 @@ class API(APIPrivate):
             sell_marketing.PromotionReportApi,
             sell_marketing.ApiClient,
             "get_promotion_reports",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "promotion_report"],
             marketplace_id,
@@ -7302,7 +7326,7 @@ class API(APIPrivate):
             sell_marketing.PromotionSummaryReportApi,
             sell_marketing.ApiClient,
             "get_promotion_summary_report",
-            SellMarketingException,
+            sell_marketing.rest.ApiException,
             True,
             ["sell.marketing", "promotion_summary_report"],
             marketplace_id,
@@ -7327,7 +7351,7 @@ class API(APIPrivate):
             sell_metadata.CompatibilitiesApi,
             sell_metadata.ApiClient,
             "get_compatibilities_by_specification",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "compatibilities"],
             (x_ebay_c_marketplace_id, content_type),
@@ -7352,7 +7376,7 @@ class API(APIPrivate):
             sell_metadata.CompatibilitiesApi,
             sell_metadata.ApiClient,
             "get_compatibility_property_names",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "compatibilities"],
             (x_ebay_c_marketplace_id, content_type),
@@ -7377,7 +7401,7 @@ class API(APIPrivate):
             sell_metadata.CompatibilitiesApi,
             sell_metadata.ApiClient,
             "get_compatibility_property_values",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "compatibilities"],
             (x_ebay_c_marketplace_id, content_type),
@@ -7402,7 +7426,7 @@ class API(APIPrivate):
             sell_metadata.CompatibilitiesApi,
             sell_metadata.ApiClient,
             "get_multi_compatibility_property_values",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "compatibilities"],
             (x_ebay_c_marketplace_id, content_type),
@@ -7427,7 +7451,7 @@ class API(APIPrivate):
             sell_metadata.CompatibilitiesApi,
             sell_metadata.ApiClient,
             "get_product_compatibilities",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "compatibilities"],
             (x_ebay_c_marketplace_id, content_type),
@@ -7450,7 +7474,7 @@ class API(APIPrivate):
             sell_metadata.CountryApi,
             sell_metadata.ApiClient,
             "get_sales_tax_jurisdictions",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "country"],
             country_code,
@@ -7475,7 +7499,7 @@ class API(APIPrivate):
             sell_metadata.MarketplaceApi,
             sell_metadata.ApiClient,
             "get_automotive_parts_compatibility_policies",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "marketplace"],
             marketplace_id,
@@ -7500,7 +7524,7 @@ class API(APIPrivate):
             sell_metadata.MarketplaceApi,
             sell_metadata.ApiClient,
             "get_category_policies",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "marketplace"],
             marketplace_id,
@@ -7525,7 +7549,7 @@ class API(APIPrivate):
             sell_metadata.MarketplaceApi,
             sell_metadata.ApiClient,
             "get_classified_ad_policies",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "marketplace"],
             marketplace_id,
@@ -7547,7 +7571,7 @@ class API(APIPrivate):
             sell_metadata.MarketplaceApi,
             sell_metadata.ApiClient,
             "get_currencies",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "marketplace"],
             marketplace_id,
@@ -7573,7 +7597,7 @@ class API(APIPrivate):
             sell_metadata.MarketplaceApi,
             sell_metadata.ApiClient,
             "get_extended_producer_responsibility_policies",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "marketplace"],
             marketplace_id,
@@ -7597,7 +7621,7 @@ class API(APIPrivate):
             sell_metadata.MarketplaceApi,
             sell_metadata.ApiClient,
             "get_hazardous_materials_labels",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "marketplace"],
             marketplace_id,
@@ -7623,7 +7647,7 @@ class API(APIPrivate):
             sell_metadata.MarketplaceApi,
             sell_metadata.ApiClient,
             "get_item_condition_policies",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "marketplace"],
             marketplace_id,
@@ -7649,7 +7673,7 @@ class API(APIPrivate):
             sell_metadata.MarketplaceApi,
             sell_metadata.ApiClient,
             "get_listing_structure_policies",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "marketplace"],
             marketplace_id,
@@ -7674,7 +7698,7 @@ class API(APIPrivate):
             sell_metadata.MarketplaceApi,
             sell_metadata.ApiClient,
             "get_listing_type_policies",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "marketplace"],
             marketplace_id,
@@ -7699,7 +7723,7 @@ class API(APIPrivate):
             sell_metadata.MarketplaceApi,
             sell_metadata.ApiClient,
             "get_motors_listing_policies",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "marketplace"],
             marketplace_id,
@@ -7725,7 +7749,7 @@ class API(APIPrivate):
             sell_metadata.MarketplaceApi,
             sell_metadata.ApiClient,
             "get_negotiated_price_policies",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "marketplace"],
             marketplace_id,
@@ -7748,7 +7772,7 @@ class API(APIPrivate):
             sell_metadata.MarketplaceApi,
             sell_metadata.ApiClient,
             "get_product_safety_labels",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "marketplace"],
             marketplace_id,
@@ -7773,7 +7797,7 @@ class API(APIPrivate):
             sell_metadata.MarketplaceApi,
             sell_metadata.ApiClient,
             "get_regulatory_policies",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "marketplace"],
             marketplace_id,
@@ -7797,7 +7821,7 @@ class API(APIPrivate):
             sell_metadata.MarketplaceApi,
             sell_metadata.ApiClient,
             "get_return_policies",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "marketplace"],
             marketplace_id,
@@ -7822,7 +7846,7 @@ class API(APIPrivate):
             sell_metadata.MarketplaceApi,
             sell_metadata.ApiClient,
             "get_shipping_policies",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "marketplace"],
             marketplace_id,
@@ -7847,7 +7871,7 @@ class API(APIPrivate):
             sell_metadata.MarketplaceApi,
             sell_metadata.ApiClient,
             "get_site_visibility_policies",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "marketplace"],
             marketplace_id,
@@ -7871,7 +7895,7 @@ class API(APIPrivate):
             sell_metadata.ShippingmarketplaceApi,
             sell_metadata.ApiClient,
             "get_exclude_shipping_locations",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "shippingmarketplace"],
             marketplace_id,
@@ -7893,7 +7917,7 @@ class API(APIPrivate):
             sell_metadata.ShippingmarketplaceApi,
             sell_metadata.ApiClient,
             "get_handling_times",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "shippingmarketplace"],
             marketplace_id,
@@ -7917,7 +7941,7 @@ class API(APIPrivate):
             sell_metadata.ShippingmarketplaceApi,
             sell_metadata.ApiClient,
             "get_shipping_carriers",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "shippingmarketplace"],
             marketplace_id,
@@ -7941,7 +7965,7 @@ class API(APIPrivate):
             sell_metadata.ShippingmarketplaceApi,
             sell_metadata.ApiClient,
             "get_shipping_locations",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "shippingmarketplace"],
             marketplace_id,
@@ -7965,7 +7989,7 @@ class API(APIPrivate):
             sell_metadata.ShippingmarketplaceApi,
             sell_metadata.ApiClient,
             "get_shipping_services",
-            SellMetadataException,
+            sell_metadata.rest.ApiException,
             False,
             ["sell.metadata", "shippingmarketplace"],
             marketplace_id,
@@ -7990,7 +8014,7 @@ class API(APIPrivate):
             sell_negotiation.OfferApi,
             sell_negotiation.ApiClient,
             "find_eligible_items",
-            SellNegotiationException,
+            sell_negotiation.rest.ApiException,
             True,
             ["sell.negotiation", "offer"],
             x_ebay_c_marketplace_id,
@@ -8015,7 +8039,7 @@ class API(APIPrivate):
             sell_negotiation.OfferApi,
             sell_negotiation.ApiClient,
             "send_offer_to_interested_buyers",
-            SellNegotiationException,
+            sell_negotiation.rest.ApiException,
             True,
             ["sell.negotiation", "offer"],
             (x_ebay_c_marketplace_id, content_type),
@@ -8042,7 +8066,7 @@ class API(APIPrivate):
             sell_recommendation.ListingRecommendationApi,
             sell_recommendation.ApiClient,
             "find_listing_recommendations",
-            SellRecommendationException,
+            sell_recommendation.rest.ApiException,
             True,
             ["sell.recommendation", "listing_recommendation"],
             x_ebay_c_marketplace_id,
@@ -8063,7 +8087,7 @@ class API(APIPrivate):
             sell_stores.StoreApi,
             sell_stores.ApiClient,
             "add_store_category",
-            SellStoresException,
+            sell_stores.rest.ApiException,
             False,
             ["sell.stores", "store"],
             content_type,
@@ -8084,7 +8108,7 @@ class API(APIPrivate):
             sell_stores.StoreApi,
             sell_stores.ApiClient,
             "delete_store_category",
-            SellStoresException,
+            sell_stores.rest.ApiException,
             False,
             ["sell.stores", "store"],
             category_id,
@@ -8104,7 +8128,7 @@ class API(APIPrivate):
             sell_stores.StoreApi,
             sell_stores.ApiClient,
             "get_store",
-            SellStoresException,
+            sell_stores.rest.ApiException,
             False,
             ["sell.stores", "store"],
             None,
@@ -8124,7 +8148,7 @@ class API(APIPrivate):
             sell_stores.StoreApi,
             sell_stores.ApiClient,
             "get_store_categories",
-            SellStoresException,
+            sell_stores.rest.ApiException,
             False,
             ["sell.stores", "store"],
             None,
@@ -8145,7 +8169,7 @@ class API(APIPrivate):
             sell_stores.StoreApi,
             sell_stores.ApiClient,
             "get_store_task",
-            SellStoresException,
+            sell_stores.rest.ApiException,
             False,
             ["sell.stores", "store"],
             task_id,
@@ -8165,7 +8189,7 @@ class API(APIPrivate):
             sell_stores.StoreApi,
             sell_stores.ApiClient,
             "get_store_tasks",
-            SellStoresException,
+            sell_stores.rest.ApiException,
             False,
             ["sell.stores", "store"],
             None,
@@ -8187,7 +8211,7 @@ class API(APIPrivate):
             sell_stores.StoreApi,
             sell_stores.ApiClient,
             "move_store_category",
-            SellStoresException,
+            sell_stores.rest.ApiException,
             False,
             ["sell.stores", "store"],
             (body, content_type),
@@ -8211,7 +8235,7 @@ class API(APIPrivate):
             sell_stores.StoreApi,
             sell_stores.ApiClient,
             "rename_store_category",
-            SellStoresException,
+            sell_stores.rest.ApiException,
             False,
             ["sell.stores", "store"],
             (content_type, category_id),
@@ -0,0 +1,196 @@
+# Standard library imports
+import asyncio
+from collections import deque
+import functools
+import inspect
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+# Local imports
+from .a_p_i import API
+from .error import Error
+
+
+class AsyncAPI(API):
+    """
+    An asyncio flavour of API, it has the same constructor parameters and the same methods.
+
+    A method that returns a single object must be awaited, e.g. item = await api.buy_browse_get_item(item_id).
+    A paged method gives an asynchronous generator, e.g. async for record in api.buy_browse_search(q="iPhone").
+
+    The Swagger-generated code is blocking, so calls run on a pool of threads that is sized to match
+    the pool of HTTP connections; both are shared by all API objects that have the same pool_maxsize.
+    To keep more eBay requests in flight, raise pool_maxsize.
+    """
+
+    async def _method_single(
+        self,
+        function_configuration: Callable[..., Any],
+        base_path: str,
+        function_instance: Type[Any],
+        function_client: Union[Callable[..., Any], Type[Any]],
+        method: str,
+        swagger_method_exception: Type[Exception],
+        user_access_token: bool,
+        rate_keys: List[str],
+        params: Optional[Union[str, Tuple[str, ...]]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Await the work for a method that returns a single object.
+
+        A throttled call waits on the event loop, so it doesn't hold one of the shared threads.
+
+        The parameters are those of API._method_single.
+        :return: The result of API._method_single.
+        """
+        await self._swagger_throttle_async(base_path, rate_keys)
+        return await self._run_blocking(
+            self._call_single,
+            function_configuration,
+            base_path,
+            function_instance,
+            function_client,
+            method,
+            swagger_method_exception,
+            user_access_token,
+            rate_keys,
+            params,
+            kwargs,
+        )
+
+    async def _method_paged(self, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        """
+        Asynchronously yield what the generator for a paged method yields.
+
+        :param args: Positional arguments for API._method_paged.
+        :param kwargs: Keyword arguments for API._method_paged.
+        :return: An asynchronous generator.
+        """
+        generator = super()._method_paged(*args, **kwargs)
+        finished = object()
+        future = None
+        try:
+            while True:
+                future = self._transport.executor.submit(next, generator, finished)
+                result = await asyncio.wrap_future(future)
+                if result is finished:
+                    break
+                yield result
+        finally:
+            # When cancelled, next may still be running on its thread; close the generator once it returns.
+            if future is None:
+                generator.close()
+            else:
+                future.add_done_callback(lambda _future: generator.close())
+
+    async def batched(
+        self,
+        method: Union[str, Callable[..., Any]],
+        ids: Iterable[str],
+        concurrency: int = 4,
+        **kwargs: Any,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        The asynchronous generator version of API.batched; it has the same parameters and yields the same.
+        """
+        name, spec = self._batch_spec(method, concurrency)
+        batches = self._batch_ids(ids, spec)
+        pending = deque()
+        try:
+            while True:
+                while len(pending) < concurrency:
+                    batch = next(batches, None)
+                    if batch is None:
+                        break
+                    task = asyncio.ensure_future(
+                        self._call_batch(name, spec, batch, kwargs)
+                    )
+                    pending.append((batch, task))
+                if not pending:
+                    break
+                batch, task = pending.popleft()
+                try:
+                    result = await task
+                except Error as error:
+                    yield {"error": {"ids": batch, "error": error}}
+                else:
+                    for item in self._batch_results(spec, batch, result):
+                        yield item
+        finally:
+            for _batch, task in pending:
+                task.cancel()
+
+    async def buy_feed_download(self, *args: Any, **kwargs: Any) -> None:
+        """
+        The asynchronous version of API.buy_feed_download; it has the same parameters.
+        """
+        await self._run_blocking(super().buy_feed_download, *args, **kwargs)
+
+    async def _call_batch(
+        self,
+        name: str,
+        spec: Tuple[str, int, str, str],
+        batch: List[str],
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        The asynchronous version of API._call_batch.
+        """
+        args, kwargs = self._batch_arguments(spec, batch, kwargs)
+        result = getattr(self, name)(*args, **kwargs)
+        if inspect.isasyncgen(result):  # a paged method
+            return {
+                spec[2]: [item["record"] async for item in result if "record" in item]
+            }
+        return await result
+
+    async def _swagger_throttle_async(
+        self, base_path: str, rate_keys: List[str]
+    ) -> None:
+        """
+        The asyncio version of API._swagger_throttle.
+
+        :param base_path:
+        :param rate_keys: Strings, keys used to look up a rate
+        """
+        if not self._sandbox:  # eBay does not limit calls to the sandbox
+            if not self._throttle or base_path.startswith("/developer/analytics"):
+                await self._rates.decrement_rate_async(
+                    base_path=base_path, rate_keys=rate_keys
+                )
+            else:
+                if self._rates.need_refresh():
+                    await self._run_blocking(self._swagger_refresh_rates)
+                await self._rates.decrement_rate_throttled_async(
+                    base_path=base_path,
+                    rate_keys=rate_keys,
+                    timeout=self._timeout,
+                    priority=self._priority,
+                )
+
+    async def _run_blocking(
+        self, function: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """
+        Run a blocking function on the shared threads, without blocking the event loop.
+
+        :param function: The blocking function.
+        :param args: Its positional arguments.
+        :param kwargs: Its keyword arguments.
+        :return: What the function returned.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._transport.executor, functools.partial(function, *args, **kwargs)
+        )
@@ -1,24 +1,48 @@
 # Standard library imports
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import datetime
-from json import loads
+import functools
+import importlib
+import inspect
+import itertools
+from json import dumps
 import logging
-import os
 from threading import Lock
-from typing import Any, Callable, Dict, List, Tuple, Type, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    Type,
+    Optional,
+    Union,
+)
 from urllib.parse import urlparse
 
+# 3rd party library imports
+from dateutil.parser import parse
 
 # Local imports
-from .api import developer_analytics
-from .api.developer_analytics.rest import ApiException as DeveloperAnalyticsException
-from .api.developer_key_management.rest import (
-    ApiException as DeveloperKeyManagementException,
-)
+from .config import Config
 from .error import Error
+from .feed_download import FeedDownload
+from .lazy_package import LazyPackage
 from .multiton import Multiton
+from .rate_budget import RateBudget
 from .rates import Rates
 from .reference import Reference
 from .token import ApplicationToken, UserToken, KeyPairToken
+from .token_store import TokenStore
+from .transport import Transport
+
+buy_feed = LazyPackage("buy_feed")
+developer_analytics = LazyPackage("developer_analytics")
+developer_key_management = LazyPackage("developer_key_management")
 
 
 class APIPrivate(metaclass=Multiton):
@@ -42,13 +66,6 @@ class APIPrivate(metaclass=Multiton):
       lower-level API interactions. It is not designed for direct interaction by end users or API clients.
     """
 
-    # TODO Improve efficiency, unique objects could be created in parallel.
-    # Use these to mitigate the duplication risk that Mutition has while treading.
-    _lock_rates = Lock()
-    _lock_key_pair_token = Lock()
-    _lock_user_token = Lock()
-    _lock_application_token = Lock()
-
     def __init__(
         self,
         path: Optional[str] = None,
@@ -60,6 +77,16 @@ class APIPrivate(metaclass=Multiton):
         key_pair: Optional[Union[str, Dict[str, Any]]] = None,
         digital_signatures: bool = False,
         async_req: bool = False,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        raw_json: bool = False,
+        prefetch: int = 0,
+        retry_policy: Optional[Dict[str, Any]] = None,
+        token_store: Optional[TokenStore] = None,
+        background_token_refresh: bool = False,
+        config: Optional[Config] = None,
+        rate_budget: Optional[RateBudget] = None,
+        priority: str = "normal",
     ) -> None:
         """
         VERY IMPORTANT:
@@ -86,115 +113,46 @@ class APIPrivate(metaclass=Multiton):
         :param key_pair: Supply the name of the desired eBay public/private key pair record in ebay_rest.json or a dict with the key pair details. Can omit when ebay_rest.json contains only one record.
         :param digital_signatures: Use eBay digital signatures
         :param async_req: When True make, asynchronous HTTP requests. Defaults to False for synchronous. !!!IGNORE THIS OPTION, THE CODE FOR IT IS INCOMPLETE!!!
+        :param pool_maxsize: The most HTTP connections to keep open to each eBay host. All API objects with the same pool settings share the connections. Defaults to 10.
+        :param keep_alive: When True, send TCP keep-alive probes on idle pooled connections. Defaults to True.
+        :param raw_json: When True, build the results straight from the JSON that eBay returns, which is much faster than making Swagger objects and converting them. Defaults to False.
+        :param prefetch: How many pages a paged method fetches in parallel, ahead of the records being yielded. Records are still yielded in order. Defaults to 0, fetch each page when it is needed.
+        :param retry_policy: Retry failed HTTP requests, with waits that back off. Supply a dict to override any of Transport.RETRY_POLICY_DEFAULTS; {} accepts all of them, which retries statuses 429, 500, 502, 503 and 504 for idempotent methods, and waits as long as eBay's Retry-After header asks. Defaults to None, only retry failed connections.
+        :param token_store: Share OAuth tokens with the API objects in other processes, e.g. FileTokenStore(path), so that a token is minted once for all of them. Defaults to None, each process gets its own tokens.
+        :param background_token_refresh: When True, a background thread renews OAuth tokens before they expire, so that calls never wait for a renewal. Defaults to False, calls renew tokens when they need to.
+        :param config: Instead of path, application, user, header and key_pair, supply a Config made from them, which is faster because they were loaded and checked in advance.
+        :param rate_budget: When throttling, share the remaining counts of calls with the API objects in other processes, e.g. SQLiteRateBudget(path), so that together they keep to the app_id's call limits. Defaults to None, each process counts its own calls.
+        :param priority: When throttling, "high", "normal" or "low". When calls are scarce, lower priority calls wait first, so that higher ones needn't. To give some calls another priority, make a second API object for them. Defaults to "normal".
         :return: An API object.
         """
-        # if present, load the configuration file
-        config_contents = None
-        if path is None:
-            path = os.getcwd()
-        self._config_location = os.path.join(path, "ebay_rest.json")
-        if os.path.isfile(self._config_location):
-            try:
-                with open(self._config_location, "r") as f:
-                    config_contents = loads(f.read())
-            except IOError as e:
-                raise Error(
-                    number=99001,
-                    reason="Unable to open " + self._config_location,
-                    cause=e,
-                )
-        else:
-            if not (
-                isinstance(application, dict)
-                and isinstance(user, dict)
-                and isinstance(header, dict)
-            ):
-                detail = (
-                    "Either at "
-                    + self._config_location
-                    + " do this https://github.com/matecsaj/ebay_rest/blob/main/tests/ebay_rest_EXAMPLE.json."
-                    + " Or, supply dicts to all of the params application, user, and header."
-                )
-                raise Error(
-                    number=99015,
-                    reason="Missing configuration information.",
-                    detail=detail,
-                )
-
-        # get configuration sections from parameters or the loaded file
-        self._application = self._process_config_section(
-            config_contents, "applications", application
-        )
-        self._user = self._process_config_section(config_contents, "users", user)
-        self._header = self._process_config_section(config_contents, "headers", header)
-        self._key_pair = self._process_config_section(
-            config_contents, "key_pairs", key_pair, mandatory=False
-        )
+        # load and check the configuration, unless that was done in advance
+        if config is None:
+            config = Config(
+                path=path,
+                application=application,
+                user=user,
+                header=header,
+                key_pair=key_pair,
+            )
+        elif not isinstance(config, Config):
+            detail = f"Parameter config {config} must be unspecified, None or a Config."
+            raise Error(number=99029, reason="Bad config parameter.", detail=detail)
+        elif (path, application, user, header, key_pair) != (None,) * 5:
+            detail = (
+                "Supply either config or path, application, user, header and key_pair."
+            )
+            raise Error(number=99029, reason="Bad config parameter.", detail=detail)
+        self._application = config.application
+        self._user = config.user
+        self._header = config.header
+        self._key_pair = config.key_pair
         self._use_digital_signatures = digital_signatures
 
-        # check the application keys and values
-        # True if the dictionary key is required and False when optional.
-        # Nothing appears to use dev_id! What should it be used for?
-        application_keys = [
-            ("app_id", True),
-            ("cert_id", True),
-            ("dev_id", False),
-            ("redirect_uri", True),
-        ]
-        self._check_keys(self._application, application_keys, "application")
-
-        # check the user keys and values
-        user_keys = [
-            ("email_or_username", True),
-            ("password", True),
-            ("scopes", False),
-            ("refresh_token", False),
-            ("refresh_token_expiry", False),
-        ]
-        self._check_keys(self._user, user_keys, "user")
-
-        # check the key pair keys and values
-        key_pair_keys = [
-            ("creation_time", False),
-            ("expiration_time", False),
-            ("jwe", False),
-            ("private_key", False),
-            ("public_key", False),
-            ("signing_key_cipher", False),
-            ("signing_key_id", False),
-        ]
-        self._check_keys(self._key_pair, key_pair_keys, "key_pair")
-
         # Determine if we are using the sandbox. Of course, production is the only alternative.
-        self._sandbox = self._application["cert_id"].startswith("SBX-")
-
-        # check the header keys and values
+        self._sandbox = config.sandbox
 
         # get valid marketplace ids
-        self._marketplace_ids = list(Reference.get_marketplace_id_values())
-
-        # get all the languages that marketplaces use
-        marketplace_languages = set()
-        for marketplace_id_value in Reference.get_marketplace_id_values().values():
-            for key in marketplace_id_value[1]:
-                marketplace_languages.add(key)
-        marketplace_languages = list(marketplace_languages)
-
-        header_keys_values = [
-            ("accept_language", marketplace_languages),
-            (
-                "affiliate_campaign_id",
-                None,
-            ),  # None indicates that any value is acceptable.
-            ("affiliate_reference_id", None),
-            ("device_id", None),
-            ("content_language", marketplace_languages),
-            ("country", list(Reference.get_country_codes().keys())),
-            ("currency", list(Reference.get_currency_codes().keys())),
-            ("marketplace_id", self._marketplace_ids),
-            ("zip", None),
-        ]
-        self._check_header(header_keys_values)
+        self._marketplace_ids = Reference.get_valid_marketplace_ids()
 
         # check the throttle parameters
         detail = None
@@ -222,6 +180,86 @@ class APIPrivate(metaclass=Multiton):
         else:
             self._async_req = async_req
 
+        # check the connection pool parameters
+        if isinstance(pool_maxsize, bool) or not isinstance(pool_maxsize, int):
+            detail = (
+                f"Parameter pool_maxsize {pool_maxsize} must be unspecified or an int."
+            )
+            raise Error(
+                number=99020, reason="Bad pool_maxsize parameter.", detail=detail
+            )
+        if pool_maxsize <= 0:
+            detail = f"Parameter pool_maxsize {pool_maxsize} must be positive."
+            raise Error(
+                number=99020, reason="Bad pool_maxsize parameter.", detail=detail
+            )
+        if keep_alive not in (True, False):
+            detail = (
+                f"Parameter keep_alive {keep_alive} must be unspecified, True or False."
+            )
+            raise Error(number=99021, reason="Bad keep_alive parameter.", detail=detail)
+
+        # check the retry_policy parameter
+        if retry_policy is not None:
+            if not isinstance(retry_policy, dict):
+                detail = f"Parameter retry_policy {retry_policy} must be unspecified, None or a dict."
+                raise Error(
+                    number=99026, reason="Bad retry_policy parameter.", detail=detail
+                )
+            unknown = set(retry_policy) - set(Transport.RETRY_POLICY_DEFAULTS)
+            if unknown:
+                detail = f"Parameter retry_policy has unknown keys {sorted(unknown)}."
+                raise Error(
+                    number=99026, reason="Bad retry_policy parameter.", detail=detail
+                )
+
+        self._transport = Transport(
+            pool_maxsize=pool_maxsize, keep_alive=keep_alive, retry_policy=retry_policy
+        )
+
+        # check the raw_json parameter
+        if raw_json not in (True, False):
+            detail = (
+                f"Parameter raw_json {raw_json} must be unspecified, True or False."
+            )
+            raise Error(number=99022, reason="Bad raw_json parameter.", detail=detail)
+        self._raw_json = raw_json
+
+        # check the prefetch parameter
+        if isinstance(prefetch, bool) or not isinstance(prefetch, int) or prefetch < 0:
+            detail = f"Parameter prefetch {prefetch} must be unspecified or an int that is zero or more."
+            raise Error(number=99023, reason="Bad prefetch parameter.", detail=detail)
+        self._prefetch = prefetch
+
+        # check the token_store parameter
+        if token_store is not None and not isinstance(token_store, TokenStore):
+            detail = f"Parameter token_store {token_store} must be unspecified, None or a TokenStore."
+            raise Error(
+                number=99027, reason="Bad token_store parameter.", detail=detail
+            )
+
+        # check the background_token_refresh parameter
+        if background_token_refresh not in (True, False):
+            detail = f"Parameter background_token_refresh {background_token_refresh} must be unspecified, True or False."
+            raise Error(
+                number=99028,
+                reason="Bad background_token_refresh parameter.",
+                detail=detail,
+            )
+
+        # check the rate_budget parameter
+        if rate_budget is not None and not isinstance(rate_budget, RateBudget):
+            detail = f"Parameter rate_budget {rate_budget} must be unspecified, None or a RateBudget."
+            raise Error(
+                number=99030, reason="Bad rate_budget parameter.", detail=detail
+            )
+
+        # check the priority parameter
+        if not isinstance(priority, str) or priority not in Rates.PRIORITIES:
+            detail = f"Parameter priority {priority} must be unspecified, or one of {', '.join(Rates.PRIORITIES)}."
+            raise Error(number=99031, reason="Bad priority parameter.", detail=detail)
+        self._priority = priority
+
         if (
             self._sandbox
         ):  # The sandbox will not return rates; there is no point in throttling.
@@ -229,9 +267,10 @@ class APIPrivate(metaclass=Multiton):
             self._timeout = -1.0
             self._rates = None
         else:
-            with APIPrivate._lock_rates:
-                # If sandbox starts return rates, you will need to add a sandbox param to the Rates constructor.
-                self._rates = Rates(app_id=self._application["app_id"])
+            # If sandbox starts return rates, you will need to add a sandbox param to the Rates constructor.
+            self._rates = Rates(
+                app_id=self._application["app_id"], rate_budget=rate_budget
+            )
 
         # preload the multipurpose header self._end_user_ctx
         equates = list()
@@ -259,261 +298,106 @@ class APIPrivate(metaclass=Multiton):
         else:
             self._end_user_ctx = None
 
-        with APIPrivate._lock_application_token:
-            self._application_token = ApplicationToken(
-                self._sandbox,
-                # application/client credentials
-                client_id=self._application["app_id"],
-                client_secret=self._application["cert_id"],
-                ru_name=self._application["redirect_uri"],
-            )
+        self._application_token = ApplicationToken(
+            self._sandbox,
+            # application/client credentials
+            client_id=self._application["app_id"],
+            client_secret=self._application["cert_id"],
+            ru_name=self._application["redirect_uri"],
+            token_store=token_store,
+        )
 
-        with APIPrivate._lock_user_token:
-            self._user_token = UserToken(
-                self._sandbox,
-                # application/client credentials
-                client_id=self._application["app_id"],
-                client_secret=self._application["cert_id"],
-                ru_name=self._application["redirect_uri"],
-                # user credentials
-                user_id=self._user["email_or_username"],
-                user_password=self._user["password"],
-                user_scopes=(
-                    None if "scopes" not in self._user else self._user["scopes"]
-                ),
-                # user token supply
-                user_refresh_token=(
-                    None
-                    if "refresh_token" not in self._user
-                    else self._user["refresh_token"]
-                ),
-                user_refresh_token_expiry=(
-                    None
-                    if "refresh_token_expiry" not in self._user
-                    else self._user["refresh_token_expiry"]
-                ),
-            )
+        self._user_token = UserToken(
+            self._sandbox,
+            # application/client credentials
+            client_id=self._application["app_id"],
+            client_secret=self._application["cert_id"],
+            ru_name=self._application["redirect_uri"],
+            # user credentials
+            user_id=self._user["email_or_username"],
+            user_password=self._user["password"],
+            user_scopes=(
+                None if "scopes" not in self._user else list(self._user["scopes"])
+            ),
+            # user token supply
+            user_refresh_token=(
+                None
+                if "refresh_token" not in self._user
+                else self._user["refresh_token"]
+            ),
+            user_refresh_token_expiry=(
+                None
+                if "refresh_token_expiry" not in self._user
+                else self._user["refresh_token_expiry"]
+            ),
+            # token sharing
+            token_store=token_store,
+        )
 
-        with APIPrivate._lock_key_pair_token:
-            self._key_pair_token = KeyPairToken(
-                creation_time=self._key_pair.get("creation_time", None),
-                expiration_time=self._key_pair.get("expiration_time", None),
-                jwe=self._key_pair.get("jwe", None),
-                private_key=self._key_pair.get("private_key", None),
-                public_key=self._key_pair.get("public_key", None),
-                signing_key_cipher=self._key_pair.get("signing_key_cipher", None),
-                signing_key_id=self._key_pair.get("signing_key_id", None),
-            )
+        if background_token_refresh:
+            self._application_token.refresh_in_background()
+            self._user_token.refresh_in_background()
+
+        self._key_pair_token = KeyPairToken(
+            creation_time=self._key_pair.get("creation_time", None),
+            expiration_time=self._key_pair.get("expiration_time", None),
+            jwe=self._key_pair.get("jwe", None),
+            private_key=self._key_pair.get("private_key", None),
+            public_key=self._key_pair.get("public_key", None),
+            signing_key_cipher=self._key_pair.get("signing_key_cipher", None),
+            signing_key_id=self._key_pair.get("signing_key_id", None),
+        )
+
+        # a registry of long-lived Swagger clients, see _get_api_client
+        self._api_clients = dict()
+        self._lock_api_clients = Lock()
 
         return
 
-    @staticmethod
-    def _process_config_section(
-        config_contents: Dict[str, Any],
-        section: str,
-        parameter: Optional[Union[str, Dict[str, Any]]] = None,
-        mandatory: bool = True,
-    ) -> Optional[Dict[str, Any]]:
+    def _method_single(
+        self,
+        function_configuration: Callable[..., Any],
+        base_path: str,
+        function_instance: Type[Any],
+        function_client: Union[Callable[..., Any], Type[Any]],
+        method: str,
+        swagger_method_exception: Type[Exception],
+        user_access_token: bool,
+        rate_keys: List[str],
+        params: Optional[Union[str, Tuple[str, ...]]] = None,
+        **kwargs: int,
+    ) -> Any:
         """
-        Get a configuration section from the parameter or the loaded config file.
+        Do the work for a method that returns a single object.
 
-        :param config_contents:
-        :param section:
-        :param parameter:
-        :param mandatory:
+        :param function_configuration:
+        :param base_path:
+        :param function_instance:
+        :param function_client:
+        :param method:
+        :param swagger_method_exception:
+        :param user_access_token:
+        :param rate_keys:
+        :param params:
+        :param kwargs:
         :return:
         """
-        result = None
-        detail = None
-        param_name = section[:-1]
-
-        if isinstance(parameter, dict):
-            result = parameter
-
-        elif isinstance(parameter, str):
-            if len(parameter) == 0:
-                detail = (
-                    "Empty strings are not allowed for the "
-                    + param_name
-                    + " parameter."
-                )
-
-            if config_contents:
-                if section in config_contents:
-                    if parameter in config_contents[section]:
-                        result = config_contents[section][parameter]
-                    else:
-                        detail = (
-                            "Unable to find section "
-                            + parameter
-                            + " in the configuration file."
-                        )
-                else:
-                    detail = (
-                        "Section "
-                        + section
-                        + " is missing from the configuration file."
-                    )
-            else:
-                detail = (
-                    "The parameter "
-                    + param_name
-                    + " should not be a string or the configuration file should exist."
-                )
-
-        elif parameter is None:
-            if config_contents:
-                if section in config_contents:
-                    sections = config_contents[section].keys()
-                    if len(sections) == 1:
-                        result = config_contents[section][tuple(sections)[0]]
-                    else:
-                        detail = (
-                            "Perhaps parameter "
-                            + param_name
-                            + " should be one of "
-                            + ", ".join(sections)
-                            + "."
-                        )
-                else:
-                    detail = (
-                        "The parameter "
-                        + param_name
-                        + " should not be none or section "
-                        + section
-                        + " is missing from the configuration file."
-                    )
-            else:
-                detail = (
-                    "The parameter "
-                    + param_name
-                    + " should not be None or the configuration file should exist."
-                )
-
-        else:
-            detail = (
-                "Parameter "
-                + param_name
-                + " must be a Dict, String or None but it is a "
-                + str(type(parameter))
-                + "."
-            )
-
-        if result is None:
-            if mandatory:
-                raise Error(
-                    number=99003,
-                    reason="Get configuration for " + param_name + " problem.",
-                    detail=detail,
-                )
-            else:
-                return {}
-        else:
-            # delete blank lines, to eliminate subsequent blank line checks
-            to_delete = []
-            for key in result:
-                if isinstance(result[key], str):
-                    if len(result[key].strip()) == 0:
-                        to_delete.append(key)
-            for key in to_delete:
-                del result[key]
-
-            return result
-
-    @staticmethod
-    def _check_keys(dict_: dict, keys: List[Tuple[str, bool]], name: str) -> None:
-        """
-        True if the dictionary key is required and False when optional.
-
-        :param dict_:
-        :param keys:
-        :param name:
-        """
-        valid_keys = []
-        for key, required in keys:
-            valid_keys.append(key)
-
-            if key in dict_:
-                if key == "scopes":
-                    if not isinstance(dict_[key], list):
-                        raise Error(
-                            number=99004,
-                            reason="The key's value must be a list.",
-                            detail=key + " in " + name,
-                        )
-                else:
-                    if not isinstance(dict_[key], str):
-                        raise Error(
-                            number=99005,
-                            reason="The key's value must be a string.",
-                            detail=key + " in " + name,
-                        )
-            if required:
-                if key in dict_:
-                    if len(dict_[key]) == 0:
-                        raise Error(
-                            number=99006,
-                            reason="The key's value can not be of zero length.",
-                            detail=key + " in " + name,
-                        )
-                else:
-                    raise Error(
-                        number=99007,
-                        reason="A required key missing",
-                        detail=key + " in " + name,
-                    )
-
-        for key in dict_:
-            if key not in valid_keys:
-                raise Error(
-                    number=99008,
-                    reason="Found an unexpected key.",
-                    detail=key + " in " + name,
-                )
-
-    def _check_header(
-        self, keys_values: List[Union[Tuple[str, list], Tuple[str, None]]]
-    ) -> None:
-        """
-        Check header keys and values.
-
-        :param keys_values:
-        """
-        header = self._header
-        valid_keys = []
-        for key, values in keys_values:
-            valid_keys.append(key)
-            if key in header:
-                if isinstance(header[key], str):
-                    if values is not None:
-                        if header[key] not in values:
-                            values.sort()
-                            detail = (
-                                "Header key "
-                                + key
-                                + " has value "
-                                + header[key]
-                                + ". Choose from "
-                                + ", ".join(values)
-                                + "."
-                            )
-                            raise Error(
-                                number=99009,
-                                reason="Invalid header value.",
-                                detail=detail,
-                            )
-                else:
-                    raise Error(
-                        number=99010,
-                        reason="Header values must be strings.",
-                        detail="Check key " + key + ".",
-                    )
+        self._swagger_throttle(base_path=base_path, rate_keys=rate_keys)
 
-        for key in header:
-            if key not in valid_keys:
-                raise Error(number=99011, reason="Unexpected header key.", detail=key)
+        return self._call_single(
+            function_configuration,
+            base_path,
+            function_instance,
+            function_client,
+            method,
+            swagger_method_exception,
+            user_access_token,
+            rate_keys,
+            params,
+            kwargs,
+        )
 
-    def _method_single(
+    def _call_single(
         self,
         function_configuration: Callable[..., Any],
         base_path: str,
@@ -523,11 +407,11 @@ class APIPrivate(metaclass=Multiton):
         swagger_method_exception: Type[Exception],
         user_access_token: bool,
         rate_keys: List[str],
-        params: Optional[Union[str, Tuple[str, ...]]] = None,
-        **kwargs: int,
+        params: Optional[Union[str, Tuple[str, ...]]],
+        kwargs: Dict[str, Any],
     ) -> Any:
         """
-        Do the work for a method that returns a single object.
+        Call the swagger method for a method that returns a single object, once throttled.
 
         :param function_configuration:
         :param base_path:
@@ -551,10 +435,13 @@ class APIPrivate(metaclass=Multiton):
             params,
         )
 
-        self._swagger_throttle(base_path=base_path, rate_keys=rate_keys)
-
         return self._call_swagger(
-            swagger_method, params, kwargs, swagger_method_exception
+            swagger_method,
+            params,
+            kwargs,
+            swagger_method_exception,
+            base_path=base_path,
+            rate_keys=rate_keys,
         )
 
     def _method_paged(
@@ -598,7 +485,7 @@ class APIPrivate(metaclass=Multiton):
         ]
         page_limit = 200  # the maximum number of records per page, as dictated by eBay
         yield_record_count = 0
-        yielded_info = list()
+        yielded_info = set()  # canonical JSON of non-record information yielded
 
         # co-opt some parameters
         if "offset" in kwargs:
@@ -635,81 +522,119 @@ class APIPrivate(metaclass=Multiton):
             records_desired = None  # the user wants all possible records
             kwargs["limit"] = page_limit  # fill pages with as many records as possible
 
-        swagger_method = self._get_swagger_method(
-            function_configuration,
-            base_path,
-            function_instance,
-            function_client,
-            method,
-            user_access_token,
-            params,
-        )
+        def fetch_page(page_offset: int) -> Any:
+            self._swagger_throttle(base_path=base_path, rate_keys=rate_keys)
+            # get the method for each page, so that a long walk doesn't outlive its access token
+            swagger_method = self._get_swagger_method(
+                function_configuration,
+                base_path,
+                function_instance,
+                function_client,
+                method,
+                user_access_token,
+                params,
+            )
+            return self._call_swagger(
+                swagger_method,
+                params,
+                dict(kwargs, offset=page_offset),
+                swagger_method_exception,
+                base_path=base_path,
+                rate_keys=rate_keys,
+            )
+
+        # when prefetching, later pages are fetched in parallel and queued in offset order
+        records_wanted = records_desired
+        prefetched = deque()
+        prefetch_offset = None  # the offset of the next page to prefetch
+        executor = None
 
         # loop though pages until a reason to stop presents itself
         offset = 0  # start at the first record; yes, the record index starts at zero
         record_list_key = None  # a placeholder for the dictionary key that will refer to the list of records
         loop = True
         result = None
-        while loop:
-            self._swagger_throttle(base_path=base_path, rate_keys=rate_keys)
-
-            kwargs["offset"] = offset  # get the next page of results
-            # TODO If the caller does not process all yielded results within five minutes, the token might expire.
-            result = self._call_swagger(
-                swagger_method, params, kwargs, swagger_method_exception
-            )
-
-            if result is None:
-                break
+        try:
+            while loop:
+                if prefetched:
+                    result = (
+                        prefetched.popleft().result()
+                    )  # raises the page's error, if any
+                else:
+                    result = fetch_page(offset)
+
+                if result is None:
+                    break
+
+                # queue up to prefetch pages beyond this one, stopping at the last one needed
+                if self._prefetch and result.get("total"):
+                    if executor is None:
+                        executor = ThreadPoolExecutor(max_workers=self._prefetch)
+                        prefetch_offset = offset + kwargs["limit"]
+                    while (
+                        len(prefetched) < self._prefetch
+                        and prefetch_offset < result["total"]
+                        and (records_wanted is None or prefetch_offset < records_wanted)
+                    ):
+                        prefetched.append(executor.submit(fetch_page, prefetch_offset))
+                        prefetch_offset += kwargs["limit"]
+
+                if (
+                    record_list_key is None
+                ):  # if still needed, find the dictionary key to the list of results
+                    for key in result:
+                        if isinstance(result[key], list):
+                            record_list_key = key
+                            page_controls.append(key)
+                            break
+                        # it will not be found when the record set is totally empty
 
-            if (
-                record_list_key is None
-            ):  # if still needed, find the dictionary key to the list of results
+                # Yield unique non-record information.
                 for key in result:
-                    if isinstance(result[key], list):
-                        record_list_key = key
-                        page_controls.append(key)
-                        break
-                    # it will not be found when the record set is totally empty
-
-            # Yield unique non-record information.
-            for key in result:
-                if key not in page_controls:
-                    if result[key] is not None:
-                        yield_info = {key: result[key]}
-                        if yield_info not in yielded_info:
-                            # TODO For some 'warnings' handle the problem or raise an exception.
-                            yield yield_info
-                            yielded_info.append(yield_info)
-
-            # Determine the number of records on the current page.
-            records_in_page = 0
-            if record_list_key is not None:  # is the record set totally empty?
-                if record_list_key in result:  # is the current page well-formed?
-                    if (
-                        result[record_list_key] is not None
-                    ):  # does the current page have > zero results?
-                        records_in_page = len(
-                            result[record_list_key]
-                        )  # all good, get the record count
-
-            # Yield each record, then stop looping and prepare the next page's offset.
-            if records_in_page:
-                for element in result[record_list_key]:
-                    yield {"record": element}
-                    yield_record_count += 1
-                    if records_desired is not None:
-                        records_desired -= 1
-                        if records_desired <= 0:
-                            loop = False
-                            break
-                offset += kwargs[
-                    "limit"
-                ]  # The offset must be either zero or a multiple of the limit value.
-                if result["total"] <= offset:
+                    if key not in page_controls:
+                        if result[key] is not None:
+                            yield_info = {key: result[key]}
+                            signature = dumps(yield_info, sort_keys=True, default=str)
+                            if signature not in yielded_info:
+                                # TODO For some 'warnings' handle the problem or raise an exception.
+                                yield yield_info
+                                yielded_info.add(signature)
+
+                # Determine the number of records on the current page.
+                records_in_page = 0
+                if record_list_key is not None:  # is the record set totally empty?
+                    if record_list_key in result:  # is the current page well-formed?
+                        if (
+                            result[record_list_key] is not None
+                        ):  # does the current page have > zero results?
+                            records_in_page = len(
+                                result[record_list_key]
+                            )  # all good, get the record count
+
+                # Yield each record, then stop looping and prepare the next page's offset.
+                if records_in_page:
+                    # release each record once it is yielded, so memory does not hold the whole page
+                    records = result[record_list_key]
+                    result[record_list_key] = None
+                    records.reverse()
+                    while records:
+                        yield {"record": records.pop()}
+                        yield_record_count += 1
+                        if records_desired is not None:
+                            records_desired -= 1
+                            if records_desired <= 0:
+                                loop = False
+                                break
+                    offset += kwargs[
+                        "limit"
+                    ]  # The offset must be either zero or a multiple of the limit value.
+                    if result["total"] <= offset:
+                        loop = False
+                else:
                     loop = False
-            else:
-                loop = False
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
 
         # Warning, if the caller stopped this generator prematurely, then the following will not happen.
         if result is None:
@@ -745,19 +670,130 @@ class APIPrivate(metaclass=Multiton):
         :param params:
         :return:
         """
-        # Configure OAuth2 access token for authorization: api_auth
-        configuration = function_configuration()
-        if user_access_token:
-            configuration.access_token = self._user_token.get()
-        else:
-            configuration.access_token = self._application_token.get()
-
         # Load key pair for digital signature
         use_digital_signatures = (
             self._use_digital_signatures and "key_management" not in base_path
         )
         if use_digital_signatures:
             self._key_pair_token._ensure_key_pair(self)
+
+        # X-EBAY-C-MARKETPLACE-ID
+        marketplace_id = self._header["marketplace_id"]
+        # some calls have a positional parameter for this, and the header must use the same value
+        if user_access_token:  # all such calls happen to require a user access token
+            # TODO instead it would be safer to check if 'method' is in a list of ones that belong
+            for param in params or []:
+                if param in self._marketplace_ids:
+                    marketplace_id = param
+
+        api_client = self._get_api_client(
+            function_configuration,
+            base_path,
+            function_client,
+            user_access_token,
+            use_digital_signatures,
+            marketplace_id,
+        )
+
+        # Only the per-call credentials change, everything else was configured when the client was made.
+        # Configure OAuth2 access token for authorization: api_auth
+        if user_access_token:
+            api_client.configuration.access_token = self._user_token.get()
+        else:
+            api_client.configuration.access_token = self._application_token.get()
+        if use_digital_signatures:
+            api_client.rest_client.key_pair = self._key_pair_token.key_dict()
+
+        # create an instance of the API class
+        api_instance = function_instance(api_client)
+
+        # return the callable function
+        return getattr(api_instance, method)
+
+    def _get_api_client(
+        self,
+        function_configuration: Callable[..., Any],
+        base_path: str,
+        function_client: Union[Callable[..., Any], Type[Any]],
+        user_access_token: bool,
+        use_digital_signatures: bool,
+        marketplace_id: str,
+    ) -> Any:
+        """
+        Get a Swagger ApiClient from the registry, making and configuring a new one when needed.
+
+        Making a client is costly; it comes with a thread pool and an HTTP connection pool.
+        Reusing one also reuses its warm TLS connections to eBay.
+        A client's headers never change after it is made, so the key covers everything that varies them.
+
+        :param function_configuration:
+        :param base_path:
+        :param function_client:
+        :param user_access_token:
+        :param use_digital_signatures:
+        :param marketplace_id:
+        :return: A Swagger ApiClient.
+        """
+        key = (
+            function_client,
+            base_path,
+            self._sandbox,
+            user_access_token,
+            use_digital_signatures,
+            marketplace_id,
+        )
+        api_client = self._api_clients.get(key)
+        if api_client is not None:
+            return api_client
+
+        with self._lock_api_clients:
+            api_client = self._api_clients.get(key)  # Double-check pattern
+            if api_client is None:
+                api_client = self._make_api_client(
+                    function_configuration,
+                    base_path,
+                    function_client,
+                    use_digital_signatures,
+                    marketplace_id,
+                )
+                self._api_clients[key] = api_client
+        return api_client
+
+    def _make_api_client(
+        self,
+        function_configuration: Callable[..., Any],
+        base_path: str,
+        function_client: Union[Callable[..., Any], Type[Any]],
+        use_digital_signatures: bool,
+        marketplace_id: str,
+    ) -> Any:
+        """
+        Make a new Swagger ApiClient with the host and headers configured.
+
+        :param function_configuration:
+        :param base_path:
+        :param function_client:
+        :param use_digital_signatures:
+        :param marketplace_id:
+        :return: A Swagger ApiClient.
+        """
+        configuration = function_configuration()
+
+        # share HTTP connections with the clients of all other APIs
+        configuration.pool_manager = self._transport.pool_manager
+
+        # skip making Swagger model objects; convert the JSON with the table generated for the API
+        if self._raw_json:
+            package = function_client.__module__.rpartition(".")[0]
+            model_table = importlib.import_module(".model_table", package)
+            configuration.raw_deserializer = functools.partial(
+                APIPrivate._de_json,
+                models=model_table.MODELS,
+                response_types=model_table.RESPONSE_TYPES,
+            )
+
+        # The key pair is refreshed before every call, but the REST client wants one when it is made.
+        if use_digital_signatures:
             configuration.api_key["key_pair"] = self._key_pair_token.key_dict()
 
         # Configure the host endpoint
@@ -788,8 +824,7 @@ class APIPrivate(metaclass=Multiton):
                 "eBay or Swagger has fixed the flaw so remove the compensating code."
             )
 
-        # create an instance of the API class
-        api_instance = function_instance(function_client(configuration))
+        api_client = function_client(configuration)
 
         # The request headers that eBay accepts are mostly described here.
         # https://developer.ebay.com/api-docs/static/rest-request-components.html#headers
@@ -799,7 +834,7 @@ class APIPrivate(metaclass=Multiton):
 
         # Accept-Language
         if self._header["accept_language"]:
-            api_instance.api_client.default_headers["Accept-Language"] = self._header[
+            api_client.default_headers["Accept-Language"] = self._header[
                 "accept_language"
             ]
 
@@ -809,25 +844,16 @@ class APIPrivate(metaclass=Multiton):
         # Digital signatures
         # Add 'x-ebay-enforce-signature', and then the rest is handled in the modified Swagger code.
         if use_digital_signatures:
-            api_instance.api_client.default_headers["x-ebay-enforce-signature"] = "true"
+            api_client.default_headers["x-ebay-enforce-signature"] = "true"
 
         # Content-Language
         if self._header["content_language"]:
-            api_instance.api_client.default_headers["Content-Language"] = self._header[
+            api_client.default_headers["Content-Language"] = self._header[
                 "content_language"
             ]
 
         # X-EBAY-C-MARKETPLACE-ID
-        marketplace_id = self._header["marketplace_id"]
-        # some calls have a positional parameter for this, and the header must use the same value
-        if user_access_token:  # all such calls happen to require a user access token
-            # TODO instead it would be safer to check if 'method' is in a list of ones that belong
-            for param in params or []:
-                if param in self._marketplace_ids:
-                    marketplace_id = param
-        api_instance.api_client.default_headers["X-EBAY-C-MARKETPLACE-ID"] = (
-            marketplace_id
-        )
+        api_client.default_headers["X-EBAY-C-MARKETPLACE-ID"] = marketplace_id
 
         # X-EBAY-C-ENDUSERCTX   # noqa: typo
         # beware: the site_id is a bit different from the Buy API
@@ -836,12 +862,9 @@ class APIPrivate(metaclass=Multiton):
         # header for shipping information accuracy per https://developer.ebay.com/api-docs/buy/static/api-browse.html
         if "/buy/browse" in base_path and self._end_user_ctx:
             # noinspection SpellCheckingInspection
-            api_instance.api_client.default_headers["X-EBAY-C-ENDUSERCTX"] = (
-                self._end_user_ctx
-            )
+            api_client.default_headers["X-EBAY-C-ENDUSERCTX"] = self._end_user_ctx
 
-        # return the callable function
-        return getattr(api_instance, method)
+        return api_client
 
     def _swagger_throttle(self, base_path: str, rate_keys: list) -> None:
         """
@@ -858,34 +881,87 @@ class APIPrivate(metaclass=Multiton):
                 self._rates.decrement_rate(base_path=base_path, rate_keys=rate_keys)
             else:
                 # if rates need to be refreshed, then do so.
-                if self._rates.need_refresh():
-                    limits = self.copy_of_developer_analytics_get_rate_limits()
-                    self._rates.refresh_developer_analytics(
-                        rate_limits=limits["rate_limits"]
-                    )
+                self._swagger_refresh_rates()
+
+                # decrement the rate, throttling if needed
+                self._rates.decrement_rate_throttled(
+                    base_path=base_path,
+                    rate_keys=rate_keys,
+                    timeout=self._timeout,
+                    priority=self._priority,
+                )
 
-                    # decrement the rate, throttling if needed
-                    self._rates.decrement_rate_throttled(
-                        base_path=base_path, rate_keys=rate_keys, timeout=self._timeout
-                    )
+    def _swagger_refresh_rates(self) -> None:
+        """
+        Refresh the call limits from Developer Analytics, when they are due.
+
+        Only the first call to find them due gets them, and unless there are none yet, in the background.
+        """
+        self._rates.refresh(
+            lambda: self.copy_of_developer_analytics_get_rate_limits()["rate_limits"]
+        )
 
     def copy_of_developer_analytics_get_rate_limits(self, **kwargs):
         """
         TO AVOID CIRCULAR IMPORTS, here in is a copy of the API class's method developer_analytics_get_rate_limits.
         """
-        return self._method_single(
+        # call the blocking version, even when a subclass like AsyncAPI overrides it
+        return APIPrivate._method_single(
+            self,
             developer_analytics.Configuration,
             "/developer/analytics/v1_beta",
             developer_analytics.RateLimitApi,
             developer_analytics.ApiClient,
             "get_rate_limits",
-            DeveloperAnalyticsException,
+            developer_analytics.rest.ApiException,
             False,
             ["developer.analytics", "rate_limit"],
             None,
             **kwargs,
         )  # noqa: E501
 
+    def copy_of_developer_key_management_create_signing_key(
+        self, content_type, **kwargs
+    ):
+        """
+        TO AVOID CIRCULAR IMPORTS, here in is a copy of the API class's method developer_key_management_create_signing_key.
+        """
+        # call the blocking version, even when a subclass like AsyncAPI overrides it
+        return APIPrivate._method_single(
+            self,
+            developer_key_management.Configuration,
+            "/developer/key_management/v1",
+            developer_key_management.SigningKeyApi,
+            developer_key_management.ApiClient,
+            "create_signing_key",
+            developer_key_management.rest.ApiException,
+            False,
+            ["developer.key.management", "signing_key"],
+            content_type,
+            **kwargs,
+        )  # noqa: E501
+
+    def copy_of_developer_key_management_get_signing_key(
+        self, signing_key_id, **kwargs
+    ):
+        """
+        TO AVOID CIRCULAR IMPORTS, here in is a copy of the API class's method developer_key_management_get_signing_key.
+        """
+        # call the blocking version, even when a subclass like AsyncAPI overrides it
+        return APIPrivate._method_single(
+            self,
+            developer_key_management.Configuration,
+            "/developer/key_management/v1",
+            developer_key_management.SigningKeyApi,
+            developer_key_management.ApiClient,
+            "get_signing_key",
+            developer_key_management.rest.ApiException,
+            False,
+            ["developer.key.management", "signing_key"],
+            signing_key_id,
+            **kwargs,
+        )  # noqa: E501
+
     def _de_swagger(self, obj: Any):
         """
         Convert a Swagger data object and return the Python-styled equivalent.
@@ -972,12 +1048,64 @@ class APIPrivate(metaclass=Multiton):
             logging.debug(f"Unexpected object of type {type(obj)}.")
             return obj  # something needs to be returned, hopefully it is useful as is
 
+    @staticmethod
+    def _de_json(
+        data: Any,
+        response_type: str,
+        models: Dict[str, Tuple[Tuple[str, str, Any], ...]],
+        response_types: Dict[str, Any],
+    ) -> Any:
+        """
+        Convert the decoded JSON of a response and return the Python-styled equivalent.
+
+        This is the fast alternative to having Swagger make model objects that _de_swagger then converts.
+        The result is the same, each model becomes a dict with all of its snake_case attribute names as keys.
+
+        :param data: The output of json.loads.
+        :param response_type: The type that Swagger would have deserialized to, e.g. "list[ItemSummary]".
+        :param models: From the API's generated model_table.py module.
+        :param response_types: Also from model_table.py; a response type that is missing isn't converted.
+        :return: A deep copy, converted.
+        """
+
+        def convert(value: Any, code: Any) -> Any:
+            if value is None or code is None:
+                return value
+            if code.__class__ is tuple:
+                kind, element_code = code
+                if kind == "list":
+                    return [convert(element, element_code) for element in value]
+                return {k: convert(v, element_code) for k, v in value.items()}
+            fields = models.get(code)
+            if fields is None:
+                if code == "datetime":
+                    return parse(value)
+                if code == "date":
+                    return parse(value).date()
+                return value
+            if not fields:
+                return value  # Swagger passes through models that have no attributes
+            if not isinstance(value, dict):
+                value = dict()
+            return {
+                name: (
+                    value.get(key)
+                    if field_code is None
+                    else convert(value.get(key), field_code)
+                )
+                for key, name, field_code in fields
+            }
+
+        return convert(data, response_types.get(response_type))
+
     def _call_swagger(
         self,
         swagger_method: Callable[..., Any],
         params: Optional[Union[str, Tuple[str, ...]]] = None,
         kwargs: Dict[str, Any] = None,
         swagger_method_exception: Type[Exception] = Exception,
+        base_path: Optional[str] = None,
+        rate_keys: Optional[List[str]] = None,
     ) -> Any:
         """
         Call the API method generated by Swagger and tidy the result.
@@ -986,11 +1114,20 @@ class APIPrivate(metaclass=Multiton):
         :param params:
         :param kwargs:
         :param swagger_method_exception:
+        :param base_path: With rate_keys, tell Rates what the response says about the call limit.
+        :param rate_keys:
         :return:
         """
+        record = (
+            base_path is not None
+            and self._rates is not None  # None in the sandbox
+            and not self._async_req
+        )
         # Swagger defaults to False, only add the key word argument if need be.
         if self._async_req:
             kwargs["async_req"] = self._async_req
+        elif record:
+            kwargs = dict(kwargs or {}, _return_http_data_only=False)
         try:
             if params:
                 if isinstance(params, tuple):
@@ -1010,12 +1147,14 @@ class APIPrivate(metaclass=Multiton):
                     api_response = swagger_method()
 
         except swagger_method_exception as e:
+            if record:
+                self._rates.record_response(base_path, rate_keys, e.status, e.headers)
             # error.status will be 100 to 599, see https://en.wikipedia.org/wiki/List_of_HTTP_status_codes
             raise Error(
                 number=99000 + e.status, reason=e.reason, detail=e.body, cause=e
             )
 
-        except DeveloperKeyManagementException as e:
+        except developer_key_management.rest.ApiException as e:
             raise Error(
                 number=99018,
                 reason="A Digital Signature problem.",
@@ -1024,6 +1163,9 @@ class APIPrivate(metaclass=Multiton):
             )
 
         else:
+            if record:
+                api_response, status, headers = api_response
+                self._rates.record_response(base_path, rate_keys, status, headers)
             if (
                 self._async_req
             ):  # TODO Wait for the asynchronous HTTP request to finish.
@@ -1033,6 +1175,8 @@ class APIPrivate(metaclass=Multiton):
                 raise Error(
                     number=99017, reason="Bad async_req parameter.", detail=detail
                 )
+            if self._raw_json:
+                return api_response
             return self._de_swagger(api_response)
 
     def get_digital_signature_key(self, create_new=False):
@@ -1061,3 +1205,249 @@ class APIPrivate(metaclass=Multiton):
                 )
         key = self._key_pair_token._load_key()
         return key
+
+    def batched(
+        self,
+        method: Union[str, Callable[..., Any]],
+        ids: Iterable[str],
+        concurrency: int = 4,
+        **kwargs: Any,
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Call a method that takes a limited list of ids, with any number of ids, and yield the results.
+
+        The ids are split into batches of the most that the method accepts, and up to concurrency batches
+        are called in parallel; each call is throttled like any other. The results are yielded in the
+        order of the batches. Each is {"record": ...} for a record found, or {"error": {"ids": [...], "error": ...}}
+        for ids without a record. The latter's error is the Error raised by the batch, what eBay said about
+        the ids, or None.
+
+        Supported methods: buy_browse_get_items, sell_fulfillment_get_orders, and
+        sell_inventory_bulk_get_inventory_item.
+
+        :param method: The name of an API method, or the method itself.
+        :param ids: Item ids, order ids or SKUs; any number of them.
+        :param concurrency: The most calls to have in flight, defaults to 4.
+        :param kwargs: Other parameters for the method.
+        :return: A generator.
+        """
+        name, spec = self._batch_spec(method, concurrency)
+        batches = self._batch_ids(ids, spec)
+        pending = deque()
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            while True:
+                while len(pending) < concurrency:
+                    batch = next(batches, None)
+                    if batch is None:
+                        break
+                    future = executor.submit(
+                        self._call_batch, name, spec, batch, kwargs
+                    )
+                    pending.append((batch, future))
+                if not pending:
+                    break
+                batch, future = pending.popleft()
+                try:
+                    result = future.result()
+                except Error as error:
+                    yield {"error": {"ids": batch, "error": error}}
+                else:
+                    yield from self._batch_results(spec, batch, result)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def buy_feed_download(
+        self,
+        file_id: str,
+        path: str,
+        x_ebay_c_marketplace_id: Optional[str] = None,
+        chunk_size: int = FeedDownload.CHUNK_SIZE,
+        parallel: int = 1,
+        retries: int = 3,
+    ) -> None:
+        """
+        Download a feed file to disk, a chunk at a time, instead of into memory like buy_feed_download_file.
+
+        Each chunk is a throttled call with a Range header. A chunk whose connection fails resumes from
+        the last good byte; when the download fails, calling this again with the same path and
+        chunk_size resumes it. Read the downloaded file with buy_feed_rows.
+
+        :param file_id: As for buy_feed_download_file; get it with buy_feed_get_files.
+        :param path: Where to put the gzip file; path + ".part" and path + ".journal" are used while downloading.
+        :param x_ebay_c_marketplace_id: The marketplace of the feed file, defaults to that of the header.
+        :param chunk_size: The most bytes to get in one call, defaults to 64 MB.
+        :param parallel: How many chunks to get at the same time, defaults to 1.
+        :param retries: How many times to resume a chunk after its connection fails, defaults to 3.
+        """
+        base_path = "/buy/feed/v1"
+        rate_keys = ["buy.feed", "file"]
+        marketplace_id = x_ebay_c_marketplace_id or self._header["marketplace_id"]
+
+        def fetch(first: int, last: int) -> Any:
+            self._swagger_throttle(base_path=base_path, rate_keys=rate_keys)
+            swagger_method = self._get_swagger_method(
+                buy_feed.Configuration,
+                base_path,
+                buy_feed.FileApi,
+                buy_feed.ApiClient,
+                "download_file",
+                False,
+                (file_id, marketplace_id),
+            )
+            try:
+                # don't preload, the response is streamed to the file
+                response = swagger_method(
+                    file_id,
+                    marketplace_id,
+                    range=f"bytes={first}-{last}",
+                    _preload_content=False,
+                )
+            except buy_feed.rest.ApiException as e:
+                if self._rates is not None:  # None in the sandbox
+                    self._rates.record_response(
+                        base_path, rate_keys, e.status, e.headers
+                    )
+                raise Error(
+                    number=99000 + e.status, reason=e.reason, detail=e.body, cause=e
+                )
+            if self._rates is not None:
+                self._rates.record_response(
+                    base_path, rate_keys, response.status, response.headers
+                )
+            return response
+
+        FeedDownload(path, chunk_size).run(fetch, parallel, retries)
+
+    @staticmethod
+    def buy_feed_rows(path: str) -> Iterator[Dict[str, str]]:
+        """
+        Yield the rows of a feed file from buy_feed_download, decompressing it as it goes, so that memory use stays small.
+
+        :param path: The gzip TSV feed file.
+        :return: An iterator of dicts, keyed by the column names in the file's first row.
+        """
+        return FeedDownload.rows(path)
+
+    # The methods that batched() supports; the method name maps to a tuple of the ids parameter,
+    # the most ids per call, the key to the list of records, and the key to the id within a record.
+    _BATCH_SPECS = {
+        "buy_browse_get_items": ("item_ids", 20, "items", "item_id"),
+        "sell_fulfillment_get_orders": ("order_ids", 50, "orders", "order_id"),
+        "sell_inventory_bulk_get_inventory_item": ("body", 25, "responses", "sku"),
+    }
+
+    @staticmethod
+    def _batch_spec(
+        method: Union[str, Callable[..., Any]], concurrency: int
+    ) -> Tuple[str, Tuple[str, int, str, str]]:
+        """
+        Check the parameters of batched() and find how to batch the method.
+
+        :param method: The name of an API method, or the method itself.
+        :param concurrency: The most calls to have in flight.
+        :return: The method's name and its batch spec.
+        """
+        name = method if isinstance(method, str) else getattr(method, "__name__", None)
+        if name not in APIPrivate._BATCH_SPECS:
+            detail = (
+                f"Method {name} is not one of {', '.join(APIPrivate._BATCH_SPECS)}."
+            )
+            raise Error(
+                number=99024, reason="Unsupported batched method.", detail=detail
+            )
+        if isinstance(concurrency, bool) or not isinstance(concurrency, int):
+            detail = (
+                f"Parameter concurrency {concurrency} must be unspecified or an int."
+            )
+            raise Error(
+                number=99025, reason="Bad concurrency parameter.", detail=detail
+            )
+        if concurrency <= 0:
+            detail = f"Parameter concurrency {concurrency} must be positive."
+            raise Error(
+                number=99025, reason="Bad concurrency parameter.", detail=detail
+            )
+        return name, APIPrivate._BATCH_SPECS[name]
+
+    @staticmethod
+    def _batch_ids(
+        ids: Iterable[str], spec: Tuple[str, int, str, str]
+    ) -> Iterator[List[str]]:
+        """
+        Split the ids into batches, lazily.
+
+        :param ids: Any number of ids.
+        :param spec: The batch spec of the method.
+        :return: An iterator of lists of ids.
+        """
+        ids = iter(ids)
+        while batch := list(itertools.islice(ids, spec[1])):
+            yield batch
+
+    @staticmethod
+    def _batch_arguments(
+        spec: Tuple[str, int, str, str], batch: List[str], kwargs: Dict[str, Any]
+    ) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        """
+        Make the arguments for calling a method with a batch of ids.
+
+        :param spec: The batch spec of the method.
+        :param batch: The ids.
+        :param kwargs: Other parameters for the method.
+        :return: The positional and keyword arguments.
+        """
+        parameter = spec[0]
+        if parameter == "body":
+            body = {"requests": [{"sku": sku} for sku in batch]}
+            return (body, "application/json"), kwargs
+        return (), dict(kwargs, **{parameter: ",".join(batch)})
+
+    def _call_batch(
+        self,
+        name: str,
+        spec: Tuple[str, int, str, str],
+        batch: List[str],
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Call a method with a batch of ids.
+
+        :param name: The name of the method.
+        :param spec: The batch spec of the method.
+        :param batch: The ids.
+        :param kwargs: Other parameters for the method.
+        :return: The result; for a paged method, a dict with its records.
+        """
+        args, kwargs = self._batch_arguments(spec, batch, kwargs)
+        result = getattr(self, name)(*args, **kwargs)
+        if inspect.isgenerator(result):  # a paged method
+            result = {spec[2]: [item["record"] for item in result if "record" in item]}
+        return result
+
+    @staticmethod
+    def _batch_results(
+        spec: Tuple[str, int, str, str], batch: List[str], result: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Split the result of a batch into records and errors for batched() to yield.
+
+        :param spec: The batch spec of the method.
+        :param batch: The ids.
+        :param result: What the method returned.
+        :return: An iterator of records and errors.
+        """
+        _parameter, _size, records_key, id_key = spec
+        found = set()
+        for record in (result or {}).get(records_key) or []:
+            status_code = record.get("status_code")
+            if status_code is not None and not 200 <= status_code <= 299:
+                error = {"ids": [record.get(id_key)], "error": record.get("errors")}
+                yield {"error": error}
+            else:
+                yield {"record": record}
+            found.add(record.get(id_key))
+        missing = [id_ for id_ in batch if id_ not in found]
+        if missing:
+            detail = (result or {}).get("warnings") or (result or {}).get("errors")
+            yield {"error": {"ids": missing, "error": detail}}
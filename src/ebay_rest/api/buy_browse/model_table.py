@@ -0,0 +1,657 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'AdditionalProductIdentity': (
+        ('productIdentity', 'product_identity', ('list', 'ProductIdentity')),
+    ),
+    'AddonService': (
+        ('selection', 'selection', None),
+        ('serviceFee', 'service_fee', 'ConvertedAmount'),
+        ('serviceId', 'service_id', None),
+        ('serviceType', 'service_type', None),
+    ),
+    'Address': (
+        ('addressLine1', 'address_line1', None),
+        ('addressLine2', 'address_line2', None),
+        ('city', 'city', None),
+        ('country', 'country', None),
+        ('county', 'county', None),
+        ('postalCode', 'postal_code', None),
+        ('stateOrProvince', 'state_or_province', None),
+    ),
+    'Amount': (
+        ('currency', 'currency', None),
+        ('value', 'value', None),
+    ),
+    'Aspect': (
+        ('localizedName', 'localized_name', None),
+        ('localizedValues', 'localized_values', None),
+    ),
+    'AspectDistribution': (
+        ('aspectValueDistributions', 'aspect_value_distributions', ('list', 'AspectValueDistribution')),
+        ('localizedAspectName', 'localized_aspect_name', None),
+    ),
+    'AspectGroup': (
+        ('aspects', 'aspects', ('list', 'Aspect')),
+        ('localizedGroupName', 'localized_group_name', None),
+    ),
+    'AspectValueDistribution': (
+        ('localizedAspectValue', 'localized_aspect_value', None),
+        ('matchCount', 'match_count', None),
+        ('refinementHref', 'refinement_href', None),
+    ),
+    'AttributeNameValue': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'AuthenticityGuaranteeProgram': (
+        ('description', 'description', None),
+        ('termsWebUrl', 'terms_web_url', None),
+    ),
+    'AuthenticityVerificationProgram': (
+        ('description', 'description', None),
+        ('termsWebUrl', 'terms_web_url', None),
+    ),
+    'AutoCorrections': (
+        ('q', 'q', None),
+    ),
+    'AvailableCoupon': (
+        ('constraint', 'constraint', 'CouponConstraint'),
+        ('discountAmount', 'discount_amount', 'Amount'),
+        ('discountType', 'discount_type', None),
+        ('message', 'message', None),
+        ('redemptionCode', 'redemption_code', None),
+        ('termsWebUrl', 'terms_web_url', None),
+    ),
+    'BuyingOptionDistribution': (
+        ('buyingOption', 'buying_option', None),
+        ('matchCount', 'match_count', None),
+        ('refinementHref', 'refinement_href', None),
+    ),
+    'Category': (
+        ('categoryId', 'category_id', None),
+        ('categoryName', 'category_name', None),
+    ),
+    'CategoryDistribution': (
+        ('categoryId', 'category_id', None),
+        ('categoryName', 'category_name', None),
+        ('matchCount', 'match_count', None),
+        ('refinementHref', 'refinement_href', None),
+    ),
+    'CommonDescriptions': (
+        ('description', 'description', None),
+        ('itemIds', 'item_ids', None),
+    ),
+    'CompanyAddress': (
+        ('addressLine1', 'address_line1', None),
+        ('addressLine2', 'address_line2', None),
+        ('city', 'city', None),
+        ('companyName', 'company_name', None),
+        ('contactUrl', 'contact_url', None),
+        ('country', 'country', None),
+        ('countryName', 'country_name', None),
+        ('county', 'county', None),
+        ('email', 'email', None),
+        ('phone', 'phone', None),
+        ('postalCode', 'postal_code', None),
+        ('stateOrProvince', 'state_or_province', None),
+    ),
+    'CompatibilityPayload': (
+        ('compatibilityProperties', 'compatibility_properties', ('list', 'AttributeNameValue')),
+    ),
+    'CompatibilityProperty': (
+        ('localizedName', 'localized_name', None),
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'CompatibilityResponse': (
+        ('compatibilityStatus', 'compatibility_status', None),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'ConditionDescriptor': (
+        ('name', 'name', None),
+        ('values', 'values', ('list', 'ConditionDescriptorValue')),
+    ),
+    'ConditionDescriptorValue': (
+        ('additionalInfo', 'additional_info', None),
+        ('content', 'content', None),
+    ),
+    'ConditionDistribution': (
+        ('condition', 'condition', None),
+        ('conditionId', 'condition_id', None),
+        ('matchCount', 'match_count', None),
+        ('refinementHref', 'refinement_href', None),
+    ),
+    'ConvertedAmount': (
+        ('convertedFromCurrency', 'converted_from_currency', None),
+        ('convertedFromValue', 'converted_from_value', None),
+        ('currency', 'currency', None),
+        ('value', 'value', None),
+    ),
+    'CoreItem': (
+        ('additionalImages', 'additional_images', ('list', 'Image')),
+        ('adultOnly', 'adult_only', None),
+        ('ageGroup', 'age_group', None),
+        ('authenticityGuarantee', 'authenticity_guarantee', 'AuthenticityGuaranteeProgram'),
+        ('authenticityVerification', 'authenticity_verification', 'AuthenticityVerificationProgram'),
+        ('availableCoupons', 'available_coupons', ('list', 'AvailableCoupon')),
+        ('bidCount', 'bid_count', None),
+        ('brand', 'brand', None),
+        ('buyingOptions', 'buying_options', None),
+        ('categoryId', 'category_id', None),
+        ('categoryPath', 'category_path', None),
+        ('color', 'color', None),
+        ('charityTerms', 'charity_terms', 'ItemCharityTerms'),
+        ('condition', 'condition', None),
+        ('conditionDescription', 'condition_description', None),
+        ('conditionId', 'condition_id', None),
+        ('currentBidPrice', 'current_bid_price', 'ConvertedAmount'),
+        ('description', 'description', None),
+        ('eligibleForInlineCheckout', 'eligible_for_inline_checkout', None),
+        ('enabledForGuestCheckout', 'enabled_for_guest_checkout', None),
+        ('energyEfficiencyClass', 'energy_efficiency_class', None),
+        ('epid', 'epid', None),
+        ('estimatedAvailabilities', 'estimated_availabilities', ('list', 'EstimatedAvailability')),
+        ('gender', 'gender', None),
+        ('gtin', 'gtin', None),
+        ('image', 'image', 'Image'),
+        ('immediatePay', 'immediate_pay', None),
+        ('inferredEpid', 'inferred_epid', None),
+        ('itemAffiliateWebUrl', 'item_affiliate_web_url', None),
+        ('itemCreationDate', 'item_creation_date', None),
+        ('itemEndDate', 'item_end_date', None),
+        ('itemId', 'item_id', None),
+        ('itemLocation', 'item_location', 'Address'),
+        ('itemWebUrl', 'item_web_url', None),
+        ('legacyItemId', 'legacy_item_id', None),
+        ('localizedAspects', 'localized_aspects', ('list', 'TypedNameValue')),
+        ('lotSize', 'lot_size', None),
+        ('marketingPrice', 'marketing_price', 'MarketingPrice'),
+        ('material', 'material', None),
+        ('minimumPriceToBid', 'minimum_price_to_bid', 'ConvertedAmount'),
+        ('mpn', 'mpn', None),
+        ('pattern', 'pattern', None),
+        ('paymentMethods', 'payment_methods', ('list', 'PaymentMethod')),
+        ('price', 'price', 'ConvertedAmount'),
+        ('priceDisplayCondition', 'price_display_condition', None),
+        ('primaryItemGroup', 'primary_item_group', 'ItemGroupSummary'),
+        ('primaryProductReviewRating', 'primary_product_review_rating', 'ReviewRating'),
+        ('priorityListing', 'priority_listing', None),
+        ('product', 'product', 'Product'),
+        ('productFicheWebUrl', 'product_fiche_web_url', None),
+        ('qualifiedPrograms', 'qualified_programs', None),
+        ('quantityLimitPerBuyer', 'quantity_limit_per_buyer', None),
+        ('reservePriceMet', 'reserve_price_met', None),
+        ('returnTerms', 'return_terms', 'ItemReturnTerms'),
+        ('seller', 'seller', 'SellerDetail'),
+        ('sellerItemRevision', 'seller_item_revision', None),
+        ('shippingOptions', 'shipping_options', ('list', 'ShippingOption')),
+        ('shipToLocations', 'ship_to_locations', 'ShipToLocations'),
+        ('shortDescription', 'short_description', None),
+        ('size', 'size', None),
+        ('sizeSystem', 'size_system', None),
+        ('sizeType', 'size_type', None),
+        ('subtitle', 'subtitle', None),
+        ('taxes', 'taxes', ('list', 'Taxes')),
+        ('title', 'title', None),
+        ('topRatedBuyingExperience', 'top_rated_buying_experience', None),
+        ('tyreLabelImageUrl', 'tyre_label_image_url', None),
+        ('uniqueBidderCount', 'unique_bidder_count', None),
+        ('unitPrice', 'unit_price', 'ConvertedAmount'),
+        ('unitPricingMeasure', 'unit_pricing_measure', None),
+    ),
+    'CouponConstraint': (
+        ('expirationDate', 'expiration_date', None),
+    ),
+    'EconomicOperator': (
+        ('companyName', 'company_name', None),
+        ('addressLine1', 'address_line1', None),
+        ('addressLine2', 'address_line2', None),
+        ('city', 'city', None),
+        ('stateOrProvince', 'state_or_province', None),
+        ('postalCode', 'postal_code', None),
+        ('country', 'country', None),
+        ('phone', 'phone', None),
+        ('email', 'email', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'EstimatedAvailability': (
+        ('availabilityThreshold', 'availability_threshold', None),
+        ('availabilityThresholdType', 'availability_threshold_type', None),
+        ('deliveryOptions', 'delivery_options', None),
+        ('estimatedAvailabilityStatus', 'estimated_availability_status', None),
+        ('estimatedAvailableQuantity', 'estimated_available_quantity', None),
+        ('estimatedRemainingQuantity', 'estimated_remaining_quantity', None),
+        ('estimatedSoldQuantity', 'estimated_sold_quantity', None),
+    ),
+    'HazardPictogram': (
+        ('pictogramDescription', 'pictogram_description', None),
+        ('pictogramId', 'pictogram_id', None),
+        ('pictogramUrl', 'pictogram_url', None),
+    ),
+    'HazardStatement': (
+        ('statementDescription', 'statement_description', None),
+        ('statementId', 'statement_id', None),
+    ),
+    'HazardousMaterialsLabels': (
+        ('additionalInformation', 'additional_information', None),
+        ('pictograms', 'pictograms', ('list', 'HazardPictogram')),
+        ('signalWord', 'signal_word', None),
+        ('signalWordId', 'signal_word_id', None),
+        ('statements', 'statements', ('list', 'HazardStatement')),
+    ),
+    'Image': (
+        ('height', 'height', None),
+        ('imageUrl', 'image_url', None),
+        ('width', 'width', None),
+    ),
+    'Item': (
+        ('additionalImages', 'additional_images', ('list', 'Image')),
+        ('addonServices', 'addon_services', ('list', 'AddonService')),
+        ('adultOnly', 'adult_only', None),
+        ('ageGroup', 'age_group', None),
+        ('authenticityGuarantee', 'authenticity_guarantee', 'AuthenticityGuaranteeProgram'),
+        ('authenticityVerification', 'authenticity_verification', 'AuthenticityVerificationProgram'),
+        ('availableCoupons', 'available_coupons', ('list', 'AvailableCoupon')),
+        ('bidCount', 'bid_count', None),
+        ('brand', 'brand', None),
+        ('buyingOptions', 'buying_options', None),
+        ('categoryId', 'category_id', None),
+        ('categoryIdPath', 'category_id_path', None),
+        ('categoryPath', 'category_path', None),
+        ('charityTerms', 'charity_terms', 'ItemCharityTerms'),
+        ('color', 'color', None),
+        ('condition', 'condition', None),
+        ('conditionDescription', 'condition_description', None),
+        ('conditionDescriptors', 'condition_descriptors', ('list', 'ConditionDescriptor')),
+        ('conditionId', 'condition_id', None),
+        ('currentBidPrice', 'current_bid_price', 'ConvertedAmount'),
+        ('description', 'description', None),
+        ('ecoParticipationFee', 'eco_participation_fee', 'ConvertedAmount'),
+        ('eligibleForInlineCheckout', 'eligible_for_inline_checkout', None),
+        ('enabledForGuestCheckout', 'enabled_for_guest_checkout', None),
+        ('energyEfficiencyClass', 'energy_efficiency_class', None),
+        ('epid', 'epid', None),
+        ('estimatedAvailabilities', 'estimated_availabilities', ('list', 'EstimatedAvailability')),
+        ('gender', 'gender', None),
+        ('gtin', 'gtin', None),
+        ('hazardousMaterialsLabels', 'hazardous_materials_labels', 'HazardousMaterialsLabels'),
+        ('image', 'image', 'Image'),
+        ('immediatePay', 'immediate_pay', None),
+        ('inferredEpid', 'inferred_epid', None),
+        ('itemAffiliateWebUrl', 'item_affiliate_web_url', None),
+        ('itemCreationDate', 'item_creation_date', None),
+        ('itemEndDate', 'item_end_date', None),
+        ('itemId', 'item_id', None),
+        ('itemLocation', 'item_location', 'Address'),
+        ('itemWebUrl', 'item_web_url', None),
+        ('legacyItemId', 'legacy_item_id', None),
+        ('listingMarketplaceId', 'listing_marketplace_id', None),
+        ('localizedAspects', 'localized_aspects', ('list', 'TypedNameValue')),
+        ('lotSize', 'lot_size', None),
+        ('manufacturer', 'manufacturer', 'CompanyAddress'),
+        ('marketingPrice', 'marketing_price', 'MarketingPrice'),
+        ('material', 'material', None),
+        ('minimumPriceToBid', 'minimum_price_to_bid', 'ConvertedAmount'),
+        ('mpn', 'mpn', None),
+        ('pattern', 'pattern', None),
+        ('paymentMethods', 'payment_methods', ('list', 'PaymentMethod')),
+        ('price', 'price', 'ConvertedAmount'),
+        ('priceDisplayCondition', 'price_display_condition', None),
+        ('primaryItemGroup', 'primary_item_group', 'ItemGroupSummary'),
+        ('primaryProductReviewRating', 'primary_product_review_rating', 'ReviewRating'),
+        ('priorityListing', 'priority_listing', None),
+        ('product', 'product', 'Product'),
+        ('productFicheWebUrl', 'product_fiche_web_url', None),
+        ('productSafetyLabels', 'product_safety_labels', 'ProductSafetyLabels'),
+        ('qualifiedPrograms', 'qualified_programs', None),
+        ('quantityLimitPerBuyer', 'quantity_limit_per_buyer', None),
+        ('repairScore', 'repair_score', None),
+        ('reservePriceMet', 'reserve_price_met', None),
+        ('responsiblePersons', 'responsible_persons', ('list', 'ResponsiblePerson')),
+        ('returnTerms', 'return_terms', 'ItemReturnTerms'),
+        ('seller', 'seller', 'SellerDetail'),
+        ('sellerCustomPolicies', 'seller_custom_policies', ('list', 'SellerCustomPolicy')),
+        ('sellerItemRevision', 'seller_item_revision', None),
+        ('shippingOptions', 'shipping_options', ('list', 'ShippingOption')),
+        ('shipToLocations', 'ship_to_locations', 'ShipToLocations'),
+        ('shortDescription', 'short_description', None),
+        ('size', 'size', None),
+        ('sizeSystem', 'size_system', None),
+        ('sizeType', 'size_type', None),
+        ('subtitle', 'subtitle', None),
+        ('taxes', 'taxes', ('list', 'Taxes')),
+        ('title', 'title', None),
+        ('topRatedBuyingExperience', 'top_rated_buying_experience', None),
+        ('tyreLabelImageUrl', 'tyre_label_image_url', None),
+        ('uniqueBidderCount', 'unique_bidder_count', None),
+        ('unitPrice', 'unit_price', 'ConvertedAmount'),
+        ('unitPricingMeasure', 'unit_pricing_measure', None),
+        ('warnings', 'warnings', ('list', 'Error')),
+        ('watchCount', 'watch_count', None),
+    ),
+    'ItemCharityTerms': (
+        ('charityOrgId', 'charity_org_id', None),
+        ('donationPercentage', 'donation_percentage', None),
+        ('LogoImage', 'logo_image', 'Image'),
+        ('name', 'name', None),
+        ('website', 'website', None),
+    ),
+    'ItemGroup': (
+        ('commonDescriptions', 'common_descriptions', ('list', 'CommonDescriptions')),
+        ('items', 'items', ('list', 'Item')),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'ItemGroupSummary': (
+        ('itemGroupAdditionalImages', 'item_group_additional_images', ('list', 'Image')),
+        ('itemGroupHref', 'item_group_href', None),
+        ('itemGroupId', 'item_group_id', None),
+        ('itemGroupImage', 'item_group_image', 'Image'),
+        ('itemGroupTitle', 'item_group_title', None),
+        ('itemGroupType', 'item_group_type', None),
+    ),
+    'ItemLocationImpl': (
+        ('addressLine1', 'address_line1', None),
+        ('addressLine2', 'address_line2', None),
+        ('city', 'city', None),
+        ('country', 'country', None),
+        ('county', 'county', None),
+        ('postalCode', 'postal_code', None),
+        ('stateOrProvince', 'state_or_province', None),
+    ),
+    'ItemReturnTerms': (
+        ('extendedHolidayReturnsOffered', 'extended_holiday_returns_offered', None),
+        ('refundMethod', 'refund_method', None),
+        ('restockingFeePercentage', 'restocking_fee_percentage', None),
+        ('returnInstructions', 'return_instructions', None),
+        ('returnMethod', 'return_method', None),
+        ('returnPeriod', 'return_period', 'TimeDuration'),
+        ('returnsAccepted', 'returns_accepted', None),
+        ('returnShippingCostPayer', 'return_shipping_cost_payer', None),
+    ),
+    'ItemSummary': (
+        ('additionalImages', 'additional_images', ('list', 'Image')),
+        ('adultOnly', 'adult_only', None),
+        ('availableCoupons', 'available_coupons', None),
+        ('bidCount', 'bid_count', None),
+        ('buyingOptions', 'buying_options', None),
+        ('categories', 'categories', ('list', 'Category')),
+        ('compatibilityMatch', 'compatibility_match', None),
+        ('compatibilityProperties', 'compatibility_properties', ('list', 'CompatibilityProperty')),
+        ('condition', 'condition', None),
+        ('conditionId', 'condition_id', None),
+        ('currentBidPrice', 'current_bid_price', 'ConvertedAmount'),
+        ('distanceFromPickupLocation', 'distance_from_pickup_location', 'TargetLocation'),
+        ('energyEfficiencyClass', 'energy_efficiency_class', None),
+        ('epid', 'epid', None),
+        ('image', 'image', 'Image'),
+        ('itemAffiliateWebUrl', 'item_affiliate_web_url', None),
+        ('itemCreationDate', 'item_creation_date', None),
+        ('itemEndDate', 'item_end_date', None),
+        ('itemGroupHref', 'item_group_href', None),
+        ('itemGroupType', 'item_group_type', None),
+        ('itemHref', 'item_href', None),
+        ('itemId', 'item_id', None),
+        ('itemLocation', 'item_location', 'ItemLocationImpl'),
+        ('itemOriginDate', 'item_origin_date', None),
+        ('itemWebUrl', 'item_web_url', None),
+        ('leafCategoryIds', 'leaf_category_ids', None),
+        ('legacyItemId', 'legacy_item_id', None),
+        ('listingMarketplaceId', 'listing_marketplace_id', None),
+        ('marketingPrice', 'marketing_price', 'MarketingPrice'),
+        ('pickupOptions', 'pickup_options', ('list', 'PickupOptionSummary')),
+        ('price', 'price', 'ConvertedAmount'),
+        ('priceDisplayCondition', 'price_display_condition', None),
+        ('priorityListing', 'priority_listing', None),
+        ('qualifiedPrograms', 'qualified_programs', None),
+        ('seller', 'seller', 'Seller'),
+        ('shippingOptions', 'shipping_options', ('list', 'ShippingOptionSummary')),
+        ('shortDescription', 'short_description', None),
+        ('thumbnailImages', 'thumbnail_images', ('list', 'Image')),
+        ('title', 'title', None),
+        ('topRatedBuyingExperience', 'top_rated_buying_experience', None),
+        ('tyreLabelImageUrl', 'tyre_label_image_url', None),
+        ('unitPrice', 'unit_price', 'ConvertedAmount'),
+        ('unitPricingMeasure', 'unit_pricing_measure', None),
+        ('watchCount', 'watch_count', None),
+    ),
+    'Items': (
+        ('items', 'items', ('list', 'CoreItem')),
+        ('total', 'total', None),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'LegalAddress': (
+        ('addressLine1', 'address_line1', None),
+        ('addressLine2', 'address_line2', None),
+        ('city', 'city', None),
+        ('country', 'country', None),
+        ('countryName', 'country_name', None),
+        ('county', 'county', None),
+        ('postalCode', 'postal_code', None),
+        ('stateOrProvince', 'state_or_province', None),
+    ),
+    'MarketingPrice': (
+        ('discountAmount', 'discount_amount', 'ConvertedAmount'),
+        ('discountPercentage', 'discount_percentage', None),
+        ('originalPrice', 'original_price', 'ConvertedAmount'),
+        ('priceTreatment', 'price_treatment', None),
+    ),
+    'PaymentMethod': (
+        ('paymentMethodType', 'payment_method_type', None),
+        ('paymentMethodBrands', 'payment_method_brands', ('list', 'PaymentMethodBrand')),
+        ('paymentInstructions', 'payment_instructions', None),
+        ('sellerInstructions', 'seller_instructions', None),
+    ),
+    'PaymentMethodBrand': (
+        ('paymentMethodBrandType', 'payment_method_brand_type', None),
+        ('logoImage', 'logo_image', 'Image'),
+    ),
+    'PickupOptionSummary': (
+        ('pickupLocationType', 'pickup_location_type', None),
+    ),
+    'Product': (
+        ('additionalImages', 'additional_images', ('list', 'Image')),
+        ('additionalProductIdentities', 'additional_product_identities', ('list', 'AdditionalProductIdentity')),
+        ('aspectGroups', 'aspect_groups', ('list', 'AspectGroup')),
+        ('brand', 'brand', None),
+        ('description', 'description', None),
+        ('gtins', 'gtins', None),
+        ('image', 'image', 'Image'),
+        ('mpns', 'mpns', None),
+        ('title', 'title', None),
+    ),
+    'ProductIdentity': (
+        ('identifierType', 'identifier_type', None),
+        ('identifierValue', 'identifier_value', None),
+    ),
+    'ProductSafetyLabelPictogram': (
+        ('pictogramDescription', 'pictogram_description', None),
+        ('pictogramId', 'pictogram_id', None),
+        ('pictogramUrl', 'pictogram_url', None),
+    ),
+    'ProductSafetyLabelStatement': (
+        ('statementDescription', 'statement_description', None),
+        ('statementId', 'statement_id', None),
+    ),
+    'ProductSafetyLabels': (
+        ('pictograms', 'pictograms', ('list', 'ProductSafetyLabelPictogram')),
+        ('statements', 'statements', ('list', 'ProductSafetyLabelStatement')),
+    ),
+    'RatingHistogram': (
+        ('count', 'count', None),
+        ('rating', 'rating', None),
+    ),
+    'Refinement': (
+        ('aspectDistributions', 'aspect_distributions', ('list', 'AspectDistribution')),
+        ('buyingOptionDistributions', 'buying_option_distributions', ('list', 'BuyingOptionDistribution')),
+        ('categoryDistributions', 'category_distributions', ('list', 'CategoryDistribution')),
+        ('conditionDistributions', 'condition_distributions', ('list', 'ConditionDistribution')),
+        ('dominantCategoryId', 'dominant_category_id', None),
+    ),
+    'Region': (
+        ('regionName', 'region_name', None),
+        ('regionType', 'region_type', None),
+    ),
+    'ResponsiblePerson': (
+        ('addressLine1', 'address_line1', None),
+        ('addressLine2', 'address_line2', None),
+        ('city', 'city', None),
+        ('companyName', 'company_name', None),
+        ('contactUrl', 'contact_url', None),
+        ('country', 'country', None),
+        ('countryName', 'country_name', None),
+        ('county', 'county', None),
+        ('email', 'email', None),
+        ('phone', 'phone', None),
+        ('postalCode', 'postal_code', None),
+        ('stateOrProvince', 'state_or_province', None),
+        ('types', 'types', None),
+    ),
+    'ReviewRating': (
+        ('averageRating', 'average_rating', None),
+        ('ratingHistograms', 'rating_histograms', ('list', 'RatingHistogram')),
+        ('reviewCount', 'review_count', None),
+    ),
+    'SearchByImageRequest': (
+        ('image', 'image', None),
+    ),
+    'SearchPagedCollection': (
+        ('autoCorrections', 'auto_corrections', 'AutoCorrections'),
+        ('href', 'href', None),
+        ('itemSummaries', 'item_summaries', ('list', 'ItemSummary')),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('refinement', 'refinement', 'Refinement'),
+        ('total', 'total', None),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'Seller': (
+        ('feedbackPercentage', 'feedback_percentage', None),
+        ('feedbackScore', 'feedback_score', None),
+        ('sellerAccountType', 'seller_account_type', None),
+        ('username', 'username', None),
+    ),
+    'SellerCustomPolicy': (
+        ('description', 'description', None),
+        ('label', 'label', None),
+        ('type', 'type', None),
+    ),
+    'SellerDetail': (
+        ('feedbackPercentage', 'feedback_percentage', None),
+        ('feedbackScore', 'feedback_score', None),
+        ('sellerAccountType', 'seller_account_type', None),
+        ('sellerLegalInfo', 'seller_legal_info', 'SellerLegalInfo'),
+        ('userId', 'user_id', None),
+        ('username', 'username', None),
+    ),
+    'SellerLegalInfo': (
+        ('email', 'email', None),
+        ('fax', 'fax', None),
+        ('imprint', 'imprint', None),
+        ('legalContactFirstName', 'legal_contact_first_name', None),
+        ('legalContactLastName', 'legal_contact_last_name', None),
+        ('name', 'name', None),
+        ('phone', 'phone', None),
+        ('registrationNumber', 'registration_number', None),
+        ('sellerProvidedLegalAddress', 'seller_provided_legal_address', 'LegalAddress'),
+        ('termsOfService', 'terms_of_service', None),
+        ('vatDetails', 'vat_details', ('list', 'VatDetail')),
+        ('economicOperator', 'economic_operator', 'EconomicOperator'),
+        ('weeeNumber', 'weee_number', None),
+    ),
+    'ShipToLocation': (
+        ('country', 'country', None),
+        ('postalCode', 'postal_code', None),
+    ),
+    'ShipToLocations': (
+        ('regionExcluded', 'region_excluded', ('list', 'ShipToRegion')),
+        ('regionIncluded', 'region_included', ('list', 'ShipToRegion')),
+    ),
+    'ShipToRegion': (
+        ('regionId', 'region_id', None),
+        ('regionName', 'region_name', None),
+        ('regionType', 'region_type', None),
+    ),
+    'ShippingOption': (
+        ('additionalShippingCostPerUnit', 'additional_shipping_cost_per_unit', 'ConvertedAmount'),
+        ('cutOffDateUsedForEstimate', 'cut_off_date_used_for_estimate', None),
+        ('fulfilledThrough', 'fulfilled_through', None),
+        ('guaranteedDelivery', 'guaranteed_delivery', None),
+        ('importCharges', 'import_charges', 'ConvertedAmount'),
+        ('maxEstimatedDeliveryDate', 'max_estimated_delivery_date', None),
+        ('minEstimatedDeliveryDate', 'min_estimated_delivery_date', None),
+        ('quantityUsedForEstimate', 'quantity_used_for_estimate', None),
+        ('shippingCarrierCode', 'shipping_carrier_code', None),
+        ('shippingCost', 'shipping_cost', 'ConvertedAmount'),
+        ('shippingCostType', 'shipping_cost_type', None),
+        ('shippingServiceCode', 'shipping_service_code', None),
+        ('shipToLocationUsedForEstimate', 'ship_to_location_used_for_estimate', 'ShipToLocation'),
+        ('trademarkSymbol', 'trademark_symbol', None),
+        ('type', 'type', None),
+    ),
+    'ShippingOptionSummary': (
+        ('guaranteedDelivery', 'guaranteed_delivery', None),
+        ('maxEstimatedDeliveryDate', 'max_estimated_delivery_date', None),
+        ('minEstimatedDeliveryDate', 'min_estimated_delivery_date', None),
+        ('shippingCost', 'shipping_cost', 'ConvertedAmount'),
+        ('shippingCostType', 'shipping_cost_type', None),
+    ),
+    'TargetLocation': (
+        ('unitOfMeasure', 'unit_of_measure', None),
+        ('value', 'value', None),
+    ),
+    'TaxJurisdiction': (
+        ('region', 'region', 'Region'),
+        ('taxJurisdictionId', 'tax_jurisdiction_id', None),
+    ),
+    'Taxes': (
+        ('ebayCollectAndRemitTax', 'ebay_collect_and_remit_tax', None),
+        ('includedInPrice', 'included_in_price', None),
+        ('shippingAndHandlingTaxed', 'shipping_and_handling_taxed', None),
+        ('taxJurisdiction', 'tax_jurisdiction', 'TaxJurisdiction'),
+        ('taxPercentage', 'tax_percentage', None),
+        ('taxType', 'tax_type', None),
+    ),
+    'TimeDuration': (
+        ('unit', 'unit', None),
+        ('value', 'value', None),
+    ),
+    'TypedNameValue': (
+        ('name', 'name', None),
+        ('type', 'type', None),
+        ('value', 'value', None),
+    ),
+    'VatDetail': (
+        ('issuingCountry', 'issuing_country', None),
+        ('vatId', 'vat_id', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'CompatibilityResponse': 'CompatibilityResponse',
+    'Item': 'Item',
+    'ItemGroup': 'ItemGroup',
+    'Items': 'Items',
+    'SearchPagedCollection': 'SearchPagedCollection',
+}
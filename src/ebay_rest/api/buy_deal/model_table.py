@@ -0,0 +1,144 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'Amount': (
+        ('currency', 'currency', None),
+        ('value', 'value', None),
+    ),
+    'Coupon': (
+        ('redemptionCode', 'redemption_code', None),
+        ('terms', 'terms', 'Terms'),
+    ),
+    'DealItem': (
+        ('additionalImages', 'additional_images', ('list', 'Image')),
+        ('categoryAncestorIds', 'category_ancestor_ids', None),
+        ('categoryId', 'category_id', None),
+        ('commissionable', 'commissionable', None),
+        ('dealAffiliateWebUrl', 'deal_affiliate_web_url', None),
+        ('dealEndDate', 'deal_end_date', None),
+        ('dealStartDate', 'deal_start_date', None),
+        ('dealWebUrl', 'deal_web_url', None),
+        ('energyEfficiencyClass', 'energy_efficiency_class', None),
+        ('image', 'image', 'Image'),
+        ('itemAffiliateWebUrl', 'item_affiliate_web_url', None),
+        ('itemGroupId', 'item_group_id', None),
+        ('itemGroupType', 'item_group_type', None),
+        ('itemId', 'item_id', None),
+        ('itemWebUrl', 'item_web_url', None),
+        ('legacyItemId', 'legacy_item_id', None),
+        ('marketingPrice', 'marketing_price', 'MarketingPrice'),
+        ('price', 'price', 'Amount'),
+        ('qualifiedPrograms', 'qualified_programs', None),
+        ('shippingOptions', 'shipping_options', ('list', 'ShippingOption')),
+        ('title', 'title', None),
+        ('unitPrice', 'unit_price', 'Amount'),
+        ('unitPricingMeasure', 'unit_pricing_measure', None),
+    ),
+    'DealItemSearchResponse': (
+        ('dealItems', 'deal_items', ('list', 'DealItem')),
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'Event': (
+        ('applicableCoupons', 'applicable_coupons', ('list', 'Coupon')),
+        ('description', 'description', None),
+        ('endDate', 'end_date', None),
+        ('eventAffiliateWebUrl', 'event_affiliate_web_url', None),
+        ('eventId', 'event_id', None),
+        ('eventWebUrl', 'event_web_url', None),
+        ('images', 'images', ('list', 'Image')),
+        ('startDate', 'start_date', None),
+        ('terms', 'terms', 'Terms'),
+        ('title', 'title', None),
+    ),
+    'EventItem': (
+        ('additionalImages', 'additional_images', ('list', 'Image')),
+        ('categoryAncestorIds', 'category_ancestor_ids', None),
+        ('categoryId', 'category_id', None),
+        ('energyEfficiencyClass', 'energy_efficiency_class', None),
+        ('eventId', 'event_id', None),
+        ('image', 'image', 'Image'),
+        ('itemAffiliateWebUrl', 'item_affiliate_web_url', None),
+        ('itemGroupId', 'item_group_id', None),
+        ('itemGroupType', 'item_group_type', None),
+        ('itemId', 'item_id', None),
+        ('itemWebUrl', 'item_web_url', None),
+        ('legacyItemId', 'legacy_item_id', None),
+        ('marketingPrice', 'marketing_price', 'MarketingPrice'),
+        ('price', 'price', 'Amount'),
+        ('qualifiedPrograms', 'qualified_programs', None),
+        ('shippingOptions', 'shipping_options', ('list', 'ShippingOption')),
+        ('title', 'title', None),
+        ('unitPrice', 'unit_price', 'Amount'),
+        ('unitPricingMeasure', 'unit_pricing_measure', None),
+    ),
+    'EventItemSearchResponse': (
+        ('eventItems', 'event_items', ('list', 'EventItem')),
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+    ),
+    'EventSearchResponse': (
+        ('events', 'events', ('list', 'Event')),
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+    ),
+    'Image': (
+        ('height', 'height', None),
+        ('imageUrl', 'image_url', None),
+        ('text', 'text', None),
+        ('width', 'width', None),
+    ),
+    'MarketingPrice': (
+        ('discountAmount', 'discount_amount', 'Amount'),
+        ('discountPercentage', 'discount_percentage', None),
+        ('originalPrice', 'original_price', 'Amount'),
+        ('priceTreatment', 'price_treatment', None),
+    ),
+    'ShippingOption': (
+        ('shippingCost', 'shipping_cost', 'Amount'),
+        ('shippingCostType', 'shipping_cost_type', None),
+    ),
+    'Terms': (
+        ('fullText', 'full_text', None),
+        ('summary', 'summary', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'DealItemSearchResponse': 'DealItemSearchResponse',
+    'Event': 'Event',
+    'EventItemSearchResponse': 'EventItemSearchResponse',
+    'EventSearchResponse': 'EventSearchResponse',
+}
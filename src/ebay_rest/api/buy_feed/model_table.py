@@ -0,0 +1,108 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'Access': (
+        ('constraints', 'constraints', ('list', 'FeedTypeConstraint')),
+        ('feedType', 'feed_type', None),
+    ),
+    'ApplicationAccess': (
+        ('accesses', 'accesses', ('list', 'Access')),
+    ),
+    'Constraint': (
+        ('marketplaceIds', 'marketplace_ids', None),
+    ),
+    'Dimension': (
+        ('dimensionKey', 'dimension_key', None),
+        ('values', 'values', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'FeedType': (
+        ('description', 'description', None),
+        ('feedTypeId', 'feed_type_id', None),
+        ('supportedFeeds', 'supported_feeds', ('list', 'SupportedFeed')),
+    ),
+    'FeedTypeConstraint': (
+        ('categoryIds', 'category_ids', None),
+        ('listingMarketplaceConstraints', 'listing_marketplace_constraints', ('list', 'ListingMarketplaceFeedTypeConstraint')),
+        ('marketplaceId', 'marketplace_id', None),
+    ),
+    'FeedTypeSearchResponse': (
+        ('feedTypes', 'feed_types', ('list', 'FeedType')),
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('total', 'total', None),
+    ),
+    'FileMetadata': (
+        ('access', 'access', None),
+        ('dimensions', 'dimensions', ('list', 'Dimension')),
+        ('feedDate', 'feed_date', None),
+        ('feedScope', 'feed_scope', None),
+        ('feedTypeId', 'feed_type_id', None),
+        ('fileId', 'file_id', None),
+        ('format', 'format', None),
+        ('marketplaceId', 'marketplace_id', None),
+        ('schemaVersion', 'schema_version', None),
+        ('size', 'size', None),
+        ('span', 'span', 'TimeDuration'),
+    ),
+    'FileMetadataSearchResponse': (
+        ('fileMetadata', 'file_metadata', ('list', 'FileMetadata')),
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('total', 'total', None),
+    ),
+    'ListingMarketplaceFeedTypeConstraint': (
+        ('listingCategoryIds', 'listing_category_ids', None),
+        ('listingMarketplaceId', 'listing_marketplace_id', None),
+    ),
+    'OutputStream': (
+    ),
+    'SupportedFeed': (
+        ('authorizationScopes', 'authorization_scopes', None),
+        ('constraint', 'constraint', 'Constraint'),
+        ('feedScope', 'feed_scope', None),
+        ('lookBack', 'look_back', 'TimeDuration'),
+        ('status', 'status', None),
+        ('supportedSchemas', 'supported_schemas', ('list', 'SupportedSchema')),
+    ),
+    'SupportedSchema': (
+        ('definition', 'definition', None),
+        ('deprecated', 'deprecated', None),
+        ('formats', 'formats', None),
+        ('schemaVersion', 'schema_version', None),
+    ),
+    'TimeDuration': (
+        ('unit', 'unit', None),
+        ('value', 'value', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'ApplicationAccess': 'ApplicationAccess',
+    'FeedType': 'FeedType',
+    'FeedTypeSearchResponse': 'FeedTypeSearchResponse',
+    'FileMetadata': 'FileMetadata',
+    'FileMetadataSearchResponse': 'FileMetadataSearchResponse',
+    'OutputStream': 'OutputStream',
+}
@@ -0,0 +1,67 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'Amount': (
+        ('currency', 'currency', None),
+        ('value', 'value', None),
+    ),
+    'BestSellingProductResponse': (
+        ('merchandisedProducts', 'merchandised_products', ('list', 'MerchandisedProduct')),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'Image': (
+        ('height', 'height', None),
+        ('imageUrl', 'image_url', None),
+        ('width', 'width', None),
+    ),
+    'MarketPriceDetail': (
+        ('conditionGroup', 'condition_group', None),
+        ('conditionIds', 'condition_ids', None),
+        ('estimatedStartPrice', 'estimated_start_price', 'Amount'),
+    ),
+    'MerchandisedProduct': (
+        ('averageRating', 'average_rating', None),
+        ('epid', 'epid', None),
+        ('image', 'image', 'Image'),
+        ('marketPriceDetails', 'market_price_details', ('list', 'MarketPriceDetail')),
+        ('ratingAspects', 'rating_aspects', ('list', 'RatingAspect')),
+        ('ratingCount', 'rating_count', None),
+        ('reviewCount', 'review_count', None),
+        ('title', 'title', None),
+    ),
+    'RatingAspect': (
+        ('count', 'count', None),
+        ('description', 'description', None),
+        ('name', 'name', None),
+        ('ratingAspectDistributions', 'rating_aspect_distributions', ('list', 'RatingAspectDistribution')),
+    ),
+    'RatingAspectDistribution': (
+        ('count', 'count', None),
+        ('percentage', 'percentage', None),
+        ('value', 'value', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'BestSellingProductResponse': 'BestSellingProductResponse',
+}
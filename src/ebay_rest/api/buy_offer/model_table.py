@@ -0,0 +1,58 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'Amount': (
+        ('currency', 'currency', None),
+        ('value', 'value', None),
+    ),
+    'Bidding': (
+        ('auctionEndDate', 'auction_end_date', None),
+        ('auctionStatus', 'auction_status', None),
+        ('bidCount', 'bid_count', None),
+        ('currentPrice', 'current_price', 'Amount'),
+        ('currentProxyBid', 'current_proxy_bid', 'ProxyBid'),
+        ('highBidder', 'high_bidder', None),
+        ('itemId', 'item_id', None),
+        ('reservePriceMet', 'reserve_price_met', None),
+        ('suggestedBidAmounts', 'suggested_bid_amounts', ('list', 'Amount')),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'PlaceProxyBidRequest': (
+        ('maxAmount', 'max_amount', 'Amount'),
+        ('userConsent', 'user_consent', 'UserConsent'),
+    ),
+    'PlaceProxyBidResponse': (
+        ('proxyBidId', 'proxy_bid_id', None),
+    ),
+    'ProxyBid': (
+        ('maxAmount', 'max_amount', 'Amount'),
+        ('proxyBidId', 'proxy_bid_id', None),
+    ),
+    'UserConsent': (
+        ('adultOnlyItem', 'adult_only_item', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'Bidding': 'Bidding',
+    'PlaceProxyBidResponse': 'PlaceProxyBidResponse',
+}
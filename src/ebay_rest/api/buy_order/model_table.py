@@ -0,0 +1,228 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'Adjustment': (
+        ('amount', 'amount', 'Amount'),
+        ('label', 'label', None),
+    ),
+    'Amount': (
+        ('currency', 'currency', None),
+        ('value', 'value', None),
+    ),
+    'AuthenticityVerificationProgram': (
+        ('description', 'description', None),
+        ('outcomeReason', 'outcome_reason', None),
+        ('status', 'status', None),
+        ('termsWebUrl', 'terms_web_url', None),
+    ),
+    'Coupon': (
+        ('redemptionCode', 'redemption_code', None),
+    ),
+    'CouponRequest': (
+        ('redemptionCode', 'redemption_code', None),
+    ),
+    'CreateGuestCheckoutSessionRequestV2': (
+        ('contactEmail', 'contact_email', None),
+        ('lineItemInputs', 'line_item_inputs', ('list', 'LineItemInput')),
+        ('shippingAddress', 'shipping_address', 'ShippingAddress'),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'Fee': (
+        ('amount', 'amount', 'Amount'),
+        ('feeType', 'fee_type', None),
+    ),
+    'GuestCheckoutSessionResponseV2': (
+        ('appliedCoupons', 'applied_coupons', ('list', 'Coupon')),
+        ('checkoutSessionId', 'checkout_session_id', None),
+        ('lineItems', 'line_items', ('list', 'LineItem')),
+        ('pricingSummary', 'pricing_summary', 'PricingSummaryV2'),
+        ('shippingAddress', 'shipping_address', 'ShippingAddress'),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'GuestPurchaseOrderV2': (
+        ('lineItems', 'line_items', ('list', 'OrderLineItemV2')),
+        ('pricingSummary', 'pricing_summary', 'PricingSummary'),
+        ('purchaseOrderCreationDate', 'purchase_order_creation_date', None),
+        ('purchaseOrderId', 'purchase_order_id', None),
+        ('purchaseOrderPaymentStatus', 'purchase_order_payment_status', None),
+        ('purchaseOrderStatus', 'purchase_order_status', None),
+        ('refundedAmount', 'refunded_amount', 'Amount'),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'Image': (
+        ('imageUrl', 'image_url', None),
+    ),
+    'ImportChargesV2': (
+        ('amount', 'amount', 'Amount'),
+        ('applicableChargeType', 'applicable_charge_type', None),
+    ),
+    'ImportTax': (
+        ('amount', 'amount', 'Amount'),
+        ('importTaxType', 'import_tax_type', None),
+    ),
+    'LegacyReference': (
+        ('legacyItemId', 'legacy_item_id', None),
+        ('legacyOrderId', 'legacy_order_id', None),
+        ('legacyTransactionId', 'legacy_transaction_id', None),
+    ),
+    'LineItem': (
+        ('authenticityVerification', 'authenticity_verification', 'AuthenticityVerificationProgram'),
+        ('baseUnitPrice', 'base_unit_price', 'Amount'),
+        ('fees', 'fees', ('list', 'Fee')),
+        ('image', 'image', 'Image'),
+        ('itemId', 'item_id', None),
+        ('lineItemId', 'line_item_id', None),
+        ('netPrice', 'net_price', 'Amount'),
+        ('promotions', 'promotions', ('list', 'Promotion')),
+        ('quantity', 'quantity', None),
+        ('seller', 'seller', 'Seller'),
+        ('shippingOptions', 'shipping_options', ('list', 'ShippingOption')),
+        ('taxDetails', 'tax_details', ('list', 'TaxDetail')),
+        ('title', 'title', None),
+    ),
+    'LineItemInput': (
+        ('itemId', 'item_id', None),
+        ('quantity', 'quantity', None),
+    ),
+    'OrderLineItemV2': (
+        ('authenticityVerification', 'authenticity_verification', 'AuthenticityVerificationProgram'),
+        ('baseUnitPrice', 'base_unit_price', 'Amount'),
+        ('fees', 'fees', ('list', 'Fee')),
+        ('image', 'image', 'Image'),
+        ('itemId', 'item_id', None),
+        ('itemOnHold', 'item_on_hold', None),
+        ('legacyReference', 'legacy_reference', 'LegacyReference'),
+        ('lineItemId', 'line_item_id', None),
+        ('lineItemPaymentStatus', 'line_item_payment_status', None),
+        ('lineItemStatus', 'line_item_status', None),
+        ('netPrice', 'net_price', 'Amount'),
+        ('orderId', 'order_id', None),
+        ('promotions', 'promotions', ('list', 'Promotion')),
+        ('quantity', 'quantity', None),
+        ('seller', 'seller', 'Seller'),
+        ('shippingDetail', 'shipping_detail', 'ShippingDetail'),
+        ('taxDetails', 'tax_details', ('list', 'TaxDetail')),
+        ('title', 'title', None),
+    ),
+    'PricingSummary': (
+        ('additionalSavings', 'additional_savings', 'Amount'),
+        ('adjustment', 'adjustment', 'Adjustment'),
+        ('deliveryCost', 'delivery_cost', 'Amount'),
+        ('deliveryDiscount', 'delivery_discount', 'Amount'),
+        ('fee', 'fee', 'Amount'),
+        ('importCharges', 'import_charges', 'Amount'),
+        ('importTax', 'import_tax', 'ImportTax'),
+        ('priceDiscount', 'price_discount', 'Amount'),
+        ('priceSubtotal', 'price_subtotal', 'Amount'),
+        ('tax', 'tax', 'Amount'),
+        ('total', 'total', 'Amount'),
+    ),
+    'PricingSummaryV2': (
+        ('additionalSavings', 'additional_savings', 'Amount'),
+        ('adjustment', 'adjustment', 'Adjustment'),
+        ('deliveryCost', 'delivery_cost', 'Amount'),
+        ('fee', 'fee', 'Amount'),
+        ('importCharges', 'import_charges', 'ImportChargesV2'),
+        ('importTax', 'import_tax', 'ImportTax'),
+        ('priceDiscount', 'price_discount', 'Amount'),
+        ('priceSubtotal', 'price_subtotal', 'Amount'),
+        ('tax', 'tax', 'Amount'),
+        ('total', 'total', 'Amount'),
+    ),
+    'Promotion': (
+        ('discount', 'discount', 'Amount'),
+        ('message', 'message', None),
+        ('promotionType', 'promotion_type', None),
+    ),
+    'Recipient': (
+        ('firstName', 'first_name', None),
+        ('lastName', 'last_name', None),
+    ),
+    'Region': (
+        ('regionName', 'region_name', None),
+        ('regionType', 'region_type', None),
+    ),
+    'Seller': (
+        ('username', 'username', None),
+    ),
+    'ShippingAddress': (
+        ('addressLine1', 'address_line1', None),
+        ('addressLine2', 'address_line2', None),
+        ('city', 'city', None),
+        ('country', 'country', None),
+        ('county', 'county', None),
+        ('phoneNumber', 'phone_number', None),
+        ('postalCode', 'postal_code', None),
+        ('recipient', 'recipient', 'Recipient'),
+        ('stateOrProvince', 'state_or_province', None),
+    ),
+    'ShippingAddressImpl': (
+        ('addressLine1', 'address_line1', None),
+        ('addressLine2', 'address_line2', None),
+        ('city', 'city', None),
+        ('country', 'country', None),
+        ('county', 'county', None),
+        ('phoneNumber', 'phone_number', None),
+        ('postalCode', 'postal_code', None),
+        ('recipient', 'recipient', 'Recipient'),
+        ('stateOrProvince', 'state_or_province', None),
+    ),
+    'ShippingDetail': (
+        ('maxEstimatedDeliveryDate', 'max_estimated_delivery_date', None),
+        ('minEstimatedDeliveryDate', 'min_estimated_delivery_date', None),
+        ('shippingCarrierCode', 'shipping_carrier_code', None),
+        ('shippingServiceCode', 'shipping_service_code', None),
+    ),
+    'ShippingOption': (
+        ('baseDeliveryCost', 'base_delivery_cost', 'Amount'),
+        ('deliveryDiscount', 'delivery_discount', 'Amount'),
+        ('importCharges', 'import_charges', 'Amount'),
+        ('maxEstimatedDeliveryDate', 'max_estimated_delivery_date', None),
+        ('minEstimatedDeliveryDate', 'min_estimated_delivery_date', None),
+        ('selected', 'selected', None),
+        ('shippingCarrierCode', 'shipping_carrier_code', None),
+        ('shippingOptionId', 'shipping_option_id', None),
+        ('shippingServiceCode', 'shipping_service_code', None),
+    ),
+    'TaxDetail': (
+        ('includedInPrice', 'included_in_price', None),
+        ('taxJurisdiction', 'tax_jurisdiction', 'TaxJurisdiction'),
+        ('taxType', 'tax_type', None),
+    ),
+    'TaxJurisdiction': (
+        ('region', 'region', 'Region'),
+        ('taxJurisdictionId', 'tax_jurisdiction_id', None),
+    ),
+    'UpdateQuantity': (
+        ('lineItemId', 'line_item_id', None),
+        ('quantity', 'quantity', None),
+    ),
+    'UpdateShippingOption': (
+        ('lineItemId', 'line_item_id', None),
+        ('shippingOptionId', 'shipping_option_id', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'GuestCheckoutSessionResponseV2': 'GuestCheckoutSessionResponseV2',
+    'GuestPurchaseOrderV2': 'GuestPurchaseOrderV2',
+}
@@ -0,0 +1,95 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'Aspect': (
+        ('localizedName', 'localized_name', None),
+        ('localizedValues', 'localized_values', None),
+    ),
+    'AspectDistribution': (
+        ('aspectValueDistributions', 'aspect_value_distributions', ('list', 'AspectValueDistribution')),
+        ('localizedAspectName', 'localized_aspect_name', None),
+    ),
+    'AspectValueDistribution': (
+        ('localizedAspectValue', 'localized_aspect_value', None),
+        ('matchCount', 'match_count', None),
+        ('refinementHref', 'refinement_href', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'Image': (
+        ('height', 'height', None),
+        ('imageUrl', 'image_url', None),
+        ('width', 'width', None),
+    ),
+    'Product': (
+        ('additionalImages', 'additional_images', ('list', 'Image')),
+        ('aspects', 'aspects', ('list', 'Aspect')),
+        ('brand', 'brand', None),
+        ('compatibilityCount', 'compatibility_count', None),
+        ('description', 'description', None),
+        ('ean', 'ean', None),
+        ('epid', 'epid', None),
+        ('gtin', 'gtin', None),
+        ('image', 'image', 'Image'),
+        ('isbn', 'isbn', None),
+        ('mpn', 'mpn', None),
+        ('otherApplicableCategoryIds', 'other_applicable_category_ids', None),
+        ('primaryCategoryId', 'primary_category_id', None),
+        ('productWebUrl', 'product_web_url', None),
+        ('title', 'title', None),
+        ('upc', 'upc', None),
+        ('version', 'version', None),
+    ),
+    'ProductSearchResponse': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('productSummaries', 'product_summaries', ('list', 'ProductSummary')),
+        ('refinement', 'refinement', 'Refinement'),
+        ('total', 'total', None),
+    ),
+    'ProductSummary': (
+        ('additionalImages', 'additional_images', ('list', 'Image')),
+        ('aspects', 'aspects', ('list', 'Aspect')),
+        ('brand', 'brand', None),
+        ('ean', 'ean', None),
+        ('epid', 'epid', None),
+        ('gtin', 'gtin', None),
+        ('image', 'image', 'Image'),
+        ('isbn', 'isbn', None),
+        ('mpn', 'mpn', None),
+        ('productHref', 'product_href', None),
+        ('productWebUrl', 'product_web_url', None),
+        ('title', 'title', None),
+        ('upc', 'upc', None),
+    ),
+    'Refinement': (
+        ('aspectDistributions', 'aspect_distributions', ('list', 'AspectDistribution')),
+        ('dominantCategoryId', 'dominant_category_id', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'Product': 'Product',
+    'ProductSearchResponse': 'ProductSearchResponse',
+}
@@ -0,0 +1,67 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'Address': (
+        ('city', 'city', None),
+        ('stateOrProvince', 'state_or_province', None),
+        ('postalCode', 'postal_code', None),
+        ('country', 'country', None),
+    ),
+    'CharityOrg': (
+        ('charityOrgId', 'charity_org_id', None),
+        ('description', 'description', None),
+        ('location', 'location', 'Location'),
+        ('logoImage', 'logo_image', 'Image'),
+        ('missionStatement', 'mission_statement', None),
+        ('name', 'name', None),
+        ('registrationId', 'registration_id', None),
+        ('website', 'website', None),
+    ),
+    'CharitySearchResponse': (
+        ('charityOrgs', 'charity_orgs', ('list', 'CharityOrg')),
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'GeoCoordinates': (
+        ('latitude', 'latitude', None),
+        ('longitude', 'longitude', None),
+    ),
+    'Image': (
+        ('height', 'height', None),
+        ('imageUrl', 'image_url', None),
+        ('width', 'width', None),
+    ),
+    'Location': (
+        ('address', 'address', 'Address'),
+        ('geoCoordinates', 'geo_coordinates', 'GeoCoordinates'),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'CharityOrg': 'CharityOrg',
+    'CharitySearchResponse': 'CharitySearchResponse',
+}
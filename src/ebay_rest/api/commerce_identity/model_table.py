@@ -0,0 +1,73 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'Address': (
+        ('addressLine1', 'address_line1', None),
+        ('addressLine2', 'address_line2', None),
+        ('city', 'city', None),
+        ('country', 'country', None),
+        ('county', 'county', None),
+        ('postalCode', 'postal_code', None),
+        ('stateOrProvince', 'state_or_province', None),
+    ),
+    'BusinessAccount': (
+        ('address', 'address', 'Address'),
+        ('doingBusinessAs', 'doing_business_as', None),
+        ('email', 'email', None),
+        ('name', 'name', None),
+        ('primaryContact', 'primary_contact', 'Contact'),
+        ('primaryPhone', 'primary_phone', 'Phone'),
+        ('secondaryPhone', 'secondary_phone', 'Phone'),
+        ('website', 'website', None),
+    ),
+    'Contact': (
+        ('firstName', 'first_name', None),
+        ('lastName', 'last_name', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'IndividualAccount': (
+        ('email', 'email', None),
+        ('firstName', 'first_name', None),
+        ('lastName', 'last_name', None),
+        ('primaryPhone', 'primary_phone', 'Phone'),
+        ('registrationAddress', 'registration_address', 'Address'),
+        ('secondaryPhone', 'secondary_phone', 'Phone'),
+    ),
+    'Phone': (
+        ('countryCode', 'country_code', None),
+        ('number', 'number', None),
+        ('phoneType', 'phone_type', None),
+    ),
+    'UserResponse': (
+        ('accountType', 'account_type', None),
+        ('businessAccount', 'business_account', 'BusinessAccount'),
+        ('individualAccount', 'individual_account', 'IndividualAccount'),
+        ('registrationMarketplaceId', 'registration_marketplace_id', None),
+        ('status', 'status', None),
+        ('userId', 'user_id', None),
+        ('username', 'username', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'UserResponse': 'UserResponse',
+}
@@ -0,0 +1,96 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'CreateDocumentFromUrlRequest': (
+        ('documentType', 'document_type', None),
+        ('documentUrl', 'document_url', None),
+        ('languages', 'languages', None),
+    ),
+    'CreateDocumentRequest': (
+        ('documentType', 'document_type', None),
+        ('languages', 'languages', None),
+    ),
+    'CreateDocumentResponse': (
+        ('documentId', 'document_id', None),
+        ('documentStatus', 'document_status', None),
+        ('documentType', 'document_type', None),
+        ('languages', 'languages', None),
+    ),
+    'CreateImageFromUrlRequest': (
+        ('imageUrl', 'image_url', None),
+    ),
+    'CreateVideoRequest': (
+        ('classification', 'classification', None),
+        ('description', 'description', None),
+        ('size', 'size', None),
+        ('title', 'title', None),
+    ),
+    'DocumentMetadata': (
+        ('fileName', 'file_name', None),
+        ('fileSize', 'file_size', None),
+        ('fileType', 'file_type', None),
+    ),
+    'DocumentResponse': (
+        ('documentId', 'document_id', None),
+        ('documentMetadata', 'document_metadata', 'DocumentMetadata'),
+        ('documentStatus', 'document_status', None),
+        ('documentType', 'document_type', None),
+        ('languages', 'languages', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'Image': (
+        ('imageUrl', 'image_url', None),
+    ),
+    'ImageResponse': (
+        ('expirationDate', 'expiration_date', None),
+        ('imageUrl', 'image_url', None),
+    ),
+    'InputStream': (
+    ),
+    'Moderation': (
+        ('rejectReasons', 'reject_reasons', None),
+    ),
+    'Play': (
+        ('playUrl', 'play_url', None),
+        ('protocol', 'protocol', None),
+    ),
+    'Video': (
+        ('classification', 'classification', None),
+        ('description', 'description', None),
+        ('expirationDate', 'expiration_date', None),
+        ('moderation', 'moderation', 'Moderation'),
+        ('playLists', 'play_lists', ('list', 'Play')),
+        ('size', 'size', None),
+        ('status', 'status', None),
+        ('statusMessage', 'status_message', None),
+        ('thumbnail', 'thumbnail', 'Image'),
+        ('title', 'title', None),
+        ('videoId', 'video_id', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'CreateDocumentResponse': 'CreateDocumentResponse',
+    'DocumentResponse': 'DocumentResponse',
+    'ImageResponse': 'ImageResponse',
+    'Video': 'Video',
+}
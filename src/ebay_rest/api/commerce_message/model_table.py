@@ -0,0 +1,127 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'BulkConversation': (
+        ('conversationId', 'conversation_id', None),
+        ('conversationStatus', 'conversation_status', None),
+        ('conversationType', 'conversation_type', None),
+    ),
+    'BulkUpdateConversationsRequest': (
+        ('conversations', 'conversations', ('list', 'BulkConversation')),
+    ),
+    'BulkUpdateConversationsResponse': (
+        ('conversationsMetadata', 'conversations_metadata', 'ConversationsMetadata'),
+        ('conversationsResponse', 'conversations_response', ('list', 'ConversationsResponse')),
+    ),
+    'ConversationDetail': (
+        ('conversationId', 'conversation_id', None),
+        ('conversationStatus', 'conversation_status', None),
+        ('conversationTitle', 'conversation_title', None),
+        ('conversationType', 'conversation_type', None),
+        ('createdDate', 'created_date', None),
+        ('latestMessage', 'latest_message', 'MessageDetail'),
+        ('referenceId', 'reference_id', None),
+        ('referenceType', 'reference_type', None),
+        ('unreadCount', 'unread_count', None),
+    ),
+    'ConversationsMetadata': (
+        ('totalConversationsCount', 'total_conversations_count', None),
+        ('updateFailureCount', 'update_failure_count', None),
+        ('updateSuccessCount', 'update_success_count', None),
+    ),
+    'ConversationsResponse': (
+        ('conversationId', 'conversation_id', None),
+        ('updateStatus', 'update_status', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'GetAllMyConversationsResponse': (
+        ('conversations', 'conversations', ('list', 'ConversationDetail')),
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+    ),
+    'GetMessagesByConversationIdResponse': (
+        ('conversationStatus', 'conversation_status', None),
+        ('conversationTitle', 'conversation_title', None),
+        ('conversationType', 'conversation_type', None),
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('messages', 'messages', ('list', 'MessageDetail')),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+    ),
+    'MessageDetail': (
+        ('createdDate', 'created_date', None),
+        ('messageBody', 'message_body', None),
+        ('messageId', 'message_id', None),
+        ('messageMedia', 'message_media', ('list', 'MessageMedia')),
+        ('readStatus', 'read_status', None),
+        ('recipientUsername', 'recipient_username', None),
+        ('senderUsername', 'sender_username', None),
+        ('subject', 'subject', None),
+    ),
+    'MessageMedia': (
+        ('mediaName', 'media_name', None),
+        ('mediaType', 'media_type', None),
+        ('mediaUrl', 'media_url', None),
+    ),
+    'Reference': (
+        ('referenceId', 'reference_id', None),
+        ('referenceType', 'reference_type', None),
+    ),
+    'SendMessageRequest': (
+        ('conversationId', 'conversation_id', None),
+        ('emailCopyToSender', 'email_copy_to_sender', None),
+        ('messageMedia', 'message_media', ('list', 'MessageMedia')),
+        ('messageText', 'message_text', None),
+        ('otherPartyUsername', 'other_party_username', None),
+        ('reference', 'reference', 'Reference'),
+    ),
+    'SendMessageResponse': (
+        ('createdDate', 'created_date', None),
+        ('messageBody', 'message_body', None),
+        ('messageId', 'message_id', None),
+        ('messageMedia', 'message_media', ('list', 'MessageMedia')),
+        ('readStatus', 'read_status', None),
+        ('recipientUserName', 'recipient_user_name', None),
+        ('senderUserName', 'sender_user_name', None),
+        ('subject', 'subject', None),
+    ),
+    'UpdateConversationRequest': (
+        ('conversationId', 'conversation_id', None),
+        ('conversationStatus', 'conversation_status', None),
+        ('conversationType', 'conversation_type', None),
+        ('read', 'read', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'BulkUpdateConversationsResponse': 'BulkUpdateConversationsResponse',
+    'GetAllMyConversationsResponse': 'GetAllMyConversationsResponse',
+    'GetMessagesByConversationIdResponse': 'GetMessagesByConversationIdResponse',
+    'SendMessageResponse': 'SendMessageResponse',
+}
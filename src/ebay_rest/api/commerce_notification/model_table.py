@@ -0,0 +1,132 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'Config': (
+        ('alertEmail', 'alert_email', None),
+    ),
+    'CreateSubscriptionFilterRequest': (
+        ('filterSchema', 'filter_schema', None),
+    ),
+    'CreateSubscriptionRequest': (
+        ('destinationId', 'destination_id', None),
+        ('payload', 'payload', 'SubscriptionPayloadDetail'),
+        ('status', 'status', None),
+        ('topicId', 'topic_id', None),
+    ),
+    'DeliveryConfig': (
+        ('endpoint', 'endpoint', None),
+        ('verificationToken', 'verification_token', None),
+    ),
+    'Destination': (
+        ('deliveryConfig', 'delivery_config', 'DeliveryConfig'),
+        ('destinationId', 'destination_id', None),
+        ('name', 'name', None),
+        ('status', 'status', None),
+    ),
+    'DestinationRequest': (
+        ('deliveryConfig', 'delivery_config', 'DeliveryConfig'),
+        ('name', 'name', None),
+        ('status', 'status', None),
+    ),
+    'DestinationSearchResponse': (
+        ('destinations', 'destinations', ('list', 'Destination')),
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('total', 'total', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'PayloadDetail': (
+        ('deliveryProtocol', 'delivery_protocol', None),
+        ('deprecated', 'deprecated', None),
+        ('format', 'format', None),
+        ('schemaVersion', 'schema_version', None),
+    ),
+    'PublicKey': (
+        ('algorithm', 'algorithm', None),
+        ('digest', 'digest', None),
+        ('key', 'key', None),
+    ),
+    'Subscription': (
+        ('creationDate', 'creation_date', None),
+        ('destinationId', 'destination_id', None),
+        ('filterId', 'filter_id', None),
+        ('payload', 'payload', 'SubscriptionPayloadDetail'),
+        ('status', 'status', None),
+        ('subscriptionId', 'subscription_id', None),
+        ('topicId', 'topic_id', None),
+    ),
+    'SubscriptionFilter': (
+        ('creationDate', 'creation_date', None),
+        ('filterId', 'filter_id', None),
+        ('filterSchema', 'filter_schema', None),
+        ('filterStatus', 'filter_status', None),
+        ('subscriptionId', 'subscription_id', None),
+    ),
+    'SubscriptionPayloadDetail': (
+        ('deliveryProtocol', 'delivery_protocol', None),
+        ('format', 'format', None),
+        ('schemaVersion', 'schema_version', None),
+    ),
+    'SubscriptionSearchResponse': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('subscriptions', 'subscriptions', ('list', 'Subscription')),
+        ('total', 'total', None),
+    ),
+    'Topic': (
+        ('authorizationScopes', 'authorization_scopes', None),
+        ('context', 'context', None),
+        ('description', 'description', None),
+        ('filterable', 'filterable', None),
+        ('scope', 'scope', None),
+        ('status', 'status', None),
+        ('supportedPayloads', 'supported_payloads', ('list', 'PayloadDetail')),
+        ('topicId', 'topic_id', None),
+    ),
+    'TopicSearchResponse': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('topics', 'topics', ('list', 'Topic')),
+        ('total', 'total', None),
+    ),
+    'UpdateSubscriptionRequest': (
+        ('destinationId', 'destination_id', None),
+        ('payload', 'payload', 'SubscriptionPayloadDetail'),
+        ('status', 'status', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'Config': 'Config',
+    'Destination': 'Destination',
+    'DestinationSearchResponse': 'DestinationSearchResponse',
+    'PublicKey': 'PublicKey',
+    'Subscription': 'Subscription',
+    'SubscriptionFilter': 'SubscriptionFilter',
+    'SubscriptionSearchResponse': 'SubscriptionSearchResponse',
+    'Topic': 'Topic',
+    'TopicSearchResponse': 'TopicSearchResponse',
+    'object': None,
+}
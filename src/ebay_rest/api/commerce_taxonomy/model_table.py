@@ -0,0 +1,141 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'AncestorReference': (
+        ('categoryId', 'category_id', None),
+        ('categoryName', 'category_name', None),
+        ('categorySubtreeNodeHref', 'category_subtree_node_href', None),
+        ('categoryTreeNodeLevel', 'category_tree_node_level', None),
+    ),
+    'Aspect': (
+        ('aspectConstraint', 'aspect_constraint', 'AspectConstraint'),
+        ('aspectValues', 'aspect_values', ('list', 'AspectValue')),
+        ('localizedAspectName', 'localized_aspect_name', None),
+        ('relevanceIndicator', 'relevance_indicator', 'RelevanceIndicator'),
+    ),
+    'AspectConstraint': (
+        ('aspectApplicableTo', 'aspect_applicable_to', None),
+        ('aspectDataType', 'aspect_data_type', None),
+        ('aspectEnabledForVariations', 'aspect_enabled_for_variations', None),
+        ('aspectFormat', 'aspect_format', None),
+        ('aspectMaxLength', 'aspect_max_length', None),
+        ('aspectMode', 'aspect_mode', None),
+        ('aspectRequired', 'aspect_required', None),
+        ('aspectUsage', 'aspect_usage', None),
+        ('expectedRequiredByDate', 'expected_required_by_date', None),
+        ('itemToAspectCardinality', 'item_to_aspect_cardinality', None),
+        ('aspectAdvancedDataType', 'aspect_advanced_data_type', None),
+    ),
+    'AspectMetadata': (
+        ('aspects', 'aspects', ('list', 'Aspect')),
+    ),
+    'AspectValue': (
+        ('localizedValue', 'localized_value', None),
+        ('valueConstraints', 'value_constraints', ('list', 'ValueConstraint')),
+    ),
+    'BaseCategoryTree': (
+        ('categoryTreeId', 'category_tree_id', None),
+        ('categoryTreeVersion', 'category_tree_version', None),
+    ),
+    'Category': (
+        ('categoryId', 'category_id', None),
+        ('categoryName', 'category_name', None),
+    ),
+    'CategoryAspect': (
+        ('category', 'category', 'Category'),
+        ('aspects', 'aspects', ('list', 'Aspect')),
+    ),
+    'CategorySubtree': (
+        ('categorySubtreeNode', 'category_subtree_node', 'CategoryTreeNode'),
+        ('categoryTreeId', 'category_tree_id', None),
+        ('categoryTreeVersion', 'category_tree_version', None),
+    ),
+    'CategorySuggestion': (
+        ('category', 'category', 'Category'),
+        ('categoryTreeNodeAncestors', 'category_tree_node_ancestors', ('list', 'AncestorReference')),
+        ('categoryTreeNodeLevel', 'category_tree_node_level', None),
+        ('relevancy', 'relevancy', None),
+    ),
+    'CategorySuggestionResponse': (
+        ('categorySuggestions', 'category_suggestions', ('list', 'CategorySuggestion')),
+        ('categoryTreeId', 'category_tree_id', None),
+        ('categoryTreeVersion', 'category_tree_version', None),
+    ),
+    'CategoryTree': (
+        ('applicableMarketplaceIds', 'applicable_marketplace_ids', None),
+        ('categoryTreeId', 'category_tree_id', None),
+        ('categoryTreeVersion', 'category_tree_version', None),
+        ('rootCategoryNode', 'root_category_node', 'CategoryTreeNode'),
+    ),
+    'CategoryTreeNode': (
+        ('category', 'category', 'Category'),
+        ('categoryTreeNodeLevel', 'category_tree_node_level', None),
+        ('childCategoryTreeNodes', 'child_category_tree_nodes', ('list', 'CategoryTreeNode')),
+        ('leafCategoryTreeNode', 'leaf_category_tree_node', None),
+        ('parentCategoryTreeNodeHref', 'parent_category_tree_node_href', None),
+    ),
+    'CompatibilityProperty': (
+        ('name', 'name', None),
+        ('localizedName', 'localized_name', None),
+    ),
+    'CompatibilityPropertyValue': (
+        ('value', 'value', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'ExpiredCategories': (
+        ('expiredCategories', 'expired_categories', ('list', 'ExpiredCategory')),
+    ),
+    'ExpiredCategory': (
+        ('fromCategoryId', 'from_category_id', None),
+        ('toCategoryId', 'to_category_id', None),
+    ),
+    'GetCategoriesAspectResponse': (
+        ('categoryTreeId', 'category_tree_id', None),
+        ('categoryTreeVersion', 'category_tree_version', None),
+        ('categoryAspects', 'category_aspects', ('list', 'CategoryAspect')),
+    ),
+    'GetCompatibilityMetadataResponse': (
+        ('compatibilityProperties', 'compatibility_properties', ('list', 'CompatibilityProperty')),
+    ),
+    'GetCompatibilityPropertyValuesResponse': (
+        ('compatibilityPropertyValues', 'compatibility_property_values', ('list', 'CompatibilityPropertyValue')),
+    ),
+    'RelevanceIndicator': (
+        ('searchCount', 'search_count', None),
+    ),
+    'ValueConstraint': (
+        ('applicableForLocalizedAspectName', 'applicable_for_localized_aspect_name', None),
+        ('applicableForLocalizedAspectValues', 'applicable_for_localized_aspect_values', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'AspectMetadata': 'AspectMetadata',
+    'BaseCategoryTree': 'BaseCategoryTree',
+    'CategorySubtree': 'CategorySubtree',
+    'CategorySuggestionResponse': 'CategorySuggestionResponse',
+    'CategoryTree': 'CategoryTree',
+    'ExpiredCategories': 'ExpiredCategories',
+    'GetCategoriesAspectResponse': 'GetCategoriesAspectResponse',
+    'GetCompatibilityMetadataResponse': 'GetCompatibilityMetadataResponse',
+    'GetCompatibilityPropertyValuesResponse': 'GetCompatibilityPropertyValuesResponse',
+}
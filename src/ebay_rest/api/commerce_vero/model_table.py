@@ -0,0 +1,85 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'ReasonCodeDetailType': (
+        ('briefText', 'brief_text', None),
+        ('detailedText', 'detailed_text', None),
+        ('veroReasonCodeId', 'vero_reason_code_id', None),
+    ),
+    'ReportItemDetails': (
+        ('brand', 'brand', None),
+        ('copyEmailToRightsOwner', 'copy_email_to_rights_owner', None),
+        ('countries', 'countries', None),
+        ('detailedMessage', 'detailed_message', None),
+        ('itemId', 'item_id', None),
+        ('messageToSeller', 'message_to_seller', None),
+        ('patent', 'patent', None),
+        ('regions', 'regions', None),
+        ('veroReasonCodeId', 'vero_reason_code_id', None),
+    ),
+    'ReportStatusResponse': (
+        ('reportedItemDetails', 'reported_item_details', ('list', 'ReportedItem')),
+        ('veroReportId', 'vero_report_id', None),
+        ('veroReportStatus', 'vero_report_status', None),
+    ),
+    'ReportedItem': (
+        ('itemId', 'item_id', None),
+        ('reasonForFailure', 'reason_for_failure', None),
+        ('status', 'status', None),
+    ),
+    'VeroReasonCode': (
+        ('marketplaceId', 'marketplace_id', None),
+        ('reasonCodeDetails', 'reason_code_details', ('list', 'ReasonCodeDetailType')),
+    ),
+    'VeroReasonCodeDetailResponse': (
+        ('veroReasonCodes', 'vero_reason_codes', ('list', 'VeroReasonCode')),
+    ),
+    'VeroReasonCodeResponse': (
+        ('marketplaceId', 'marketplace_id', None),
+        ('reasonCodeDetails', 'reason_code_details', 'ReasonCodeDetailType'),
+    ),
+    'VeroReportItemsRequest': (
+        ('reportItems', 'report_items', ('list', 'ReportItemDetails')),
+    ),
+    'VeroReportItemsResponse': (
+        ('veroReportId', 'vero_report_id', None),
+        ('veroReportStatus', 'vero_report_status', None),
+    ),
+    'VeroReportStatusResponse': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('reportedItemDetails', 'reported_item_details', ('list', 'ReportedItem')),
+        ('total', 'total', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'ReportStatusResponse': 'ReportStatusResponse',
+    'VeroReasonCodeDetailResponse': 'VeroReasonCodeDetailResponse',
+    'VeroReasonCodeResponse': 'VeroReasonCodeResponse',
+    'VeroReportItemsResponse': 'VeroReportItemsResponse',
+    'VeroReportStatusResponse': 'VeroReportStatusResponse',
+}
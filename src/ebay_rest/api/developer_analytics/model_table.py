@@ -0,0 +1,48 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'Rate': (
+        ('count', 'count', None),
+        ('limit', 'limit', None),
+        ('remaining', 'remaining', None),
+        ('reset', 'reset', None),
+        ('timeWindow', 'time_window', None),
+    ),
+    'RateLimit': (
+        ('apiContext', 'api_context', None),
+        ('apiName', 'api_name', None),
+        ('apiVersion', 'api_version', None),
+        ('resources', 'resources', ('list', 'Resource')),
+    ),
+    'RateLimitsResponse': (
+        ('rateLimits', 'rate_limits', ('list', 'RateLimit')),
+    ),
+    'Resource': (
+        ('name', 'name', None),
+        ('rates', 'rates', ('list', 'Rate')),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'RateLimitsResponse': 'RateLimitsResponse',
+}
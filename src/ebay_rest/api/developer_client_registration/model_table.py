@@ -0,0 +1,50 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'ClientDetails': (
+        ('client_id', 'client_id', None),
+        ('client_id_issued_at', 'client_id_issued_at', None),
+        ('client_name', 'client_name', None),
+        ('client_secret', 'client_secret', None),
+        ('client_secret_expires_at', 'client_secret_expires_at', None),
+        ('contacts', 'contacts', None),
+        ('grant_types', 'grant_types', None),
+        ('policy_uri', 'policy_uri', None),
+        ('redirect_uris', 'redirect_uris', None),
+        ('scope', 'scope', None),
+        ('software_id', 'software_id', None),
+        ('software_statement', 'software_statement', None),
+    ),
+    'ClientSettings': (
+        ('client_name', 'client_name', None),
+        ('contacts', 'contacts', None),
+        ('policy_uri', 'policy_uri', None),
+        ('redirect_uris', 'redirect_uris', None),
+        ('software_id', 'software_id', None),
+        ('software_statement', 'software_statement', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'ClientDetails': 'ClientDetails',
+}
@@ -0,0 +1,44 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'CreateSigningKeyRequest': (
+        ('signingKeyCipher', 'signing_key_cipher', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'QuerySigningKeysResponse': (
+        ('signingKeys', 'signing_keys', ('list', 'SigningKey')),
+    ),
+    'SigningKey': (
+        ('creationTime', 'creation_time', None),
+        ('expirationTime', 'expiration_time', None),
+        ('jwe', 'jwe', None),
+        ('privateKey', 'private_key', None),
+        ('publicKey', 'public_key', None),
+        ('signingKeyCipher', 'signing_key_cipher', None),
+        ('signingKeyId', 'signing_key_id', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'QuerySigningKeysResponse': 'QuerySigningKeysResponse',
+    'SigningKey': 'SigningKey',
+}
@@ -84,7 +84,9 @@ class RESTClientObject(object):
 
         # https pool manager
         self.key_pair = configuration.api_key.get('key_pair', None)  # ebay_rest patch
-        if configuration.proxy:
+        if getattr(configuration, 'pool_manager', None) is not None:  # ebay_rest patch
+            self.pool_manager = configuration.pool_manager  # ebay_rest patch
+        elif configuration.proxy:
             self.pool_manager = urllib3.ProxyManager(
                 num_pools=pools_size,
                 maxsize=maxsize,
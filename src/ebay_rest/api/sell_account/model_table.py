@@ -0,0 +1,75 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'Amount': (
+        ('currency', 'currency', None),
+        ('value', 'value', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'PayoutInstrument': (
+        ('accountLastFourDigits', 'account_last_four_digits', None),
+        ('instrumentId', 'instrument_id', None),
+        ('instrumentStatus', 'instrument_status', None),
+        ('instrumentType', 'instrument_type', None),
+        ('nickname', 'nickname', None),
+        ('payoutPercentage', 'payout_percentage', None),
+    ),
+    'PayoutSettingsResponse': (
+        ('payoutInstruments', 'payout_instruments', ('list', 'PayoutInstrument')),
+    ),
+    'Rate': (
+        ('additionalCost', 'additional_cost', 'Amount'),
+        ('rateId', 'rate_id', None),
+        ('shippingCategory', 'shipping_category', None),
+        ('shippingCost', 'shipping_cost', 'Amount'),
+        ('shippingRegionNames', 'shipping_region_names', None),
+        ('shippingServiceCode', 'shipping_service_code', None),
+    ),
+    'RateTableDetails': (
+        ('marketplaceId', 'marketplace_id', None),
+        ('name', 'name', None),
+        ('rates', 'rates', ('list', 'Rate')),
+        ('rateTableBasis', 'rate_table_basis', None),
+        ('rateTableId', 'rate_table_id', None),
+        ('shippingOptionType', 'shipping_option_type', None),
+    ),
+    'RateTableUpdate': (
+        ('rates', 'rates', ('list', 'RateUpdate')),
+    ),
+    'RateUpdate': (
+        ('additionalCost', 'additional_cost', 'Amount'),
+        ('rateId', 'rate_id', None),
+        ('shippingCost', 'shipping_cost', 'Amount'),
+    ),
+    'UpdatePayoutPercentage': (
+        ('instrumentId', 'instrument_id', None),
+        ('payoutPercentage', 'payout_percentage', None),
+    ),
+    'UpdatePayoutPercentageRequest': (
+        ('payoutInstruments', 'payout_instruments', ('list', 'UpdatePayoutPercentage')),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'PayoutSettingsResponse': 'PayoutSettingsResponse',
+    'RateTableDetails': 'RateTableDetails',
+}
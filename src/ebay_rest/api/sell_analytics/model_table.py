@@ -0,0 +1,128 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'BenchmarkMetadata': (
+        ('average', 'average', None),
+    ),
+    'Cycle': (
+        ('cycleType', 'cycle_type', None),
+        ('evaluationDate', 'evaluation_date', None),
+        ('evaluationMonth', 'evaluation_month', None),
+    ),
+    'Definition': (
+        ('dataType', 'data_type', None),
+        ('key', 'key', None),
+        ('localizedName', 'localized_name', None),
+    ),
+    'Dimension': (
+        ('dimensionKey', 'dimension_key', None),
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'DimensionMetric': (
+        ('dimension', 'dimension', 'Dimension'),
+        ('metrics', 'metrics', ('list', 'Metric')),
+    ),
+    'Distribution': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'EvaluationCycle': (
+        ('endDate', 'end_date', None),
+        ('evaluationDate', 'evaluation_date', None),
+        ('evaluationType', 'evaluation_type', None),
+        ('startDate', 'start_date', None),
+    ),
+    'FindSellerStandardsProfilesResponse': (
+        ('standardsProfiles', 'standards_profiles', ('list', 'StandardsProfile')),
+    ),
+    'GetCustomerServiceMetricResponse': (
+        ('dimensionMetrics', 'dimension_metrics', ('list', 'DimensionMetric')),
+        ('evaluationCycle', 'evaluation_cycle', 'EvaluationCycle'),
+        ('marketplaceId', 'marketplace_id', None),
+    ),
+    'Header': (
+        ('dimensionKeys', 'dimension_keys', ('list', 'Definition')),
+        ('metrics', 'metrics', ('list', 'Definition')),
+    ),
+    'Metadata': (
+        ('metadataHeader', 'metadata_header', 'MetadataHeader'),
+        ('metadataRecords', 'metadata_records', ('list', 'MetadataRecord')),
+    ),
+    'MetadataHeader': (
+        ('key', 'key', None),
+        ('metadataKeys', 'metadata_keys', ('list', 'Definition')),
+    ),
+    'MetadataRecord': (
+        ('metadataValues', 'metadata_values', ('list', 'Value')),
+        ('value', 'value', 'Value'),
+    ),
+    'Metric': (
+        ('benchmark', 'benchmark', 'MetricBenchmark'),
+        ('distributions', 'distributions', ('list', 'MetricDistribution')),
+        ('metricKey', 'metric_key', None),
+        ('value', 'value', None),
+    ),
+    'MetricBenchmark': (
+        ('adjustment', 'adjustment', None),
+        ('basis', 'basis', None),
+        ('metadata', 'metadata', 'BenchmarkMetadata'),
+        ('rating', 'rating', None),
+    ),
+    'MetricDistribution': (
+        ('basis', 'basis', None),
+        ('data', 'data', ('list', 'Distribution')),
+    ),
+    'Record': (
+        ('dimensionValues', 'dimension_values', ('list', 'Value')),
+        ('metricValues', 'metric_values', ('list', 'Value')),
+    ),
+    'Report': (
+        ('dimensionMetadata', 'dimension_metadata', ('list', 'Metadata')),
+        ('endDate', 'end_date', None),
+        ('header', 'header', 'Header'),
+        ('lastUpdatedDate', 'last_updated_date', None),
+        ('records', 'records', ('list', 'Record')),
+        ('startDate', 'start_date', None),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'StandardsProfile': (
+        ('cycle', 'cycle', 'Cycle'),
+        ('defaultProgram', 'default_program', None),
+        ('evaluationReason', 'evaluation_reason', None),
+        ('metrics', 'metrics', ('list', 'Metric')),
+        ('program', 'program', None),
+        ('standardsLevel', 'standards_level', None),
+    ),
+    'Value': (
+        ('applicable', 'applicable', None),
+        ('value', 'value', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'FindSellerStandardsProfilesResponse': 'FindSellerStandardsProfilesResponse',
+    'GetCustomerServiceMetricResponse': 'GetCustomerServiceMetricResponse',
+    'Report': 'Report',
+    'StandardsProfile': 'StandardsProfile',
+}
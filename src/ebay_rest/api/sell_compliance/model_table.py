@@ -0,0 +1,80 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'AspectRecommendations': (
+        ('localizedAspectName', 'localized_aspect_name', None),
+        ('suggestedValues', 'suggested_values', None),
+    ),
+    'ComplianceDetail': (
+        ('reasonCode', 'reason_code', None),
+        ('message', 'message', None),
+        ('variation', 'variation', 'VariationDetails'),
+        ('violationData', 'violation_data', ('list', 'NameValueList')),
+        ('correctiveRecommendations', 'corrective_recommendations', 'CorrectiveRecommendations'),
+        ('complianceState', 'compliance_state', None),
+    ),
+    'ComplianceSummary': (
+        ('violationSummaries', 'violation_summaries', ('list', 'ComplianceSummaryInfo')),
+    ),
+    'ComplianceSummaryInfo': (
+        ('complianceType', 'compliance_type', None),
+        ('marketplaceId', 'marketplace_id', None),
+        ('listingCount', 'listing_count', None),
+    ),
+    'ComplianceViolation': (
+        ('complianceType', 'compliance_type', None),
+        ('listingId', 'listing_id', None),
+        ('sku', 'sku', None),
+        ('offerId', 'offer_id', None),
+        ('violations', 'violations', ('list', 'ComplianceDetail')),
+    ),
+    'CorrectiveRecommendations': (
+        ('productRecommendation', 'product_recommendation', 'ProductRecommendation'),
+        ('aspectRecommendations', 'aspect_recommendations', ('list', 'AspectRecommendations')),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'NameValueList': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'PagedComplianceViolationCollection': (
+        ('offset', 'offset', None),
+        ('href', 'href', None),
+        ('total', 'total', None),
+        ('next', 'next', None),
+        ('prev', 'prev', None),
+        ('limit', 'limit', None),
+        ('listingViolations', 'listing_violations', ('list', 'ComplianceViolation')),
+    ),
+    'ProductRecommendation': (
+        ('epid', 'epid', None),
+    ),
+    'VariationDetails': (
+        ('sku', 'sku', None),
+        ('variationAspects', 'variation_aspects', ('list', 'NameValueList')),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'ComplianceSummary': 'ComplianceSummary',
+    'PagedComplianceViolationCollection': 'PagedComplianceViolationCollection',
+}
@@ -0,0 +1,568 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'AddComplaintRequest': (
+        ('complaintRequest', 'complaint_request', 'AddComplaintRequestData'),
+    ),
+    'AddComplaintRequestData': (
+        ('affectedPackages', 'affected_packages', None),
+        ('complaintDate', 'complaint_date', None),
+        ('complaintReason', 'complaint_reason', None),
+        ('complaintType', 'complaint_type', None),
+        ('preferenceId', 'preference_id', None),
+        ('remark', 'remark', None),
+    ),
+    'AddPackageRequest': (
+        ('packageInfo', 'package_info', 'PackageInfoRequest'),
+    ),
+    'AddPackageResponses': (
+        ('createPackageResult', 'create_package_result', 'AddPackageResponsesData'),
+    ),
+    'AddPackageResponsesData': (
+        ('estimateCost', 'estimate_cost', 'Amount'),
+        ('lastMileTrackingNumber', 'last_mile_tracking_number', None),
+        ('packageId', 'package_id', None),
+        ('paymentCost', 'payment_cost', 'Amount'),
+        ('trackingNumber', 'tracking_number', None),
+    ),
+    'AgentInfoData': (
+        ('agentAddress', 'agent_address', None),
+        ('agentName', 'agent_name', None),
+        ('agentPhone', 'agent_phone', None),
+    ),
+    'AgentModelResponses': (
+        ('agentAddress', 'agent_address', None),
+        ('agentName', 'agent_name', None),
+        ('agentPhone', 'agent_phone', None),
+        ('agentPreferences', 'agent_preferences', ('list', 'AgentPreferenceListResponse')),
+        ('arName', 'ar_name', None),
+    ),
+    'AgentPreferenceListResponse': (
+        ('ebayId', 'ebay_id', None),
+        ('shippingCountry', 'shipping_country', None),
+    ),
+    'Amount': (
+        ('currency', 'currency', None),
+        ('value', 'value', None),
+    ),
+    'BatteryQualResponses': (
+        ('batteryType', 'battery_type', None),
+        ('elecQualificationId', 'elec_qualification_id', None),
+        ('elecQualificationName', 'elec_qualification_name', None),
+        ('expireDate', 'expire_date', None),
+        ('remark', 'remark', None),
+    ),
+    'BundleDetailResponse': (
+        ('bundleDetail', 'bundle_detail', 'BundleDetailResponseData'),
+    ),
+    'BundleDetailResponseData': (
+        ('consignPreferenceId', 'consign_preference_id', None),
+        ('trackingNumbers', 'tracking_numbers', None),
+    ),
+    'BundleLabelResponse': (
+        ('label', 'label', 'BundleLabelResponseData'),
+    ),
+    'BundleLabelResponseData': (
+        ('base64Str', 'base64_str', None),
+    ),
+    'CancelPackagesRequest': (
+        ('requests', 'requests', 'CancelPackagesRequestData'),
+    ),
+    'CancelPackagesRequestData': (
+        ('packageIds', 'package_ids', None),
+    ),
+    'CancelPackagesResponses': (
+        ('responses', 'responses', ('list', 'CancelPackagesResponsesData')),
+    ),
+    'CancelPackagesResponsesData': (
+        ('message', 'message', None),
+        ('packageId', 'package_id', None),
+        ('resultCode', 'result_code', None),
+    ),
+    'ClonePackageResponses': (
+        ('clonePackageResult', 'clone_package_result', 'ClonePackageResponsesData'),
+    ),
+    'ClonePackageResponsesData': (
+        ('lastMileTrackingNumber', 'last_mile_tracking_number', None),
+        ('packageId', 'package_id', None),
+        ('paymentCost', 'payment_cost', 'Amount'),
+        ('trackingNumber', 'tracking_number', None),
+    ),
+    'ConfirmPackagesRequest': (
+        ('requests', 'requests', 'ConfirmPackagesRequestData'),
+    ),
+    'ConfirmPackagesRequestData': (
+        ('packageIds', 'package_ids', None),
+    ),
+    'ConfirmPackagesResponses': (
+        ('responses', 'responses', ('list', 'ConfirmPackagesResponsesData')),
+    ),
+    'ConfirmPackagesResponsesData': (
+        ('message', 'message', None),
+        ('packageId', 'package_id', None),
+        ('resultCode', 'result_code', None),
+    ),
+    'ConsignPreferenceInfoResponses': (
+        ('consignPreferenceId', 'consign_preference_id', None),
+        ('consignPreferenceName', 'consign_preference_name', None),
+        ('dropoffSiteId', 'dropoff_site_id', None),
+        ('pickupAddress', 'pickup_address', 'PickupAddressResponsesData'),
+        ('pickupTime', 'pickup_time', None),
+        ('type', 'type', None),
+    ),
+    'CreateAddressPreferenceRequest': (
+        ('shipFromAddress', 'ship_from_address', 'CreateAddressPreferenceRequestData'),
+    ),
+    'CreateAddressPreferenceRequestData': (
+        ('city', 'city', None),
+        ('company', 'company', None),
+        ('contact', 'contact', None),
+        ('countryCode', 'country_code', None),
+        ('district', 'district', None),
+        ('name', 'name', None),
+        ('phone', 'phone', None),
+        ('postcode', 'postcode', None),
+        ('province', 'province', None),
+        ('street1', 'street1', None),
+        ('street2', 'street2', None),
+        ('street3', 'street3', None),
+        ('type', 'type', None),
+    ),
+    'CreateAddressPreferenceResponses': (
+        ('shipFromAddressId', 'ship_from_address_id', 'CreateAddressPreferenceResponsesData'),
+    ),
+    'CreateAddressPreferenceResponsesData': (
+        ('addressId', 'address_id', None),
+    ),
+    'CreateBundleRequest': (
+        ('bundle', 'bundle', 'CreateBundleRequestData'),
+    ),
+    'CreateBundleRequestData': (
+        ('consignPreferenceId', 'consign_preference_id', None),
+        ('trackingNumbers', 'tracking_numbers', None),
+    ),
+    'CreateBundleResponse': (
+        ('bundle', 'bundle', 'CreateBundleResponseData'),
+    ),
+    'CreateBundleResponseData': (
+        ('bundleId', 'bundle_id', None),
+    ),
+    'CreateConsignPreferenceRequest': (
+        ('consignAddress', 'consign_address', 'CreateConsignPreferenceRequestData'),
+    ),
+    'CreateConsignPreferenceRequestData': (
+        ('consignPreferenceName', 'consign_preference_name', None),
+        ('dropoffSiteId', 'dropoff_site_id', None),
+        ('pickupAddress', 'pickup_address', 'PickupAddressRequestData'),
+        ('pickupTime', 'pickup_time', None),
+        ('type', 'type', None),
+    ),
+    'CreateConsignPreferenceResponses': (
+        ('consignAddressId', 'consign_address_id', 'CreateConsignPreferenceResponsesData'),
+    ),
+    'CreateConsignPreferenceResponsesData': (
+        ('consignPreferenceId', 'consign_preference_id', None),
+    ),
+    'DeletePackagesRequest': (
+        ('requests', 'requests', 'DeletePackagesRequestData'),
+    ),
+    'DeletePackagesRequestData': (
+        ('packageIds', 'package_ids', None),
+    ),
+    'DeletePackagesResponses': (
+        ('responses', 'responses', ('list', 'DeletePackagesResponsesData')),
+    ),
+    'DeletePackagesResponsesData': (
+        ('message', 'message', None),
+        ('packageId', 'package_id', None),
+        ('resultCode', 'result_code', None),
+    ),
+    'DirectionsResponses': (
+        ('batteryType', 'battery_type', None),
+        ('from', '_from', None),
+        ('to', 'to', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'FDCSkuRequest': (
+        ('quantity', 'quantity', None),
+        ('skuId', 'sku_id', None),
+    ),
+    'GetActualCostResponses': (
+        ('actualCosts', 'actual_costs', ('list', 'GetActualCostResponsesData')),
+    ),
+    'GetActualCostResponsesData': (
+        ('actualWeight', 'actual_weight', None),
+        ('amount', 'amount', 'Amount'),
+        ('billingTime', 'billing_time', None),
+        ('chargeMode', 'charge_mode', None),
+        ('chargeWeight', 'charge_weight', None),
+        ('costType', 'cost_type', None),
+        ('message', 'message', None),
+        ('remark', 'remark', None),
+        ('resultCode', 'result_code', None),
+        ('size', 'size', None),
+        ('trackingNumber', 'tracking_number', None),
+    ),
+    'GetAddressPreferenceListResponses': (
+        ('addressPreferenceList', 'address_preference_list', 'GetAddressPreferenceListResponsesData'),
+    ),
+    'GetAddressPreferenceListResponsesData': (
+        ('addresses', 'addresses', ('list', 'GetAddressPreferencesResponses')),
+    ),
+    'GetAddressPreferencesResponses': (
+        ('addressId', 'address_id', None),
+        ('city', 'city', None),
+        ('cityName', 'city_name', None),
+        ('company', 'company', None),
+        ('contact', 'contact', None),
+        ('countryCode', 'country_code', None),
+        ('countryName', 'country_name', None),
+        ('district', 'district', None),
+        ('districtName', 'district_name', None),
+        ('name', 'name', None),
+        ('phone', 'phone', None),
+        ('postcode', 'postcode', None),
+        ('province', 'province', None),
+        ('provinceName', 'province_name', None),
+        ('street1', 'street1', None),
+        ('street2', 'street2', None),
+        ('street3', 'street3', None),
+        ('type', 'type', None),
+    ),
+    'GetAgentListResponses': (
+        ('agentList', 'agent_list', 'GetAgentListResponsesData'),
+    ),
+    'GetAgentListResponsesData': (
+        ('agents', 'agents', ('list', 'AgentModelResponses')),
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+    ),
+    'GetBatteryQualListResponses': (
+        ('batteryQualificationList', 'battery_qualification_list', 'GetBatteryQualListResponsesData'),
+    ),
+    'GetBatteryQualListResponsesData': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('qualifications', 'qualifications', ('list', 'BatteryQualResponses')),
+        ('total', 'total', None),
+    ),
+    'GetConsignPreferenceListResponses': (
+        ('consignPreferenceList', 'consign_preference_list', 'GetConsignPreferenceListResponsesData'),
+    ),
+    'GetConsignPreferenceListResponsesData': (
+        ('consignPreferences', 'consign_preferences', ('list', 'ConsignPreferenceInfoResponses')),
+    ),
+    'GetDropoffSiteListResponses': (
+        ('dropoffSiteList', 'dropoff_site_list', 'GetDropoffSitesResponsesData'),
+    ),
+    'GetDropoffSitesResponses': (
+        ('city', 'city', None),
+        ('contact', 'contact', None),
+        ('country', 'country', None),
+        ('district', 'district', None),
+        ('dropoffSiteId', 'dropoff_site_id', None),
+        ('name', 'name', None),
+        ('phone', 'phone', None),
+        ('province', 'province', None),
+        ('street1', 'street1', None),
+        ('street2', 'street2', None),
+        ('street3', 'street3', None),
+        ('type', 'type', None),
+    ),
+    'GetDropoffSitesResponsesData': (
+        ('dropoffSites', 'dropoff_sites', ('list', 'GetDropoffSitesResponses')),
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+    ),
+    'GetHandoverSheetResponses': (
+        ('handoverSheet', 'handover_sheet', 'GetHandoverSheetResponsesData'),
+    ),
+    'GetHandoverSheetResponsesData': (
+        ('base64Str', 'base64_str', None),
+    ),
+    'GetItemPackageIdResponses': (
+        ('itemPackages', 'item_packages', ('list', 'GetItemPackageIdResponsesData')),
+    ),
+    'GetItemPackageIdResponsesData': (
+        ('packageId', 'package_id', None),
+        ('packageStatus', 'package_status', None),
+        ('trackingNumber', 'tracking_number', None),
+    ),
+    'GetLabelListResponses': (
+        ('labels', 'labels', ('list', 'GetLabelListResponsesData')),
+    ),
+    'GetLabelListResponsesData': (
+        ('base64Str', 'base64_str', None),
+        ('message', 'message', None),
+        ('resultCode', 'result_code', None),
+        ('trackingNumber', 'tracking_number', None),
+    ),
+    'GetPackageDetailResponses': (
+        ('packageDetail', 'package_detail', 'GetPackageDetailResponsesData'),
+    ),
+    'GetPackageDetailResponsesData': (
+        ('agentInfoResponse', 'agent_info_response', 'AgentInfoData'),
+        ('consignPreferenceId', 'consign_preference_id', None),
+        ('incoterm', 'incoterm', None),
+        ('items', 'items', ('list', 'ItemResponses')),
+        ('lastMileTrackingNumber', 'last_mile_tracking_number', None),
+        ('packageComment', 'package_comment', None),
+        ('packageHeight', 'package_height', None),
+        ('packageId', 'package_id', None),
+        ('packageLength', 'package_length', None),
+        ('packageStatus', 'package_status', None),
+        ('packageWeight', 'package_weight', None),
+        ('packageWidth', 'package_width', None),
+        ('paymentCost', 'payment_cost', 'Amount'),
+        ('shipFromAddressId', 'ship_from_address_id', None),
+        ('shipToAddress', 'ship_to_address', 'ShipToAddressResponsesData'),
+        ('shippingServiceId', 'shipping_service_id', None),
+        ('specialServiceDetail', 'special_service_detail', 'SpecialServiceDetail'),
+        ('valueForCarriage', 'value_for_carriage', None),
+    ),
+    'GetServiceListResponses': (
+        ('serviceList', 'service_list', 'GetServiceListResponsesData'),
+    ),
+    'GetServiceListResponsesData': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('services', 'services', ('list', 'ServiceInfoResponses')),
+        ('total', 'total', None),
+    ),
+    'GetTrackingDetailResponses': (
+        ('trackingDetails', 'tracking_details', ('list', 'GetTrackingDetailResponsesData')),
+    ),
+    'GetTrackingDetailResponsesData': (
+        ('city', 'city', None),
+        ('country', 'country', None),
+        ('descriptionEn', 'description_en', None),
+        ('descriptionZh', 'description_zh', None),
+        ('district', 'district', None),
+        ('eventPostalCode', 'event_postal_code', None),
+        ('eventTime', 'event_time', None),
+        ('province', 'province', None),
+        ('status', 'status', None),
+        ('trackingNumber', 'tracking_number', None),
+    ),
+    'ItemRequest': (
+        ('buyerId', 'buyer_id', None),
+        ('buyerTaxId', 'buyer_tax_id', None),
+        ('buyerTaxType', 'buyer_tax_type', None),
+        ('ebayCollectAndRemitTax', 'ebay_collect_and_remit_tax', None),
+        ('ebayCollectAndRemitTaxesValue', 'ebay_collect_and_remit_taxes_value', None),
+        ('email', 'email', None),
+        ('itemTitle', 'item_title', None),
+        ('listingId', 'listing_id', None),
+        ('message', 'message', None),
+        ('orderId', 'order_id', None),
+        ('orderLineItem', 'order_line_item', None),
+        ('payPalEmail', 'pay_pal_email', None),
+        ('payPalMessage', 'pay_pal_message', None),
+        ('paymentDate', 'payment_date', None),
+        ('postedQuantity', 'posted_quantity', None),
+        ('siteId', 'site_id', None),
+        ('sku', 'sku', 'SkuRequest'),
+        ('soldDate', 'sold_date', None),
+        ('soldPrice', 'sold_price', 'Amount'),
+        ('soldQuantity', 'sold_quantity', None),
+        ('transactionId', 'transaction_id', None),
+    ),
+    'ItemResponses': (
+        ('buyerId', 'buyer_id', None),
+        ('buyerTaxId', 'buyer_tax_id', None),
+        ('buyerTaxType', 'buyer_tax_type', None),
+        ('ebayCollectAndRemitTax', 'ebay_collect_and_remit_tax', None),
+        ('ebayCollectAndRemitTaxesValue', 'ebay_collect_and_remit_taxes_value', None),
+        ('email', 'email', None),
+        ('itemTitle', 'item_title', None),
+        ('listingId', 'listing_id', None),
+        ('message', 'message', None),
+        ('orderId', 'order_id', None),
+        ('orderLineItem', 'order_line_item', None),
+        ('payPalEmail', 'pay_pal_email', None),
+        ('payPalMessage', 'pay_pal_message', None),
+        ('paymentDate', 'payment_date', None),
+        ('postedQuantity', 'posted_quantity', None),
+        ('siteId', 'site_id', None),
+        ('sku', 'sku', 'SkuRequest'),
+        ('soldDate', 'sold_date', None),
+        ('soldPrice', 'sold_price', 'Amount'),
+        ('soldQuantity', 'sold_quantity', None),
+        ('transactionId', 'transaction_id', None),
+    ),
+    'PackageInfoRequest': (
+        ('agentInfoRequest', 'agent_info_request', 'AgentInfoData'),
+        ('consignPreferenceId', 'consign_preference_id', None),
+        ('incoterm', 'incoterm', None),
+        ('items', 'items', ('list', 'ItemRequest')),
+        ('maxQuantityLimit', 'max_quantity_limit', None),
+        ('packageComment', 'package_comment', None),
+        ('packageHeight', 'package_height', None),
+        ('packageLength', 'package_length', None),
+        ('packageWeight', 'package_weight', None),
+        ('packageWidth', 'package_width', None),
+        ('shipFromAddressId', 'ship_from_address_id', None),
+        ('shipToAddress', 'ship_to_address', 'ShipToAddressRequestData'),
+        ('shippingServiceId', 'shipping_service_id', None),
+        ('specialServiceDetail', 'special_service_detail', 'SpecialServiceDetail'),
+        ('valueForCarriage', 'value_for_carriage', None),
+    ),
+    'PickupAddressRequestData': (
+        ('city', 'city', None),
+        ('company', 'company', None),
+        ('contact', 'contact', None),
+        ('countryCode', 'country_code', None),
+        ('district', 'district', None),
+        ('name', 'name', None),
+        ('phone', 'phone', None),
+        ('postcode', 'postcode', None),
+        ('province', 'province', None),
+        ('street1', 'street1', None),
+        ('street2', 'street2', None),
+        ('street3', 'street3', None),
+    ),
+    'PickupAddressResponsesData': (
+        ('city', 'city', None),
+        ('cityName', 'city_name', None),
+        ('company', 'company', None),
+        ('contact', 'contact', None),
+        ('countryCode', 'country_code', None),
+        ('countryName', 'country_name', None),
+        ('district', 'district', None),
+        ('districtName', 'district_name', None),
+        ('name', 'name', None),
+        ('phone', 'phone', None),
+        ('postcode', 'postcode', None),
+        ('province', 'province', None),
+        ('provinceName', 'province_name', None),
+        ('street1', 'street1', None),
+        ('street2', 'street2', None),
+        ('street3', 'street3', None),
+    ),
+    'ServiceInfoResponses': (
+        ('descriptionEn', 'description_en', None),
+        ('descriptionHk', 'description_hk', None),
+        ('descriptionJp', 'description_jp', None),
+        ('descriptionZh', 'description_zh', None),
+        ('directions', 'directions', ('list', 'DirectionsResponses')),
+        ('incoterm', 'incoterm', None),
+        ('maxLength', 'max_length', None),
+        ('maxTotalLength', 'max_total_length', None),
+        ('maxWeight', 'max_weight', None),
+        ('nameEn', 'name_en', None),
+        ('nameHk', 'name_hk', None),
+        ('nameJp', 'name_jp', None),
+        ('nameZh', 'name_zh', None),
+        ('shippingServiceId', 'shipping_service_id', None),
+    ),
+    'ShipToAddressRequestData': (
+        ('city', 'city', None),
+        ('company', 'company', None),
+        ('contact', 'contact', None),
+        ('countryCode', 'country_code', None),
+        ('countryName', 'country_name', None),
+        ('district', 'district', None),
+        ('phone', 'phone', None),
+        ('postcode', 'postcode', None),
+        ('province', 'province', None),
+        ('street1', 'street1', None),
+        ('street2', 'street2', None),
+        ('street3', 'street3', None),
+    ),
+    'ShipToAddressResponsesData': (
+        ('city', 'city', None),
+        ('company', 'company', None),
+        ('contact', 'contact', None),
+        ('countryCode', 'country_code', None),
+        ('countryName', 'country_name', None),
+        ('district', 'district', None),
+        ('phone', 'phone', None),
+        ('postcode', 'postcode', None),
+        ('province', 'province', None),
+        ('street1', 'street1', None),
+        ('street2', 'street2', None),
+        ('street3', 'street3', None),
+    ),
+    'SkuRequest': (
+        ('elecQualificationId', 'elec_qualification_id', None),
+        ('fdcSkus', 'fdc_skus', ('list', 'FDCSkuRequest')),
+        ('height', 'height', None),
+        ('isLiBattery', 'is_li_battery', None),
+        ('length', 'length', None),
+        ('liBatteryType', 'li_battery_type', None),
+        ('nameEn', 'name_en', None),
+        ('nameZh', 'name_zh', None),
+        ('origin', 'origin', None),
+        ('price', 'price', 'Amount'),
+        ('remark', 'remark', None),
+        ('skuNumber', 'sku_number', None),
+        ('tariffCode', 'tariff_code', None),
+        ('weight', 'weight', None),
+        ('width', 'width', None),
+    ),
+    'SpecialServiceDetail': (
+        ('insuranceFee', 'insurance_fee', None),
+        ('packagingType', 'packaging_type', None),
+        ('signatureType', 'signature_type', None),
+        ('specialServiceTypes', 'special_service_types', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'AddPackageResponses': 'AddPackageResponses',
+    'BundleDetailResponse': 'BundleDetailResponse',
+    'BundleLabelResponse': 'BundleLabelResponse',
+    'CancelPackagesResponses': 'CancelPackagesResponses',
+    'ClonePackageResponses': 'ClonePackageResponses',
+    'ConfirmPackagesResponses': 'ConfirmPackagesResponses',
+    'CreateAddressPreferenceResponses': 'CreateAddressPreferenceResponses',
+    'CreateBundleResponse': 'CreateBundleResponse',
+    'CreateConsignPreferenceResponses': 'CreateConsignPreferenceResponses',
+    'DeletePackagesResponses': 'DeletePackagesResponses',
+    'GetActualCostResponses': 'GetActualCostResponses',
+    'GetAddressPreferenceListResponses': 'GetAddressPreferenceListResponses',
+    'GetAgentListResponses': 'GetAgentListResponses',
+    'GetBatteryQualListResponses': 'GetBatteryQualListResponses',
+    'GetConsignPreferenceListResponses': 'GetConsignPreferenceListResponses',
+    'GetDropoffSiteListResponses': 'GetDropoffSiteListResponses',
+    'GetHandoverSheetResponses': 'GetHandoverSheetResponses',
+    'GetItemPackageIdResponses': 'GetItemPackageIdResponses',
+    'GetLabelListResponses': 'GetLabelListResponses',
+    'GetPackageDetailResponses': 'GetPackageDetailResponses',
+    'GetServiceListResponses': 'GetServiceListResponses',
+    'GetTrackingDetailResponses': 'GetTrackingDetailResponses',
+    'object': None,
+}
@@ -0,0 +1,229 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'CreateInventoryTaskRequest': (
+        ('feedType', 'feed_type', None),
+        ('filterCriteria', 'filter_criteria', 'InventoryFilterCriteria'),
+        ('schemaVersion', 'schema_version', None),
+    ),
+    'CreateOrderTaskRequest': (
+        ('feedType', 'feed_type', None),
+        ('filterCriteria', 'filter_criteria', 'OrderFilterCriteria'),
+        ('schemaVersion', 'schema_version', None),
+    ),
+    'CreateServiceMetricsTaskRequest': (
+        ('feedType', 'feed_type', None),
+        ('filterCriteria', 'filter_criteria', 'CustomerServiceMetricsFilterCriteria'),
+        ('schemaVersion', 'schema_version', None),
+    ),
+    'CreateTaskRequest': (
+        ('feedType', 'feed_type', None),
+        ('schemaVersion', 'schema_version', None),
+    ),
+    'CreateUserScheduleRequest': (
+        ('feedType', 'feed_type', None),
+        ('preferredTriggerDayOfMonth', 'preferred_trigger_day_of_month', None),
+        ('preferredTriggerDayOfWeek', 'preferred_trigger_day_of_week', None),
+        ('preferredTriggerHour', 'preferred_trigger_hour', None),
+        ('scheduleEndDate', 'schedule_end_date', None),
+        ('scheduleName', 'schedule_name', None),
+        ('scheduleStartDate', 'schedule_start_date', None),
+        ('scheduleTemplateId', 'schedule_template_id', None),
+        ('schemaVersion', 'schema_version', None),
+    ),
+    'CustomerServiceMetricTaskCollection': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('tasks', 'tasks', ('list', 'ServiceMetricsTask')),
+        ('total', 'total', None),
+    ),
+    'CustomerServiceMetricsFilterCriteria': (
+        ('customerServiceMetricType', 'customer_service_metric_type', None),
+        ('evaluationMarketplaceId', 'evaluation_marketplace_id', None),
+        ('listingCategories', 'listing_categories', None),
+        ('shippingRegions', 'shipping_regions', None),
+    ),
+    'DateRange': (
+        ('from', '_from', None),
+        ('to', 'to', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'InventoryFilterCriteria': (
+        ('listingFormat', 'listing_format', None),
+    ),
+    'InventoryTask': (
+        ('taskId', 'task_id', None),
+        ('status', 'status', None),
+        ('feedType', 'feed_type', None),
+        ('creationDate', 'creation_date', None),
+        ('completionDate', 'completion_date', None),
+        ('schemaVersion', 'schema_version', None),
+        ('detailHref', 'detail_href', None),
+        ('uploadSummary', 'upload_summary', 'UploadSummary'),
+        ('filterCriteria', 'filter_criteria', 'InventoryFilterCriteria'),
+    ),
+    'InventoryTaskCollection': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('tasks', 'tasks', ('list', 'InventoryTask')),
+        ('total', 'total', None),
+    ),
+    'OrderFilterCriteria': (
+        ('creationDateRange', 'creation_date_range', 'DateRange'),
+        ('modifiedDateRange', 'modified_date_range', 'DateRange'),
+        ('orderStatus', 'order_status', None),
+    ),
+    'OrderTask': (
+        ('completionDate', 'completion_date', None),
+        ('creationDate', 'creation_date', None),
+        ('detailHref', 'detail_href', None),
+        ('feedType', 'feed_type', None),
+        ('filterCriteria', 'filter_criteria', 'OrderFilterCriteria'),
+        ('schemaVersion', 'schema_version', None),
+        ('status', 'status', None),
+        ('taskId', 'task_id', None),
+        ('uploadSummary', 'upload_summary', 'UploadSummary'),
+    ),
+    'OrderTaskCollection': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('tasks', 'tasks', ('list', 'OrderTask')),
+        ('total', 'total', None),
+    ),
+    'ScheduleTemplateCollection': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('scheduleTemplates', 'schedule_templates', ('list', 'ScheduleTemplateResponse')),
+        ('total', 'total', None),
+    ),
+    'ScheduleTemplateResponse': (
+        ('feedType', 'feed_type', None),
+        ('frequency', 'frequency', None),
+        ('name', 'name', None),
+        ('scheduleTemplateId', 'schedule_template_id', None),
+        ('status', 'status', None),
+        ('supportedConfigurations', 'supported_configurations', ('list', 'SupportedConfiguration')),
+    ),
+    'ServiceMetricsTask': (
+        ('completionDate', 'completion_date', None),
+        ('creationDate', 'creation_date', None),
+        ('detailHref', 'detail_href', None),
+        ('feedType', 'feed_type', None),
+        ('filterCriteria', 'filter_criteria', 'CustomerServiceMetricsFilterCriteria'),
+        ('schemaVersion', 'schema_version', None),
+        ('status', 'status', None),
+        ('taskId', 'task_id', None),
+    ),
+    'StreamingOutput': (
+    ),
+    'SupportedConfiguration': (
+        ('defaultValue', 'default_value', None),
+        ('property', '_property', None),
+        ('usage', 'usage', None),
+    ),
+    'Task': (
+        ('completionDate', 'completion_date', None),
+        ('creationDate', 'creation_date', None),
+        ('detailHref', 'detail_href', None),
+        ('feedType', 'feed_type', None),
+        ('schemaVersion', 'schema_version', None),
+        ('status', 'status', None),
+        ('taskId', 'task_id', None),
+        ('uploadSummary', 'upload_summary', 'UploadSummary'),
+    ),
+    'TaskCollection': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('tasks', 'tasks', ('list', 'Task')),
+        ('total', 'total', None),
+    ),
+    'UpdateUserScheduleRequest': (
+        ('preferredTriggerDayOfMonth', 'preferred_trigger_day_of_month', None),
+        ('preferredTriggerDayOfWeek', 'preferred_trigger_day_of_week', None),
+        ('preferredTriggerHour', 'preferred_trigger_hour', None),
+        ('scheduleEndDate', 'schedule_end_date', None),
+        ('scheduleName', 'schedule_name', None),
+        ('scheduleStartDate', 'schedule_start_date', None),
+        ('schemaVersion', 'schema_version', None),
+    ),
+    'UploadSummary': (
+        ('failureCount', 'failure_count', None),
+        ('successCount', 'success_count', None),
+    ),
+    'UserScheduleCollection': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('schedules', 'schedules', ('list', 'UserScheduleResponse')),
+        ('total', 'total', None),
+    ),
+    'UserScheduleResponse': (
+        ('scheduleId', 'schedule_id', None),
+        ('creationDate', 'creation_date', None),
+        ('feedType', 'feed_type', None),
+        ('lastModifiedDate', 'last_modified_date', None),
+        ('preferredTriggerDayOfMonth', 'preferred_trigger_day_of_month', None),
+        ('preferredTriggerDayOfWeek', 'preferred_trigger_day_of_week', None),
+        ('preferredTriggerHour', 'preferred_trigger_hour', None),
+        ('scheduleEndDate', 'schedule_end_date', None),
+        ('scheduleName', 'schedule_name', None),
+        ('scheduleStartDate', 'schedule_start_date', None),
+        ('scheduleTemplateId', 'schedule_template_id', None),
+        ('schemaVersion', 'schema_version', None),
+        ('status', 'status', None),
+        ('statusReason', 'status_reason', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'CustomerServiceMetricTaskCollection': 'CustomerServiceMetricTaskCollection',
+    'InventoryTask': 'InventoryTask',
+    'InventoryTaskCollection': 'InventoryTaskCollection',
+    'OrderTask': 'OrderTask',
+    'OrderTaskCollection': 'OrderTaskCollection',
+    'ScheduleTemplateCollection': 'ScheduleTemplateCollection',
+    'ScheduleTemplateResponse': 'ScheduleTemplateResponse',
+    'ServiceMetricsTask': 'ServiceMetricsTask',
+    'StreamingOutput': 'StreamingOutput',
+    'Task': 'Task',
+    'TaskCollection': 'TaskCollection',
+    'UserScheduleCollection': 'UserScheduleCollection',
+    'UserScheduleResponse': 'UserScheduleResponse',
+    'object': None,
+}
@@ -0,0 +1,242 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'Amount': (
+        ('convertedFromCurrency', 'converted_from_currency', None),
+        ('convertedFromValue', 'converted_from_value', None),
+        ('convertedToCurrency', 'converted_to_currency', None),
+        ('convertedToValue', 'converted_to_value', None),
+        ('currency', 'currency', None),
+        ('exchangeRate', 'exchange_rate', None),
+        ('value', 'value', None),
+    ),
+    'BalanceAdjustment': (
+        ('adjustmentAmount', 'adjustment_amount', 'Amount'),
+        ('adjustmentType', 'adjustment_type', None),
+    ),
+    'BillingActivityLineItem': (
+        ('amount', 'amount', 'Amount'),
+        ('billingTransactionDate', 'billing_transaction_date', None),
+        ('billingTransactionId', 'billing_transaction_id', None),
+        ('bookingEntry', 'booking_entry', None),
+        ('feeType', 'fee_type', None),
+        ('feeTypeDescription', 'fee_type_description', None),
+        ('listingId', 'listing_id', None),
+        ('orderId', 'order_id', None),
+        ('promotionalOffers', 'promotional_offers', ('list', 'DiscountDetail')),
+    ),
+    'BillingActivityResponse': (
+        ('billingActivities', 'billing_activities', ('list', 'BillingActivityLineItem')),
+        ('count', 'count', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+    ),
+    'Buyer': (
+        ('username', 'username', None),
+    ),
+    'Charge': (
+        ('cancellationId', 'cancellation_id', None),
+        ('caseId', 'case_id', None),
+        ('chargeNetAmount', 'charge_net_amount', 'Amount'),
+        ('inquiryId', 'inquiry_id', None),
+        ('orderId', 'order_id', None),
+        ('paymentDisputeId', 'payment_dispute_id', None),
+        ('refundId', 'refund_id', None),
+        ('returnId', 'return_id', None),
+    ),
+    'DiscountDetail': (
+        ('amount', 'amount', 'Amount'),
+        ('offerType', 'offer_type', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'Fee': (
+        ('amount', 'amount', 'Amount'),
+        ('feeJurisdiction', 'fee_jurisdiction', 'FeeJurisdiction'),
+        ('feeMemo', 'fee_memo', None),
+        ('feeType', 'fee_type', None),
+    ),
+    'FeeJurisdiction': (
+        ('regionName', 'region_name', None),
+        ('regionType', 'region_type', None),
+    ),
+    'FundingSource': (
+        ('brand', 'brand', None),
+        ('memo', 'memo', None),
+        ('type', 'type', None),
+    ),
+    'OrderLineItem': (
+        ('donations', 'donations', ('list', 'Fee')),
+        ('feeBasisAmount', 'fee_basis_amount', 'Amount'),
+        ('lineItemId', 'line_item_id', None),
+        ('marketplaceFees', 'marketplace_fees', ('list', 'Fee')),
+    ),
+    'Payout': (
+        ('amount', 'amount', 'Amount'),
+        ('bankReference', 'bank_reference', None),
+        ('lastAttemptedPayoutDate', 'last_attempted_payout_date', None),
+        ('payoutDate', 'payout_date', None),
+        ('payoutId', 'payout_id', None),
+        ('payoutInstrument', 'payout_instrument', 'PayoutInstrument'),
+        ('payoutMemo', 'payout_memo', None),
+        ('payoutReference', 'payout_reference', None),
+        ('payoutStatus', 'payout_status', None),
+        ('payoutStatusDescription', 'payout_status_description', None),
+        ('totalAmount', 'total_amount', 'Amount'),
+        ('totalFee', 'total_fee', 'Amount'),
+        ('totalFeeDetails', 'total_fee_details', ('list', 'Fee')),
+        ('transactionCount', 'transaction_count', None),
+    ),
+    'PayoutDetails': (
+        ('payoutIds', 'payout_ids', None),
+        ('payoutReference', 'payout_reference', None),
+    ),
+    'PayoutInstrument': (
+        ('accountLastFourDigits', 'account_last_four_digits', None),
+        ('instrumentType', 'instrument_type', None),
+        ('nickname', 'nickname', None),
+        ('payoutPercentage', 'payout_percentage', None),
+    ),
+    'PayoutSummaryResponse': (
+        ('amount', 'amount', 'Amount'),
+        ('payoutCount', 'payout_count', None),
+        ('transactionCount', 'transaction_count', None),
+    ),
+    'Payouts': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('payouts', 'payouts', ('list', 'Payout')),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+    ),
+    'Reference': (
+        ('referenceId', 'reference_id', None),
+        ('referenceType', 'reference_type', None),
+    ),
+    'SellerFundsSummaryResponse': (
+        ('availableFunds', 'available_funds', 'Amount'),
+        ('fundsOnHold', 'funds_on_hold', 'Amount'),
+        ('processingFunds', 'processing_funds', 'Amount'),
+        ('totalFunds', 'total_funds', 'Amount'),
+    ),
+    'Tax': (
+        ('taxType', 'tax_type', None),
+        ('amount', 'amount', 'Amount'),
+    ),
+    'Transaction': (
+        ('amount', 'amount', 'Amount'),
+        ('bookingEntry', 'booking_entry', None),
+        ('buyer', 'buyer', 'Buyer'),
+        ('eBayCollectedTaxAmount', 'e_bay_collected_tax_amount', 'Amount'),
+        ('feeJurisdiction', 'fee_jurisdiction', 'FeeJurisdiction'),
+        ('feeType', 'fee_type', None),
+        ('orderId', 'order_id', None),
+        ('orderLineItems', 'order_line_items', ('list', 'OrderLineItem')),
+        ('paymentsEntity', 'payments_entity', None),
+        ('payoutDetails', 'payout_details', 'PayoutDetails'),
+        ('payoutId', 'payout_id', None),
+        ('references', 'references', ('list', 'Reference')),
+        ('salesRecordReference', 'sales_record_reference', None),
+        ('taxes', 'taxes', ('list', 'Tax')),
+        ('totalFeeAmount', 'total_fee_amount', 'Amount'),
+        ('totalFeeBasisAmount', 'total_fee_basis_amount', 'Amount'),
+        ('transactionDate', 'transaction_date', None),
+        ('transactionId', 'transaction_id', None),
+        ('transactionMemo', 'transaction_memo', None),
+        ('transactionStatus', 'transaction_status', None),
+        ('transactionType', 'transaction_type', None),
+    ),
+    'TransactionSummaryResponse': (
+        ('adjustmentAmount', 'adjustment_amount', 'Amount'),
+        ('adjustmentBookingEntry', 'adjustment_booking_entry', None),
+        ('adjustmentCount', 'adjustment_count', None),
+        ('balanceTransferAmount', 'balance_transfer_amount', 'Amount'),
+        ('balanceTransferBookingEntry', 'balance_transfer_booking_entry', None),
+        ('balanceTransferCount', 'balance_transfer_count', None),
+        ('creditAmount', 'credit_amount', 'Amount'),
+        ('creditBookingEntry', 'credit_booking_entry', None),
+        ('creditCount', 'credit_count', None),
+        ('disputeAmount', 'dispute_amount', 'Amount'),
+        ('disputeBookingEntry', 'dispute_booking_entry', None),
+        ('disputeCount', 'dispute_count', None),
+        ('loanRepaymentAmount', 'loan_repayment_amount', 'Amount'),
+        ('loanRepaymentBookingEntry', 'loan_repayment_booking_entry', None),
+        ('loanRepaymentCount', 'loan_repayment_count', None),
+        ('nonSaleChargeAmount', 'non_sale_charge_amount', 'Amount'),
+        ('nonSaleChargeBookingEntry', 'non_sale_charge_booking_entry', None),
+        ('nonSaleChargeCount', 'non_sale_charge_count', None),
+        ('onHoldAmount', 'on_hold_amount', 'Amount'),
+        ('onHoldBookingEntry', 'on_hold_booking_entry', None),
+        ('onHoldCount', 'on_hold_count', None),
+        ('purchaseAmount', 'purchase_amount', 'Amount'),
+        ('purchaseBookingEntry', 'purchase_booking_entry', None),
+        ('purchaseCount', 'purchase_count', None),
+        ('refundAmount', 'refund_amount', 'Amount'),
+        ('refundBookingEntry', 'refund_booking_entry', None),
+        ('refundCount', 'refund_count', None),
+        ('shippingLabelAmount', 'shipping_label_amount', 'Amount'),
+        ('shippingLabelBookingEntry', 'shipping_label_booking_entry', None),
+        ('shippingLabelCount', 'shipping_label_count', None),
+        ('transferAmount', 'transfer_amount', 'Amount'),
+        ('transferBookingEntry', 'transfer_booking_entry', None),
+        ('transferCount', 'transfer_count', None),
+        ('withdrawalAmount', 'withdrawal_amount', 'Amount'),
+        ('withdrawalBookingEntry', 'withdrawal_booking_entry', None),
+        ('withdrawalCount', 'withdrawal_count', None),
+    ),
+    'Transactions': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+        ('transactions', 'transactions', ('list', 'Transaction')),
+    ),
+    'Transfer': (
+        ('fundingSource', 'funding_source', 'FundingSource'),
+        ('transactionDate', 'transaction_date', None),
+        ('transferAmount', 'transfer_amount', 'Amount'),
+        ('transferDetail', 'transfer_detail', 'TransferDetail'),
+        ('transferId', 'transfer_id', None),
+    ),
+    'TransferDetail': (
+        ('balanceAdjustment', 'balance_adjustment', 'BalanceAdjustment'),
+        ('charges', 'charges', ('list', 'Charge')),
+        ('totalChargeNetAmount', 'total_charge_net_amount', 'Amount'),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'BillingActivityResponse': 'BillingActivityResponse',
+    'Payout': 'Payout',
+    'PayoutSummaryResponse': 'PayoutSummaryResponse',
+    'Payouts': 'Payouts',
+    'SellerFundsSummaryResponse': 'SellerFundsSummaryResponse',
+    'TransactionSummaryResponse': 'TransactionSummaryResponse',
+    'Transactions': 'Transactions',
+    'Transfer': 'Transfer',
+}
@@ -0,0 +1,517 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'AcceptPaymentDisputeRequest': (
+        ('returnAddress', 'return_address', 'ReturnAddress'),
+        ('revision', 'revision', None),
+    ),
+    'AddEvidencePaymentDisputeRequest': (
+        ('evidenceType', 'evidence_type', None),
+        ('files', 'files', ('list', 'FileEvidence')),
+        ('lineItems', 'line_items', ('list', 'OrderLineItems')),
+    ),
+    'AddEvidencePaymentDisputeResponse': (
+        ('evidenceId', 'evidence_id', None),
+    ),
+    'Address': (
+        ('addressLine1', 'address_line1', None),
+        ('addressLine2', 'address_line2', None),
+        ('city', 'city', None),
+        ('countryCode', 'country_code', None),
+        ('county', 'county', None),
+        ('postalCode', 'postal_code', None),
+        ('stateOrProvince', 'state_or_province', None),
+    ),
+    'Amount': (
+        ('convertedFromCurrency', 'converted_from_currency', None),
+        ('convertedFromValue', 'converted_from_value', None),
+        ('currency', 'currency', None),
+        ('value', 'value', None),
+    ),
+    'AppliedPromotion': (
+        ('description', 'description', None),
+        ('discountAmount', 'discount_amount', 'Amount'),
+        ('promotionId', 'promotion_id', None),
+    ),
+    'AppointmentDetails': (
+        ('appointmentEndTime', 'appointment_end_time', None),
+        ('appointmentStartTime', 'appointment_start_time', None),
+        ('appointmentStatus', 'appointment_status', None),
+        ('appointmentType', 'appointment_type', None),
+        ('appointmentWindow', 'appointment_window', None),
+        ('serviceProviderAppointmentDate', 'service_provider_appointment_date', None),
+    ),
+    'Buyer': (
+        ('buyerRegistrationAddress', 'buyer_registration_address', 'ExtendedContact'),
+        ('taxAddress', 'tax_address', 'TaxAddress'),
+        ('taxIdentifier', 'tax_identifier', 'TaxIdentifier'),
+        ('username', 'username', None),
+    ),
+    'CancelRequest': (
+        ('cancelCompletedDate', 'cancel_completed_date', None),
+        ('cancelInitiator', 'cancel_initiator', None),
+        ('cancelReason', 'cancel_reason', None),
+        ('cancelRequestedDate', 'cancel_requested_date', None),
+        ('cancelRequestId', 'cancel_request_id', None),
+        ('cancelRequestState', 'cancel_request_state', None),
+    ),
+    'CancelStatus': (
+        ('cancelledDate', 'cancelled_date', None),
+        ('cancelRequests', 'cancel_requests', ('list', 'CancelRequest')),
+        ('cancelState', 'cancel_state', None),
+    ),
+    'Charge': (
+        ('amount', 'amount', 'Amount'),
+        ('chargeType', 'charge_type', None),
+    ),
+    'ContestPaymentDisputeRequest': (
+        ('note', 'note', None),
+        ('returnAddress', 'return_address', 'ReturnAddress'),
+        ('revision', 'revision', None),
+    ),
+    'DeliveryCost': (
+        ('discountAmount', 'discount_amount', 'Amount'),
+        ('handlingCost', 'handling_cost', 'Amount'),
+        ('importCharges', 'import_charges', 'Amount'),
+        ('shippingCost', 'shipping_cost', 'Amount'),
+        ('shippingIntermediationFee', 'shipping_intermediation_fee', 'Amount'),
+    ),
+    'DisputeAmount': (
+        ('convertedFromCurrency', 'converted_from_currency', None),
+        ('convertedFromValue', 'converted_from_value', None),
+        ('currency', 'currency', None),
+        ('exchangeRate', 'exchange_rate', None),
+        ('value', 'value', None),
+    ),
+    'DisputeEvidence': (
+        ('evidenceId', 'evidence_id', None),
+        ('evidenceType', 'evidence_type', None),
+        ('files', 'files', ('list', 'FileInfo')),
+        ('lineItems', 'line_items', ('list', 'OrderLineItems')),
+        ('providedDate', 'provided_date', None),
+        ('requestDate', 'request_date', None),
+        ('respondByDate', 'respond_by_date', None),
+        ('shipmentTracking', 'shipment_tracking', ('list', 'TrackingInfo')),
+    ),
+    'DisputeSummaryResponse': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('paymentDisputeSummaries', 'payment_dispute_summaries', ('list', 'PaymentDisputeSummary')),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+    ),
+    'EbayCollectAndRemitTax': (
+        ('amount', 'amount', 'Amount'),
+        ('ebayReference', 'ebay_reference', 'EbayTaxReference'),
+        ('taxType', 'tax_type', None),
+        ('collectionMethod', 'collection_method', None),
+    ),
+    'EbayCollectedCharges': (
+        ('ebayShipping', 'ebay_shipping', 'Amount'),
+        ('charges', 'charges', ('list', 'Charge')),
+    ),
+    'EbayFulfillmentProgram': (
+        ('fulfilledBy', 'fulfilled_by', None),
+    ),
+    'EbayInternationalShipping': (
+        ('returnsManagedBy', 'returns_managed_by', None),
+    ),
+    'EbayShipping': (
+        ('shippingLabelProvidedBy', 'shipping_label_provided_by', None),
+    ),
+    'EbayTaxReference': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'EbayVaultProgram': (
+        ('fulfillmentType', 'fulfillment_type', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'EvidenceRequest': (
+        ('evidenceId', 'evidence_id', None),
+        ('evidenceType', 'evidence_type', None),
+        ('lineItems', 'line_items', ('list', 'OrderLineItems')),
+        ('requestDate', 'request_date', None),
+        ('respondByDate', 'respond_by_date', None),
+    ),
+    'ExtendedContact': (
+        ('companyName', 'company_name', None),
+        ('contactAddress', 'contact_address', 'Address'),
+        ('email', 'email', None),
+        ('fullName', 'full_name', None),
+        ('primaryPhone', 'primary_phone', 'PhoneNumber'),
+    ),
+    'FileEvidence': (
+        ('fileId', 'file_id', None),
+    ),
+    'FileInfo': (
+        ('fileId', 'file_id', None),
+        ('fileType', 'file_type', None),
+        ('name', 'name', None),
+        ('uploadedDate', 'uploaded_date', None),
+    ),
+    'FulfillmentStartInstruction': (
+        ('appointment', 'appointment', 'AppointmentDetails'),
+        ('ebaySupportedFulfillment', 'ebay_supported_fulfillment', None),
+        ('finalDestinationAddress', 'final_destination_address', 'Address'),
+        ('fulfillmentInstructionsType', 'fulfillment_instructions_type', None),
+        ('maxEstimatedDeliveryDate', 'max_estimated_delivery_date', None),
+        ('minEstimatedDeliveryDate', 'min_estimated_delivery_date', None),
+        ('pickupStep', 'pickup_step', 'PickupStep'),
+        ('shippingStep', 'shipping_step', 'ShippingStep'),
+    ),
+    'GiftDetails': (
+        ('message', 'message', None),
+        ('recipientEmail', 'recipient_email', None),
+        ('senderName', 'sender_name', None),
+    ),
+    'InfoFromBuyer': (
+        ('contentOnHold', 'content_on_hold', None),
+        ('note', 'note', None),
+        ('returnShipmentTracking', 'return_shipment_tracking', ('list', 'TrackingInfo')),
+    ),
+    'IssueRefundRequest': (
+        ('reasonForRefund', 'reason_for_refund', None),
+        ('comment', 'comment', None),
+        ('refundItems', 'refund_items', ('list', 'RefundItem')),
+        ('orderLevelRefundAmount', 'order_level_refund_amount', 'SimpleAmount'),
+    ),
+    'ItemLocation': (
+        ('countryCode', 'country_code', None),
+        ('location', 'location', None),
+        ('postalCode', 'postal_code', None),
+    ),
+    'LegacyReference': (
+        ('legacyItemId', 'legacy_item_id', None),
+        ('legacyTransactionId', 'legacy_transaction_id', None),
+    ),
+    'LineItem': (
+        ('appliedPromotions', 'applied_promotions', ('list', 'AppliedPromotion')),
+        ('compatibilityProperties', 'compatibility_properties', ('list', 'ModelProperty')),
+        ('deliveryCost', 'delivery_cost', 'DeliveryCost'),
+        ('discountedLineItemCost', 'discounted_line_item_cost', 'Amount'),
+        ('ebayCollectAndRemitTaxes', 'ebay_collect_and_remit_taxes', ('list', 'EbayCollectAndRemitTax')),
+        ('ebayCollectedCharges', 'ebay_collected_charges', 'EbayCollectedCharges'),
+        ('giftDetails', 'gift_details', 'GiftDetails'),
+        ('itemLocation', 'item_location', 'ItemLocation'),
+        ('legacyItemId', 'legacy_item_id', None),
+        ('legacyVariationId', 'legacy_variation_id', None),
+        ('lineItemCost', 'line_item_cost', 'Amount'),
+        ('lineItemFulfillmentInstructions', 'line_item_fulfillment_instructions', 'LineItemFulfillmentInstructions'),
+        ('lineItemFulfillmentStatus', 'line_item_fulfillment_status', None),
+        ('lineItemId', 'line_item_id', None),
+        ('linkedOrderLineItems', 'linked_order_line_items', ('list', 'LinkedOrderLineItem')),
+        ('listingMarketplaceId', 'listing_marketplace_id', None),
+        ('properties', 'properties', 'LineItemProperties'),
+        ('purchaseMarketplaceId', 'purchase_marketplace_id', None),
+        ('quantity', 'quantity', None),
+        ('refunds', 'refunds', ('list', 'LineItemRefund')),
+        ('sku', 'sku', None),
+        ('soldFormat', 'sold_format', None),
+        ('taxes', 'taxes', ('list', 'Tax')),
+        ('title', 'title', None),
+        ('total', 'total', 'Amount'),
+        ('variationAspects', 'variation_aspects', ('list', 'NameValuePair')),
+    ),
+    'LineItemFulfillmentInstructions': (
+        ('guaranteedDelivery', 'guaranteed_delivery', None),
+        ('maxEstimatedDeliveryDate', 'max_estimated_delivery_date', None),
+        ('minEstimatedDeliveryDate', 'min_estimated_delivery_date', None),
+        ('shipByDate', 'ship_by_date', None),
+    ),
+    'LineItemProperties': (
+        ('buyerProtection', 'buyer_protection', None),
+        ('fromBestOffer', 'from_best_offer', None),
+        ('soldViaAdCampaign', 'sold_via_ad_campaign', None),
+    ),
+    'LineItemReference': (
+        ('lineItemId', 'line_item_id', None),
+        ('quantity', 'quantity', None),
+    ),
+    'LineItemRefund': (
+        ('amount', 'amount', 'Amount'),
+        ('refundDate', 'refund_date', None),
+        ('refundId', 'refund_id', None),
+        ('refundReferenceId', 'refund_reference_id', None),
+    ),
+    'LinkedOrderLineItem': (
+        ('lineItemAspects', 'line_item_aspects', ('list', 'NameValuePair')),
+        ('lineItemId', 'line_item_id', None),
+        ('maxEstimatedDeliveryDate', 'max_estimated_delivery_date', None),
+        ('minEstimatedDeliveryDate', 'min_estimated_delivery_date', None),
+        ('orderId', 'order_id', None),
+        ('sellerId', 'seller_id', None),
+        ('shipments', 'shipments', ('list', 'TrackingInfo')),
+        ('title', 'title', None),
+    ),
+    'ModelProperty': (
+        ('propertyDisplayName', 'property_display_name', None),
+        ('propertyName', 'property_name', None),
+        ('propertyValue', 'property_value', None),
+    ),
+    'MonetaryTransaction': (
+        ('date', '_date', None),
+        ('type', 'type', None),
+        ('reason', 'reason', None),
+        ('amount', 'amount', 'DisputeAmount'),
+    ),
+    'NameValuePair': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'Order': (
+        ('buyer', 'buyer', 'Buyer'),
+        ('buyerCheckoutNotes', 'buyer_checkout_notes', None),
+        ('cancelStatus', 'cancel_status', 'CancelStatus'),
+        ('creationDate', 'creation_date', None),
+        ('ebayCollectAndRemitTax', 'ebay_collect_and_remit_tax', None),
+        ('fulfillmentHrefs', 'fulfillment_hrefs', None),
+        ('fulfillmentStartInstructions', 'fulfillment_start_instructions', ('list', 'FulfillmentStartInstruction')),
+        ('lastModifiedDate', 'last_modified_date', None),
+        ('lineItems', 'line_items', ('list', 'LineItem')),
+        ('orderFulfillmentStatus', 'order_fulfillment_status', None),
+        ('orderId', 'order_id', None),
+        ('orderPaymentStatus', 'order_payment_status', None),
+        ('paymentSummary', 'payment_summary', 'PaymentSummary'),
+        ('pricingSummary', 'pricing_summary', 'PricingSummary'),
+        ('program', 'program', 'Program'),
+        ('salesRecordReference', 'sales_record_reference', None),
+        ('sellerId', 'seller_id', None),
+        ('totalFeeBasisAmount', 'total_fee_basis_amount', 'Amount'),
+        ('totalMarketplaceFee', 'total_marketplace_fee', 'Amount'),
+    ),
+    'OrderLineItems': (
+        ('itemId', 'item_id', None),
+        ('lineItemId', 'line_item_id', None),
+    ),
+    'OrderRefund': (
+        ('amount', 'amount', 'Amount'),
+        ('refundDate', 'refund_date', None),
+        ('refundId', 'refund_id', None),
+        ('refundReferenceId', 'refund_reference_id', None),
+        ('refundStatus', 'refund_status', None),
+    ),
+    'OrderSearchPagedCollection': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('orders', 'orders', ('list', 'Order')),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'Payment': (
+        ('amount', 'amount', 'Amount'),
+        ('paymentDate', 'payment_date', None),
+        ('paymentHolds', 'payment_holds', ('list', 'PaymentHold')),
+        ('paymentMethod', 'payment_method', None),
+        ('paymentReferenceId', 'payment_reference_id', None),
+        ('paymentStatus', 'payment_status', None),
+    ),
+    'PaymentDispute': (
+        ('amount', 'amount', 'SimpleAmount'),
+        ('availableChoices', 'available_choices', None),
+        ('buyerProvided', 'buyer_provided', 'InfoFromBuyer'),
+        ('buyerUsername', 'buyer_username', None),
+        ('closedDate', 'closed_date', None),
+        ('evidence', 'evidence', ('list', 'DisputeEvidence')),
+        ('evidenceRequests', 'evidence_requests', ('list', 'EvidenceRequest')),
+        ('lineItems', 'line_items', ('list', 'OrderLineItems')),
+        ('monetaryTransactions', 'monetary_transactions', ('list', 'MonetaryTransaction')),
+        ('note', 'note', None),
+        ('openDate', 'open_date', None),
+        ('orderId', 'order_id', None),
+        ('paymentDisputeId', 'payment_dispute_id', None),
+        ('paymentDisputeStatus', 'payment_dispute_status', None),
+        ('reason', 'reason', None),
+        ('resolution', 'resolution', 'PaymentDisputeOutcomeDetail'),
+        ('respondByDate', 'respond_by_date', None),
+        ('returnAddress', 'return_address', 'ReturnAddress'),
+        ('revision', 'revision', None),
+        ('sellerResponse', 'seller_response', None),
+    ),
+    'PaymentDisputeActivity': (
+        ('activityDate', 'activity_date', None),
+        ('activityType', 'activity_type', None),
+        ('actor', 'actor', None),
+    ),
+    'PaymentDisputeActivityHistory': (
+        ('activity', 'activity', ('list', 'PaymentDisputeActivity')),
+    ),
+    'PaymentDisputeOutcomeDetail': (
+        ('fees', 'fees', 'SimpleAmount'),
+        ('protectedAmount', 'protected_amount', 'SimpleAmount'),
+        ('protectionStatus', 'protection_status', None),
+        ('reasonForClosure', 'reason_for_closure', None),
+        ('recoupAmount', 'recoup_amount', 'SimpleAmount'),
+        ('totalFeeCredit', 'total_fee_credit', 'SimpleAmount'),
+    ),
+    'PaymentDisputeSummary': (
+        ('amount', 'amount', 'SimpleAmount'),
+        ('buyerUsername', 'buyer_username', None),
+        ('closedDate', 'closed_date', None),
+        ('openDate', 'open_date', None),
+        ('orderId', 'order_id', None),
+        ('paymentDisputeId', 'payment_dispute_id', None),
+        ('paymentDisputeStatus', 'payment_dispute_status', None),
+        ('reason', 'reason', None),
+        ('respondByDate', 'respond_by_date', None),
+    ),
+    'PaymentHold': (
+        ('expectedReleaseDate', 'expected_release_date', None),
+        ('holdAmount', 'hold_amount', 'Amount'),
+        ('holdReason', 'hold_reason', None),
+        ('holdState', 'hold_state', None),
+        ('releaseDate', 'release_date', None),
+        ('sellerActionsToRelease', 'seller_actions_to_release', ('list', 'SellerActionsToRelease')),
+    ),
+    'PaymentSummary': (
+        ('payments', 'payments', ('list', 'Payment')),
+        ('refunds', 'refunds', ('list', 'OrderRefund')),
+        ('totalDueSeller', 'total_due_seller', 'Amount'),
+    ),
+    'Phone': (
+        ('countryCode', 'country_code', None),
+        ('number', 'number', None),
+    ),
+    'PhoneNumber': (
+        ('phoneNumber', 'phone_number', None),
+    ),
+    'PickupStep': (
+        ('merchantLocationKey', 'merchant_location_key', None),
+    ),
+    'PostSaleAuthenticationProgram': (
+        ('outcomeReason', 'outcome_reason', None),
+        ('status', 'status', None),
+    ),
+    'PricingSummary': (
+        ('adjustment', 'adjustment', 'Amount'),
+        ('deliveryCost', 'delivery_cost', 'Amount'),
+        ('deliveryDiscount', 'delivery_discount', 'Amount'),
+        ('fee', 'fee', 'Amount'),
+        ('priceDiscount', 'price_discount', 'Amount'),
+        ('priceSubtotal', 'price_subtotal', 'Amount'),
+        ('tax', 'tax', 'Amount'),
+        ('total', 'total', 'Amount'),
+    ),
+    'Program': (
+        ('authenticityVerification', 'authenticity_verification', 'PostSaleAuthenticationProgram'),
+        ('ebayShipping', 'ebay_shipping', 'EbayShipping'),
+        ('ebayVault', 'ebay_vault', 'EbayVaultProgram'),
+        ('ebayInternationalShipping', 'ebay_international_shipping', 'EbayInternationalShipping'),
+        ('fulfillmentProgram', 'fulfillment_program', 'EbayFulfillmentProgram'),
+    ),
+    'Refund': (
+        ('refundId', 'refund_id', None),
+        ('refundStatus', 'refund_status', None),
+    ),
+    'RefundItem': (
+        ('refundAmount', 'refund_amount', 'SimpleAmount'),
+        ('lineItemId', 'line_item_id', None),
+        ('legacyReference', 'legacy_reference', 'LegacyReference'),
+    ),
+    'ReturnAddress': (
+        ('addressLine1', 'address_line1', None),
+        ('addressLine2', 'address_line2', None),
+        ('city', 'city', None),
+        ('country', 'country', None),
+        ('county', 'county', None),
+        ('fullName', 'full_name', None),
+        ('postalCode', 'postal_code', None),
+        ('primaryPhone', 'primary_phone', 'Phone'),
+        ('stateOrProvince', 'state_or_province', None),
+    ),
+    'SellerActionsToRelease': (
+        ('sellerActionToRelease', 'seller_action_to_release', None),
+    ),
+    'ShippingFulfillment': (
+        ('fulfillmentId', 'fulfillment_id', None),
+        ('lineItems', 'line_items', ('list', 'LineItemReference')),
+        ('shipmentTrackingNumber', 'shipment_tracking_number', None),
+        ('shippedDate', 'shipped_date', None),
+        ('shippingCarrierCode', 'shipping_carrier_code', None),
+    ),
+    'ShippingFulfillmentDetails': (
+        ('lineItems', 'line_items', ('list', 'LineItemReference')),
+        ('shippedDate', 'shipped_date', None),
+        ('shippingCarrierCode', 'shipping_carrier_code', None),
+        ('trackingNumber', 'tracking_number', None),
+    ),
+    'ShippingFulfillmentPagedCollection': (
+        ('fulfillments', 'fulfillments', ('list', 'ShippingFulfillment')),
+        ('total', 'total', None),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'ShippingStep': (
+        ('shippingCarrierCode', 'shipping_carrier_code', None),
+        ('shippingServiceCode', 'shipping_service_code', None),
+        ('shipTo', 'ship_to', 'ExtendedContact'),
+        ('shipToReferenceId', 'ship_to_reference_id', None),
+    ),
+    'SimpleAmount': (
+        ('currency', 'currency', None),
+        ('value', 'value', None),
+    ),
+    'Tax': (
+        ('amount', 'amount', 'Amount'),
+        ('taxType', 'tax_type', None),
+    ),
+    'TaxAddress': (
+        ('city', 'city', None),
+        ('countryCode', 'country_code', None),
+        ('postalCode', 'postal_code', None),
+        ('stateOrProvince', 'state_or_province', None),
+    ),
+    'TaxIdentifier': (
+        ('taxpayerId', 'taxpayer_id', None),
+        ('taxIdentifierType', 'tax_identifier_type', None),
+        ('issuingCountry', 'issuing_country', None),
+    ),
+    'TrackingInfo': (
+        ('shipmentTrackingNumber', 'shipment_tracking_number', None),
+        ('shippingCarrierCode', 'shipping_carrier_code', None),
+    ),
+    'UpdateEvidencePaymentDisputeRequest': (
+        ('evidenceId', 'evidence_id', None),
+        ('evidenceType', 'evidence_type', None),
+        ('files', 'files', ('list', 'FileEvidence')),
+        ('lineItems', 'line_items', ('list', 'OrderLineItems')),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'AddEvidencePaymentDisputeResponse': 'AddEvidencePaymentDisputeResponse',
+    'DisputeSummaryResponse': 'DisputeSummaryResponse',
+    'FileEvidence': 'FileEvidence',
+    'Order': 'Order',
+    'OrderSearchPagedCollection': 'OrderSearchPagedCollection',
+    'PaymentDispute': 'PaymentDispute',
+    'PaymentDisputeActivityHistory': 'PaymentDisputeActivityHistory',
+    'Refund': 'Refund',
+    'ShippingFulfillment': 'ShippingFulfillment',
+    'ShippingFulfillmentPagedCollection': 'ShippingFulfillmentPagedCollection',
+    'list[str]': None,
+    'object': None,
+}
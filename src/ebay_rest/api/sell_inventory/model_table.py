@@ -0,0 +1,669 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'Address': (
+        ('addressLine1', 'address_line1', None),
+        ('addressLine2', 'address_line2', None),
+        ('city', 'city', None),
+        ('country', 'country', None),
+        ('county', 'county', None),
+        ('postalCode', 'postal_code', None),
+        ('stateOrProvince', 'state_or_province', None),
+    ),
+    'Amount': (
+        ('currency', 'currency', None),
+        ('value', 'value', None),
+    ),
+    'Availability': (
+        ('pickupAtLocationAvailability', 'pickup_at_location_availability', ('list', 'PickupAtLocationAvailability')),
+        ('shipToLocationAvailability', 'ship_to_location_availability', 'ShipToLocationAvailability'),
+    ),
+    'AvailabilityDistribution': (
+        ('fulfillmentTime', 'fulfillment_time', 'TimeDuration'),
+        ('merchantLocationKey', 'merchant_location_key', None),
+        ('quantity', 'quantity', None),
+    ),
+    'AvailabilityWithAll': (
+        ('pickupAtLocationAvailability', 'pickup_at_location_availability', ('list', 'PickupAtLocationAvailability')),
+        ('shipToLocationAvailability', 'ship_to_location_availability', 'ShipToLocationAvailabilityWithAll'),
+    ),
+    'BaseResponse': (
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'BestOffer': (
+        ('autoAcceptPrice', 'auto_accept_price', 'Amount'),
+        ('autoDeclinePrice', 'auto_decline_price', 'Amount'),
+        ('bestOfferEnabled', 'best_offer_enabled', None),
+    ),
+    'BulkEbayOfferDetailsWithKeys': (
+        ('requests', 'requests', ('list', 'EbayOfferDetailsWithKeys')),
+    ),
+    'BulkGetInventoryItem': (
+        ('requests', 'requests', ('list', 'GetInventoryItem')),
+    ),
+    'BulkGetInventoryItemResponse': (
+        ('responses', 'responses', ('list', 'GetInventoryItemResponse')),
+    ),
+    'BulkInventoryItem': (
+        ('requests', 'requests', ('list', 'InventoryItemWithSkuLocale')),
+    ),
+    'BulkInventoryItemResponse': (
+        ('responses', 'responses', ('list', 'InventoryItemResponse')),
+    ),
+    'BulkMigrateListing': (
+        ('requests', 'requests', ('list', 'MigrateListing')),
+    ),
+    'BulkMigrateListingResponse': (
+        ('responses', 'responses', ('list', 'MigrateListingResponse')),
+    ),
+    'BulkOffer': (
+        ('requests', 'requests', ('list', 'OfferKeyWithId')),
+    ),
+    'BulkOfferResponse': (
+        ('responses', 'responses', ('list', 'OfferSkuResponse')),
+    ),
+    'BulkPriceQuantity': (
+        ('requests', 'requests', ('list', 'PriceQuantity')),
+    ),
+    'BulkPriceQuantityResponse': (
+        ('responses', 'responses', ('list', 'PriceQuantityResponse')),
+    ),
+    'BulkPublishResponse': (
+        ('responses', 'responses', ('list', 'OfferResponseWithListingId')),
+    ),
+    'Charity': (
+        ('charityId', 'charity_id', None),
+        ('donationPercentage', 'donation_percentage', None),
+    ),
+    'Compatibility': (
+        ('compatibleProducts', 'compatible_products', ('list', 'CompatibleProduct')),
+        ('sku', 'sku', None),
+    ),
+    'CompatibleProduct': (
+        ('compatibilityProperties', 'compatibility_properties', ('list', 'NameValueList')),
+        ('notes', 'notes', None),
+        ('productFamilyProperties', 'product_family_properties', 'ProductFamilyProperties'),
+        ('productIdentifier', 'product_identifier', 'ProductIdentifier'),
+    ),
+    'ConditionDescriptor': (
+        ('additionalInfo', 'additional_info', None),
+        ('name', 'name', None),
+        ('values', 'values', None),
+    ),
+    'CountryPolicy': (
+        ('country', 'country', None),
+        ('policyIds', 'policy_ids', None),
+    ),
+    'Dimension': (
+        ('height', 'height', None),
+        ('length', 'length', None),
+        ('unit', 'unit', None),
+        ('width', 'width', None),
+    ),
+    'Document': (
+        ('documentId', 'document_id', None),
+    ),
+    'EbayOfferDetailsWithAll': (
+        ('availableQuantity', 'available_quantity', None),
+        ('categoryId', 'category_id', None),
+        ('charity', 'charity', 'Charity'),
+        ('extendedProducerResponsibility', 'extended_producer_responsibility', 'ExtendedProducerResponsibility'),
+        ('format', 'format', None),
+        ('hideBuyerDetails', 'hide_buyer_details', None),
+        ('includeCatalogProductDetails', 'include_catalog_product_details', None),
+        ('listing', 'listing', 'ListingDetails'),
+        ('listingDescription', 'listing_description', None),
+        ('listingDuration', 'listing_duration', None),
+        ('listingPolicies', 'listing_policies', 'ListingPolicies'),
+        ('listingStartDate', 'listing_start_date', None),
+        ('lotSize', 'lot_size', None),
+        ('marketplaceId', 'marketplace_id', None),
+        ('merchantLocationKey', 'merchant_location_key', None),
+        ('offerId', 'offer_id', None),
+        ('pricingSummary', 'pricing_summary', 'PricingSummary'),
+        ('quantityLimitPerBuyer', 'quantity_limit_per_buyer', None),
+        ('regulatory', 'regulatory', 'Regulatory'),
+        ('secondaryCategoryId', 'secondary_category_id', None),
+        ('sku', 'sku', None),
+        ('status', 'status', None),
+        ('storeCategoryNames', 'store_category_names', None),
+        ('tax', 'tax', 'Tax'),
+    ),
+    'EbayOfferDetailsWithId': (
+        ('availableQuantity', 'available_quantity', None),
+        ('categoryId', 'category_id', None),
+        ('charity', 'charity', 'Charity'),
+        ('extendedProducerResponsibility', 'extended_producer_responsibility', 'ExtendedProducerResponsibility'),
+        ('hideBuyerDetails', 'hide_buyer_details', None),
+        ('includeCatalogProductDetails', 'include_catalog_product_details', None),
+        ('listingDescription', 'listing_description', None),
+        ('listingDuration', 'listing_duration', None),
+        ('listingPolicies', 'listing_policies', 'ListingPolicies'),
+        ('listingStartDate', 'listing_start_date', None),
+        ('lotSize', 'lot_size', None),
+        ('merchantLocationKey', 'merchant_location_key', None),
+        ('pricingSummary', 'pricing_summary', 'PricingSummary'),
+        ('quantityLimitPerBuyer', 'quantity_limit_per_buyer', None),
+        ('regulatory', 'regulatory', 'Regulatory'),
+        ('secondaryCategoryId', 'secondary_category_id', None),
+        ('storeCategoryNames', 'store_category_names', None),
+        ('tax', 'tax', 'Tax'),
+    ),
+    'EbayOfferDetailsWithKeys': (
+        ('availableQuantity', 'available_quantity', None),
+        ('categoryId', 'category_id', None),
+        ('charity', 'charity', 'Charity'),
+        ('extendedProducerResponsibility', 'extended_producer_responsibility', 'ExtendedProducerResponsibility'),
+        ('format', 'format', None),
+        ('hideBuyerDetails', 'hide_buyer_details', None),
+        ('includeCatalogProductDetails', 'include_catalog_product_details', None),
+        ('listingDescription', 'listing_description', None),
+        ('listingDuration', 'listing_duration', None),
+        ('listingPolicies', 'listing_policies', 'ListingPolicies'),
+        ('listingStartDate', 'listing_start_date', None),
+        ('lotSize', 'lot_size', None),
+        ('marketplaceId', 'marketplace_id', None),
+        ('merchantLocationKey', 'merchant_location_key', None),
+        ('pricingSummary', 'pricing_summary', 'PricingSummary'),
+        ('quantityLimitPerBuyer', 'quantity_limit_per_buyer', None),
+        ('regulatory', 'regulatory', 'Regulatory'),
+        ('secondaryCategoryId', 'secondary_category_id', None),
+        ('sku', 'sku', None),
+        ('storeCategoryNames', 'store_category_names', None),
+        ('tax', 'tax', 'Tax'),
+    ),
+    'EnergyEfficiencyLabel': (
+        ('imageDescription', 'image_description', None),
+        ('imageURL', 'image_url', None),
+        ('productInformationSheet', 'product_information_sheet', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'ExtendedProducerResponsibility': (
+        ('ecoParticipationFee', 'eco_participation_fee', 'Amount'),
+        ('producerProductId', 'producer_product_id', None),
+        ('productDocumentationId', 'product_documentation_id', None),
+        ('productPackageId', 'product_package_id', None),
+        ('shipmentPackageId', 'shipment_package_id', None),
+    ),
+    'Fee': (
+        ('amount', 'amount', 'Amount'),
+        ('feeType', 'fee_type', None),
+        ('promotionalDiscount', 'promotional_discount', 'Amount'),
+    ),
+    'FeeSummary': (
+        ('fees', 'fees', ('list', 'Fee')),
+        ('marketplaceId', 'marketplace_id', None),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'FeesSummaryResponse': (
+        ('feeSummaries', 'fee_summaries', ('list', 'FeeSummary')),
+    ),
+    'FormatAllocation': (
+        ('auction', 'auction', None),
+        ('fixedPrice', 'fixed_price', None),
+    ),
+    'FulfillmentCenterSpecifications': (
+        ('sameDayShippingCutOffTimes', 'same_day_shipping_cut_off_times', 'SameDayShippingCutOffTimes'),
+    ),
+    'GeoCoordinates': (
+        ('latitude', 'latitude', None),
+        ('longitude', 'longitude', None),
+    ),
+    'GetInventoryItem': (
+        ('sku', 'sku', None),
+    ),
+    'GetInventoryItemResponse': (
+        ('errors', 'errors', ('list', 'Error')),
+        ('inventoryItem', 'inventory_item', 'InventoryItemWithSkuLocaleGroupKeys'),
+        ('sku', 'sku', None),
+        ('statusCode', 'status_code', None),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'Hazmat': (
+        ('component', 'component', None),
+        ('pictograms', 'pictograms', None),
+        ('signalWord', 'signal_word', None),
+        ('statements', 'statements', None),
+    ),
+    'Interval': (
+        ('close', 'close', None),
+        ('open', 'open', None),
+    ),
+    'InventoryItem': (
+        ('availability', 'availability', 'Availability'),
+        ('condition', 'condition', None),
+        ('conditionDescription', 'condition_description', None),
+        ('conditionDescriptors', 'condition_descriptors', ('list', 'ConditionDescriptor')),
+        ('packageWeightAndSize', 'package_weight_and_size', 'PackageWeightAndSize'),
+        ('product', 'product', 'Product'),
+    ),
+    'InventoryItemGroup': (
+        ('aspects', 'aspects', None),
+        ('description', 'description', None),
+        ('imageUrls', 'image_urls', None),
+        ('inventoryItemGroupKey', 'inventory_item_group_key', None),
+        ('subtitle', 'subtitle', None),
+        ('title', 'title', None),
+        ('variantSKUs', 'variant_skus', None),
+        ('variesBy', 'varies_by', 'VariesBy'),
+        ('videoIds', 'video_ids', None),
+    ),
+    'InventoryItemListing': (
+        ('offerId', 'offer_id', None),
+        ('sku', 'sku', None),
+    ),
+    'InventoryItemResponse': (
+        ('errors', 'errors', ('list', 'Error')),
+        ('locale', 'locale', None),
+        ('sku', 'sku', None),
+        ('statusCode', 'status_code', None),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'InventoryItemWithSkuLocale': (
+        ('availability', 'availability', 'Availability'),
+        ('condition', 'condition', None),
+        ('conditionDescription', 'condition_description', None),
+        ('conditionDescriptors', 'condition_descriptors', ('list', 'ConditionDescriptor')),
+        ('locale', 'locale', None),
+        ('packageWeightAndSize', 'package_weight_and_size', 'PackageWeightAndSize'),
+        ('product', 'product', 'Product'),
+        ('sku', 'sku', None),
+    ),
+    'InventoryItemWithSkuLocaleGroupKeys': (
+        ('availability', 'availability', 'AvailabilityWithAll'),
+        ('condition', 'condition', None),
+        ('conditionDescription', 'condition_description', None),
+        ('conditionDescriptors', 'condition_descriptors', ('list', 'ConditionDescriptor')),
+        ('inventoryItemGroupKeys', 'inventory_item_group_keys', None),
+        ('locale', 'locale', None),
+        ('packageWeightAndSize', 'package_weight_and_size', 'PackageWeightAndSize'),
+        ('product', 'product', 'Product'),
+        ('sku', 'sku', None),
+    ),
+    'InventoryItemWithSkuLocaleGroupid': (
+        ('availability', 'availability', 'AvailabilityWithAll'),
+        ('condition', 'condition', None),
+        ('conditionDescription', 'condition_description', None),
+        ('conditionDescriptors', 'condition_descriptors', ('list', 'ConditionDescriptor')),
+        ('groupIds', 'group_ids', None),
+        ('inventoryItemGroupKeys', 'inventory_item_group_keys', None),
+        ('locale', 'locale', None),
+        ('packageWeightAndSize', 'package_weight_and_size', 'PackageWeightAndSize'),
+        ('product', 'product', 'Product'),
+        ('sku', 'sku', None),
+    ),
+    'InventoryItems': (
+        ('href', 'href', None),
+        ('inventoryItems', 'inventory_items', ('list', 'InventoryItemWithSkuLocaleGroupid')),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('prev', 'prev', None),
+        ('size', 'size', None),
+        ('total', 'total', None),
+    ),
+    'InventoryLocation': (
+        ('location', 'location', 'LocationDetails'),
+        ('locationAdditionalInformation', 'location_additional_information', None),
+        ('locationInstructions', 'location_instructions', None),
+        ('locationTypes', 'location_types', None),
+        ('locationWebUrl', 'location_web_url', None),
+        ('name', 'name', None),
+        ('operatingHours', 'operating_hours', ('list', 'OperatingHours')),
+        ('phone', 'phone', None),
+        ('specialHours', 'special_hours', ('list', 'SpecialHours')),
+        ('timeZoneId', 'time_zone_id', None),
+        ('fulfillmentCenterSpecifications', 'fulfillment_center_specifications', 'FulfillmentCenterSpecifications'),
+    ),
+    'InventoryLocationFull': (
+        ('location', 'location', 'LocationDetails'),
+        ('locationAdditionalInformation', 'location_additional_information', None),
+        ('locationInstructions', 'location_instructions', None),
+        ('locationTypes', 'location_types', None),
+        ('locationWebUrl', 'location_web_url', None),
+        ('merchantLocationStatus', 'merchant_location_status', None),
+        ('name', 'name', None),
+        ('operatingHours', 'operating_hours', ('list', 'OperatingHours')),
+        ('phone', 'phone', None),
+        ('specialHours', 'special_hours', ('list', 'SpecialHours')),
+        ('timeZoneId', 'time_zone_id', None),
+        ('fulfillmentCenterSpecifications', 'fulfillment_center_specifications', 'FulfillmentCenterSpecifications'),
+    ),
+    'InventoryLocationResponse': (
+        ('location', 'location', 'Location'),
+        ('locationAdditionalInformation', 'location_additional_information', None),
+        ('locationInstructions', 'location_instructions', None),
+        ('locationTypes', 'location_types', None),
+        ('locationWebUrl', 'location_web_url', None),
+        ('merchantLocationKey', 'merchant_location_key', None),
+        ('merchantLocationStatus', 'merchant_location_status', None),
+        ('name', 'name', None),
+        ('operatingHours', 'operating_hours', ('list', 'OperatingHours')),
+        ('phone', 'phone', None),
+        ('specialHours', 'special_hours', ('list', 'SpecialHours')),
+        ('timeZoneId', 'time_zone_id', None),
+        ('fulfillmentCenterSpecifications', 'fulfillment_center_specifications', 'FulfillmentCenterSpecifications'),
+    ),
+    'ListingDetails': (
+        ('listingId', 'listing_id', None),
+        ('listingOnHold', 'listing_on_hold', None),
+        ('listingStatus', 'listing_status', None),
+        ('soldQuantity', 'sold_quantity', None),
+    ),
+    'ListingPolicies': (
+        ('bestOfferTerms', 'best_offer_terms', 'BestOffer'),
+        ('eBayPlusIfEligible', 'e_bay_plus_if_eligible', None),
+        ('fulfillmentPolicyId', 'fulfillment_policy_id', None),
+        ('paymentPolicyId', 'payment_policy_id', None),
+        ('productCompliancePolicyIds', 'product_compliance_policy_ids', None),
+        ('regionalProductCompliancePolicies', 'regional_product_compliance_policies', 'RegionalProductCompliancePolicies'),
+        ('regionalTakeBackPolicies', 'regional_take_back_policies', 'RegionalTakeBackPolicies'),
+        ('returnPolicyId', 'return_policy_id', None),
+        ('shippingCostOverrides', 'shipping_cost_overrides', ('list', 'ShippingCostOverride')),
+        ('takeBackPolicyId', 'take_back_policy_id', None),
+    ),
+    'Location': (
+        ('address', 'address', 'Address'),
+        ('geoCoordinates', 'geo_coordinates', 'GeoCoordinates'),
+        ('locationId', 'location_id', None),
+    ),
+    'LocationAvailabilityDetails': (
+        ('merchantLocationKey', 'merchant_location_key', None),
+    ),
+    'LocationDetails': (
+        ('address', 'address', 'Address'),
+        ('geoCoordinates', 'geo_coordinates', 'GeoCoordinates'),
+    ),
+    'LocationMapping': (
+        ('locations', 'locations', ('list', 'LocationAvailabilityDetails')),
+    ),
+    'LocationResponse': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+        ('locations', 'locations', ('list', 'InventoryLocationResponse')),
+    ),
+    'Manufacturer': (
+        ('addressLine1', 'address_line1', None),
+        ('addressLine2', 'address_line2', None),
+        ('city', 'city', None),
+        ('companyName', 'company_name', None),
+        ('contactUrl', 'contact_url', None),
+        ('country', 'country', None),
+        ('email', 'email', None),
+        ('phone', 'phone', None),
+        ('postalCode', 'postal_code', None),
+        ('stateOrProvince', 'state_or_province', None),
+    ),
+    'MigrateListing': (
+        ('listingId', 'listing_id', None),
+    ),
+    'MigrateListingResponse': (
+        ('errors', 'errors', ('list', 'Error')),
+        ('inventoryItemGroupKey', 'inventory_item_group_key', None),
+        ('inventoryItems', 'inventory_items', ('list', 'InventoryItemListing')),
+        ('listingId', 'listing_id', None),
+        ('marketplaceId', 'marketplace_id', None),
+        ('statusCode', 'status_code', None),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'NameValueList': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'OfferKeyWithId': (
+        ('offerId', 'offer_id', None),
+    ),
+    'OfferKeysWithId': (
+        ('offers', 'offers', ('list', 'OfferKeyWithId')),
+    ),
+    'OfferPriceQuantity': (
+        ('availableQuantity', 'available_quantity', None),
+        ('offerId', 'offer_id', None),
+        ('price', 'price', 'Amount'),
+    ),
+    'OfferResponse': (
+        ('offerId', 'offer_id', None),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'OfferResponseWithListingId': (
+        ('errors', 'errors', ('list', 'Error')),
+        ('listingId', 'listing_id', None),
+        ('offerId', 'offer_id', None),
+        ('statusCode', 'status_code', None),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'OfferSkuResponse': (
+        ('errors', 'errors', ('list', 'Error')),
+        ('format', 'format', None),
+        ('marketplaceId', 'marketplace_id', None),
+        ('offerId', 'offer_id', None),
+        ('sku', 'sku', None),
+        ('statusCode', 'status_code', None),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'Offers': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offers', 'offers', ('list', 'EbayOfferDetailsWithAll')),
+        ('prev', 'prev', None),
+        ('size', 'size', None),
+        ('total', 'total', None),
+    ),
+    'OperatingHours': (
+        ('dayOfWeekEnum', 'day_of_week_enum', None),
+        ('intervals', 'intervals', ('list', 'Interval')),
+    ),
+    'Overrides': (
+        ('cutOffTime', 'cut_off_time', None),
+        ('endDate', 'end_date', None),
+        ('startDate', 'start_date', None),
+    ),
+    'PackageWeightAndSize': (
+        ('dimensions', 'dimensions', 'Dimension'),
+        ('packageType', 'package_type', None),
+        ('shippingIrregular', 'shipping_irregular', None),
+        ('weight', 'weight', 'Weight'),
+    ),
+    'PickupAtLocationAvailability': (
+        ('availabilityType', 'availability_type', None),
+        ('fulfillmentTime', 'fulfillment_time', 'TimeDuration'),
+        ('merchantLocationKey', 'merchant_location_key', None),
+        ('quantity', 'quantity', None),
+    ),
+    'PriceQuantity': (
+        ('offers', 'offers', ('list', 'OfferPriceQuantity')),
+        ('shipToLocationAvailability', 'ship_to_location_availability', 'ShipToLocationAvailability'),
+        ('sku', 'sku', None),
+    ),
+    'PriceQuantityResponse': (
+        ('errors', 'errors', ('list', 'Error')),
+        ('offerId', 'offer_id', None),
+        ('sku', 'sku', None),
+        ('statusCode', 'status_code', None),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'PricingSummary': (
+        ('auctionReservePrice', 'auction_reserve_price', 'Amount'),
+        ('auctionStartPrice', 'auction_start_price', 'Amount'),
+        ('minimumAdvertisedPrice', 'minimum_advertised_price', 'Amount'),
+        ('originallySoldForRetailPriceOn', 'originally_sold_for_retail_price_on', None),
+        ('originalRetailPrice', 'original_retail_price', 'Amount'),
+        ('price', 'price', 'Amount'),
+        ('pricingVisibility', 'pricing_visibility', None),
+    ),
+    'Product': (
+        ('aspects', 'aspects', None),
+        ('brand', 'brand', None),
+        ('description', 'description', None),
+        ('ean', 'ean', None),
+        ('epid', 'epid', None),
+        ('imageUrls', 'image_urls', None),
+        ('isbn', 'isbn', None),
+        ('mpn', 'mpn', None),
+        ('subtitle', 'subtitle', None),
+        ('title', 'title', None),
+        ('upc', 'upc', None),
+        ('videoIds', 'video_ids', None),
+    ),
+    'ProductFamilyProperties': (
+        ('engine', 'engine', None),
+        ('make', 'make', None),
+        ('model', 'model', None),
+        ('trim', 'trim', None),
+        ('year', 'year', None),
+    ),
+    'ProductIdentifier': (
+        ('epid', 'epid', None),
+        ('gtin', 'gtin', None),
+        ('ktype', 'ktype', None),
+    ),
+    'ProductSafety': (
+        ('component', 'component', None),
+        ('pictograms', 'pictograms', None),
+        ('statements', 'statements', None),
+    ),
+    'PublishByInventoryItemGroupRequest': (
+        ('inventoryItemGroupKey', 'inventory_item_group_key', None),
+        ('marketplaceId', 'marketplace_id', None),
+    ),
+    'PublishResponse': (
+        ('listingId', 'listing_id', None),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'RegionalProductCompliancePolicies': (
+        ('countryPolicies', 'country_policies', ('list', 'CountryPolicy')),
+    ),
+    'RegionalTakeBackPolicies': (
+        ('countryPolicies', 'country_policies', ('list', 'CountryPolicy')),
+    ),
+    'Regulatory': (
+        ('documents', 'documents', ('list', 'Document')),
+        ('energyEfficiencyLabel', 'energy_efficiency_label', 'EnergyEfficiencyLabel'),
+        ('hazmat', 'hazmat', 'Hazmat'),
+        ('manufacturer', 'manufacturer', 'Manufacturer'),
+        ('productSafety', 'product_safety', 'ProductSafety'),
+        ('repairScore', 'repair_score', None),
+        ('responsiblePersons', 'responsible_persons', ('list', 'ResponsiblePerson')),
+    ),
+    'ResponsiblePerson': (
+        ('addressLine1', 'address_line1', None),
+        ('addressLine2', 'address_line2', None),
+        ('city', 'city', None),
+        ('companyName', 'company_name', None),
+        ('contactUrl', 'contact_url', None),
+        ('country', 'country', None),
+        ('email', 'email', None),
+        ('phone', 'phone', None),
+        ('postalCode', 'postal_code', None),
+        ('stateOrProvince', 'state_or_province', None),
+        ('types', 'types', None),
+    ),
+    'SameDayShippingCutOffTimes': (
+        ('overrides', 'overrides', ('list', 'Overrides')),
+        ('weeklySchedule', 'weekly_schedule', ('list', 'WeeklySchedule')),
+    ),
+    'ShipToLocationAvailability': (
+        ('availabilityDistributions', 'availability_distributions', ('list', 'AvailabilityDistribution')),
+        ('quantity', 'quantity', None),
+    ),
+    'ShipToLocationAvailabilityWithAll': (
+        ('allocationByFormat', 'allocation_by_format', 'FormatAllocation'),
+        ('availabilityDistributions', 'availability_distributions', ('list', 'AvailabilityDistribution')),
+        ('quantity', 'quantity', None),
+    ),
+    'ShippingCostOverride': (
+        ('additionalShippingCost', 'additional_shipping_cost', 'Amount'),
+        ('priority', 'priority', None),
+        ('shippingCost', 'shipping_cost', 'Amount'),
+        ('shippingServiceType', 'shipping_service_type', None),
+        ('surcharge', 'surcharge', 'Amount'),
+    ),
+    'SpecialHours': (
+        ('date', '_date', None),
+        ('intervals', 'intervals', ('list', 'Interval')),
+    ),
+    'Specification': (
+        ('name', 'name', None),
+        ('values', 'values', None),
+    ),
+    'Tax': (
+        ('applyTax', 'apply_tax', None),
+        ('thirdPartyTaxCategory', 'third_party_tax_category', None),
+        ('vatPercentage', 'vat_percentage', None),
+    ),
+    'TimeDuration': (
+        ('unit', 'unit', None),
+        ('value', 'value', None),
+    ),
+    'VariesBy': (
+        ('aspectsImageVariesBy', 'aspects_image_varies_by', None),
+        ('specifications', 'specifications', ('list', 'Specification')),
+    ),
+    'Version': (
+        ('instance', 'instance', 'Version'),
+        ('version', 'version', None),
+    ),
+    'WeeklySchedule': (
+        ('cutOffTime', 'cut_off_time', None),
+        ('dayOfWeekEnum', 'day_of_week_enum', None),
+    ),
+    'Weight': (
+        ('unit', 'unit', None),
+        ('value', 'value', None),
+    ),
+    'WithdrawByInventoryItemGroupRequest': (
+        ('inventoryItemGroupKey', 'inventory_item_group_key', None),
+        ('marketplaceId', 'marketplace_id', None),
+    ),
+    'WithdrawResponse': (
+        ('listingId', 'listing_id', None),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'BaseResponse': 'BaseResponse',
+    'BulkGetInventoryItemResponse': 'BulkGetInventoryItemResponse',
+    'BulkInventoryItemResponse': 'BulkInventoryItemResponse',
+    'BulkMigrateListingResponse': 'BulkMigrateListingResponse',
+    'BulkOfferResponse': 'BulkOfferResponse',
+    'BulkPriceQuantityResponse': 'BulkPriceQuantityResponse',
+    'BulkPublishResponse': 'BulkPublishResponse',
+    'Compatibility': 'Compatibility',
+    'EbayOfferDetailsWithAll': 'EbayOfferDetailsWithAll',
+    'FeesSummaryResponse': 'FeesSummaryResponse',
+    'InventoryItemGroup': 'InventoryItemGroup',
+    'InventoryItemWithSkuLocaleGroupid': 'InventoryItemWithSkuLocaleGroupid',
+    'InventoryItems': 'InventoryItems',
+    'InventoryLocationResponse': 'InventoryLocationResponse',
+    'LocationMapping': 'LocationMapping',
+    'LocationResponse': 'LocationResponse',
+    'OfferResponse': 'OfferResponse',
+    'Offers': 'Offers',
+    'PublishResponse': 'PublishResponse',
+    'WithdrawResponse': 'WithdrawResponse',
+    'object': None,
+}
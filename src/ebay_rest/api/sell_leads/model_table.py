@@ -0,0 +1,82 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'Amount': (
+        ('convertedFromCurrency', 'converted_from_currency', None),
+        ('convertedFromValue', 'converted_from_value', None),
+        ('currency', 'currency', None),
+        ('value', 'value', None),
+    ),
+    'ClassifiedLead': (
+        ('itemId', 'item_id', None),
+        ('itemTitle', 'item_title', None),
+        ('responses', 'responses', ('list', 'ClassifiedLeadResponses')),
+    ),
+    'ClassifiedLeadResponses': (
+        ('additionalInformation', 'additional_information', None),
+        ('contactInformation', 'contact_information', 'ContactInformation'),
+        ('email', 'email', None),
+        ('externalEmail', 'external_email', None),
+        ('financingAnswer', 'financing_answer', None),
+        ('leadFee', 'lead_fee', 'LeadFee'),
+        ('leadStatus', 'lead_status', None),
+        ('memberMessage', 'member_message', 'MemberMessage'),
+        ('submittedTime', 'submitted_time', None),
+        ('tradeInMake', 'trade_in_make', None),
+        ('tradeInModel', 'trade_in_model', None),
+        ('tradeInYear', 'trade_in_year', None),
+        ('userId', 'user_id', None),
+    ),
+    'ClassifiedLeadsListResponse': (
+        ('classifiedLeads', 'classified_leads', ('list', 'ClassifiedLead')),
+        ('totalItems', 'total_items', None),
+        ('totalLeads', 'total_leads', None),
+    ),
+    'ContactInformation': (
+        ('firstName', 'first_name', None),
+        ('lastName', 'last_name', None),
+        ('phone', 'phone', None),
+        ('postalCode', 'postal_code', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'LeadFee': (
+        ('amount', 'amount', 'Amount'),
+        ('description', 'description', None),
+    ),
+    'MemberMessage': (
+        ('memberMessageExchange', 'member_message_exchange', ('list', 'MemberMessageExchange')),
+    ),
+    'MemberMessageExchange': (
+        ('creationDate', 'creation_date', None),
+        ('question', 'question', 'Question'),
+        ('response', 'response', None),
+    ),
+    'Question': (
+        ('body', 'body', None),
+        ('messageID', 'message_id', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'ClassifiedLead': 'ClassifiedLead',
+    'ClassifiedLeadsListResponse': 'ClassifiedLeadsListResponse',
+}
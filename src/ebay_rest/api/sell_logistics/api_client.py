@@ -14,6 +14,7 @@ import datetime
 import json
 import mimetypes
 from multiprocessing.pool import ThreadPool
+import threading  # ebay_rest patch
 import os
 import re
 import tempfile
@@ -65,7 +66,8 @@ class ApiClient(object):
             configuration = Configuration()
         self.configuration = configuration
 
-        self.pool = ThreadPool()
+        self._pool = None  # ebay_rest patch
+        self._pool_lock = threading.Lock()  # ebay_rest patch
         self.rest_client = rest.RESTClientObject(configuration)
         self.default_headers = {}
         if header_name is not None:
@@ -75,8 +77,18 @@ class ApiClient(object):
         self.user_agent = 'Swagger-Codegen/1.0.0/python'
 
     def __del__(self):
-        self.pool.close()
-        self.pool.join()
+        if self._pool is not None:  # ebay_rest patch
+            self._pool.close()
+            self._pool.join()
+
+    @property
+    def pool(self):  # ebay_rest patch
+        """Thread pool for async_req calls, started on first use"""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadPool()
+        return self._pool
 
     @property
     def user_agent(self):
@@ -229,6 +241,9 @@ class ApiClient(object):
         except ValueError:
             data = response.data
 
+        raw_deserializer = getattr(self.configuration, 'raw_deserializer', None)  # ebay_rest patch
+        if raw_deserializer is not None:  # ebay_rest patch
+            return raw_deserializer(data, response_type)  # ebay_rest patch
         return self.__deserialize(data, response_type)
 
     def __deserialize(self, data, klass):
@@ -0,0 +1,157 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'AdditionalOption': (
+        ('additionalCost', 'additional_cost', 'Amount'),
+        ('optionType', 'option_type', None),
+    ),
+    'Amount': (
+        ('currency', 'currency', None),
+        ('value', 'value', None),
+    ),
+    'Contact': (
+        ('companyName', 'company_name', None),
+        ('contactAddress', 'contact_address', 'ContactAddress'),
+        ('fullName', 'full_name', None),
+        ('primaryPhone', 'primary_phone', 'PhoneNumber'),
+    ),
+    'ContactAddress': (
+        ('addressLine1', 'address_line1', None),
+        ('addressLine2', 'address_line2', None),
+        ('city', 'city', None),
+        ('countryCode', 'country_code', None),
+        ('county', 'county', None),
+        ('postalCode', 'postal_code', None),
+        ('stateOrProvince', 'state_or_province', None),
+    ),
+    'CreateShipmentFromQuoteRequest': (
+        ('additionalOptions', 'additional_options', ('list', 'AdditionalOption')),
+        ('labelCustomMessage', 'label_custom_message', None),
+        ('labelSize', 'label_size', None),
+        ('rateId', 'rate_id', None),
+        ('returnTo', 'return_to', 'Contact'),
+        ('shippingQuoteId', 'shipping_quote_id', None),
+    ),
+    'Dimensions': (
+        ('height', 'height', None),
+        ('length', 'length', None),
+        ('unit', 'unit', None),
+        ('width', 'width', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'Order': (
+        ('channel', 'channel', None),
+        ('orderId', 'order_id', None),
+    ),
+    'PackageSpecification': (
+        ('dimensions', 'dimensions', 'Dimensions'),
+        ('weight', 'weight', 'Weight'),
+    ),
+    'PhoneNumber': (
+        ('phoneNumber', 'phone_number', None),
+    ),
+    'PickupSlot': (
+        ('pickupSlotEndTime', 'pickup_slot_end_time', None),
+        ('pickupSlotId', 'pickup_slot_id', None),
+        ('pickupSlotStartTime', 'pickup_slot_start_time', None),
+        ('pickupSlotTimeZone', 'pickup_slot_time_zone', None),
+    ),
+    'PurchasedRate': (
+        ('additionalOptions', 'additional_options', ('list', 'AdditionalOption')),
+        ('baseShippingCost', 'base_shipping_cost', 'Amount'),
+        ('destinationTimeZone', 'destination_time_zone', None),
+        ('maxEstimatedDeliveryDate', 'max_estimated_delivery_date', None),
+        ('minEstimatedDeliveryDate', 'min_estimated_delivery_date', None),
+        ('pickupNetworks', 'pickup_networks', None),
+        ('pickupSlotId', 'pickup_slot_id', None),
+        ('pickupType', 'pickup_type', None),
+        ('rateId', 'rate_id', None),
+        ('shippingCarrierCode', 'shipping_carrier_code', None),
+        ('shippingCarrierName', 'shipping_carrier_name', None),
+        ('shippingQuoteId', 'shipping_quote_id', None),
+        ('shippingServiceCode', 'shipping_service_code', None),
+        ('shippingServiceName', 'shipping_service_name', None),
+        ('totalShippingCost', 'total_shipping_cost', 'Amount'),
+    ),
+    'Rate': (
+        ('additionalOptions', 'additional_options', ('list', 'AdditionalOption')),
+        ('baseShippingCost', 'base_shipping_cost', 'Amount'),
+        ('destinationTimeZone', 'destination_time_zone', None),
+        ('maxEstimatedDeliveryDate', 'max_estimated_delivery_date', None),
+        ('minEstimatedDeliveryDate', 'min_estimated_delivery_date', None),
+        ('pickupNetworks', 'pickup_networks', None),
+        ('pickupSlots', 'pickup_slots', ('list', 'PickupSlot')),
+        ('pickupType', 'pickup_type', None),
+        ('rateId', 'rate_id', None),
+        ('rateRecommendation', 'rate_recommendation', None),
+        ('shippingCarrierCode', 'shipping_carrier_code', None),
+        ('shippingCarrierName', 'shipping_carrier_name', None),
+        ('shippingServiceCode', 'shipping_service_code', None),
+        ('shippingServiceName', 'shipping_service_name', None),
+    ),
+    'Shipment': (
+        ('cancellation', 'cancellation', 'ShipmentCancellation'),
+        ('creationDate', 'creation_date', None),
+        ('labelCustomMessage', 'label_custom_message', None),
+        ('labelDownloadUrl', 'label_download_url', None),
+        ('labelSize', 'label_size', None),
+        ('orders', 'orders', ('list', 'Order')),
+        ('packageSpecification', 'package_specification', 'PackageSpecification'),
+        ('rate', 'rate', 'PurchasedRate'),
+        ('returnTo', 'return_to', 'Contact'),
+        ('shipFrom', 'ship_from', 'Contact'),
+        ('shipmentId', 'shipment_id', None),
+        ('shipmentTrackingNumber', 'shipment_tracking_number', None),
+        ('shipTo', 'ship_to', 'Contact'),
+    ),
+    'ShipmentCancellation': (
+        ('cancellationRequestedDate', 'cancellation_requested_date', None),
+        ('cancellationStatus', 'cancellation_status', None),
+    ),
+    'ShippingQuote': (
+        ('creationDate', 'creation_date', None),
+        ('expirationDate', 'expiration_date', None),
+        ('orders', 'orders', ('list', 'Order')),
+        ('packageSpecification', 'package_specification', 'PackageSpecification'),
+        ('rates', 'rates', ('list', 'Rate')),
+        ('shipFrom', 'ship_from', 'Contact'),
+        ('shippingQuoteId', 'shipping_quote_id', None),
+        ('shipTo', 'ship_to', 'Contact'),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'ShippingQuoteRequest': (
+        ('orders', 'orders', ('list', 'Order')),
+        ('packageSpecification', 'package_specification', 'PackageSpecification'),
+        ('shipFrom', 'ship_from', 'Contact'),
+        ('shipTo', 'ship_to', 'Contact'),
+    ),
+    'Weight': (
+        ('unit', 'unit', None),
+        ('value', 'value', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'Shipment': 'Shipment',
+    'ShippingQuote': 'ShippingQuote',
+    'list[str]': None,
+}
@@ -0,0 +1,962 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'Ad': (
+        ('adGroupId', 'ad_group_id', None),
+        ('adId', 'ad_id', None),
+        ('adStatus', 'ad_status', None),
+        ('alerts', 'alerts', ('list', 'Alert')),
+        ('bidPercentage', 'bid_percentage', None),
+        ('inventoryReferenceId', 'inventory_reference_id', None),
+        ('inventoryReferenceType', 'inventory_reference_type', None),
+        ('listingId', 'listing_id', None),
+    ),
+    'AdGroup': (
+        ('adGroupId', 'ad_group_id', None),
+        ('adGroupStatus', 'ad_group_status', None),
+        ('defaultBid', 'default_bid', 'Amount'),
+        ('name', 'name', None),
+    ),
+    'AdGroupPagedCollectionResponse': (
+        ('adGroups', 'ad_groups', ('list', 'AdGroup')),
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+    ),
+    'AdIds': (
+        ('adIds', 'ad_ids', None),
+    ),
+    'AdPagedCollectionResponse': (
+        ('ads', 'ads', ('list', 'Ad')),
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+    ),
+    'AdReference': (
+        ('adId', 'ad_id', None),
+        ('href', 'href', None),
+    ),
+    'AdReferences': (
+        ('ads', 'ads', ('list', 'AdReference')),
+    ),
+    'AdResponse': (
+        ('adGroupId', 'ad_group_id', None),
+        ('adId', 'ad_id', None),
+        ('errors', 'errors', ('list', 'Error')),
+        ('href', 'href', None),
+        ('listingId', 'listing_id', None),
+        ('statusCode', 'status_code', None),
+    ),
+    'AdUpdateResponse': (
+        ('adId', 'ad_id', None),
+        ('errors', 'errors', ('list', 'Error')),
+        ('href', 'href', None),
+        ('listingId', 'listing_id', None),
+        ('statusCode', 'status_code', None),
+    ),
+    'AdUpdateStatusByListingIdResponse': (
+        ('adGroupId', 'ad_group_id', None),
+        ('errors', 'errors', ('list', 'Error')),
+        ('href', 'href', None),
+        ('listingId', 'listing_id', None),
+        ('statusCode', 'status_code', None),
+    ),
+    'AdUpdateStatusResponse': (
+        ('adId', 'ad_id', None),
+        ('errors', 'errors', ('list', 'Error')),
+        ('href', 'href', None),
+        ('statusCode', 'status_code', None),
+    ),
+    'AdditionalInfo': (
+        ('infoType', 'info_type', None),
+        ('metrics', 'metrics', ('list', 'AdditionalInfoData')),
+    ),
+    'AdditionalInfoData': (
+        ('metricKey', 'metric_key', None),
+        ('value', 'value', None),
+    ),
+    'Ads': (
+        ('ads', 'ads', ('list', 'Ad')),
+    ),
+    'Alert': (
+        ('alertType', 'alert_type', None),
+        ('details', 'details', ('list', 'AlertDetails')),
+    ),
+    'AlertDetails': (
+        ('dimension', 'dimension', 'AlertDimension'),
+        ('aspect', 'aspect', 'Aspect'),
+    ),
+    'AlertDimension': (
+        ('key', 'key', None),
+        ('value', 'value', None),
+    ),
+    'Amount': (
+        ('currency', 'currency', None),
+        ('value', 'value', None),
+    ),
+    'Aspect': (
+        ('key', 'key', None),
+        ('value', 'value', None),
+    ),
+    'BaseResponse': (
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'BidPreference': (
+        ('maxCpc', 'max_cpc', 'MaxCpc'),
+    ),
+    'Budget': (
+        ('amount', 'amount', 'Amount'),
+        ('budgetStatus', 'budget_status', None),
+    ),
+    'BudgetRecommendationResponse': (
+        ('budget', 'budget', 'CampaignBudget'),
+        ('campaignId', 'campaign_id', None),
+        ('channels', 'channels', None),
+    ),
+    'BudgetRequest': (
+        ('amount', 'amount', 'Amount'),
+    ),
+    'BulkAdResponse': (
+        ('responses', 'responses', ('list', 'AdResponse')),
+    ),
+    'BulkAdUpdateResponse': (
+        ('responses', 'responses', ('list', 'AdUpdateResponse')),
+    ),
+    'BulkAdUpdateStatusByListingIdResponse': (
+        ('responses', 'responses', ('list', 'AdUpdateStatusByListingIdResponse')),
+    ),
+    'BulkAdUpdateStatusResponse': (
+        ('responses', 'responses', ('list', 'AdUpdateStatusResponse')),
+    ),
+    'BulkCreateAdRequest': (
+        ('requests', 'requests', ('list', 'CreateAdRequest')),
+    ),
+    'BulkCreateAdsByInventoryReferenceRequest': (
+        ('requests', 'requests', ('list', 'CreateAdsByInventoryReferenceRequest')),
+    ),
+    'BulkCreateAdsByInventoryReferenceResponse': (
+        ('responses', 'responses', ('list', 'CreateAdsByInventoryReferenceResponse')),
+    ),
+    'BulkCreateKeywordRequest': (
+        ('requests', 'requests', ('list', 'CreateKeywordRequest')),
+    ),
+    'BulkCreateKeywordResponse': (
+        ('responses', 'responses', ('list', 'KeywordResponse')),
+    ),
+    'BulkCreateNegativeKeywordRequest': (
+        ('requests', 'requests', ('list', 'CreateNegativeKeywordRequest')),
+    ),
+    'BulkCreateNegativeKeywordResponse': (
+        ('responses', 'responses', ('list', 'NegativeKeywordResponse')),
+    ),
+    'BulkDeleteAdRequest': (
+        ('requests', 'requests', ('list', 'DeleteAdRequest')),
+    ),
+    'BulkDeleteAdResponse': (
+        ('responses', 'responses', ('list', 'DeleteAdResponse')),
+    ),
+    'BulkDeleteAdsByInventoryReferenceRequest': (
+        ('requests', 'requests', ('list', 'DeleteAdsByInventoryReferenceRequest')),
+    ),
+    'BulkDeleteAdsByInventoryReferenceResponse': (
+        ('responses', 'responses', ('list', 'DeleteAdsByInventoryReferenceResponse')),
+    ),
+    'BulkUpdateAdStatusByListingIdRequest': (
+        ('requests', 'requests', ('list', 'UpdateAdStatusByListingIdRequest')),
+    ),
+    'BulkUpdateAdStatusRequest': (
+        ('requests', 'requests', ('list', 'UpdateAdStatusRequest')),
+    ),
+    'BulkUpdateAdsByInventoryReferenceResponse': (
+        ('responses', 'responses', ('list', 'UpdateAdsByInventoryReferenceResponse')),
+    ),
+    'BulkUpdateKeywordRequest': (
+        ('requests', 'requests', ('list', 'UpdateKeywordByKeywordIdRequest')),
+    ),
+    'BulkUpdateKeywordResponse': (
+        ('responses', 'responses', ('list', 'UpdateKeywordResponse')),
+    ),
+    'BulkUpdateNegativeKeywordRequest': (
+        ('requests', 'requests', ('list', 'UpdateNegativeKeywordIdRequest')),
+    ),
+    'BulkUpdateNegativeKeywordResponse': (
+        ('responses', 'responses', ('list', 'UpdateNegativeKeywordResponse')),
+    ),
+    'Campaign': (
+        ('alerts', 'alerts', ('list', 'Alert')),
+        ('budget', 'budget', 'CampaignBudget'),
+        ('campaignCriterion', 'campaign_criterion', 'CampaignCriterion'),
+        ('campaignId', 'campaign_id', None),
+        ('campaignName', 'campaign_name', None),
+        ('campaignStatus', 'campaign_status', None),
+        ('campaignTargetingType', 'campaign_targeting_type', None),
+        ('channels', 'channels', None),
+        ('endDate', 'end_date', None),
+        ('fundingStrategy', 'funding_strategy', 'FundingStrategy'),
+        ('marketplaceId', 'marketplace_id', None),
+        ('startDate', 'start_date', None),
+    ),
+    'CampaignAudience': (
+        ('audienceType', 'audience_type', None),
+        ('code', 'code', None),
+        ('name', 'name', None),
+    ),
+    'CampaignBudget': (
+        ('daily', 'daily', 'Budget'),
+    ),
+    'CampaignBudgetRequest': (
+        ('daily', 'daily', 'BudgetRequest'),
+    ),
+    'CampaignCriterion': (
+        ('autoSelectFutureInventory', 'auto_select_future_inventory', None),
+        ('criterionType', 'criterion_type', None),
+        ('selectionRules', 'selection_rules', ('list', 'SelectionRule')),
+    ),
+    'CampaignDTO': (
+        ('audiences', 'audiences', ('list', 'CampaignAudience')),
+        ('creationDate', 'creation_date', None),
+        ('emailCampaignId', 'email_campaign_id', None),
+        ('emailCampaignStatus', 'email_campaign_status', None),
+        ('emailCampaignType', 'email_campaign_type', None),
+        ('marketplaceId', 'marketplace_id', None),
+        ('modificationDate', 'modification_date', None),
+        ('scheduleDate', 'schedule_date', None),
+        ('scheduleDateType', 'schedule_date_type', None),
+        ('sentDate', 'sent_date', None),
+        ('subject', 'subject', None),
+    ),
+    'CampaignPagedCollectionResponse': (
+        ('campaigns', 'campaigns', ('list', 'Campaign')),
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+    ),
+    'Campaigns': (
+        ('campaigns', 'campaigns', ('list', 'Campaign')),
+    ),
+    'CloneCampaignRequest': (
+        ('campaignName', 'campaign_name', None),
+        ('endDate', 'end_date', None),
+        ('fundingStrategy', 'funding_strategy', 'FundingStrategy'),
+        ('startDate', 'start_date', None),
+    ),
+    'CouponConfiguration': (
+        ('couponCode', 'coupon_code', None),
+        ('couponType', 'coupon_type', None),
+        ('maxCouponRedemptionPerUser', 'max_coupon_redemption_per_user', None),
+    ),
+    'CreateAdGroupRequest': (
+        ('defaultBid', 'default_bid', 'Amount'),
+        ('name', 'name', None),
+    ),
+    'CreateAdRequest': (
+        ('adGroupId', 'ad_group_id', None),
+        ('bidPercentage', 'bid_percentage', None),
+        ('listingId', 'listing_id', None),
+    ),
+    'CreateAdsByInventoryReferenceRequest': (
+        ('adGroupId', 'ad_group_id', None),
+        ('bidPercentage', 'bid_percentage', None),
+        ('inventoryReferenceId', 'inventory_reference_id', None),
+        ('inventoryReferenceType', 'inventory_reference_type', None),
+    ),
+    'CreateAdsByInventoryReferenceResponse': (
+        ('adGroupId', 'ad_group_id', None),
+        ('ads', 'ads', ('list', 'AdReference')),
+        ('errors', 'errors', ('list', 'Error')),
+        ('inventoryReferenceId', 'inventory_reference_id', None),
+        ('inventoryReferenceType', 'inventory_reference_type', None),
+        ('statusCode', 'status_code', None),
+    ),
+    'CreateCampaignRequest': (
+        ('budget', 'budget', 'CampaignBudgetRequest'),
+        ('campaignCriterion', 'campaign_criterion', 'CampaignCriterion'),
+        ('campaignName', 'campaign_name', None),
+        ('campaignTargetingType', 'campaign_targeting_type', None),
+        ('channels', 'channels', None),
+        ('endDate', 'end_date', None),
+        ('fundingStrategy', 'funding_strategy', 'FundingStrategy'),
+        ('marketplaceId', 'marketplace_id', None),
+        ('startDate', 'start_date', None),
+    ),
+    'CreateEmailCampaignRequest': (
+        ('audienceCodes', 'audience_codes', None),
+        ('categoryId', 'category_id', None),
+        ('categoryType', 'category_type', None),
+        ('emailCampaignType', 'email_campaign_type', None),
+        ('itemIds', 'item_ids', None),
+        ('itemSelectMode', 'item_select_mode', None),
+        ('personalizedMessage', 'personalized_message', None),
+        ('priceRange', 'price_range', 'PriceRange'),
+        ('promotionId', 'promotion_id', None),
+        ('promotionSelectModeEnum', 'promotion_select_mode_enum', None),
+        ('scheduleDate', 'schedule_date', None),
+        ('sort', 'sort', None),
+        ('subject', 'subject', None),
+    ),
+    'CreateEmailCampaignResponse': (
+        ('emailCampaignId', 'email_campaign_id', None),
+        ('emailCampaignStatus', 'email_campaign_status', None),
+    ),
+    'CreateKeywordRequest': (
+        ('adGroupId', 'ad_group_id', None),
+        ('bid', 'bid', 'Amount'),
+        ('keywordText', 'keyword_text', None),
+        ('matchType', 'match_type', None),
+    ),
+    'CreateNegativeKeywordRequest': (
+        ('adGroupId', 'ad_group_id', None),
+        ('campaignId', 'campaign_id', None),
+        ('negativeKeywordMatchType', 'negative_keyword_match_type', None),
+        ('negativeKeywordText', 'negative_keyword_text', None),
+    ),
+    'CreateReportTask': (
+        ('additionalRecords', 'additional_records', None),
+        ('campaignIds', 'campaign_ids', None),
+        ('channels', 'channels', None),
+        ('dateFrom', 'date_from', None),
+        ('dateTo', 'date_to', None),
+        ('dimensions', 'dimensions', ('list', 'Dimension')),
+        ('fundingModels', 'funding_models', None),
+        ('inventoryReferences', 'inventory_references', ('list', 'InventoryReference')),
+        ('listingIds', 'listing_ids', None),
+        ('marketplaceId', 'marketplace_id', None),
+        ('metricKeys', 'metric_keys', None),
+        ('reportFormat', 'report_format', None),
+        ('reportType', 'report_type', None),
+    ),
+    'DeleteAdRequest': (
+        ('listingId', 'listing_id', None),
+    ),
+    'DeleteAdResponse': (
+        ('adId', 'ad_id', None),
+        ('errors', 'errors', ('list', 'Error')),
+        ('listingId', 'listing_id', None),
+        ('statusCode', 'status_code', None),
+    ),
+    'DeleteAdsByInventoryReferenceRequest': (
+        ('inventoryReferenceId', 'inventory_reference_id', None),
+        ('inventoryReferenceType', 'inventory_reference_type', None),
+    ),
+    'DeleteAdsByInventoryReferenceResponse': (
+        ('adIds', 'ad_ids', None),
+        ('errors', 'errors', ('list', 'Error')),
+        ('inventoryReferenceId', 'inventory_reference_id', None),
+        ('inventoryReferenceType', 'inventory_reference_type', None),
+        ('statusCode', 'status_code', None),
+    ),
+    'DeleteEmailCampaignResponse': (
+        ('emailCampaignId', 'email_campaign_id', None),
+    ),
+    'Dimension': (
+        ('annotationKeys', 'annotation_keys', None),
+        ('dimensionKey', 'dimension_key', None),
+    ),
+    'DimensionKeyAnnotation': (
+        ('annotationKey', 'annotation_key', None),
+        ('dataType', 'data_type', None),
+    ),
+    'DimensionMetadata': (
+        ('dataType', 'data_type', None),
+        ('dimensionKey', 'dimension_key', None),
+        ('dimensionKeyAnnotations', 'dimension_key_annotations', ('list', 'DimensionKeyAnnotation')),
+    ),
+    'DiscountBenefit': (
+        ('amountOffItem', 'amount_off_item', 'Amount'),
+        ('amountOffOrder', 'amount_off_order', 'Amount'),
+        ('percentageOffItem', 'percentage_off_item', None),
+        ('percentageOffOrder', 'percentage_off_order', None),
+    ),
+    'DiscountRule': (
+        ('discountBenefit', 'discount_benefit', 'DiscountBenefit'),
+        ('discountSpecification', 'discount_specification', 'DiscountSpecification'),
+        ('maxDiscountAmount', 'max_discount_amount', 'Amount'),
+        ('ruleOrder', 'rule_order', None),
+    ),
+    'DiscountSpecification': (
+        ('forEachAmount', 'for_each_amount', 'Amount'),
+        ('forEachQuantity', 'for_each_quantity', None),
+        ('minAmount', 'min_amount', 'Amount'),
+        ('minQuantity', 'min_quantity', None),
+        ('numberOfDiscountedItems', 'number_of_discounted_items', None),
+    ),
+    'DynamicAdRatePreference': (
+        ('adRateAdjustmentPercent', 'ad_rate_adjustment_percent', None),
+        ('adRateCapPercent', 'ad_rate_cap_percent', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'FundingStrategy': (
+        ('adRateStrategy', 'ad_rate_strategy', None),
+        ('biddingStrategy', 'bidding_strategy', None),
+        ('bidPercentage', 'bid_percentage', None),
+        ('bidPreferences', 'bid_preferences', ('list', 'BidPreference')),
+        ('dynamicAdRatePreferences', 'dynamic_ad_rate_preferences', ('list', 'DynamicAdRatePreference')),
+        ('fundingModel', 'funding_model', None),
+    ),
+    'GetEmailCampaignAudiencesResponse': (
+        ('audiences', 'audiences', ('list', 'CampaignAudience')),
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+    ),
+    'GetEmailCampaignResponse': (
+        ('audiences', 'audiences', ('list', 'CampaignAudience')),
+        ('categoryId', 'category_id', None),
+        ('categoryType', 'category_type', None),
+        ('creationDate', 'creation_date', None),
+        ('emailCampaignId', 'email_campaign_id', None),
+        ('emailCampaignStatus', 'email_campaign_status', None),
+        ('emailCampaignType', 'email_campaign_type', None),
+        ('itemIds', 'item_ids', None),
+        ('itemSelectMode', 'item_select_mode', None),
+        ('marketplaceId', 'marketplace_id', None),
+        ('modificationDate', 'modification_date', None),
+        ('personalizedMessage', 'personalized_message', None),
+        ('priceRange', 'price_range', 'PriceRange'),
+        ('promotionId', 'promotion_id', None),
+        ('promotionSelectMode', 'promotion_select_mode', None),
+        ('scheduleDate', 'schedule_date', None),
+        ('scheduleDateType', 'schedule_date_type', None),
+        ('sentDate', 'sent_date', None),
+        ('sort', 'sort', None),
+        ('subject', 'subject', None),
+    ),
+    'GetEmailCampaignsResponse': (
+        ('campaigns', 'campaigns', ('list', 'CampaignDTO')),
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+    ),
+    'GetEmailPreviewResponse': (
+        ('content', 'content', None),
+        ('renderDate', 'render_date', None),
+    ),
+    'GetEmailReportResponse': (
+        ('clickCount', 'click_count', None),
+        ('openCount', 'open_count', None),
+        ('totalSales', 'total_sales', 'Amount'),
+    ),
+    'InventoryCriterion': (
+        ('inventoryCriterionType', 'inventory_criterion_type', None),
+        ('inventoryItems', 'inventory_items', ('list', 'InventoryItem')),
+        ('listingIds', 'listing_ids', None),
+        ('ruleCriteria', 'rule_criteria', 'RuleCriteria'),
+    ),
+    'InventoryItem': (
+        ('inventoryReferenceId', 'inventory_reference_id', None),
+    ),
+    'InventoryReference': (
+        ('inventoryReferenceId', 'inventory_reference_id', None),
+        ('inventoryReferenceType', 'inventory_reference_type', None),
+    ),
+    'ItemBasis': (
+        ('estimatedValue', 'estimated_value', None),
+        ('metric', 'metric', None),
+    ),
+    'ItemMarkdownStatus': (
+        ('listingMarkdownStatus', 'listing_markdown_status', None),
+        ('statusChangedDate', 'status_changed_date', None),
+        ('statusMessage', 'status_message', None),
+    ),
+    'ItemPriceMarkdown': (
+        ('applyFreeShipping', 'apply_free_shipping', None),
+        ('autoSelectFutureInventory', 'auto_select_future_inventory', None),
+        ('blockPriceIncreaseInItemRevision', 'block_price_increase_in_item_revision', None),
+        ('description', 'description', None),
+        ('endDate', 'end_date', None),
+        ('marketplaceId', 'marketplace_id', None),
+        ('name', 'name', None),
+        ('priority', 'priority', None),
+        ('promotionImageUrl', 'promotion_image_url', None),
+        ('promotionStatus', 'promotion_status', None),
+        ('selectedInventoryDiscounts', 'selected_inventory_discounts', ('list', 'SelectedInventoryDiscount')),
+        ('startDate', 'start_date', None),
+    ),
+    'ItemPromotion': (
+        ('applyDiscountToSingleItemOnly', 'apply_discount_to_single_item_only', None),
+        ('budget', 'budget', 'Amount'),
+        ('couponConfiguration', 'coupon_configuration', 'CouponConfiguration'),
+        ('description', 'description', None),
+        ('discountRules', 'discount_rules', ('list', 'DiscountRule')),
+        ('endDate', 'end_date', None),
+        ('inventoryCriterion', 'inventory_criterion', 'InventoryCriterion'),
+        ('marketplaceId', 'marketplace_id', None),
+        ('name', 'name', None),
+        ('priority', 'priority', None),
+        ('promotionImageUrl', 'promotion_image_url', None),
+        ('promotionStatus', 'promotion_status', None),
+        ('promotionType', 'promotion_type', None),
+        ('startDate', 'start_date', None),
+    ),
+    'ItemPromotionResponse': (
+        ('applyDiscountToSingleItemOnly', 'apply_discount_to_single_item_only', None),
+        ('budget', 'budget', 'Amount'),
+        ('couponConfiguration', 'coupon_configuration', 'CouponConfiguration'),
+        ('description', 'description', None),
+        ('discountRules', 'discount_rules', ('list', 'DiscountRule')),
+        ('endDate', 'end_date', None),
+        ('inventoryCriterion', 'inventory_criterion', 'InventoryCriterion'),
+        ('marketplaceId', 'marketplace_id', None),
+        ('name', 'name', None),
+        ('priority', 'priority', None),
+        ('promotionId', 'promotion_id', None),
+        ('promotionImageUrl', 'promotion_image_url', None),
+        ('promotionStatus', 'promotion_status', None),
+        ('promotionType', 'promotion_type', None),
+        ('startDate', 'start_date', None),
+    ),
+    'ItemsPagedCollection': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('listings', 'listings', ('list', 'ListingDetail')),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'Keyword': (
+        ('adGroupId', 'ad_group_id', None),
+        ('bid', 'bid', 'Amount'),
+        ('keywordId', 'keyword_id', None),
+        ('keywordStatus', 'keyword_status', None),
+        ('keywordText', 'keyword_text', None),
+        ('matchType', 'match_type', None),
+    ),
+    'KeywordPagedCollectionResponse': (
+        ('href', 'href', None),
+        ('keywords', 'keywords', ('list', 'Keyword')),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+    ),
+    'KeywordRequest': (
+        ('keywordText', 'keyword_text', None),
+        ('matchType', 'match_type', None),
+    ),
+    'KeywordResponse': (
+        ('adGroupId', 'ad_group_id', None),
+        ('errors', 'errors', ('list', 'Error')),
+        ('href', 'href', None),
+        ('keywordId', 'keyword_id', None),
+        ('keywordText', 'keyword_text', None),
+        ('matchType', 'match_type', None),
+        ('statusCode', 'status_code', None),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'ListingDetail': (
+        ('currentPrice', 'current_price', 'Amount'),
+        ('freeShipping', 'free_shipping', None),
+        ('inventoryReferenceId', 'inventory_reference_id', None),
+        ('inventoryReferenceType', 'inventory_reference_type', None),
+        ('listingCategoryId', 'listing_category_id', None),
+        ('listingCondition', 'listing_condition', None),
+        ('listingConditionId', 'listing_condition_id', None),
+        ('listingId', 'listing_id', None),
+        ('listingPromotionStatuses', 'listing_promotion_statuses', ('list', 'ItemMarkdownStatus')),
+        ('quantity', 'quantity', None),
+        ('storeCategoryId', 'store_category_id', None),
+        ('title', 'title', None),
+    ),
+    'MaxCpc': (
+        ('amount', 'amount', 'Amount'),
+    ),
+    'MetricMetadata': (
+        ('dataType', 'data_type', None),
+        ('metricKey', 'metric_key', None),
+    ),
+    'NegativeKeyword': (
+        ('adGroupId', 'ad_group_id', None),
+        ('campaignId', 'campaign_id', None),
+        ('negativeKeywordId', 'negative_keyword_id', None),
+        ('negativeKeywordMatchType', 'negative_keyword_match_type', None),
+        ('negativeKeywordStatus', 'negative_keyword_status', None),
+        ('negativeKeywordText', 'negative_keyword_text', None),
+    ),
+    'NegativeKeywordPagedCollectionResponse': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('negativeKeywords', 'negative_keywords', ('list', 'NegativeKeyword')),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+    ),
+    'NegativeKeywordResponse': (
+        ('adGroupId', 'ad_group_id', None),
+        ('campaignId', 'campaign_id', None),
+        ('errors', 'errors', ('list', 'Error')),
+        ('href', 'href', None),
+        ('negativeKeywordId', 'negative_keyword_id', None),
+        ('negativeKeywordMatchType', 'negative_keyword_match_type', None),
+        ('negativeKeywordText', 'negative_keyword_text', None),
+        ('statusCode', 'status_code', None),
+    ),
+    'PriceRange': (
+        ('currency', 'currency', None),
+        ('gte', 'gte', None),
+        ('lte', 'lte', None),
+    ),
+    'PromotionDetail': (
+        ('couponCode', 'coupon_code', None),
+        ('description', 'description', None),
+        ('endDate', 'end_date', None),
+        ('marketplaceId', 'marketplace_id', None),
+        ('name', 'name', None),
+        ('priority', 'priority', None),
+        ('promotionHref', 'promotion_href', None),
+        ('promotionId', 'promotion_id', None),
+        ('promotionImageUrl', 'promotion_image_url', None),
+        ('promotionStatus', 'promotion_status', None),
+        ('promotionType', 'promotion_type', None),
+        ('startDate', 'start_date', None),
+    ),
+    'PromotionReportDetail': (
+        ('averageItemDiscount', 'average_item_discount', 'Amount'),
+        ('averageItemRevenue', 'average_item_revenue', 'Amount'),
+        ('averageOrderDiscount', 'average_order_discount', 'Amount'),
+        ('averageOrderRevenue', 'average_order_revenue', 'Amount'),
+        ('averageOrderSize', 'average_order_size', None),
+        ('baseSale', 'base_sale', 'Amount'),
+        ('itemsSoldQuantity', 'items_sold_quantity', None),
+        ('numberOfOrdersSold', 'number_of_orders_sold', None),
+        ('percentageSalesLift', 'percentage_sales_lift', None),
+        ('promotionHref', 'promotion_href', None),
+        ('promotionId', 'promotion_id', None),
+        ('promotionReportId', 'promotion_report_id', None),
+        ('promotionSale', 'promotion_sale', 'Amount'),
+        ('promotionType', 'promotion_type', None),
+        ('totalDiscount', 'total_discount', 'Amount'),
+        ('totalSale', 'total_sale', 'Amount'),
+    ),
+    'PromotionsPagedCollection': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('promotions', 'promotions', ('list', 'PromotionDetail')),
+        ('total', 'total', None),
+    ),
+    'PromotionsReportPagedCollection': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('promotionReports', 'promotion_reports', ('list', 'PromotionReportDetail')),
+        ('total', 'total', None),
+    ),
+    'ProposedBid': (
+        ('currency', 'currency', None),
+        ('rangeEnd', 'range_end', None),
+        ('rangeStart', 'range_start', None),
+        ('value', 'value', None),
+    ),
+    'QuickSetupRequest': (
+        ('budget', 'budget', 'CampaignBudgetRequest'),
+        ('campaignName', 'campaign_name', None),
+        ('endDate', 'end_date', None),
+        ('listingIds', 'listing_ids', None),
+        ('marketplaceId', 'marketplace_id', None),
+        ('startDate', 'start_date', None),
+    ),
+    'ReportMetadata': (
+        ('dimensionMetadata', 'dimension_metadata', ('list', 'DimensionMetadata')),
+        ('maxNumberOfDimensionsToRequest', 'max_number_of_dimensions_to_request', None),
+        ('maxNumberOfMetricsToRequest', 'max_number_of_metrics_to_request', None),
+        ('channel', 'channel', None),
+        ('metricMetadata', 'metric_metadata', ('list', 'MetricMetadata')),
+        ('reportType', 'report_type', None),
+    ),
+    'ReportMetadatas': (
+        ('reportMetadata', 'report_metadata', ('list', 'ReportMetadata')),
+    ),
+    'ReportTask': (
+        ('campaignIds', 'campaign_ids', None),
+        ('channels', 'channels', None),
+        ('dateFrom', 'date_from', None),
+        ('dateTo', 'date_to', None),
+        ('dimensions', 'dimensions', ('list', 'Dimension')),
+        ('fundingModels', 'funding_models', None),
+        ('inventoryReferences', 'inventory_references', ('list', 'InventoryReference')),
+        ('listingIds', 'listing_ids', None),
+        ('marketplaceId', 'marketplace_id', None),
+        ('metricKeys', 'metric_keys', None),
+        ('reportExpirationDate', 'report_expiration_date', None),
+        ('reportFormat', 'report_format', None),
+        ('reportHref', 'report_href', None),
+        ('reportId', 'report_id', None),
+        ('reportName', 'report_name', None),
+        ('reportTaskCompletionDate', 'report_task_completion_date', None),
+        ('reportTaskCreationDate', 'report_task_creation_date', None),
+        ('reportTaskExpectedCompletionDate', 'report_task_expected_completion_date', None),
+        ('reportTaskId', 'report_task_id', None),
+        ('reportTaskStatus', 'report_task_status', None),
+        ('reportTaskStatusMessage', 'report_task_status_message', None),
+        ('reportType', 'report_type', None),
+    ),
+    'ReportTaskPagedCollection': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+        ('reportTasks', 'report_tasks', ('list', 'ReportTask')),
+    ),
+    'RuleCriteria': (
+        ('excludeInventoryItems', 'exclude_inventory_items', ('list', 'InventoryItem')),
+        ('excludeListingIds', 'exclude_listing_ids', None),
+        ('markupInventoryItems', 'markup_inventory_items', ('list', 'InventoryItem')),
+        ('markupListingIds', 'markup_listing_ids', None),
+        ('selectionRules', 'selection_rules', ('list', 'SelectionRule')),
+    ),
+    'SelectedInventoryDiscount': (
+        ('discountBenefit', 'discount_benefit', 'DiscountBenefit'),
+        ('discountId', 'discount_id', None),
+        ('inventoryCriterion', 'inventory_criterion', 'InventoryCriterion'),
+        ('ruleOrder', 'rule_order', None),
+    ),
+    'SelectionRule': (
+        ('brands', 'brands', None),
+        ('categoryIds', 'category_ids', None),
+        ('categoryScope', 'category_scope', None),
+        ('listingConditionIds', 'listing_condition_ids', None),
+        ('maxPrice', 'max_price', 'Amount'),
+        ('minPrice', 'min_price', 'Amount'),
+    ),
+    'SuggestBudgetResponse': (
+        ('suggestedBudget', 'suggested_budget', ('list', 'BudgetRecommendationResponse')),
+    ),
+    'SuggestMaxCpcRequest': (
+        ('listingIds', 'listing_ids', None),
+        ('marketplaceId', 'marketplace_id', None),
+    ),
+    'SuggestMaxCpcResponse': (
+        ('amount', 'amount', 'Amount'),
+        ('marketplaceId', 'marketplace_id', None),
+    ),
+    'SuggestedBids': (
+        ('keywordText', 'keyword_text', None),
+        ('matchType', 'match_type', None),
+        ('proposedBid', 'proposed_bid', 'ProposedBid'),
+    ),
+    'SuggestedKeywords': (
+        ('additionalInfo', 'additional_info', ('list', 'AdditionalInfo')),
+        ('keywordText', 'keyword_text', None),
+        ('matchType', 'match_type', None),
+    ),
+    'SummaryReportResponse': (
+        ('baseSale', 'base_sale', 'Amount'),
+        ('lastUpdated', 'last_updated', None),
+        ('percentageSalesLift', 'percentage_sales_lift', None),
+        ('promotionSale', 'promotion_sale', 'Amount'),
+        ('totalSale', 'total_sale', 'Amount'),
+    ),
+    'TargetedAdsPagedCollection': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('suggestedItems', 'suggested_items', ('list', 'TargetingItems')),
+        ('total', 'total', None),
+    ),
+    'TargetedBidRequest': (
+        ('keywords', 'keywords', ('list', 'KeywordRequest')),
+    ),
+    'TargetedBidsPagedCollection': (
+        ('suggestedBids', 'suggested_bids', ('list', 'SuggestedBids')),
+    ),
+    'TargetedKeywordRequest': (
+        ('additionalInfo', 'additional_info', None),
+        ('exclusions', 'exclusions', None),
+        ('listingIds', 'listing_ids', None),
+        ('matchType', 'match_type', None),
+    ),
+    'TargetedKeywordsPagedCollection': (
+        ('suggestedKeywords', 'suggested_keywords', ('list', 'SuggestedKeywords')),
+    ),
+    'TargetingItems': (
+        ('bases', 'bases', ('list', 'ItemBasis')),
+        ('listingId', 'listing_id', None),
+    ),
+    'UpdateAdGroupRequest': (
+        ('adGroupStatus', 'ad_group_status', None),
+        ('defaultBid', 'default_bid', 'Amount'),
+        ('name', 'name', None),
+    ),
+    'UpdateAdStatusByListingIdRequest': (
+        ('adGroupId', 'ad_group_id', None),
+        ('adStatus', 'ad_status', None),
+        ('listingId', 'listing_id', None),
+    ),
+    'UpdateAdStatusRequest': (
+        ('adId', 'ad_id', None),
+        ('adStatus', 'ad_status', None),
+    ),
+    'UpdateAdrateStrategyRequest': (
+        ('adRateStrategy', 'ad_rate_strategy', None),
+        ('bidPercentage', 'bid_percentage', None),
+        ('dynamicAdRatePreferences', 'dynamic_ad_rate_preferences', ('list', 'DynamicAdRatePreference')),
+    ),
+    'UpdateAdsByInventoryReferenceResponse': (
+        ('ads', 'ads', ('list', 'AdReference')),
+        ('errors', 'errors', ('list', 'Error')),
+        ('inventoryReferenceId', 'inventory_reference_id', None),
+        ('inventoryReferenceType', 'inventory_reference_type', None),
+        ('statusCode', 'status_code', None),
+    ),
+    'UpdateBidPercentageRequest': (
+        ('bidPercentage', 'bid_percentage', None),
+    ),
+    'UpdateBiddingStrategyRequest': (
+        ('biddingStrategy', 'bidding_strategy', None),
+        ('bidPreferences', 'bid_preferences', ('list', 'BidPreference')),
+    ),
+    'UpdateCampaignBudgetRequest': (
+        ('daily', 'daily', 'BudgetRequest'),
+    ),
+    'UpdateCampaignIdentificationRequest': (
+        ('campaignName', 'campaign_name', None),
+        ('endDate', 'end_date', None),
+        ('startDate', 'start_date', None),
+    ),
+    'UpdateCampaignRequest': (
+        ('audienceCodes', 'audience_codes', None),
+        ('categoryId', 'category_id', None),
+        ('categoryType', 'category_type', None),
+        ('itemIds', 'item_ids', None),
+        ('itemSelectMode', 'item_select_mode', None),
+        ('personalizedMessage', 'personalized_message', None),
+        ('priceRange', 'price_range', 'PriceRange'),
+        ('promotionId', 'promotion_id', None),
+        ('promotionSelectModeEnum', 'promotion_select_mode_enum', None),
+        ('scheduleDate', 'schedule_date', None),
+        ('sort', 'sort', None),
+        ('subject', 'subject', None),
+    ),
+    'UpdateEmailCampaignResponse': (
+        ('emailCampaignId', 'email_campaign_id', None),
+        ('emailCampaignStatus', 'email_campaign_status', None),
+    ),
+    'UpdateKeywordByKeywordIdRequest': (
+        ('bid', 'bid', 'Amount'),
+        ('keywordId', 'keyword_id', None),
+        ('keywordStatus', 'keyword_status', None),
+    ),
+    'UpdateKeywordRequest': (
+        ('bid', 'bid', 'Amount'),
+        ('keywordStatus', 'keyword_status', None),
+    ),
+    'UpdateKeywordResponse': (
+        ('errors', 'errors', ('list', 'Error')),
+        ('keywordId', 'keyword_id', None),
+        ('statusCode', 'status_code', None),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'UpdateNegativeKeywordIdRequest': (
+        ('negativeKeywordId', 'negative_keyword_id', None),
+        ('negativeKeywordStatus', 'negative_keyword_status', None),
+    ),
+    'UpdateNegativeKeywordRequest': (
+        ('negativeKeywordStatus', 'negative_keyword_status', None),
+    ),
+    'UpdateNegativeKeywordResponse': (
+        ('errors', 'errors', ('list', 'Error')),
+        ('negativeKeywordId', 'negative_keyword_id', None),
+        ('statusCode', 'status_code', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'Ad': 'Ad',
+    'AdGroup': 'AdGroup',
+    'AdGroupPagedCollectionResponse': 'AdGroupPagedCollectionResponse',
+    'AdIds': 'AdIds',
+    'AdPagedCollectionResponse': 'AdPagedCollectionResponse',
+    'AdReferences': 'AdReferences',
+    'Ads': 'Ads',
+    'BaseResponse': 'BaseResponse',
+    'BulkAdResponse': 'BulkAdResponse',
+    'BulkAdUpdateResponse': 'BulkAdUpdateResponse',
+    'BulkAdUpdateStatusByListingIdResponse': 'BulkAdUpdateStatusByListingIdResponse',
+    'BulkAdUpdateStatusResponse': 'BulkAdUpdateStatusResponse',
+    'BulkCreateAdsByInventoryReferenceResponse': 'BulkCreateAdsByInventoryReferenceResponse',
+    'BulkCreateKeywordResponse': 'BulkCreateKeywordResponse',
+    'BulkCreateNegativeKeywordResponse': 'BulkCreateNegativeKeywordResponse',
+    'BulkDeleteAdResponse': 'BulkDeleteAdResponse',
+    'BulkDeleteAdsByInventoryReferenceResponse': 'BulkDeleteAdsByInventoryReferenceResponse',
+    'BulkUpdateAdsByInventoryReferenceResponse': 'BulkUpdateAdsByInventoryReferenceResponse',
+    'BulkUpdateKeywordResponse': 'BulkUpdateKeywordResponse',
+    'BulkUpdateNegativeKeywordResponse': 'BulkUpdateNegativeKeywordResponse',
+    'Campaign': 'Campaign',
+    'CampaignPagedCollectionResponse': 'CampaignPagedCollectionResponse',
+    'Campaigns': 'Campaigns',
+    'CreateEmailCampaignResponse': 'CreateEmailCampaignResponse',
+    'DeleteEmailCampaignResponse': 'DeleteEmailCampaignResponse',
+    'GetEmailCampaignAudiencesResponse': 'GetEmailCampaignAudiencesResponse',
+    'GetEmailCampaignResponse': 'GetEmailCampaignResponse',
+    'GetEmailCampaignsResponse': 'GetEmailCampaignsResponse',
+    'GetEmailPreviewResponse': 'GetEmailPreviewResponse',
+    'GetEmailReportResponse': 'GetEmailReportResponse',
+    'ItemPriceMarkdown': 'ItemPriceMarkdown',
+    'ItemPromotionResponse': 'ItemPromotionResponse',
+    'ItemsPagedCollection': 'ItemsPagedCollection',
+    'Keyword': 'Keyword',
+    'KeywordPagedCollectionResponse': 'KeywordPagedCollectionResponse',
+    'NegativeKeyword': 'NegativeKeyword',
+    'NegativeKeywordPagedCollectionResponse': 'NegativeKeywordPagedCollectionResponse',
+    'PromotionsPagedCollection': 'PromotionsPagedCollection',
+    'PromotionsReportPagedCollection': 'PromotionsReportPagedCollection',
+    'ReportMetadata': 'ReportMetadata',
+    'ReportMetadatas': 'ReportMetadatas',
+    'ReportTask': 'ReportTask',
+    'ReportTaskPagedCollection': 'ReportTaskPagedCollection',
+    'SuggestBudgetResponse': 'SuggestBudgetResponse',
+    'SuggestMaxCpcResponse': 'SuggestMaxCpcResponse',
+    'SummaryReportResponse': 'SummaryReportResponse',
+    'TargetedAdsPagedCollection': 'TargetedAdsPagedCollection',
+    'TargetedBidsPagedCollection': 'TargetedBidsPagedCollection',
+    'TargetedKeywordsPagedCollection': 'TargetedKeywordsPagedCollection',
+    'UpdateEmailCampaignResponse': 'UpdateEmailCampaignResponse',
+    'UpdateKeywordResponse': 'UpdateKeywordResponse',
+    'object': None,
+}
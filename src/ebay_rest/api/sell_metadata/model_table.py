@@ -0,0 +1,547 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'Amount': (
+        ('currency', 'currency', None),
+        ('value', 'value', None),
+    ),
+    'AutomotivePartsCompatibilityPolicy': (
+        ('categoryId', 'category_id', None),
+        ('categoryTreeId', 'category_tree_id', None),
+        ('compatibilityBasedOn', 'compatibility_based_on', None),
+        ('compatibleVehicleTypes', 'compatible_vehicle_types', None),
+        ('maxNumberOfCompatibleVehicles', 'max_number_of_compatible_vehicles', None),
+    ),
+    'AutomotivePartsCompatibilityPolicyResponse': (
+        ('automotivePartsCompatibilityPolicies', 'automotive_parts_compatibility_policies', ('list', 'AutomotivePartsCompatibilityPolicy')),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'CategoryPolicy': (
+        ('autoPayEnabled', 'auto_pay_enabled', None),
+        ('b2bVatEnabled', 'b2b_vat_enabled', None),
+        ('categoryId', 'category_id', None),
+        ('categoryTreeId', 'category_tree_id', None),
+        ('eanSupport', 'ean_support', None),
+        ('expired', 'expired', None),
+        ('intangibleEnabled', 'intangible_enabled', None),
+        ('isbnSupport', 'isbn_support', None),
+        ('lsd', 'lsd', None),
+        ('minimumReservePrice', 'minimum_reserve_price', None),
+        ('orpa', 'orpa', None),
+        ('orra', 'orra', None),
+        ('paymentMethods', 'payment_methods', None),
+        ('reduceReserveAllowed', 'reduce_reserve_allowed', None),
+        ('upcSupport', 'upc_support', None),
+        ('valueCategory', 'value_category', None),
+        ('virtual', 'virtual', None),
+    ),
+    'CategoryPolicyResponse': (
+        ('categoryPolicies', 'category_policies', ('list', 'CategoryPolicy')),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'ClassifiedAdPolicy': (
+        ('adFormatEnabled', 'ad_format_enabled', None),
+        ('categoryId', 'category_id', None),
+        ('categoryTreeId', 'category_tree_id', None),
+        ('classifiedAdAutoAcceptEnabled', 'classified_ad_auto_accept_enabled', None),
+        ('classifiedAdAutoDeclineEnabled', 'classified_ad_auto_decline_enabled', None),
+        ('classifiedAdBestOfferEnabled', 'classified_ad_best_offer_enabled', None),
+        ('classifiedAdCompanyNameEnabled', 'classified_ad_company_name_enabled', None),
+        ('classifiedAdContactByAddressEnabled', 'classified_ad_contact_by_address_enabled', None),
+        ('classifiedAdContactByEmailEnabled', 'classified_ad_contact_by_email_enabled', None),
+        ('classifiedAdContactByPhoneEnabled', 'classified_ad_contact_by_phone_enabled', None),
+        ('classifiedAdCounterOfferEnabled', 'classified_ad_counter_offer_enabled', None),
+        ('classifiedAdPaymentMethodEnabled', 'classified_ad_payment_method_enabled', None),
+        ('classifiedAdPhoneCount', 'classified_ad_phone_count', None),
+        ('classifiedAdShippingMethodEnabled', 'classified_ad_shipping_method_enabled', None),
+        ('classifiedAdStreetCount', 'classified_ad_street_count', None),
+        ('sellerContactDetailsEnabled', 'seller_contact_details_enabled', None),
+    ),
+    'ClassifiedAdPolicyResponse': (
+        ('classifiedAdPolicies', 'classified_ad_policies', ('list', 'ClassifiedAdPolicy')),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'Compatibility': (
+        ('compatibilityDetails', 'compatibility_details', ('list', 'CompatibilityDetails')),
+    ),
+    'CompatibilityDetails': (
+        ('propertyName', 'property_name', None),
+        ('propertyValue', 'property_value', None),
+    ),
+    'Currency': (
+        ('code', 'code', None),
+        ('description', 'description', None),
+    ),
+    'DisabledProductFilter': (
+        ('excludeForEbayReviews', 'exclude_for_ebay_reviews', None),
+        ('excludeForEbaySelling', 'exclude_for_ebay_selling', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'ExtendedProducerResponsibility': (
+        ('enabledForVariations', 'enabled_for_variations', None),
+        ('name', 'name', None),
+        ('usage', 'usage', None),
+    ),
+    'ExtendedProducerResponsibilityPolicy': (
+        ('categoryId', 'category_id', None),
+        ('categoryTreeId', 'category_tree_id', None),
+        ('supportedAttributes', 'supported_attributes', ('list', 'ExtendedProducerResponsibility')),
+    ),
+    'ExtendedProducerResponsibilityPolicyResponse': (
+        ('extendedProducerResponsibilities', 'extended_producer_responsibilities', ('list', 'ExtendedProducerResponsibilityPolicy')),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'GetCurrenciesResponse': (
+        ('defaultCurrency', 'default_currency', 'Currency'),
+        ('marketplaceId', 'marketplace_id', None),
+    ),
+    'HazardStatement': (
+        ('statementId', 'statement_id', None),
+        ('statementDescription', 'statement_description', None),
+    ),
+    'HazardousMaterialDetailsResponse': (
+        ('signalWords', 'signal_words', ('list', 'SignalWord')),
+        ('statements', 'statements', ('list', 'HazardStatement')),
+        ('pictograms', 'pictograms', ('list', 'Pictogram')),
+    ),
+    'ItemCondition': (
+        ('conditionDescription', 'condition_description', None),
+        ('conditionDescriptors', 'condition_descriptors', ('list', 'ItemConditionDescriptor')),
+        ('conditionHelpText', 'condition_help_text', None),
+        ('conditionId', 'condition_id', None),
+        ('usage', 'usage', None),
+    ),
+    'ItemConditionDescriptor': (
+        ('conditionDescriptorConstraint', 'condition_descriptor_constraint', 'ItemConditionDescriptorConstraint'),
+        ('conditionDescriptorHelpText', 'condition_descriptor_help_text', None),
+        ('conditionDescriptorId', 'condition_descriptor_id', None),
+        ('conditionDescriptorName', 'condition_descriptor_name', None),
+        ('conditionDescriptorValues', 'condition_descriptor_values', ('list', 'ItemConditionDescriptorValue')),
+    ),
+    'ItemConditionDescriptorConstraint': (
+        ('applicableToConditionDescriptorIds', 'applicable_to_condition_descriptor_ids', None),
+        ('cardinality', 'cardinality', None),
+        ('defaultConditionDescriptorValueId', 'default_condition_descriptor_value_id', None),
+        ('maxLength', 'max_length', None),
+        ('mode', 'mode', None),
+        ('usage', 'usage', None),
+    ),
+    'ItemConditionDescriptorValue': (
+        ('conditionDescriptorValueAdditionalHelpText', 'condition_descriptor_value_additional_help_text', None),
+        ('conditionDescriptorValueConstraints', 'condition_descriptor_value_constraints', ('list', 'ItemConditionDescriptorValueConstraint')),
+        ('conditionDescriptorValueHelpText', 'condition_descriptor_value_help_text', None),
+        ('conditionDescriptorValueId', 'condition_descriptor_value_id', None),
+        ('conditionDescriptorValueName', 'condition_descriptor_value_name', None),
+    ),
+    'ItemConditionDescriptorValueConstraint': (
+        ('applicableToConditionDescriptorId', 'applicable_to_condition_descriptor_id', None),
+        ('applicableToConditionDescriptorValueIds', 'applicable_to_condition_descriptor_value_ids', None),
+    ),
+    'ItemConditionPolicy': (
+        ('categoryId', 'category_id', None),
+        ('categoryTreeId', 'category_tree_id', None),
+        ('itemConditionRequired', 'item_condition_required', None),
+        ('itemConditions', 'item_conditions', ('list', 'ItemCondition')),
+    ),
+    'ItemConditionPolicyResponse': (
+        ('itemConditionPolicies', 'item_condition_policies', ('list', 'ItemConditionPolicy')),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'ListingDuration': (
+        ('durationValues', 'duration_values', None),
+        ('listingType', 'listing_type', None),
+    ),
+    'ListingStructurePolicy': (
+        ('categoryId', 'category_id', None),
+        ('categoryTreeId', 'category_tree_id', None),
+        ('variationsSupported', 'variations_supported', None),
+    ),
+    'ListingStructurePolicyResponse': (
+        ('listingStructurePolicies', 'listing_structure_policies', ('list', 'ListingStructurePolicy')),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'ListingTypePoliciesResponse': (
+        ('listingTypePolicies', 'listing_type_policies', ('list', 'ListingTypePolicy')),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'ListingTypePolicy': (
+        ('categoryId', 'category_id', None),
+        ('categoryTreeId', 'category_tree_id', None),
+        ('digitalGoodDeliveryEnabled', 'digital_good_delivery_enabled', None),
+        ('listingDurations', 'listing_durations', ('list', 'ListingDuration')),
+        ('pickupDropOffEnabled', 'pickup_drop_off_enabled', None),
+    ),
+    'LocalListingDistance': (
+        ('distances', 'distances', None),
+        ('distanceType', 'distance_type', None),
+    ),
+    'MotorsListingPoliciesResponse': (
+        ('motorsListingPolicies', 'motors_listing_policies', ('list', 'MotorsListingPolicy')),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'MotorsListingPolicy': (
+        ('categoryId', 'category_id', None),
+        ('categoryTreeId', 'category_tree_id', None),
+        ('depositSupported', 'deposit_supported', None),
+        ('ebayMotorsProAdFormatEnabled', 'ebay_motors_pro_ad_format_enabled', None),
+        ('ebayMotorsProAutoAcceptEnabled', 'ebay_motors_pro_auto_accept_enabled', None),
+        ('ebayMotorsProAutoDeclineEnabled', 'ebay_motors_pro_auto_decline_enabled', None),
+        ('ebayMotorsProBestOfferEnabled', 'ebay_motors_pro_best_offer_enabled', None),
+        ('ebayMotorsProCompanyNameEnabled', 'ebay_motors_pro_company_name_enabled', None),
+        ('ebayMotorsProContactByAddressEnabled', 'ebay_motors_pro_contact_by_address_enabled', None),
+        ('ebayMotorsProContactByEmailEnabled', 'ebay_motors_pro_contact_by_email_enabled', None),
+        ('ebayMotorsProContactByPhoneEnabled', 'ebay_motors_pro_contact_by_phone_enabled', None),
+        ('ebayMotorsProCounterOfferEnabled', 'ebay_motors_pro_counter_offer_enabled', None),
+        ('ebayMotorsProPaymentMethodCheckOutEnabled', 'ebay_motors_pro_payment_method_check_out_enabled', None),
+        ('ebayMotorsProPhoneCount', 'ebay_motors_pro_phone_count', None),
+        ('ebayMotorsProSellerContactDetailsEnabled', 'ebay_motors_pro_seller_contact_details_enabled', None),
+        ('ebayMotorsProShippingMethodEnabled', 'ebay_motors_pro_shipping_method_enabled', None),
+        ('ebayMotorsProStreetCount', 'ebay_motors_pro_street_count', None),
+        ('epidSupported', 'epid_supported', None),
+        ('kTypeSupported', 'k_type_supported', None),
+        ('localListingDistances', 'local_listing_distances', ('list', 'LocalListingDistance')),
+        ('localMarketAdFormatEnabled', 'local_market_ad_format_enabled', None),
+        ('localMarketAutoAcceptEnabled', 'local_market_auto_accept_enabled', None),
+        ('localMarketAutoDeclineEnabled', 'local_market_auto_decline_enabled', None),
+        ('localMarketBestOfferEnabled', 'local_market_best_offer_enabled', None),
+        ('localMarketCompanyNameEnabled', 'local_market_company_name_enabled', None),
+        ('localMarketContactByAddressEnabled', 'local_market_contact_by_address_enabled', None),
+        ('localMarketContactByEmailEnabled', 'local_market_contact_by_email_enabled', None),
+        ('localMarketContactByPhoneEnabled', 'local_market_contact_by_phone_enabled', None),
+        ('localMarketCounterOfferEnabled', 'local_market_counter_offer_enabled', None),
+        ('localMarketNonSubscription', 'local_market_non_subscription', None),
+        ('localMarketPaymentMethodCheckOutEnabled', 'local_market_payment_method_check_out_enabled', None),
+        ('localMarketPhoneCount', 'local_market_phone_count', None),
+        ('localMarketPremiumSubscription', 'local_market_premium_subscription', None),
+        ('localMarketRegularSubscription', 'local_market_regular_subscription', None),
+        ('localMarketSellerContactDetailsEnabled', 'local_market_seller_contact_details_enabled', None),
+        ('localMarketShippingMethodEnabled', 'local_market_shipping_method_enabled', None),
+        ('localMarketSpecialitySubscription', 'local_market_speciality_subscription', None),
+        ('localMarketStreetCount', 'local_market_street_count', None),
+        ('maxGranularFitmentCount', 'max_granular_fitment_count', None),
+        ('maxItemCompatibility', 'max_item_compatibility', None),
+        ('minItemCompatibility', 'min_item_compatibility', None),
+        ('nonSubscription', 'non_subscription', None),
+        ('premiumSubscription', 'premium_subscription', None),
+        ('regularSubscription', 'regular_subscription', None),
+        ('sellerProvidedTitleSupported', 'seller_provided_title_supported', None),
+        ('specialitySubscription', 'speciality_subscription', None),
+        ('vinSupported', 'vin_supported', None),
+        ('vrmSupported', 'vrm_supported', None),
+    ),
+    'MultiCompatibilityPropertyValuesRequest': (
+        ('categoryId', 'category_id', None),
+        ('propertyFilters', 'property_filters', ('list', 'PropertyFilterInner')),
+        ('propertyNames', 'property_names', None),
+    ),
+    'MultiCompatibilityPropertyValuesResponse': (
+        ('compatibilities', 'compatibilities', ('list', 'Compatibility')),
+        ('metadataVersion', 'metadata_version', None),
+    ),
+    'NegotiatedPricePolicy': (
+        ('bestOfferAutoAcceptEnabled', 'best_offer_auto_accept_enabled', None),
+        ('bestOfferAutoDeclineEnabled', 'best_offer_auto_decline_enabled', None),
+        ('bestOfferCounterEnabled', 'best_offer_counter_enabled', None),
+        ('categoryId', 'category_id', None),
+        ('categoryTreeId', 'category_tree_id', None),
+    ),
+    'NegotiatedPricePolicyResponse': (
+        ('negotiatedPricePolicies', 'negotiated_price_policies', ('list', 'NegotiatedPricePolicy')),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'PackageLimits': (
+        ('dimensionUnit', 'dimension_unit', None),
+        ('maxGirth', 'max_girth', None),
+        ('maxHeight', 'max_height', None),
+        ('maxLength', 'max_length', None),
+        ('maxWeight', 'max_weight', None),
+        ('maxWidth', 'max_width', None),
+        ('minGirth', 'min_girth', None),
+        ('minHeight', 'min_height', None),
+        ('minLength', 'min_length', None),
+        ('minWeight', 'min_weight', None),
+        ('minWidth', 'min_width', None),
+        ('weightUnit', 'weight_unit', None),
+    ),
+    'Pagination': (
+        ('count', 'count', None),
+        ('limit', 'limit', None),
+        ('offset', 'offset', None),
+        ('total', 'total', None),
+    ),
+    'PaginationInput': (
+        ('limit', 'limit', None),
+        ('offset', 'offset', None),
+    ),
+    'Pictogram': (
+        ('pictogramId', 'pictogram_id', None),
+        ('pictogramDescription', 'pictogram_description', None),
+        ('pictogramUrl', 'pictogram_url', None),
+    ),
+    'ProductIdentifier': (
+        ('ean', 'ean', None),
+        ('epid', 'epid', None),
+        ('isbn', 'isbn', None),
+        ('productId', 'product_id', None),
+        ('upc', 'upc', None),
+    ),
+    'ProductRequest': (
+        ('applicationPropertyFilters', 'application_property_filters', ('list', 'PropertyFilterInner')),
+        ('dataset', 'dataset', None),
+        ('datasetPropertyName', 'dataset_property_name', None),
+        ('disabledProductFilter', 'disabled_product_filter', 'DisabledProductFilter'),
+        ('paginationInput', 'pagination_input', 'PaginationInput'),
+        ('productIdentifier', 'product_identifier', 'ProductIdentifier'),
+        ('sortOrders', 'sort_orders', ('list', 'SortOrderInner')),
+    ),
+    'ProductResponse': (
+        ('compatibilityDetails', 'compatibility_details', ('list', 'ProductResponseCompatibilityDetails')),
+        ('pagination', 'pagination', 'Pagination'),
+    ),
+    'ProductResponseCompatibilityDetails': (
+        ('noteDetails', 'note_details', ('list', 'PropertyFilterInner')),
+        ('productDetails', 'product_details', ('list', 'PropertyValues')),
+    ),
+    'ProductSafetyLabelPictogram': (
+        ('pictogramDescription', 'pictogram_description', None),
+        ('pictogramId', 'pictogram_id', None),
+        ('pictogramUrl', 'pictogram_url', None),
+    ),
+    'ProductSafetyLabelStatement': (
+        ('statementDescription', 'statement_description', None),
+        ('statementId', 'statement_id', None),
+    ),
+    'ProductSafetyLabelsResponse': (
+        ('pictograms', 'pictograms', ('list', 'ProductSafetyLabelPictogram')),
+        ('statements', 'statements', ('list', 'ProductSafetyLabelStatement')),
+    ),
+    'PropertyFilterInner': (
+        ('propertyName', 'property_name', None),
+        ('propertyValue', 'property_value', None),
+        ('unitOfMeasurement', 'unit_of_measurement', None),
+        ('url', 'url', None),
+    ),
+    'PropertyNamesRequest': (
+        ('categoryId', 'category_id', None),
+        ('dataset', 'dataset', None),
+    ),
+    'PropertyNamesResponse': (
+        ('categoryId', 'category_id', None),
+        ('properties', 'properties', ('list', 'PropertyNamesResponseProperties')),
+    ),
+    'PropertyNamesResponseProperties': (
+        ('dataset', 'dataset', None),
+        ('propertyNames', 'property_names', ('list', 'PropertyNamesResponsePropertyNames')),
+    ),
+    'PropertyNamesResponsePropertyNameMetadata': (
+        ('displaySequence', 'display_sequence', None),
+    ),
+    'PropertyNamesResponsePropertyNames': (
+        ('propertyDisplayName', 'property_display_name', None),
+        ('propertyName', 'property_name', None),
+        ('propertyNameMetadata', 'property_name_metadata', 'PropertyNamesResponsePropertyNameMetadata'),
+    ),
+    'PropertyValues': (
+        ('propertyName', 'property_name', None),
+        ('propertyValue', 'property_value', None),
+    ),
+    'PropertyValuesRequest': (
+        ('categoryId', 'category_id', None),
+        ('propertyFilters', 'property_filters', ('list', 'PropertyFilterInner')),
+        ('propertyName', 'property_name', None),
+        ('sortOrder', 'sort_order', None),
+    ),
+    'PropertyValuesResponse': (
+        ('metadataVersion', 'metadata_version', None),
+        ('propertyName', 'property_name', None),
+        ('propertyValues', 'property_values', None),
+    ),
+    'RegulatoryAttribute': (
+        ('name', 'name', None),
+        ('usage', 'usage', None),
+    ),
+    'RegulatoryPolicy': (
+        ('categoryId', 'category_id', None),
+        ('categoryTreeId', 'category_tree_id', None),
+        ('supportedAttributes', 'supported_attributes', ('list', 'RegulatoryAttribute')),
+    ),
+    'RegulatoryPolicyResponse': (
+        ('regulatoryPolicies', 'regulatory_policies', ('list', 'RegulatoryPolicy')),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'ReturnPolicy': (
+        ('categoryId', 'category_id', None),
+        ('categoryTreeId', 'category_tree_id', None),
+        ('domestic', 'domestic', 'ReturnPolicyDetails'),
+        ('international', 'international', 'ReturnPolicyDetails'),
+        ('required', 'required', None),
+    ),
+    'ReturnPolicyDetails': (
+        ('policyDescriptionEnabled', 'policy_description_enabled', None),
+        ('refundMethods', 'refund_methods', None),
+        ('returnMethods', 'return_methods', None),
+        ('returnPeriods', 'return_periods', ('list', 'TimeDuration')),
+        ('returnsAcceptanceEnabled', 'returns_acceptance_enabled', None),
+        ('returnShippingCostPayers', 'return_shipping_cost_payers', None),
+    ),
+    'ReturnPolicyResponse': (
+        ('returnPolicies', 'return_policies', ('list', 'ReturnPolicy')),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'SalesTaxJurisdiction': (
+        ('salesTaxJurisdictionId', 'sales_tax_jurisdiction_id', None),
+    ),
+    'SalesTaxJurisdictions': (
+        ('salesTaxJurisdictions', 'sales_tax_jurisdictions', ('list', 'SalesTaxJurisdiction')),
+    ),
+    'ShippingCarrier': (
+        ('description', 'description', None),
+        ('shippingCarrier', 'shipping_carrier', None),
+    ),
+    'ShippingCarrierResponse': (
+        ('shippingCarriers', 'shipping_carriers', ('list', 'ShippingCarrier')),
+    ),
+    'ShippingExcludeLocation': (
+        ('description', 'description', None),
+        ('location', 'location', None),
+        ('region', 'region', None),
+    ),
+    'ShippingExcludeLocationResponse': (
+        ('excludeShippingLocations', 'exclude_shipping_locations', ('list', 'ShippingExcludeLocation')),
+    ),
+    'ShippingHandlingTime': (
+        ('description', 'description', None),
+        ('extendedHandling', 'extended_handling', None),
+        ('maxHandlingTime', 'max_handling_time', None),
+    ),
+    'ShippingHandlingTimeResponse': (
+        ('handlingTimes', 'handling_times', ('list', 'ShippingHandlingTime')),
+    ),
+    'ShippingLocation': (
+        ('description', 'description', None),
+        ('shippingLocation', 'shipping_location', None),
+    ),
+    'ShippingLocationResponse': (
+        ('shippingLocations', 'shipping_locations', ('list', 'ShippingLocation')),
+    ),
+    'ShippingPoliciesResponse': (
+        ('shippingPolicies', 'shipping_policies', ('list', 'ShippingPolicy')),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'ShippingPolicy': (
+        ('categoryId', 'category_id', None),
+        ('categoryTreeId', 'category_tree_id', None),
+        ('globalShippingEnabled', 'global_shipping_enabled', None),
+        ('group1MaxFlatShippingCost', 'group1_max_flat_shipping_cost', 'Amount'),
+        ('group2MaxFlatShippingCost', 'group2_max_flat_shipping_cost', 'Amount'),
+        ('group3MaxFlatShippingCost', 'group3_max_flat_shipping_cost', 'Amount'),
+        ('handlingTimeEnabled', 'handling_time_enabled', None),
+        ('maxFlatShippingCost', 'max_flat_shipping_cost', 'Amount'),
+        ('shippingTermsRequired', 'shipping_terms_required', None),
+    ),
+    'ShippingService': (
+        ('description', 'description', None),
+        ('internationalService', 'international_service', None),
+        ('maxShippingTime', 'max_shipping_time', None),
+        ('minShippingTime', 'min_shipping_time', None),
+        ('packageLimits', 'package_limits', 'PackageLimits'),
+        ('shippingCarrier', 'shipping_carrier', None),
+        ('shippingCategory', 'shipping_category', None),
+        ('shippingCostTypes', 'shipping_cost_types', None),
+        ('shippingService', 'shipping_service', None),
+        ('validForSellingFlow', 'valid_for_selling_flow', None),
+    ),
+    'ShippingServiceResponse': (
+        ('shippingServices', 'shipping_services', ('list', 'ShippingService')),
+    ),
+    'SignalWord': (
+        ('signalWordId', 'signal_word_id', None),
+        ('signalWordDescription', 'signal_word_description', None),
+    ),
+    'SiteVisibilityPoliciesResponse': (
+        ('siteVisibilityPolicies', 'site_visibility_policies', ('list', 'SiteVisibilityPolicy')),
+        ('warnings', 'warnings', ('list', 'Error')),
+    ),
+    'SiteVisibilityPolicy': (
+        ('categoryId', 'category_id', None),
+        ('categoryTreeId', 'category_tree_id', None),
+        ('crossBorderTradeAustraliaEnabled', 'cross_border_trade_australia_enabled', None),
+        ('crossBorderTradeGBEnabled', 'cross_border_trade_gb_enabled', None),
+        ('crossBorderTradeNorthAmericaEnabled', 'cross_border_trade_north_america_enabled', None),
+    ),
+    'SortOrderInner': (
+        ('sortOrder', 'sort_order', 'SortOrderProperties'),
+        ('sortPriority', 'sort_priority', None),
+    ),
+    'SortOrderProperties': (
+        ('order', 'order', None),
+        ('propertyName', 'property_name', None),
+    ),
+    'SpecificationRequest': (
+        ('categoryId', 'category_id', None),
+        ('compatibilityPropertyFilters', 'compatibility_property_filters', ('list', 'PropertyFilterInner')),
+        ('dataset', 'dataset', None),
+        ('datasetPropertyName', 'dataset_property_name', None),
+        ('exactMatch', 'exact_match', None),
+        ('paginationInput', 'pagination_input', 'PaginationInput'),
+        ('sortOrders', 'sort_orders', ('list', 'SortOrderInner')),
+        ('specifications', 'specifications', ('list', 'PropertyFilterInner')),
+    ),
+    'SpecificationResponse': (
+        ('compatibilityDetails', 'compatibility_details', ('list', 'Compatibility')),
+        ('pagination', 'pagination', 'Pagination'),
+    ),
+    'TimeDuration': (
+        ('unit', 'unit', None),
+        ('value', 'value', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'AutomotivePartsCompatibilityPolicyResponse': 'AutomotivePartsCompatibilityPolicyResponse',
+    'CategoryPolicyResponse': 'CategoryPolicyResponse',
+    'ClassifiedAdPolicyResponse': 'ClassifiedAdPolicyResponse',
+    'ExtendedProducerResponsibilityPolicyResponse': 'ExtendedProducerResponsibilityPolicyResponse',
+    'GetCurrenciesResponse': 'GetCurrenciesResponse',
+    'HazardousMaterialDetailsResponse': 'HazardousMaterialDetailsResponse',
+    'ItemConditionPolicyResponse': 'ItemConditionPolicyResponse',
+    'ListingStructurePolicyResponse': 'ListingStructurePolicyResponse',
+    'ListingTypePoliciesResponse': 'ListingTypePoliciesResponse',
+    'MotorsListingPoliciesResponse': 'MotorsListingPoliciesResponse',
+    'MultiCompatibilityPropertyValuesResponse': 'MultiCompatibilityPropertyValuesResponse',
+    'NegotiatedPricePolicyResponse': 'NegotiatedPricePolicyResponse',
+    'ProductResponse': 'ProductResponse',
+    'ProductSafetyLabelsResponse': 'ProductSafetyLabelsResponse',
+    'PropertyNamesResponse': 'PropertyNamesResponse',
+    'PropertyValuesResponse': 'PropertyValuesResponse',
+    'RegulatoryPolicyResponse': 'RegulatoryPolicyResponse',
+    'ReturnPolicyResponse': 'ReturnPolicyResponse',
+    'SalesTaxJurisdictions': 'SalesTaxJurisdictions',
+    'ShippingCarrierResponse': 'ShippingCarrierResponse',
+    'ShippingExcludeLocationResponse': 'ShippingExcludeLocationResponse',
+    'ShippingHandlingTimeResponse': 'ShippingHandlingTimeResponse',
+    'ShippingLocationResponse': 'ShippingLocationResponse',
+    'ShippingPoliciesResponse': 'ShippingPoliciesResponse',
+    'ShippingServiceResponse': 'ShippingServiceResponse',
+    'SiteVisibilityPoliciesResponse': 'SiteVisibilityPoliciesResponse',
+    'SpecificationResponse': 'SpecificationResponse',
+}
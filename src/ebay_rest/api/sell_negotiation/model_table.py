@@ -0,0 +1,81 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'Amount': (
+        ('currency', 'currency', None),
+        ('value', 'value', None),
+    ),
+    'CreateOffersRequest': (
+        ('allowCounterOffer', 'allow_counter_offer', None),
+        ('message', 'message', None),
+        ('offerDuration', 'offer_duration', 'TimeDuration'),
+        ('offeredItems', 'offered_items', ('list', 'OfferedItem')),
+    ),
+    'EligibleItem': (
+        ('listingId', 'listing_id', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'Offer': (
+        ('allowCounterOffer', 'allow_counter_offer', None),
+        ('buyer', 'buyer', 'User'),
+        ('creationDate', 'creation_date', None),
+        ('initiatedBy', 'initiated_by', None),
+        ('lastModifiedDate', 'last_modified_date', None),
+        ('message', 'message', None),
+        ('offerDuration', 'offer_duration', 'TimeDuration'),
+        ('offeredItems', 'offered_items', ('list', 'OfferedItem')),
+        ('offerId', 'offer_id', None),
+        ('offerStatus', 'offer_status', None),
+        ('offerType', 'offer_type', None),
+        ('revision', 'revision', None),
+    ),
+    'OfferedItem': (
+        ('discountPercentage', 'discount_percentage', None),
+        ('listingId', 'listing_id', None),
+        ('price', 'price', 'Amount'),
+        ('quantity', 'quantity', None),
+    ),
+    'PagedEligibleItemCollection': (
+        ('eligibleItems', 'eligible_items', ('list', 'EligibleItem')),
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+    ),
+    'SendOfferToInterestedBuyersCollectionResponse': (
+        ('offers', 'offers', ('list', 'Offer')),
+    ),
+    'TimeDuration': (
+        ('unit', 'unit', None),
+        ('value', 'value', None),
+    ),
+    'User': (
+        ('maskedUsername', 'masked_username', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'PagedEligibleItemCollection': 'PagedEligibleItemCollection',
+    'SendOfferToInterestedBuyersCollectionResponse': 'SendOfferToInterestedBuyersCollectionResponse',
+}
@@ -0,0 +1,56 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'Ad': (
+        ('bidPercentages', 'bid_percentages', ('list', 'BidPercentages')),
+        ('promoteWithAd', 'promote_with_ad', None),
+    ),
+    'BidPercentages': (
+        ('basis', 'basis', None),
+        ('value', 'value', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'FindListingRecommendationRequest': (
+        ('listingIds', 'listing_ids', None),
+    ),
+    'ListingRecommendation': (
+        ('listingId', 'listing_id', None),
+        ('marketing', 'marketing', 'MarketingRecommendation'),
+    ),
+    'MarketingRecommendation': (
+        ('ad', 'ad', 'Ad'),
+        ('message', 'message', None),
+    ),
+    'PagedListingRecommendationCollection': (
+        ('href', 'href', None),
+        ('limit', 'limit', None),
+        ('listingRecommendations', 'listing_recommendations', ('list', 'ListingRecommendation')),
+        ('next', 'next', None),
+        ('offset', 'offset', None),
+        ('prev', 'prev', None),
+        ('total', 'total', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'PagedListingRecommendationCollection': 'PagedListingRecommendationCollection',
+}
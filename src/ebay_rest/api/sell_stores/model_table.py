@@ -0,0 +1,80 @@
+# coding: utf-8
+# This file is made by scripts/generate_code.py, do not edit it manually.
+
+# For each model, a tuple of (JSON key, attribute name, type code) per field.
+# The type code is None when the value needs no conversion, otherwise it is a model name,
+# "date", "datetime", or a tuple of "list" or "dict" and the type code of the elements.
+MODELS = {
+    'AddStoreCategoryRequestType': (
+        ('categoryName', 'category_name', None),
+        ('destinationParentCategoryId', 'destination_parent_category_id', None),
+        ('listingDestinationCategoryId', 'listing_destination_category_id', None),
+    ),
+    'DeleteStoreCategoryRequestType': (
+        ('listingDestinationCategoryId', 'listing_destination_category_id', None),
+    ),
+    'Error': (
+        ('category', 'category', None),
+        ('domain', 'domain', None),
+        ('errorId', 'error_id', None),
+        ('inputRefIds', 'input_ref_ids', None),
+        ('longMessage', 'long_message', None),
+        ('message', 'message', None),
+        ('outputRefIds', 'output_ref_ids', None),
+        ('parameters', 'parameters', ('list', 'ErrorParameter')),
+        ('subdomain', 'subdomain', None),
+    ),
+    'ErrorParameter': (
+        ('name', 'name', None),
+        ('value', 'value', None),
+    ),
+    'GetStoreCategoriesResponseType': (
+        ('storeCategories', 'store_categories', ('list', 'StoreCategoryType')),
+    ),
+    'GetStoreResponseType': (
+        ('description', 'description', None),
+        ('lastOpenedTime', 'last_opened_time', None),
+        ('logo', 'logo', 'StoreLogoType'),
+        ('name', 'name', None),
+        ('url', 'url', None),
+        ('urlPath', 'url_path', None),
+    ),
+    'GetStoreTaskResponseType': (
+        ('task', 'task', 'StoreTaskType'),
+    ),
+    'GetStoreTasksResponseType': (
+        ('task', 'task', ('list', 'StoreTaskType')),
+    ),
+    'MoveStoreCategoryRequestType': (
+        ('categoryId', 'category_id', None),
+        ('destinationParentCategoryId', 'destination_parent_category_id', None),
+        ('listingDestinationCategoryId', 'listing_destination_category_id', None),
+    ),
+    'RenameStoreCategoryRequestType': (
+        ('categoryName', 'category_name', None),
+    ),
+    'StoreCategoryType': (
+        ('categoryId', 'category_id', None),
+        ('categoryName', 'category_name', None),
+        ('childrenCategories', 'children_categories', ('list', 'StoreCategoryType')),
+        ('level', 'level', None),
+        ('order', 'order', None),
+    ),
+    'StoreLogoType': (
+        ('url', 'url', None),
+    ),
+    'StoreTaskType': (
+        ('id', 'id', None),
+        ('message', 'message', None),
+        ('status', 'status', None),
+        ('type', 'type', None),
+    ),
+}
+
+# The type code of each response type that the API's methods deserialize to.
+RESPONSE_TYPES = {
+    'GetStoreCategoriesResponseType': 'GetStoreCategoriesResponseType',
+    'GetStoreResponseType': 'GetStoreResponseType',
+    'GetStoreTaskResponseType': 'GetStoreTaskResponseType',
+    'GetStoreTasksResponseType': 'GetStoreTasksResponseType',
+}
@@ -0,0 +1,459 @@
+# Standard library imports
+from json import loads
+import os
+import stat
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple, Union
+
+# Local imports
+from .error import Error
+from .reference import Reference
+
+
+class Config:
+    """
+    Validated credentials and headers for API objects; immutable and hashable.
+
+    API loads and validates its path, application, user, header and key_pair parameters whenever it meets a
+    new combination of them. To do that once, make a Config and supply it to API instead, e.g. one per seller.
+
+    Example:
+        config = Config(application="production_1", user="seller_123", header="US")
+        api = API(config=config)
+
+    Configuration files are parsed once, then again only when their modification time or size changes.
+    """
+
+    __slots__ = "_application", "_user", "_header", "_key_pair", "_hash"
+
+    # parsed configuration files, by location, with the modification time and size they had
+    _files: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        application: Optional[Union[str, Dict[str, Any]]] = None,
+        user: Optional[Union[str, Dict[str, Any]]] = None,
+        header: Optional[Union[str, Dict[str, Any]]] = None,
+        key_pair: Optional[Union[str, Dict[str, Any]]] = None,
+    ) -> None:
+        """
+        The parameters are the same as those of API.
+
+        :param path: If using an ebay_rest.json file not in the current working directory, supply a full path.
+        :param application: Supply the name of the desired application record in ebay_rest.json or a dict with application credentials. Can omit when ebay_rest.json contains only one application record.
+        :param user: Supply the name of the desired user record in ebay_rest.json or a dict with user credentials. Can omit when ebay_rest.json contains only one user record.
+        :param header: Supply the name of the desired header record in ebay_rest.json or a dict with header credentials. Can omit when ebay_rest.json contains only one header record.
+        :param key_pair: Supply the name of the desired eBay public/private key pair record in ebay_rest.json or a dict with the key pair details. Can omit when ebay_rest.json contains only one record.
+        """
+        # if present, load the configuration file
+        if path is None:
+            path = os.getcwd()
+        config_location = os.path.join(path, "ebay_rest.json")
+        config_contents = Config._load_file(config_location)
+        if config_contents is None:
+            if not (
+                isinstance(application, dict)
+                and isinstance(user, dict)
+                and isinstance(header, dict)
+            ):
+                detail = (
+                    "Either at "
+                    + config_location
+                    + " do this https://github.com/matecsaj/ebay_rest/blob/main/tests/ebay_rest_EXAMPLE.json."
+                    + " Or, supply dicts to all of the params application, user, and header."
+                )
+                raise Error(
+                    number=99015,
+                    reason="Missing configuration information.",
+                    detail=detail,
+                )
+
+        # get configuration sections from parameters or the loaded file
+        application = Config._process_config_section(
+            config_contents, "applications", application
+        )
+        user = Config._process_config_section(config_contents, "users", user)
+        header = Config._process_config_section(config_contents, "headers", header)
+        key_pair = Config._process_config_section(
+            config_contents, "key_pairs", key_pair, mandatory=False
+        )
+
+        # check the application keys and values
+        # True if the dictionary key is required and False when optional.
+        # Nothing appears to use dev_id! What should it be used for?
+        application_keys = [
+            ("app_id", True),
+            ("cert_id", True),
+            ("dev_id", False),
+            ("redirect_uri", True),
+        ]
+        Config._check_keys(application, application_keys, "application")
+
+        # check the user keys and values
+        user_keys = [
+            ("email_or_username", True),
+            ("password", True),
+            ("scopes", False),
+            ("refresh_token", False),
+            ("refresh_token_expiry", False),
+        ]
+        Config._check_keys(user, user_keys, "user")
+
+        # check the key pair keys and values
+        key_pair_keys = [
+            ("creation_time", False),
+            ("expiration_time", False),
+            ("jwe", False),
+            ("private_key", False),
+            ("public_key", False),
+            ("signing_key_cipher", False),
+            ("signing_key_id", False),
+        ]
+        Config._check_keys(key_pair, key_pair_keys, "key_pair")
+
+        # check the header keys and values
+        marketplace_languages = Reference.get_valid_languages()
+        header_keys_values = [
+            ("accept_language", marketplace_languages),
+            (
+                "affiliate_campaign_id",
+                None,
+            ),  # None indicates that any value is acceptable.
+            ("affiliate_reference_id", None),
+            ("device_id", None),
+            ("content_language", marketplace_languages),
+            ("country", Reference.get_valid_country_codes()),
+            ("currency", Reference.get_valid_currency_codes()),
+            ("marketplace_id", Reference.get_valid_marketplace_ids()),
+            ("zip", None),
+        ]
+        Config._check_header(header, header_keys_values)
+
+        self._application = Config._freeze(application)
+        self._user = Config._freeze(user)
+        self._header = Config._freeze(header)
+        self._key_pair = Config._freeze(key_pair)
+        self._hash = hash(
+            tuple(
+                frozenset(section.items())
+                for section in (
+                    self._application,
+                    self._user,
+                    self._header,
+                    self._key_pair,
+                )
+            )
+        )
+
+    @property
+    def application(self) -> Mapping[str, str]:
+        """
+        :return: The application credentials, read-only.
+        """
+        return self._application
+
+    @property
+    def user(self) -> Mapping[str, Union[str, Tuple[str, ...]]]:
+        """
+        :return: The user credentials, read-only; scopes, if any, are a tuple.
+        """
+        return self._user
+
+    @property
+    def header(self) -> Mapping[str, str]:
+        """
+        :return: The header values, read-only.
+        """
+        return self._header
+
+    @property
+    def key_pair(self) -> Mapping[str, str]:
+        """
+        :return: The key pair details, read-only; empty if there are none.
+        """
+        return self._key_pair
+
+    @property
+    def sandbox(self) -> bool:
+        """
+        :return: True for the Sandbox, False for Production.
+        """
+        return self._application["cert_id"].startswith("SBX-")
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Config):
+            return NotImplemented
+        return (
+            self._hash == other._hash
+            and self._application == other._application
+            and self._user == other._user
+            and self._header == other._header
+            and self._key_pair == other._key_pair
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        # no secrets; and don't fail when __init__ raised before setting the attributes
+        application = getattr(self, "_application", None) or {}
+        user = getattr(self, "_user", None) or {}
+        return f"<Config app_id={application.get('app_id')} user={user.get('email_or_username')}>"
+
+    @staticmethod
+    def _load_file(config_location: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a configuration file, unless it was loaded before and hasn't changed since.
+
+        :param config_location: The path and name of the file.
+        :return: The parsed contents, which must not be modified, or None if there is no file.
+        """
+        try:
+            status = os.stat(config_location)
+        except OSError:
+            return None
+        if not stat.S_ISREG(status.st_mode):
+            return None
+        version = (status.st_mtime_ns, status.st_size)
+
+        cached = Config._files.get(config_location)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        try:
+            with open(config_location, "r") as f:
+                config_contents = loads(f.read())
+        except IOError as e:
+            raise Error(
+                number=99001,
+                reason="Unable to open " + config_location,
+                cause=e,
+            )
+        Config._files[config_location] = (version, config_contents)
+        return config_contents
+
+    @staticmethod
+    def _freeze(section: Dict[str, Any]) -> Mapping[str, Any]:
+        """
+        Make a read-only copy of a checked configuration section, whose values are strings or lists of strings.
+
+        :param section:
+        :return: The copy, with lists made into tuples.
+        """
+        return MappingProxyType(
+            {
+                key: tuple(value) if isinstance(value, list) else value
+                for key, value in section.items()
+            }
+        )
+
+    @staticmethod
+    def _process_config_section(
+        config_contents: Dict[str, Any],
+        section: str,
+        parameter: Optional[Union[str, Dict[str, Any]]] = None,
+        mandatory: bool = True,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a configuration section from the parameter or the loaded config file.
+
+        :param config_contents:
+        :param section:
+        :param parameter:
+        :param mandatory:
+        :return:
+        """
+        result = None
+        detail = None
+        param_name = section[:-1]
+
+        if isinstance(parameter, dict):
+            result = parameter
+
+        elif isinstance(parameter, str):
+            if len(parameter) == 0:
+                detail = (
+                    "Empty strings are not allowed for the "
+                    + param_name
+                    + " parameter."
+                )
+
+            if config_contents:
+                if section in config_contents:
+                    if parameter in config_contents[section]:
+                        result = config_contents[section][parameter]
+                    else:
+                        detail = (
+                            "Unable to find section "
+                            + parameter
+                            + " in the configuration file."
+                        )
+                else:
+                    detail = (
+                        "Section "
+                        + section
+                        + " is missing from the configuration file."
+                    )
+            else:
+                detail = (
+                    "The parameter "
+                    + param_name
+                    + " should not be a string or the configuration file should exist."
+                )
+
+        elif parameter is None:
+            if config_contents:
+                if section in config_contents:
+                    sections = config_contents[section].keys()
+                    if len(sections) == 1:
+                        result = config_contents[section][tuple(sections)[0]]
+                    else:
+                        detail = (
+                            "Perhaps parameter "
+                            + param_name
+                            + " should be one of "
+                            + ", ".join(sections)
+                            + "."
+                        )
+                else:
+                    detail = (
+                        "The parameter "
+                        + param_name
+                        + " should not be none or section "
+                        + section
+                        + " is missing from the configuration file."
+                    )
+            else:
+                detail = (
+                    "The parameter "
+                    + param_name
+                    + " should not be None or the configuration file should exist."
+                )
+
+        else:
+            detail = (
+                "Parameter "
+                + param_name
+                + " must be a Dict, String or None but it is a "
+                + str(type(parameter))
+                + "."
+            )
+
+        if result is None:
+            if mandatory:
+                raise Error(
+                    number=99003,
+                    reason="Get configuration for " + param_name + " problem.",
+                    detail=detail,
+                )
+            else:
+                return {}
+        else:
+            # delete blank lines, to eliminate subsequent blank line checks
+            result = dict(
+                result
+            )  # without changing the caller's dict or the cached file contents
+            to_delete = []
+            for key in result:
+                if isinstance(result[key], str):
+                    if len(result[key].strip()) == 0:
+                        to_delete.append(key)
+            for key in to_delete:
+                del result[key]
+
+            return result
+
+    @staticmethod
+    def _check_keys(dict_: dict, keys: List[Tuple[str, bool]], name: str) -> None:
+        """
+        True if the dictionary key is required and False when optional.
+
+        :param dict_:
+        :param keys:
+        :param name:
+        """
+        valid_keys = []
+        for key, required in keys:
+            valid_keys.append(key)
+
+            if key in dict_:
+                if key == "scopes":
+                    if not isinstance(dict_[key], list):
+                        raise Error(
+                            number=99004,
+                            reason="The key's value must be a list.",
+                            detail=key + " in " + name,
+                        )
+                else:
+                    if not isinstance(dict_[key], str):
+                        raise Error(
+                            number=99005,
+                            reason="The key's value must be a string.",
+                            detail=key + " in " + name,
+                        )
+            if required:
+                if key in dict_:
+                    if len(dict_[key]) == 0:
+                        raise Error(
+                            number=99006,
+                            reason="The key's value can not be of zero length.",
+                            detail=key + " in " + name,
+                        )
+                else:
+                    raise Error(
+                        number=99007,
+                        reason="A required key missing",
+                        detail=key + " in " + name,
+                    )
+
+        for key in dict_:
+            if key not in valid_keys:
+                raise Error(
+                    number=99008,
+                    reason="Found an unexpected key.",
+                    detail=key + " in " + name,
+                )
+
+    @staticmethod
+    def _check_header(
+        header: Dict[str, Any],
+        keys_values: List[Tuple[str, Optional[FrozenSet[str]]]],
+    ) -> None:
+        """
+        Check header keys and values.
+
+        :param header:
+        :param keys_values:
+        """
+        valid_keys = []
+        for key, values in keys_values:
+            valid_keys.append(key)
+            if key in header:
+                if isinstance(header[key], str):
+                    if values is not None:
+                        if header[key] not in values:
+                            detail = (
+                                "Header key "
+                                + key
+                                + " has value "
+                                + header[key]
+                                + ". Choose from "
+                                + ", ".join(sorted(values))
+                                + "."
+                            )
+                            raise Error(
+                                number=99009,
+                                reason="Invalid header value.",
+                                detail=detail,
+                            )
+                else:
+                    raise Error(
+                        number=99010,
+                        reason="Header values must be strings.",
+                        detail="Check key " + key + ".",
+                    )
+
+        for key in header:
+            if key not in valid_keys:
+                raise Error(number=99011, reason="Unexpected header key.", detail=key)
@@ -0,0 +1,294 @@
+# Standard library imports
+from concurrent.futures import ThreadPoolExecutor
+import gzip
+import json
+import logging
+import os
+import re
+from threading import Lock
+from typing import Callable, Dict, Iterator, Optional, Set, Tuple
+
+# 3rd party library imports
+import urllib3
+
+# Local imports
+from .error import Error
+
+
+class FeedDownload:
+    """
+    Download a Feed API file to disk in chunks, using the Range header, so that memory use stays small.
+
+    The file is fetched chunk by chunk into path + ".part", and each finished chunk is noted in the
+    journal path + ".journal". When a chunk's connection fails, the chunk resumes from the byte after
+    the last one written. When the whole download fails, e.g. the process dies, running it again skips
+    the chunks in the journal. Once complete, the ".part" file is renamed to path.
+
+    Chunks are independent, so several can be fetched in parallel.
+    """
+
+    __slots__ = "_chunk_size", "_journal_lock", "_path"
+
+    # eBay asks for feed files larger than 200 MB to be downloaded in chunks; this is well below that.
+    CHUNK_SIZE = 64 * 1024 * 1024
+
+    # How many bytes to read from a connection at a time.
+    _READ_SIZE = 1024 * 1024
+
+    def __init__(self, path: str, chunk_size: int = CHUNK_SIZE) -> None:
+        """
+        :param path: Where to put the file.
+        :param chunk_size: The most bytes to get in one request.
+        """
+        if (
+            isinstance(chunk_size, bool)
+            or not isinstance(chunk_size, int)
+            or chunk_size < 1
+        ):
+            detail = f"Parameter chunk_size {chunk_size} must be unspecified or an int that is one or more."
+            raise Error(number=95004, reason="Bad chunk_size parameter.", detail=detail)
+        self._chunk_size = chunk_size
+        self._journal_lock = Lock()
+        self._path = path
+
+    def run(
+        self,
+        fetch: Callable[[int, int], urllib3.HTTPResponse],
+        parallel: int = 1,
+        retries: int = 3,
+    ) -> None:
+        """
+        Download the file, resuming an earlier attempt if there is one.
+
+        :param fetch: Given the first and last byte positions, start getting them; return the unread response.
+        :param parallel: How many chunks to fetch at the same time.
+        :param retries: How many times to resume a chunk after its connection fails.
+        """
+        if isinstance(parallel, bool) or not isinstance(parallel, int) or parallel < 1:
+            detail = f"Parameter parallel {parallel} must be unspecified or an int that is one or more."
+            raise Error(number=95005, reason="Bad parallel parameter.", detail=detail)
+        if isinstance(retries, bool) or not isinstance(retries, int) or retries < 0:
+            detail = f"Parameter retries {retries} must be unspecified or an int that is zero or more."
+            raise Error(number=95006, reason="Bad retries parameter.", detail=detail)
+
+        part_path = self._path + ".part"
+        journal_path = self._path + ".journal"
+        total, done = self._read_journal(journal_path)
+        if total is None or not os.path.exists(part_path):
+            # the first chunk's response says how big the file is
+            response = self._start(fetch, retries)
+            try:
+                total = FeedDownload._total_size(response)
+            except BaseException:
+                response.release_conn()
+                raise
+            if total is None:  # the whole file came, not a range of it
+                with open(part_path, "wb") as file:
+                    FeedDownload._copy(response, file)
+                os.replace(part_path, self._path)
+                return
+            with open(part_path, "wb") as file:
+                file.truncate(total)
+            with open(journal_path, "w", encoding="utf-8") as journal:
+                journal.write(
+                    json.dumps({"total": total, "chunk_size": self._chunk_size}) + "\n"
+                )
+            done = set()
+            self._get_chunk(fetch, part_path, journal_path, total, 0, retries, response)
+            done.add(0)
+
+        chunks = [
+            index
+            for index in range((total + self._chunk_size - 1) // self._chunk_size)
+            if index not in done
+        ]
+        if chunks:
+            with ThreadPoolExecutor(max_workers=parallel) as executor:
+                for future in [
+                    executor.submit(
+                        self._get_chunk,
+                        fetch,
+                        part_path,
+                        journal_path,
+                        total,
+                        index,
+                        retries,
+                    )
+                    for index in chunks
+                ]:
+                    future.result()  # raises the chunk's error, if any
+
+        os.replace(part_path, self._path)
+        os.remove(journal_path)
+
+    @staticmethod
+    def rows(path: str) -> Iterator[Dict[str, str]]:
+        """
+        Yield the rows of a downloaded gzip TSV feed file, decompressing as it goes.
+
+        :param path: The feed file.
+        :return: An iterator of dicts, keyed by the column names in the first row.
+        """
+        with gzip.open(path, "rt", encoding="utf-8", newline="\n") as file:
+            columns = None
+            for line in file:
+                values = line.rstrip("\r\n").split("\t")
+                if columns is None:
+                    columns = values
+                else:
+                    yield dict(zip(columns, values))
+
+    def _start(
+        self, fetch: Callable[[int, int], urllib3.HTTPResponse], retries: int
+    ) -> urllib3.HTTPResponse:
+        """
+        Start getting the first chunk, retrying the request when it fails like _get_chunk does.
+
+        :param fetch: As for run.
+        :param retries: As for run.
+        :return: The unread response.
+        """
+        last = self._chunk_size - 1
+        attempt = 0
+        while True:
+            try:
+                return fetch(0, last)
+            except Error as error:
+                if not 99500 <= error.number <= 99599:
+                    raise  # only a server error might not happen again
+                failure = error
+            except (urllib3.exceptions.HTTPError, OSError) as error:
+                failure = error
+            if attempt >= retries:
+                raise Error(
+                    number=95001,
+                    reason="Feed file download failed.",
+                    detail=f"Bytes 0-{last}: {failure}",
+                    cause=failure,
+                )
+            attempt += 1
+            logging.warning(f"Retrying the start of the feed file download: {failure}")
+
+    def _get_chunk(
+        self,
+        fetch: Callable[[int, int], urllib3.HTTPResponse],
+        part_path: str,
+        journal_path: str,
+        total: int,
+        index: int,
+        retries: int,
+        response: Optional[urllib3.HTTPResponse] = None,
+    ) -> None:
+        """
+        Get a chunk, resuming from the last good byte when the connection fails, then note it in the journal.
+
+        :param fetch: As for run.
+        :param part_path: The file to write into.
+        :param journal_path: The journal to note the chunk in.
+        :param total: The size of the file.
+        :param index: The chunk's index.
+        :param retries: As for run.
+        :param response: A response that already started on the chunk, or None.
+        """
+        start = index * self._chunk_size
+        last = min(start + self._chunk_size, total) - 1
+        position = start  # the next byte to write
+        attempt = 0
+        with open(part_path, "r+b") as file:
+            while True:
+                failure = None
+                file.seek(position)
+                try:
+                    if response is None:
+                        response = fetch(position, last)
+                        if response.status != 206:
+                            reason = "The feed file download got the whole file, not a chunk of it."
+                            raise Error(number=95003, reason=reason)
+                    for data in response.stream(FeedDownload._READ_SIZE):
+                        file.write(data[: last + 1 - file.tell()])
+                        if file.tell() > last:
+                            break
+                except Error as error:
+                    if not 99500 <= error.number <= 99599:
+                        raise  # only a server error might not happen again
+                    failure = error
+                except (urllib3.exceptions.HTTPError, OSError) as error:
+                    failure = error
+                finally:
+                    if response is not None:
+                        response.release_conn()
+                        response = None
+                position = file.tell()
+                if position > last:
+                    break
+                if attempt >= retries:
+                    raise Error(
+                        number=95001,
+                        reason="Feed file download failed.",
+                        detail=f"Bytes {position}-{last}: {failure or 'the response ended early'}",
+                        cause=failure,
+                    )
+                attempt += 1
+                logging.warning(
+                    f"Resuming the feed file download at byte {position}: {failure}"
+                )
+            file.flush()
+            os.fsync(file.fileno())
+        with self._journal_lock:
+            with open(journal_path, "a", encoding="utf-8") as journal:
+                journal.write(f"{index}\n")
+
+    def _read_journal(self, journal_path: str) -> Tuple[Optional[int], Set[int]]:
+        """
+        Read what an earlier attempt to download the file finished.
+
+        :param journal_path:
+        :return: The size of the file, or None to start afresh, and the indices of the finished chunks.
+        """
+        try:
+            with open(journal_path, encoding="utf-8") as journal:
+                header = json.loads(journal.readline())
+                done = {int(line) for line in journal if line.endswith("\n")}
+        except FileNotFoundError:
+            return None, set()
+        except (OSError, ValueError) as e:
+            logging.warning(
+                f"Ignoring the feed file download journal {journal_path}: {e}"
+            )
+            return None, set()
+        if header.get("chunk_size") != self._chunk_size:
+            return None, set()  # the chunks were different
+        return header.get("total"), done
+
+    @staticmethod
+    def _total_size(response: urllib3.HTTPResponse) -> Optional[int]:
+        """
+        Get the size of the whole file from a response to a request for a range of it.
+
+        :param response:
+        :return: The size, or None when the response is of the whole file.
+        """
+        if response.status != 206:
+            return None
+        match = re.match(
+            r"bytes \d+-\d+/(\d+)", response.headers.get("Content-Range", "")
+        )
+        if match is None:
+            reason = "The feed file download has an unexpected Content-Range header."
+            detail = response.headers.get("Content-Range")
+            raise Error(number=95002, reason=reason, detail=detail)
+        return int(match.group(1))
+
+    @staticmethod
+    def _copy(response: urllib3.HTTPResponse, file) -> None:
+        """
+        Write a whole response to a file.
+
+        :param response:
+        :param file: A file open for writing bytes.
+        """
+        try:
+            for data in response.stream(FeedDownload._READ_SIZE):
+                file.write(data)
+        finally:
+            response.release_conn()
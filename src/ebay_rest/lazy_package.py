@@ -0,0 +1,43 @@
+# Standard library imports
+import importlib
+from types import ModuleType
+from typing import Any, Optional
+
+# Local imports
+
+
+class LazyPackage:
+    """
+    A stand-in for one of the Swagger-generated packages in ebay_rest/api, which imports it on first use.
+
+    Each package imports all of its models, so importing the thirty-odd packages up front loads over a
+    thousand modules. With this, a program that only calls buy_browse methods only loads buy_browse.
+
+    Example:
+        buy_browse = LazyPackage("buy_browse")
+        buy_browse.ApiClient            # the first attribute access imports ebay_rest.api.buy_browse
+        buy_browse.rest.ApiException    # so do sub-modules that the package imports
+
+    Thread-safe: Python's import system serializes concurrent imports of the same module.
+    """
+
+    __slots__ = "_module", "_name"
+
+    def __init__(self, name: str) -> None:
+        """
+        :param name: The name of a package in ebay_rest/api, e.g. "buy_browse".
+        """
+        self._module: Optional[ModuleType] = None
+        self._name = name
+
+    def __getattr__(self, attribute: str) -> Any:
+        # only called for attributes not found normally, i.e. those of the package
+        module = self._module
+        if module is None:
+            module = importlib.import_module(f".api.{self._name}", __package__)
+            self._module = module
+        return getattr(module, attribute)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyPackage {self._name} ({state})>"
@@ -1,7 +1,8 @@
 # Standard library imports
+from collections import OrderedDict
 import datetime
-from threading import RLock
-from typing import Any, Dict, List, Optional, Tuple
+from threading import Event, Lock
+from typing import Any, Dict, Hashable, Optional, Tuple
 
 # Local imports
 
@@ -18,9 +19,12 @@ class Multiton(type):
     any later mutations would create unexpected state for other callers. Classes should be immutable
     after construction is complete or only use private methods with internal locking for state changes.
 
-    Thread-safe: Uses a reentrant lock to prevent race conditions when creating or accessing instances.
-    The reentrant lock allows nested instantiation (a Multiton class creating another Multiton class
-    in its __init__) without causing deadlock.
+    Thread-safe: Each class has a lock to prevent race conditions when creating or accessing its instances.
+    The lock isn't held while an instance is made, so instances with different parameters are made in parallel,
+    and nested instantiation (a Multiton class creating another Multiton class in its __init__) can't deadlock.
+    When threads ask for the same new instance at once, one makes it, and the others wait for it.
+
+    Finding an instance takes constant time; the parameters are frozen into a hashable key.
 
     In ebay_rest, Multiton helps avoid making redundant REST calls to eBay.
     Redundant calls waste time, erode daily call limits, and can trigger an "Internal Server Error" at eBay.
@@ -38,43 +42,131 @@ class Multiton(type):
     To learn about the Multiton Creation (Anti)Pattern, visit https://en.wikipedia.org/wiki/Multiton_pattern.
     """
 
-    _instances: List[Dict[str, Any]] = []
-    _lock: RLock = RLock()
+    # the instances of each class, keyed by their frozen parameters, in the order they were last touched
+    _pools: Dict[type, "OrderedDict[Hashable, Tuple[Any, datetime.datetime]]"] = {}
+    # the instances of each class that are being made, by key
+    _flights: Dict[type, Dict[Hashable, "_Flight"]] = {}
+    _locks: Dict[type, Lock] = {}
+
+    def __init__(cls, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # each class has its own pool and lock, so unrelated classes don't contend
+        Multiton._pools[cls] = OrderedDict()
+        Multiton._flights[cls] = {}
+        Multiton._locks[cls] = Lock()
 
     def __call__(cls: type, *args: Any, **kwargs: Any) -> Any:
         # return super().__call__(*args, **kwargs)  # uncomment to globally disable multiton behavior
 
-        with Multiton._lock:
-            return_object: Optional[Any] = None
-            d_t: datetime.datetime = datetime.datetime.now()
-            key: Tuple[type, Tuple[Any, ...], Dict[str, Any]] = (
-                cls,
-                args,
-                kwargs,
-            )  # form a key with the class object and all the parameters
-
-            # search for a matching old instance
-            for instance in Multiton._instances:
-                if instance["key"] == key:
-                    instance["touched"] = d_t
-                    return_object = instance["object"]
-                    break
-
-            # if not found, then create a new instance
-            if return_object is None:
-                return_object = super().__call__(*args, **kwargs)
-                Multiton._instances.append(
-                    {"key": key, "object": return_object, "touched": d_t}
-                )
-
-            # delete any instances that have not been touched for a while
-            # don't panic, if the instance's object is still in use, it will not be garbage collected
-            d_t -= datetime.timedelta(hours=1.0)
-            to_delete: List[int] = list()
-            for index, instance in enumerate(Multiton._instances):
-                if instance["touched"] < d_t:
-                    to_delete.append(index)
-            for index in reversed(to_delete):
-                del Multiton._instances[index]
-
-            return return_object
+        pool = Multiton._pools[cls]
+        flights = Multiton._flights[cls]
+        key = (_freeze(args), _freeze(kwargs))  # form a key with all the parameters
+        with Multiton._locks[cls]:
+            # look for a matching old instance, and move it to the recently touched end
+            entry = pool.pop(key, None)
+            if entry is not None:
+                pool[key] = (entry[0], datetime.datetime.now())
+                return entry[0]
+
+            # otherwise, make it, unless another thread is already doing so
+            flight = flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = flights[key] = _Flight()
+
+        if not leader:
+            return flight.wait()
+
+        # make the instance without holding the lock, so that other keys can be made in parallel
+        try:
+            flight.object = super().__call__(*args, **kwargs)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with Multiton._locks[cls]:
+                del flights[key]
+                if flight.error is None:
+                    d_t = datetime.datetime.now()
+                    pool[key] = (flight.object, d_t)
+                    Multiton._evict(pool, d_t - datetime.timedelta(hours=1.0))
+            flight.done.set()
+        return flight.object
+
+    @staticmethod
+    def _evict(
+        pool: "OrderedDict[Hashable, Tuple[Any, datetime.datetime]]",
+        cutoff: datetime.datetime,
+    ) -> None:
+        """
+        Delete the instances that have not been touched since the cutoff; the oldest are first.
+
+        Don't panic, if the instance's object is still in use, it will not be garbage collected.
+
+        :param pool: The instances of a class.
+        :param cutoff: When they must have been touched since.
+        """
+        while pool:
+            oldest_key, (_, touched) = next(iter(pool.items()))
+            if touched >= cutoff:
+                break
+            del pool[oldest_key]
+
+
+class _Flight:
+    """An instance that one thread is making, while others wait for it."""
+
+    __slots__ = "done", "error", "object"
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.error: Optional[BaseException] = None
+        self.object: Any = None
+
+    def wait(self) -> Any:
+        """
+        Wait for the instance to be made.
+
+        :return: The instance; if making it failed, raise the same exception.
+        """
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.object
+
+
+class _Identity:
+    """Make an unhashable object usable in a key, by comparing it by identity."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value  # keeping a reference stops the id from being reused
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _Identity) and self.value is other.value
+
+    def __hash__(self) -> int:
+        return id(self.value)
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Convert init parameters to a hashable form, which is equal when the parameters are equal.
+
+    Dicts, lists and sets are frozen recursively; other unhashable objects are compared by identity.
+
+    :param value: A parameter, or the args tuple or kwargs dict.
+    :return: A hashable equivalent.
+    """
+    if isinstance(value, dict):
+        return dict, frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset, frozenset(_freeze(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return _Identity(value)
+    return value
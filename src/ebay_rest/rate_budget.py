@@ -0,0 +1,126 @@
+# Standard library imports
+from abc import ABC, abstractmethod
+import os
+import sqlite3
+import threading
+from typing import Any, Optional
+
+# Local imports
+
+
+class RateBudget(ABC):
+    """
+    Somewhere to keep the remaining counts of calls, so that API objects in different processes share them.
+
+    eBay's call limits are per app_id, across every process and host that uses it. Without a budget,
+    each process counts its own calls as if it were the only one; with one, they count together.
+
+    Subclass this to keep the counts elsewhere, e.g. in Redis; implement both methods, and make take atomic.
+    A key identifies an app_id and one of its eBay API resources.
+    API objects are reused when their parameters are equal, so give budgets that share counts equality.
+
+    Example:
+        api = API(throttle=True, rate_budget=SQLiteRateBudget("/var/run/my_app/ebay_rates.sqlite"))
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def set(self, key: str, remaining: int) -> None:
+        """
+        Replace a remaining count with what eBay says it is.
+
+        :param key: Identifies the app_id and resource.
+        :param remaining: The number of calls remaining in the current time window.
+        """
+
+    @abstractmethod
+    def take(self, key: str, minimum: int) -> Optional[int]:
+        """
+        Take a call when the remaining count is at least the minimum, in one atomic step.
+
+        A call is taken by decrementing the count, unless it is zero already.
+
+        :param key: Identifies the app_id and resource.
+        :param minimum: The least count to take a call at.
+        :return: The remaining count from before taking, or None when there is no count for the key.
+        """
+
+
+class SQLiteRateBudget(RateBudget):
+    """
+    Keep the remaining counts in an SQLite database file, which all the processes on a host can share.
+
+    Each take is an immediate transaction, so processes take calls one at a time.
+    """
+
+    __slots__ = "_local", "_path"
+
+    # How many seconds to wait for another process to finish its transaction.
+    _BUSY_TIMEOUT = 10.0
+
+    def __init__(self, path: str) -> None:
+        """
+        :param path: The database file; it is made if missing.
+        """
+        # an SQLite connection can't be shared by threads
+        self._local = threading.local()
+        self._path = os.path.abspath(path)
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS remaining"
+            " (key TEXT PRIMARY KEY, remaining INTEGER NOT NULL)"
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, SQLiteRateBudget):
+            return NotImplemented
+        return self._path == other._path
+
+    def __hash__(self) -> int:
+        return hash(self._path)
+
+    def set(self, key: str, remaining: int) -> None:
+        connection = self._connection()
+        connection.execute(
+            "INSERT OR REPLACE INTO remaining (key, remaining) VALUES (?, ?)",
+            (key, remaining),
+        )
+
+    def take(self, key: str, minimum: int) -> Optional[int]:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")  # lock the database before reading
+        try:
+            row = connection.execute(
+                "SELECT remaining FROM remaining WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                remaining = None
+            else:
+                remaining = row[0]
+                if remaining >= minimum and remaining > 0:
+                    connection.execute(
+                        "UPDATE remaining SET remaining = ? WHERE key = ?",
+                        (remaining - 1, key),
+                    )
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        return remaining
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Get this thread's connection, making it on first use and again in a forked child process.
+
+        :return: An SQLite connection in autocommit mode, so that transactions are explicit.
+        """
+        local = self._local
+        pid = os.getpid()
+        if getattr(local, "pid", None) != pid:
+            local.connection = sqlite3.connect(
+                self._path,
+                timeout=SQLiteRateBudget._BUSY_TIMEOUT,
+                isolation_level=None,
+            )
+            local.pid = pid
+        return local.connection
@@ -1,16 +1,113 @@
 # Standard library imports
+import asyncio
+from collections import deque
 from datetime import timedelta
 import threading
 import logging
 import math
 import time
-from typing import Any, Dict, List, Optional
-
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional, Tuple
 
 # Local imports
 from .date_time import DateTime
 from .error import Error
 from .multiton import Multiton
+from .rate_budget import RateBudget
+
+
+class _Waiter:
+    """
+    A throttled caller in a bucket's queue, either a thread or an asyncio task.
+
+    Before waiting, and while holding the bucket's lock, call prepare; then a wake from another thread
+    can't be missed.
+    """
+
+    __slots__ = "_event", "_future", "_loop", "factor"
+
+    def __init__(
+        self, factor: float, loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> None:
+        """
+        :param factor: The threshold factor of the caller's priority, see Rates.PRIORITIES.
+        :param loop: The event loop of an asyncio task, or None for a thread.
+        """
+        self._event = threading.Event() if loop is None else None
+        # made now, because a waiter can be woken before it first prepares
+        self._future = None if loop is None else loop.create_future()
+        self._loop = loop
+        self.factor = factor
+
+    def prepare(self) -> None:
+        if self._loop is None:
+            self._event.clear()
+        elif self._future.done():
+            self._future = self._loop.create_future()
+
+    def wake(self) -> None:
+        if self._loop is None:
+            self._event.set()
+        else:
+            self._loop.call_soon_threadsafe(_Waiter._resolve, self._future)
+
+    def wait(self, seconds: float) -> None:
+        self._event.wait(None if seconds == math.inf else seconds)
+
+    async def wait_async(self, seconds: float) -> None:
+        await asyncio.wait(
+            {self._future}, timeout=None if seconds == math.inf else seconds
+        )
+
+    @staticmethod
+    def _resolve(future: asyncio.Future) -> None:
+        if not future.done():
+            future.set_result(None)
+
+
+class _Bucket:
+    """
+    The call limit and remaining calls of an eBay API resource, with a lock of its own.
+
+    Calls to different resources lock different buckets, so they don't contend.
+    Throttled callers queue by priority, then in first-in, first-out order; only the first in the
+    queue waits for the threshold, the others wait for the one ahead of them to leave.
+    """
+
+    __slots__ = "key", "lock", "limit", "remaining", "reset", "time_window", "waiters"
+
+    def __init__(self, key: str, rates: dict) -> None:
+        """
+        :param key: Identifies the app_id and resource, e.g. in a RateBudget.
+        :param rates: A rate from getRateLimits, with reset converted to a datetime.
+        """
+        self.key = key
+        self.lock = threading.Lock()
+        self.waiters: Deque[_Waiter] = deque()
+        self.update(rates)
+
+    def enqueue(self, waiter: _Waiter) -> None:
+        """
+        Queue a waiter behind those of the same or a higher priority; the caller must have the lock.
+
+        :param waiter:
+        """
+        index = len(self.waiters)
+        while index and self.waiters[index - 1].factor > waiter.factor:
+            index -= 1
+        self.waiters.insert(index, waiter)
+
+    def update(self, rates: dict) -> None:
+        """
+        Take fresh values; the caller must have the lock.
+
+        :param rates: A rate from getRateLimits, with reset converted to a datetime.
+        """
+        self.limit = rates["limit"]
+        self.remaining = rates["remaining"]
+        self.reset = rates["reset"]
+        self.time_window = rates["time_window"]
+        if self.waiters:
+            self.waiters[0].wake()  # so that it reconsiders
 
 
 class Rates(metaclass=Multiton):
@@ -20,25 +117,49 @@ class Rates(metaclass=Multiton):
     https://developer.ebay.com/api-docs/developer/analytics/resources/rate_limit/methods/getRateLimits
     """
 
-    __slots__ = "_app_id", "_lock", "_refresh_date_time", "_cache"
+    __slots__ = (
+        "_app_id",
+        "_budget",
+        "_lock",
+        "_refresh_date_time",
+        "_cache",
+        "_refreshing",
+    )
+
+    # The priorities of throttled calls, and how much of the prorated threshold each must stay above.
+    # Lower priorities stop short of the calls that higher priorities may use, and they queue behind them.
+    PRIORITIES = {"high": 0.0, "normal": 0.5, "low": 1.0}
+
+    # After a background refresh fails, wait this long before trying again.
+    _RETRY_WAIT = timedelta(minutes=1)
 
-    def __init__(self, app_id) -> None:
+    # Response headers that report a resource's call limit, calls remaining and seconds until the reset.
+    _HEADER_LIMIT = "X-RateLimit-Limit"
+    _HEADER_REMAINING = "X-RateLimit-Remaining"
+    _HEADER_RESET = "X-RateLimit-Reset"
+
+    def __init__(self, app_id, rate_budget: Optional[RateBudget] = None) -> None:
         """
         Maintain a set of daily limits for each app_id. Be lazy about it when throttling is not used.
 
         :param app_id: eBay keeps a set of daily limits for each app_id.
+        :param rate_budget: Where to keep the remaining counts of calls, to share them with other processes; when None, keep them here.
         """
         self._app_id = app_id  # save because it eases debugging
+        self._budget = rate_budget
 
-        self._lock = (
-            threading.Lock()
-        )  # secure this lock before updating or reading class variables
+        self._lock = threading.Lock()  # secure this lock before replacing the cache
         self._refresh_date_time = (
             None  # the soonest it is advisable to refresh rates data from eBay
         )
-        self._cache = (
-            None  # cache of the most recent rates re-organized to expedite lookups
-        )
+        # Cache of the most recent rates re-organized to expedite lookups, a tuple of two dicts:
+        # buckets by "base_path|resource name", and the bucket found for each (base_path, *rate_keys).
+        # A refresh replaces the tuple as a whole, so reading it needs no lock.
+        self._cache: Optional[
+            Tuple[Dict[str, _Bucket], Dict[Tuple[str, ...], Optional[_Bucket]]]
+        ] = None
+        # set when a refresh is under way, so that there is only one at a time
+        self._refreshing: Optional[threading.Event] = None
 
     def decrement_rate(self, base_path: str, rate_keys: list) -> None:
         """
@@ -49,78 +170,283 @@ class Rates(metaclass=Multiton):
         :param base_path:
         :param rate_keys: Keys used to look up a rate.
         """
-        with self._lock:
-            rate_dict = self._find_rate_dict(base_path, rate_keys)
-            if rate_dict:
-                if rate_dict["remaining"] > 0:
-                    rate_dict["remaining"] -= 1
+        bucket = self._find_bucket(base_path, rate_keys)
+        if bucket:
+            with bucket.lock:
+                self._take_shared(bucket, 0)
+                if bucket.remaining > 0:
+                    bucket.remaining -= 1
+
+    async def decrement_rate_async(self, base_path: str, rate_keys: list) -> None:
+        """
+        The asyncio version of decrement_rate; with a rate budget, which can wait for other processes, it runs on a thread.
+
+        :param base_path:
+        :param rate_keys: Keys used to look up a rate.
+        """
+        if self._budget is None:
+            self.decrement_rate(base_path, rate_keys)
+        else:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.decrement_rate, base_path, rate_keys)
+
+    def record_response(
+        self,
+        base_path: str,
+        rate_keys: list,
+        status: Optional[int],
+        headers: Optional[Mapping[str, Any]],
+    ) -> None:
+        """
+        Correct the remaining count of calls with what a response says, instead of waiting for a refresh.
+
+        Other programs that use the same app_id use up calls too, which only eBay sees.
+        A 429 response means there are no calls left, so throttle until the rates are refreshed; that
+        happens once the Retry-After seconds have passed.
+        When the response has rate limit headers, take the counts they give.
+
+        :param base_path:
+        :param rate_keys: Keys used to look up a rate.
+        :param status: The HTTP status code of the response.
+        :param headers: The headers of the response, or None.
+        """
+        bucket = self._find_bucket(base_path, rate_keys)
+        if bucket is None:
+            return
+        headers = headers or {}
+        limit = Rates._header_int(headers, Rates._HEADER_LIMIT)
+        remaining = Rates._header_int(headers, Rates._HEADER_REMAINING)
+        reset = Rates._header_int(headers, Rates._HEADER_RESET)
+        if status == 429:
+            remaining = 0
+            retry_after = Rates._header_int(headers, "Retry-After")
+            refresh_date_time = DateTime.now() + (
+                Rates._RETRY_WAIT
+                if retry_after is None
+                else timedelta(seconds=retry_after)
+            )
+            with self._lock:
+                if (
+                    self._refresh_date_time is None
+                    or self._refresh_date_time > refresh_date_time
+                ):
+                    self._refresh_date_time = refresh_date_time
+        if limit is None and remaining is None and reset is None:
+            return
+        with bucket.lock:
+            if limit:
+                bucket.limit = limit
+            if remaining is not None:
+                bucket.remaining = remaining
+                if self._budget is not None:
+                    self._budget.set(bucket.key, remaining)
+            if reset is not None:
+                bucket.reset = DateTime.now() + timedelta(seconds=reset)
+            if bucket.waiters:
+                bucket.waiters[0].wake()  # so that it reconsiders
+
+    @staticmethod
+    def _header_int(headers: Mapping[str, Any], name: str) -> Optional[int]:
+        """
+        Get a header's value as a non-negative integer.
+
+        :param headers: Response headers; the values of some header classes vary in the case of the names.
+        :param name:
+        :return: The value, or None when it is missing or not an integer.
+        """
+        value = headers.get(name)
+        if value is None:
+            value = headers.get(name.lower())
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            return None
+        return value if value >= 0 else None
 
     def decrement_rate_throttled(
-        self, base_path: str, rate_keys: list, timeout: float
+        self,
+        base_path: str,
+        rate_keys: list,
+        timeout: float,
+        priority: str = "normal",
     ) -> None:
         """
         Decrement the remaining count of calls associated with a name.
 
+        Callers that must wait are served by priority, then in the order they arrived.
+
         :param base_path:
         :param rate_keys: Keys used to look up a rate.
         :param timeout: When invoked with the floating-point timeout argument set to a positive val, throttle for at most the number of seconds specified by timeout and as below the prorated call limit. A timeout argument of -1 specifies an unbounded wait.
+        :param priority: One of PRIORITIES; when calls are scarce, lower priorities wait so that higher ones needn't.
+        """
+        bucket = self._find_bucket(base_path, rate_keys)
+        if bucket is None:
+            return
+        waiter = _Waiter(Rates.PRIORITIES[priority])
+        deadline = None if timeout == -1.0 else time.monotonic() + timeout
+        with bucket.lock:
+            bucket.enqueue(waiter)
+        try:
+            while True:
+                wait_seconds = self._take_or_prepare(bucket, waiter)
+                if wait_seconds is None:
+                    return
+                waiter.wait(Rates._limit_wait(wait_seconds, deadline))
+        finally:
+            Rates._leave(bucket, waiter)
+
+    async def decrement_rate_throttled_async(
+        self,
+        base_path: str,
+        rate_keys: list,
+        timeout: float,
+        priority: str = "normal",
+    ) -> None:
+        """
+        The asyncio version of decrement_rate_throttled; it waits without blocking the event loop.
+
+        Threads and tasks share the same queues. A rate budget's take, which can wait for other processes
+        while holding the bucket's lock, runs on a thread.
+
+        :param base_path:
+        :param rate_keys: Keys used to look up a rate.
+        :param timeout: As for decrement_rate_throttled.
+        :param priority: As for decrement_rate_throttled.
+        """
+        bucket = self._find_bucket(base_path, rate_keys)
+        if bucket is None:
+            return
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(Rates.PRIORITIES[priority], loop)
+        deadline = None if timeout == -1.0 else time.monotonic() + timeout
+        with bucket.lock:
+            bucket.enqueue(waiter)
+        try:
+            while True:
+                if self._budget is None:
+                    wait_seconds = self._take_or_prepare(bucket, waiter)
+                else:
+                    wait_seconds = await loop.run_in_executor(
+                        None, self._take_or_prepare, bucket, waiter
+                    )
+                if wait_seconds is None:
+                    return
+                await waiter.wait_async(Rates._limit_wait(wait_seconds, deadline))
+        finally:
+            if self._budget is None:
+                Rates._leave(bucket, waiter)
+            else:
+                # when cancelled, a take may still be running on its thread, holding the bucket's lock
+                await loop.run_in_executor(None, Rates._leave, bucket, waiter)
+
+    def _take_or_prepare(self, bucket: _Bucket, waiter: _Waiter) -> Optional[float]:
+        """
+        Take a call for a waiter, or else prepare it to wait, under the bucket's lock.
+
+        :param bucket:
+        :param waiter:
+        :return: As for _take.
+        """
+        with bucket.lock:
+            wait_seconds = self._take(bucket, waiter)
+            if wait_seconds is not None:
+                waiter.prepare()
+            return wait_seconds
+
+    def _take(self, bucket: _Bucket, waiter: _Waiter) -> Optional[float]:
+        """
+        Take a call for a waiter, if it is first in the queue and the remaining count is above the threshold.
+
+        The caller must have the bucket's lock.
+
+        :param bucket:
+        :param waiter:
+        :return: None when the call was taken; otherwise, how many seconds to wait, math.inf for until woken.
         """
         # The algorithm relies upon the geometrical properties of right-angled triangles.
         # Threshold is a line that extends from the height of the limit at the period start to zero at the end.
-        # Further, imagine lowering the threshold half when throttled.
+        # Further, imagine lowering the threshold by the priority's factor when throttled, half for normal.
         # If not throttled, imagine lowering the threshold to 1.
         # It is OK to proceed when the remaining count is above the threshold.
         # If we need to wait, wait in proportion to how far the threshold is out of reach or until the period ends.
 
-        timeout_used = 0
-        redo = True
-        while redo:
-            self._lock.acquire()
-            rate_dict = self._find_rate_dict(base_path, rate_keys)
-            if rate_dict is None:
-                redo = False
-            else:
-                limit = rate_dict["limit"]
-                reset = rate_dict["reset"]
-                time_window = rate_dict["time_window"]
-
-                delta = abs(
-                    (DateTime.now() - reset).total_seconds()
-                )  # abs covers small clock errors
-                threshold = ((delta * limit) / time_window) * 0.5
-                if threshold < 1.0:
-                    threshold = (
-                        1.0  # one is the minimum, protect against rounding errors
-                    )
+        if bucket.waiters[0] is not waiter:
+            return math.inf  # wait for the waiter ahead to leave
+
+        limit = bucket.limit
+        reset = bucket.reset
+        time_window = bucket.time_window
+
+        delta = abs(
+            (DateTime.now() - reset).total_seconds()
+        )  # abs covers small clock errors
+        threshold = ((delta * limit) / time_window) * waiter.factor
+        if threshold < 1.0:
+            threshold = 1.0  # one is the minimum, protect against rounding errors
+
+        self._take_shared(bucket, math.ceil(threshold))
+        remaining = bucket.remaining
+        if remaining >= math.ceil(threshold):
+            if remaining > 0:
+                bucket.remaining = remaining - 1
+            bucket.waiters.popleft()
+            if bucket.waiters:
+                bucket.waiters[0].wake()
+            return None
 
-                remaining = rate_dict["remaining"]
-                if remaining >= math.ceil(threshold):
-                    if remaining > 0:
-                        rate_dict["remaining"] = remaining - 1
-                    self._lock.release()
-                    redo = False
+        # if there are no calls left in the current period
+        if remaining <= 0:
+            # then wait until the end of the period
+            return abs((DateTime.now() - reset).total_seconds())
+        # otherwise, wait for the remaining-threshold delta proportioned by remaining time
+        return ((threshold - remaining) * time_window) / limit
 
-                else:
-                    # if there are no calls left in the current period
-                    if remaining <= 0:
-                        # then wait until the end of the period
-                        wait_seconds = abs((DateTime.now() - reset).total_seconds())
-                    else:
-                        # otherwise, wait for the remaining-threshold delta proportioned by remaining time
-                        wait_seconds = ((threshold - remaining) * time_window) / limit
-
-                    if timeout != -1.0:
-                        timeout_remaining = timeout - timeout_used
-                        if timeout_remaining <= 0:
-                            raise Error(number=97001, reason="Throttle timeout.")
-                        if (
-                            wait_seconds > timeout_remaining
-                        ):  # don't wait any longer than the caller wants
-                            wait_seconds = timeout_remaining
-
-                    self._lock.release()
-                    time.sleep(wait_seconds)
-                    timeout_used += wait_seconds
+    def _take_shared(self, bucket: _Bucket, minimum: int) -> None:
+        """
+        With a rate budget, take a call from the shared count, and copy the count from before to the bucket.
+
+        The caller must have the bucket's lock, and then take the same call from the bucket.
+
+        :param bucket:
+        :param minimum: The least count to take a call at.
+        """
+        if self._budget is not None:
+            remaining = self._budget.take(bucket.key, minimum)
+            if remaining is not None:  # otherwise, no process has shared the count yet
+                bucket.remaining = remaining
+
+    @staticmethod
+    def _limit_wait(wait_seconds: float, deadline: Optional[float]) -> float:
+        """
+        Don't wait any longer than the caller wants.
+
+        :param wait_seconds:
+        :param deadline: When the caller's timeout ends, on the time.monotonic clock, or None for never.
+        :return: How many seconds to wait.
+        """
+        if deadline is None:
+            return wait_seconds
+        timeout_remaining = deadline - time.monotonic()
+        if timeout_remaining <= 0:
+            raise Error(number=97001, reason="Throttle timeout.")
+        return min(wait_seconds, timeout_remaining)
+
+    @staticmethod
+    def _leave(bucket: _Bucket, waiter: _Waiter) -> None:
+        """
+        Remove a waiter that timed out or was cancelled from the queue; a waiter that took a call already left.
+
+        :param bucket:
+        :param waiter:
+        """
+        with bucket.lock:
+            if bucket.waiters and bucket.waiters[0] is waiter:
+                bucket.waiters.popleft()
+                if bucket.waiters:
+                    bucket.waiters[0].wake()
+            elif waiter in bucket.waiters:
+                bucket.waiters.remove(waiter)
 
     def need_refresh(self) -> bool:
         """
@@ -128,16 +454,79 @@ class Rates(metaclass=Multiton):
 
         :return:
         """
-        with self._lock:
-            if self._refresh_date_time:
-                if self._refresh_date_time > DateTime.now():
-                    result = False
-                else:
-                    result = True
+        refresh_date_time = self._refresh_date_time  # reading a reference is atomic
+        if refresh_date_time:
+            if refresh_date_time > DateTime.now():
+                result = False
             else:
                 result = True
+        else:
+            result = True
         return result
 
+    def refresh(self, get_rate_limits: Callable[[], List[dict]]) -> None:
+        """
+        Refresh the rates when they are due, making sure that only one caller gets them from eBay.
+
+        Stale rates are better than none, so while there are rates the refresh runs on a background
+        thread and the caller carries on with the stale ones. Only when there are no rates yet does
+        the caller wait for them, as do any other callers that arrive meanwhile.
+
+        :param get_rate_limits: Gets the rate_limits from Developer Analytics getRateLimits.
+        """
+        if not self.need_refresh():
+            return
+        with self._lock:
+            if not self.need_refresh():
+                return
+            flight = self._refreshing
+            leader = flight is None
+            if leader:
+                flight = self._refreshing = threading.Event()
+            stale = self._cache is not None
+        if not stale:
+            if leader:
+                self._refresh(get_rate_limits, flight, stale)
+            else:
+                flight.wait()
+        elif leader:
+            threading.Thread(
+                target=self._refresh,
+                args=(get_rate_limits, flight, stale),
+                name="ebay_rest rates refresher",
+                daemon=True,
+            ).start()
+
+    def _refresh(
+        self,
+        get_rate_limits: Callable[[], List[dict]],
+        flight: threading.Event,
+        stale: bool,
+    ) -> None:
+        """
+        Get the rates from eBay and take them; run by the one caller that refresh picked.
+
+        :param get_rate_limits: Gets the rate_limits from Developer Analytics getRateLimits.
+        :param flight: Set when done, which releases callers that wait for the rates.
+        :param stale: True on a background thread, where there is no caller to raise an Error to.
+        """
+        try:
+            self.refresh_developer_analytics(get_rate_limits())
+        # not just Error, because an unexpected response mustn't end the retries
+        except Exception as error:
+            if not stale:
+                raise
+            logging.warning(
+                f"Keeping stale call limits, refreshing failed: {error}",
+                exc_info=not isinstance(error, Error),
+            )
+            with self._lock:
+                self._refresh_date_time = DateTime.now() + Rates._RETRY_WAIT
+        finally:
+            with self._lock:
+                self._refreshing = None
+            flight.set()
+
     def refresh_developer_analytics(self, rate_limits: List[dict]) -> None:
         """
         Refresh the local Developer Analytics values and when the next refresh is recommended.
@@ -149,6 +538,7 @@ class Rates(metaclass=Multiton):
             refresh_date_time = None
 
         else:
+            old_buckets = self._cache[0] if self._cache else {}
             cache = dict()  # stores the flattened rates records
             resets = set()  # stores unique reset date-times
             for rate_limit in rate_limits:
@@ -169,7 +559,14 @@ class Rates(metaclass=Multiton):
                                 reset = DateTime.from_string(rates["reset"])
                                 rates["reset"] = reset
                                 resets.add(reset)
-                                cache[key] = rates
+                                # keep the bucket and its queue of waiters, if it exists
+                                bucket = old_buckets.get(key)
+                                if bucket is None:
+                                    bucket = _Bucket(f"{self._app_id} {key}", rates)
+                                else:
+                                    with bucket.lock:
+                                        bucket.update(rates)
+                                cache[key] = bucket
 
             now = DateTime.now()
 
@@ -193,41 +590,50 @@ class Rates(metaclass=Multiton):
             else:
                 refresh_date_time = soonest_reset
 
+        if self._budget is not None and cache is not None:
+            for bucket in cache.values():
+                self._budget.set(bucket.key, bucket.remaining)
+
         with self._lock:
-            self._cache = cache
+            self._cache = None if cache is None else (cache, dict())
             self._refresh_date_time = refresh_date_time
 
-    def _find_rate_dict(
-        self, base_path: str, rate_keys: List[str]
-    ) -> Optional[Dict[str, Any]]:
+    def _find_bucket(self, base_path: str, rate_keys: List[str]) -> Optional[_Bucket]:
         """
-        Get the index so the rate object associated with a name.
+        Get the bucket of the rate associated with a name.
 
-        The caller must have a lock.
+        The first lookup for a method builds the keys and searches; later ones take the remembered result.
 
         https://developer.ebay.com/api-docs/developer/analytics/resources/rate_limit/methods/getRateLimits
 
         :param base_path:
         :param rate_keys: The keys used to look up a rate.
-        :return: A rate.
+        :return: A bucket.
         """
         cache = self._cache
         if not cache:
             return None
-        else:
-            [resource_name_base, resource_name_module] = rate_keys
+        buckets, found = cache
+        if not buckets:
+            return None
 
-            key = base_path + "|" + resource_name_base
+        [resource_name_base, resource_name_module] = rate_keys
+        lookup = (base_path, resource_name_base, resource_name_module)
+        try:
+            return found[lookup]
+        except KeyError:
+            pass
 
-            cache = self._cache
-            if key in cache:
-                result = cache[key]
+        key = base_path + "|" + resource_name_base
+        if key in buckets:
+            result = buckets[key]
+        else:
+            key = key + resource_name_module
+            if key in buckets:
+                result = buckets[key]
             else:
-                key = key + resource_name_module
-                if key in cache:
-                    result = cache[key]
-                else:
-                    logging.debug("Unable to find rates for: " + key)
-                    result = None
+                logging.debug("Unable to find rates for: " + key)
+                result = None
 
-            return result
+        found[lookup] = result  # racing threads find the same result, so either may win
+        return result
@@ -1,7 +1,9 @@
 # Standard library imports
-import copy
+import functools
 from json import load
 import os
+from types import MappingProxyType
+from typing import Any, FrozenSet, Mapping, Union
 
 # Local imports
 
@@ -17,7 +19,7 @@ class Reference:
     _cache = {}
 
     @staticmethod
-    def get_application_scopes() -> dict:
+    def get_application_scopes(frozen: bool = False) -> Union[dict, Mapping]:
         """
         Get eBay **Client Credential/Code** Grant Type Scopes that might be permitted when minting **Application** tokens.
 
@@ -25,12 +27,13 @@ class Reference:
 
         Source https://developer.ebay.com/my/keys, Sandbox column, click OAuth Scopes, second section
 
+        :param frozen: When True, get a read-only view, which is faster because nothing is copied.
         :return: Application scopes
         """
-        return Reference._get("application_scopes")
+        return Reference._get("application_scopes", frozen)
 
     @staticmethod
-    def get_country_codes() -> dict:
+    def get_country_codes(frozen: bool = False) -> Union[dict, Mapping]:
         """
         Get eBay country code information.
 
@@ -38,12 +41,13 @@ class Reference:
 
         Source https://developer.ebay.com/devzone/xml/docs/reference/ebay/types/countrycodetype.html.
 
+        :param frozen: When True, get a read-only view, which is faster because nothing is copied.
         :return: Country codes
         """
-        return Reference._get("country_codes")
+        return Reference._get("country_codes", frozen)
 
     @staticmethod
-    def get_currency_codes() -> dict:
+    def get_currency_codes(frozen: bool = False) -> Union[dict, Mapping]:
         """
         Get eBay country code information.
 
@@ -51,12 +55,13 @@ class Reference:
 
         Source https://developer.ebay.com/devzone/xml/docs/Reference/eBay/types/CurrencyCodeType.html.
 
+        :param frozen: When True, get a read-only view, which is faster because nothing is copied.
         :return: Currency codes
         """
-        return Reference._get("currency_codes")
+        return Reference._get("currency_codes", frozen)
 
     @staticmethod
-    def get_global_id_values() -> dict:
+    def get_global_id_values(frozen: bool = False) -> Union[dict, Mapping]:
         """
         Get eBay global id information.
 
@@ -68,12 +73,13 @@ class Reference:
 
         Source https://developer.ebay.com/Devzone/merchandising/docs/CallRef/Enums/GlobalIdList.html.
 
+        :param frozen: When True, get a read-only view, which is faster because nothing is copied.
         :return: Global id values
         """
-        return Reference._get("global_id_values")
+        return Reference._get("global_id_values", frozen)
 
     @staticmethod
-    def get_marketplace_id_values() -> dict:
+    def get_marketplace_id_values(frozen: bool = False) -> Union[dict, Mapping]:
         """
         Get eBay marketplace id information.
 
@@ -82,12 +88,13 @@ class Reference:
 
         Source https://developer.ebay.com/api-docs/static/rest-request-components.html#marketpl.
 
+        :param frozen: When True, get a read-only view, which is faster because nothing is copied.
         :return: Marketplace id values
         """
-        return Reference._get("marketplace_id_values")
+        return Reference._get("marketplace_id_values", frozen)
 
     @staticmethod
-    def get_user_scopes() -> dict:
+    def get_user_scopes(frozen: bool = False) -> Union[dict, Mapping]:
         """
         Get eBay **Authorization Code** Grant Type Scopes that might be permitted when minting **User Access** tokens.
 
@@ -95,16 +102,63 @@ class Reference:
 
         Source https://developer.ebay.com/my/keys, Sandbox column, click OAuth Scopes, first section
 
+        :param frozen: When True, get a read-only view, which is faster because nothing is copied.
         :return: User scopes
         """
-        return Reference._get("user_scopes")
+        return Reference._get("user_scopes", frozen)
 
     @staticmethod
-    def _get(name) -> dict:
+    @functools.lru_cache(maxsize=None)
+    def get_valid_marketplace_ids() -> FrozenSet[str]:
+        """
+        Get the marketplace ids, e.g. EBAY_US; built once and then shared.
+
+        :return: Marketplace ids
+        """
+        return frozenset(Reference._get("marketplace_id_values", True))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_valid_languages() -> FrozenSet[str]:
+        """
+        Get the languages that marketplaces use, e.g. en-US; built once and then shared.
+
+        :return: Languages
+        """
+        languages = set()
+        for marketplace_id_value in Reference._get(
+            "marketplace_id_values", True
+        ).values():
+            languages.update(marketplace_id_value[1])
+        return frozenset(languages)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_valid_country_codes() -> FrozenSet[str]:
+        """
+        Get the country codes, e.g. US; built once and then shared.
+
+        :return: Country codes
+        """
+        return frozenset(Reference._get("country_codes", True))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_valid_currency_codes() -> FrozenSet[str]:
+        """
+        Get the currency codes, e.g. USD; built once and then shared.
+
+        :return: Currency codes
+        """
+        return frozenset(Reference._get("currency_codes", True))
+
+    @staticmethod
+    def _get(name: str, frozen: bool = False) -> Union[dict, Mapping]:
         """
         Get information from the JSON files.
 
         :param name:
+        :param frozen: When True, get a read-only view instead of a copy.
         :return: Information
         """
         if name not in Reference._cache:
@@ -113,5 +167,35 @@ class Reference:
             # to the path join the data file name and extension
             path_name = os.path.join(path, "references", name + ".json")
             with open(path_name) as file_handle:
-                Reference._cache[name] = load(file_handle)
-        return copy.deepcopy(Reference._cache[name])
+                Reference._cache[name] = _freeze(load(file_handle))
+        if frozen:
+            return Reference._cache[name]
+        return _thaw(Reference._cache[name])
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Make a read-only version of JSON data; dicts become mapping proxies, and lists become tuples.
+
+    :param value: JSON data.
+    :return: The read-only version.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """
+    Make a mutable copy of JSON data that _freeze made read-only.
+
+    :param value: Read-only JSON data.
+    :return: The mutable copy.
+    """
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
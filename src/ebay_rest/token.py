@@ -1,37 +1,232 @@
 # Standard library imports
 from base64 import b64decode
 import binascii
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+import json
 import logging
+import os
+import tempfile
 import time
-from threading import Lock
-from typing import List, Optional
+from threading import Condition, Lock, Thread
+from typing import Callable, List, Optional, Tuple, Union
 from urllib.parse import urlparse, parse_qs, unquote, urlencode
+import weakref
 from cryptography.hazmat.primitives.serialization import load_der_private_key
 
 # 3rd party library imports
 from authlib.integrations.requests_client import OAuth2Session
 
 # Local imports
-from .api.developer_key_management import CreateSigningKeyRequest
 from .date_time import DateTime
 from .error import Error
+from .lazy_package import LazyPackage
 from .multiton import Multiton
 from .reference import Reference
+from .token_store import TokenStore
 
+developer_key_management = LazyPackage("developer_key_management")
 
-def _is_token_stale(token_expiry: datetime) -> bool:
+# How long the application scopes that eBay grants a client_id are remembered on disk.
+_SCOPE_CACHE_TTL = timedelta(hours=24)
+
+# The most application scopes to ask eBay about at the same time.
+_SCOPE_PROBES = 4
+
+# How long before a token gets stale the background refresher renews it.
+_REFRESH_AHEAD = timedelta(minutes=10)
+
+
+def _is_token_stale(token_expiry: datetime, ahead: timedelta = timedelta(0)) -> bool:
     """
     Check if a token has expired or will expire within 5 minutes.
 
     :param token_expiry: The token expiry datetime (may or may not have timezone info)
+    :param ahead: Look this much further ahead than 5 minutes.
     :return: True if expired or expiring soon, False otherwise
     """
     token_expiry_utc = token_expiry.replace(tzinfo=timezone.utc)
-    now_plus_buffer = DateTime.now() + timedelta(minutes=5)
+    now_plus_buffer = DateTime.now() + timedelta(minutes=5) + ahead
     return token_expiry_utc < now_plus_buffer
 
 
+def _scope_cache_path() -> str:
+    """
+    Get the path of the file that remembers the application scopes granted to each client_id.
+
+    :return: A path in the user's cache directory.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "ebay_rest", "application_scopes.json")
+
+
+def _read_scope_cache() -> dict:
+    """
+    Read the application scope cache; when it is missing or unreadable, act as if it were empty.
+
+    :return: Cache entries keyed by client_id.
+    """
+    try:
+        with open(_scope_cache_path(), encoding="utf-8") as file:
+            cache = json.load(file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logging.warning(f"Ignoring the application scope cache: {e}")
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _write_scope_cache(cache: dict) -> None:
+    """
+    Replace the application scope cache, atomically so that concurrent readers never see half a file.
+
+    The file is only readable by its owner; a failure to write is logged and otherwise ignored.
+
+    :param cache: Cache entries keyed by client_id.
+    """
+    path = _scope_cache_path()
+    try:
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        # mkstemp makes the file with mode 0600, in the same directory so that os.replace is atomic
+        handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as file:
+                json.dump(cache, file)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except OSError as e:
+        logging.warning(f"Unable to write the application scope cache: {e}")
+
+
+def _share_token(
+    token_store: TokenStore,
+    key: str,
+    mint: Callable[[], "_OAuthToken"],
+    ahead: timedelta = timedelta(0),
+) -> "_OAuthToken":
+    """
+    Get a token from a token store, unless it is missing or stale; then mint one and store it.
+
+    Minting happens while holding the store's lock, so when several processes need the same token,
+    only the first mints it, and the others find it in the store.
+
+    :param token_store: Where tokens are shared.
+    :param key: Identifies the token in the store.
+    :param mint: Makes a new token.
+    :param ahead: Treat tokens that will be stale within this time as stale already.
+    :return: A token that isn't stale.
+    """
+    token = _token_from_store(token_store, key, ahead)
+    if token is None:
+        with token_store.lock(key):
+            token = _token_from_store(token_store, key, ahead)
+            if token is None:
+                token = mint()
+                entry = {
+                    "access_token": token.access_token,
+                    "token_expiry": DateTime.to_string(token.token_expiry),
+                }
+                token_store.save(key, entry)
+    return token
+
+
+def _token_from_store(
+    token_store: TokenStore, key: str, ahead: timedelta
+) -> Optional["_OAuthToken"]:
+    """
+    Get a token from a token store.
+
+    :param token_store: Where tokens are shared.
+    :param key: Identifies the token in the store.
+    :param ahead: Treat tokens that will be stale within this time as stale already.
+    :return: The token, or None when it is missing, malformed or stale.
+    """
+    entry = token_store.load(key)
+    try:
+        token = _OAuthToken(
+            access_token=entry["access_token"],
+            token_expiry=DateTime.from_string(entry["token_expiry"]),
+        )
+    except (Error, KeyError, TypeError):
+        return None
+    if not token.access_token or _is_token_stale(token.token_expiry, ahead):
+        return None
+    return token
+
+
+class _TokenRefresher:
+    """
+    A daemon thread that renews tokens before they get stale, so that their get() never waits for eBay.
+
+    Tokens are renewed _REFRESH_AHEAD before _is_token_stale would say so. A token is only renewed once
+    get() has fetched it, and again only if get() used it since; an idle token is left to get(), which
+    refreshes it as usual when it is used again. A failed renewal is retried; if renewals keep failing,
+    get() refreshes the token when it gets stale.
+
+    Tokens are held weakly, so that ones nothing else uses are forgotten.
+    """
+
+    __slots__ = ()
+
+    _condition = Condition()
+    _thread: Optional[Thread] = None
+    _tokens: "weakref.WeakSet[Union[ApplicationToken, UserToken]]" = weakref.WeakSet()
+
+    # the most seconds between checks, and the fewest after a failed renewal
+    _MAX_WAIT = 60.0
+    _RETRY_WAIT = 30.0
+
+    @staticmethod
+    def add(token: Union["ApplicationToken", "UserToken"]) -> None:
+        """
+        Keep a token fresh, starting the thread if need be.
+
+        :param token: An ApplicationToken or UserToken.
+        """
+        with _TokenRefresher._condition:
+            _TokenRefresher._tokens.add(token)
+            if _TokenRefresher._thread is None:
+                _TokenRefresher._thread = Thread(
+                    target=_TokenRefresher._run,
+                    name="ebay_rest_token_refresher",
+                    daemon=True,
+                )
+                _TokenRefresher._thread.start()
+
+    @staticmethod
+    def _run() -> None:
+        while True:
+            wait = _TokenRefresher._renew_all()
+            with _TokenRefresher._condition:
+                _TokenRefresher._condition.wait(timeout=max(wait, 1.0))
+
+    @staticmethod
+    def _renew_all() -> float:
+        """
+        Renew the tokens that are due; the tokens are only referenced until this returns.
+
+        :return: How many seconds until a token is due.
+        """
+        with _TokenRefresher._condition:
+            tokens = list(_TokenRefresher._tokens)
+        wait = _TokenRefresher._MAX_WAIT
+        for token in tokens:
+            try:
+                due = token._renew_ahead()
+            except Exception as e:  # keep the thread alive for the other tokens
+                logging.warning(f"Unable to renew a token in the background: {e}")
+                wait = min(wait, _TokenRefresher._RETRY_WAIT)
+                continue
+            if due is not None:
+                wait = min(wait, (due - DateTime.now()).total_seconds())
+        return wait
+
+
 class ApplicationToken(metaclass=Multiton):
     """
     Initialize, refresh, and supply an eBay OAuth ***application*** token.
@@ -42,9 +237,13 @@ class ApplicationToken(metaclass=Multiton):
     __slots__ = (
         "_lock",
         "_sandbox",
+        "_client_id",
         "_application_scopes",
         "_application_token",
         "_oauth2api_inst",
+        "_token_store",
+        "_used",
+        "__weakref__",
     )
 
     def __init__(
@@ -54,6 +253,7 @@ class ApplicationToken(metaclass=Multiton):
         client_secret: Optional[str] = None,
         ru_name: Optional[str] = None,
         application_scopes: Optional[List[str]] = None,
+        token_store: Optional[TokenStore] = None,
     ) -> None:
         """
         application/client credentials are optional if you don't make API calls that need an application/client token
@@ -63,6 +263,7 @@ class ApplicationToken(metaclass=Multiton):
         :param client_secret:
         :param ru_name:
         :param application_scopes:
+        :param token_store: Where to share the token with other processes, or None to keep it to this one.
         :return: None (None)
         """
         self._lock = Lock()
@@ -71,6 +272,7 @@ class ApplicationToken(metaclass=Multiton):
         self._sandbox = sandbox
 
         # application/client credentials
+        self._client_id = client_id
         self._application_scopes = application_scopes
 
         # token object storage
@@ -79,6 +281,11 @@ class ApplicationToken(metaclass=Multiton):
         # instantiate low-level oauth api utilities
         self._oauth2api_inst = _OAuth2Api(sandbox, client_id, client_secret, ru_name)
 
+        self._token_store = token_store
+
+        # whether get() was called since the background refresher last renewed the token
+        self._used = False
+
     def get(self) -> str:
         """
         Get an eBay Application Token.
@@ -86,6 +293,7 @@ class ApplicationToken(metaclass=Multiton):
         :return: token
         """
         with self._lock:
+            self._used = True
             if self._application_scopes is None:
                 self._determine_application_scopes()
 
@@ -98,27 +306,124 @@ class ApplicationToken(metaclass=Multiton):
 
         return token
 
+    def refresh_in_background(self) -> None:
+        """
+        Renew the token in a background thread, before it gets stale, so that get() never waits for eBay.
+        """
+        _TokenRefresher.add(self)
+
+    def _renew_ahead(self) -> Optional[datetime]:
+        """
+        Renew the token if it will be stale within _REFRESH_AHEAD; called by the _TokenRefresher thread.
+
+        This doesn't take self._lock, so that get() can keep returning the current token meanwhile.
+
+        :return: When to call again, or None if get() has yet to fetch the token or hasn't used it since the last renewal.
+        """
+        token = self._application_token
+        if token is None:
+            return None
+        if _is_token_stale(token.token_expiry, _REFRESH_AHEAD):
+            if not self._used:
+                return None  # idle, so leave it to get()
+            self._refresh_application(_REFRESH_AHEAD)
+            self._used = False
+            token = self._application_token
+        return token.token_expiry - _REFRESH_AHEAD - timedelta(minutes=5)
+
     def _determine_application_scopes(self) -> None:
         """
         Determine the application scopes that are currently allowed.
+
+        In production, eBay is asked for a token with each scope; to save time, the questions are asked
+        concurrently, and the answer is remembered on disk for _SCOPE_CACHE_TTL, unless a question failed.
         """
         if self._sandbox:
             # permission is always granted for all
-            scopes = list(Reference.get_application_scopes().keys())
+            scopes = list(Reference.get_application_scopes(frozen=True))
         else:
-            scopes = []
-            for scope in Reference.get_application_scopes():
-                token_application = self._oauth2api_inst.get_application_token([scope])
-                if token_application.error is None:
-                    if token_application.access_token is not None:
-                        if len(token_application.access_token) > 0:
-                            scopes.append(scope)
+            scopes = self._get_cached_application_scopes()
+            if scopes is None:
+                scopes, certain = self._probe_application_scopes()
+                if certain:
+                    self._cache_application_scopes(scopes)
 
         self._application_scopes = scopes
 
-    def _refresh_application(self) -> None:
+    def _probe_application_scopes(self) -> Tuple[List[str], bool]:
+        """
+        Ask eBay for a token with each of the application scopes, to find out which are granted.
+
+        :return: The granted scopes, in Reference order, and whether eBay answered every question.
+        """
+
+        def is_granted(scope: str) -> Optional[bool]:
+            # each probe has its own session, because an OAuth2Session keeps the last token it fetched
+            token_application = self._oauth2api_inst.copy().get_application_token(
+                [scope]
+            )
+            if token_application.error is None:
+                if token_application.access_token is not None:
+                    if len(token_application.access_token) > 0:
+                        return True
+            elif token_application.error.split(":", 1)[0] == "invalid_scope":
+                return False
+            return None  # e.g. a network problem, so the scope might be granted
+
+        candidates = list(Reference.get_application_scopes(frozen=True))
+        with ThreadPoolExecutor(max_workers=_SCOPE_PROBES) as executor:
+            granted = list(executor.map(is_granted, candidates))
+        scopes = [scope for scope, ok in zip(candidates, granted) if ok]
+        return scopes, None not in granted
+
+    def _get_cached_application_scopes(self) -> Optional[List[str]]:
+        """
+        Get the application scopes remembered for this client_id, unless they have expired.
+
+        :return: The scopes, or None when there is nothing fresh in the cache.
+        """
+        entry = _read_scope_cache().get(self._client_id)
+        try:
+            fresh = datetime.fromisoformat(entry["expires"]) > DateTime.now()
+            scopes = entry["scopes"]
+        except (KeyError, TypeError, ValueError):
+            return None
+        if not fresh or not isinstance(scopes, list):
+            return None
+        return scopes
+
+    def _cache_application_scopes(self, scopes: List[str]) -> None:
+        """
+        Remember the application scopes for this client_id, so that other processes can skip probing.
+
+        :param scopes: The granted scopes.
+        """
+        cache = _read_scope_cache()
+        expires = DateTime.now() + _SCOPE_CACHE_TTL
+        cache[self._client_id] = {"scopes": scopes, "expires": expires.isoformat()}
+        _write_scope_cache(cache)
+
+    def _refresh_application(self, ahead: timedelta = timedelta(0)) -> None:
         """
         Refresh the eBay Application Token and update all that comes with it.
+
+        :param ahead: When using a token store, don't accept a token from it that will be stale within this time.
+        """
+        if self._token_store is None:
+            self._application_token = self._mint_application()
+        else:
+            system = "sandbox" if self._sandbox else "production"
+            scopes = " ".join(self._application_scopes)
+            key = f"application {system} {self._client_id} {scopes}"
+            self._application_token = _share_token(
+                self._token_store, key, self._mint_application, ahead
+            )
+
+    def _mint_application(self) -> "_OAuthToken":
+        """
+        Get a new eBay Application Token.
+
+        :return: The token.
         """
         token_application = self._oauth2api_inst.get_application_token(
             self._application_scopes
@@ -133,7 +438,7 @@ class ApplicationToken(metaclass=Multiton):
                 number=96002, reason="token_application.access_token is missing."
             )
 
-        self._application_token = token_application
+        return token_application
 
 
 class UserToken(metaclass=Multiton):
@@ -153,6 +458,10 @@ class UserToken(metaclass=Multiton):
         "_user_refresh_token",
         "_user_refresh_token_expiry",
         "_allow_get_user_consent",
+        "_client_id",
+        "_token_store",
+        "_used",
+        "__weakref__",
     )
 
     def __init__(
@@ -166,6 +475,7 @@ class UserToken(metaclass=Multiton):
         user_scopes: Optional[List[str]] = None,
         user_refresh_token: Optional[str] = None,
         user_refresh_token_expiry: Optional[str] = None,
+        token_store: Optional[TokenStore] = None,
     ) -> None:
         """
         :param sandbox: The system to use, True for Sandbox/Testing and False for Production.
@@ -183,6 +493,9 @@ class UserToken(metaclass=Multiton):
         # user token supply, optional if you don't mind a Chrome browser opening when getting a user token
         :param user_refresh_token:
         :param user_refresh_token_expiry:
+
+        # token sharing, optional
+        :param token_store: Where to share the token with other processes, or None to keep it to this one.
         """
 
         self._lock = Lock()
@@ -196,6 +509,11 @@ class UserToken(metaclass=Multiton):
 
         # token object storage
         self._user_token = None
+        self._client_id = client_id
+        self._token_store = token_store
+
+        # whether get() was called since the background refresher last renewed the token
+        self._used = False
 
         # instantiate low-level oauth api utilities
         self._oauth2api_inst = _OAuth2Api(sandbox, client_id, client_secret, ru_name)
@@ -249,6 +567,7 @@ class UserToken(metaclass=Multiton):
         :return: token
         """
         with self._lock:
+            self._used = True
             if self._user_scopes is None:
                 self._determine_user_scopes()
 
@@ -260,13 +579,44 @@ class UserToken(metaclass=Multiton):
             token = self._user_token.access_token
         return token
 
+    def refresh_in_background(self) -> None:
+        """
+        Renew the token in a background thread, before it gets stale, so that get() never waits for eBay.
+        """
+        _TokenRefresher.add(self)
+
+    def _renew_ahead(self) -> Optional[datetime]:
+        """
+        Renew the token if it will be stale within _REFRESH_AHEAD; called by the _TokenRefresher thread.
+
+        This doesn't take self._lock, so that get() can keep returning the current token meanwhile.
+        Renewals that need the user's consent in a browser are left to get().
+
+        :return: When to call again, or None if there is nothing to renew.
+        """
+        token = self._user_token
+        refresh_token = self._user_refresh_token
+        if token is None or not isinstance(refresh_token, _OAuthToken):
+            return None
+        if refresh_token.refresh_token_expiry is None or _is_token_stale(
+            refresh_token.refresh_token_expiry
+        ):
+            return None
+        if _is_token_stale(token.token_expiry, _REFRESH_AHEAD):
+            if not self._used:
+                return None  # idle, so leave it to get()
+            self._refresh_user(_REFRESH_AHEAD)
+            self._used = False
+            token = self._user_token
+        return token.token_expiry - _REFRESH_AHEAD - timedelta(minutes=5)
+
     def _determine_user_scopes(self) -> None:
         """
         Determine the user access scopes that are currently allowed.
         """
         if self._sandbox:
             # permission is always granted for all
-            scopes = list(Reference.get_user_scopes().keys())
+            scopes = list(Reference.get_user_scopes(frozen=True))
         else:
             # these are always granted, many more are possible
             scopes = [
@@ -278,10 +628,28 @@ class UserToken(metaclass=Multiton):
             ]
         self._user_scopes = scopes
 
-    def _refresh_user(self) -> None:
+    def _refresh_user(self, ahead: timedelta = timedelta(0)) -> None:
         """
         Refresh the eBay User Access Token and update all that comes with it.
         If we don't have a current refresh token, run the authorization flow.
+
+        :param ahead: When using a token store, don't accept a token from it that will be stale within this time.
+        """
+        if self._token_store is None:
+            self._mint_user()
+        else:
+            system = "sandbox" if self._sandbox else "production"
+            scopes = " ".join(self._user_scopes)
+            key = f"user {system} {self._client_id} {self._user_id} {scopes}"
+            self._user_token = _share_token(
+                self._token_store, key, self._mint_user, ahead
+            )
+
+    def _mint_user(self) -> "_OAuthToken":
+        """
+        Get a new eBay User Access Token, and maybe a new refresh token too.
+
+        :return: The user access token.
         """
         if self._user_refresh_token is None:
             # We don't have a refresh token; run authorization flow
@@ -295,6 +663,8 @@ class UserToken(metaclass=Multiton):
             # Exchange our still current refresh token for a new user access token
             self._refresh_user_token()
 
+        return self._user_token
+
     def _authorization_flow(self) -> None:
         """
         Get an authorization code by running authorization-flow.
@@ -598,6 +968,18 @@ class _OAuth2Api:
         self._ru_name = ru_name
         self.session = OAuth2Session(client_id, client_secret)
 
+    def copy(self) -> "_OAuth2Api":
+        """
+        Make another instance with the same credentials and its own session.
+
+        An OAuth2Session remembers the last token it fetched, so concurrent fetches need separate sessions.
+
+        :return: A new _OAuth2Api.
+        """
+        return _OAuth2Api(
+            self._sandbox, self._client_id, self._client_secret, self._ru_name
+        )
+
     def generate_user_authorization_url(
         self,
         scopes: List[str],
@@ -890,7 +1272,7 @@ class KeyPairToken(metaclass=Multiton):
         :param api: A valid API instance that can be used to make a KeyManagementAPI call
         """
         try:
-            key = api.developer_key_management_get_signing_key(
+            key = api.copy_of_developer_key_management_get_signing_key(
                 signing_key_id=self._signing_key_id
             )
         except Error as e:
@@ -909,9 +1291,11 @@ class KeyPairToken(metaclass=Multiton):
 
         :param api: A valid API instance that can be used to make a KeyManagementAPI call
         """
-        body = CreateSigningKeyRequest(signing_key_cipher="ED25519")
+        body = developer_key_management.CreateSigningKeyRequest(
+            signing_key_cipher="ED25519"
+        )
         try:
-            key = api.developer_key_management_create_signing_key(
+            key = api.copy_of_developer_key_management_create_signing_key(
                 content_type="application/json", body=body
             )
         except Error as e:
@@ -0,0 +1,135 @@
+# Standard library imports
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+import json
+import logging
+import os
+import tempfile
+from typing import Any, ContextManager, Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ModuleNotFoundError:  # not on Windows
+    fcntl = None
+
+# Local imports
+from .error import Error
+
+
+class TokenStore(ABC):
+    """
+    Somewhere to keep OAuth tokens, so that API objects in different processes can share them.
+
+    Without a store, each process mints its own application token and refreshes its own user token.
+    With one, a token is minted once and used by all, until it gets stale.
+
+    Subclass this to keep tokens elsewhere, e.g. in Redis; implement all three methods.
+    A token is a dict with the keys "access_token" and "token_expiry".
+    API objects are reused when their parameters are equal, so give stores that share tokens equality.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a token.
+
+        :param key: Identifies the token, i.e., the credentials and scopes it is for.
+        :return: The token, or None when there isn't one.
+        """
+
+    @abstractmethod
+    def save(self, key: str, token: Dict[str, Any]) -> None:
+        """
+        Add or replace a token; only called while holding lock(key).
+
+        :param key: Identifies the token, i.e., the credentials and scopes it is for.
+        :param token: The token.
+        """
+
+    @abstractmethod
+    def lock(self, key: str) -> ContextManager[None]:
+        """
+        Exclude the other processes and threads that want to replace the same token.
+
+        While holding the lock, a process checks that no other beat it to a fresh token, before making one.
+
+        :param key: Identifies the token, i.e., the credentials and scopes it is for.
+        :return: A context manager that holds the lock.
+        """
+
+
+class FileTokenStore(TokenStore):
+    """
+    Keep tokens in a JSON file, which all the processes on a host can share.
+
+    Saving replaces the file atomically, so loading never needs to wait. The lock is an fcntl lock on a
+    neighbouring ".lock" file, which the operating system releases if its process dies.
+    Only works on Unix-like systems.
+
+    Example:
+        api = API(token_store=FileTokenStore("/var/run/my_app/ebay_tokens.json"))
+    """
+
+    __slots__ = ("_path",)
+
+    def __init__(self, path: str) -> None:
+        """
+        :param path: The file to keep the tokens in; it and its ".lock" neighbour are only readable by their owner.
+        """
+        if fcntl is None:
+            reason = "FileTokenStore needs fcntl file locking, which this operating system lacks."
+            raise Error(number=96030, reason=reason)
+        self._path = os.path.abspath(path)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, FileTokenStore):
+            return NotImplemented
+        return self._path == other._path
+
+    def __hash__(self) -> int:
+        return hash(self._path)
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._read().get(key)
+
+    def save(self, key: str, token: Dict[str, Any]) -> None:
+        tokens = self._read()
+        tokens[key] = token
+        directory = os.path.dirname(self._path)
+        # mkstemp makes the file with mode 0600, in the same directory so that os.replace is atomic
+        handle, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as file:
+                json.dump(tokens, file)
+            os.replace(temp_path, self._path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        # one lock for all keys keeps it simple; tokens are replaced only every couple of hours
+        handle = os.open(self._path + ".lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(handle)  # which releases the lock
+
+    def _read(self) -> Dict[str, Any]:
+        """
+        Read all the tokens; when the file is missing or unreadable, act as if it were empty.
+
+        :return: Tokens by key.
+        """
+        try:
+            with open(self._path, encoding="utf-8") as file:
+                tokens = json.load(file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring the token store {self._path}: {e}")
+            return {}
+        return tokens if isinstance(tokens, dict) else {}
@@ -0,0 +1,117 @@
+# Standard library imports
+from concurrent.futures import ThreadPoolExecutor
+import socket
+import ssl
+from threading import Lock
+from typing import Any, Dict, Optional
+
+# 3rd party library imports
+import certifi
+import urllib3
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+# Local imports
+from .multiton import Multiton
+
+
+class Transport(metaclass=Multiton):
+    """
+    The HTTP connection pools that all the Swagger-generated REST clients share.
+
+    Each generated API package has its own RESTClientObject, and left alone, each would make its own
+    urllib3.PoolManager. Nearly all eBay APIs live on the same host, so sharing one pool manager lets
+    a buy_browse call reuse the warm TLS connection that a sell_inventory call opened.
+
+    Being a Multiton, there is one Transport per unique set of pool settings in the process.
+    """
+
+    __slots__ = "_executor", "_lock", "_pool_manager", "_pool_maxsize"
+
+    # The number of hosts to keep pools for; eBay has a handful, e.g. api, apiz and their sandboxes.
+    _NUM_POOLS = 10
+
+    # What a retry policy has, unless it says otherwise; the keys are urllib3 Retry parameters.
+    # Between retries, wait backoff_factor * 2 ** retry seconds, at most backoff_max, plus up to
+    # backoff_jitter random seconds so that clients don't retry in step. When eBay sends a Retry-After
+    # header, wait that long instead. Only retry the idempotent allowed_methods.
+    RETRY_POLICY_DEFAULTS = {
+        "total": 5,
+        "backoff_factor": 0.5,
+        "backoff_max": 60.0,
+        "backoff_jitter": 0.5,
+        "status_forcelist": (429, 500, 502, 503, 504),
+        "allowed_methods": ("DELETE", "GET", "HEAD", "OPTIONS", "PUT", "TRACE"),
+        "respect_retry_after_header": True,
+    }
+
+    def __init__(
+        self,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        retry_policy: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        :param pool_maxsize: The most connections to keep open to each eBay host.
+        :param keep_alive: When True, send TCP keep-alive probes on idle pooled connections.
+        :param retry_policy: Overrides of RETRY_POLICY_DEFAULTS; when None, only failed connections are retried.
+        """
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = Lock()
+        self._pool_maxsize = pool_maxsize
+
+        socket_options = list(HTTPConnection.default_socket_options)
+        if keep_alive:
+            # stop NAT devices and load balancers from silently dropping idle connections
+            socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+
+        self._pool_manager = urllib3.PoolManager(
+            num_pools=Transport._NUM_POOLS,
+            maxsize=pool_maxsize,
+            cert_reqs=ssl.CERT_REQUIRED,
+            ca_certs=certifi.where(),
+            socket_options=socket_options,
+            retries=Transport.make_retry(retry_policy),
+        )
+
+    @staticmethod
+    def make_retry(retry_policy: Optional[Dict[str, Any]]) -> Retry:
+        """
+        Make the urllib3 retry configuration for a retry policy.
+
+        :param retry_policy: Overrides of RETRY_POLICY_DEFAULTS, or None for urllib3's default.
+        :return: A urllib3 Retry object.
+        """
+        if retry_policy is None:
+            return Retry.DEFAULT
+        # raise_on_status=False: once out of retries, return the response so it becomes the usual Error
+        return Retry(
+            **dict(Transport.RETRY_POLICY_DEFAULTS, **retry_policy),
+            raise_on_status=False,
+        )
+
+    @property
+    def pool_manager(self) -> urllib3.PoolManager:
+        """
+        Get the shared pool manager; it is thread-safe.
+
+        :return: A urllib3 pool manager.
+        """
+        return self._pool_manager
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Get the threads that run blocking calls for asyncio code, starting them on first use.
+
+        There is a thread for each pooled connection; more threads would only wait for a connection.
+
+        :return: A thread pool executor.
+        """
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._pool_maxsize, thread_name_prefix="ebay_rest"
+                    )
+        return self._executor
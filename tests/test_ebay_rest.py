@@ -10,23 +10,46 @@
 # - If sandbox tests fail unexpectedly, don't panic — eBay's sandbox had is unreliable. Try again later.
 
 # Standard library imports
+import asyncio
+from collections import deque
 import datetime
 from copy import deepcopy
+import gzip
+import io
 from functools import lru_cache
-from json import load as json_load
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from json import dumps as json_dumps, load as json_load, loads as json_loads
 import os
 import random
 import string
+import subprocess
+import sys
+import tempfile
+import threading
 from typing import Dict, Any, Optional, Tuple
+import time
 import unittest
+from unittest import mock
 from urllib.parse import urlparse
 
 # 3rd party libraries
 from currency_converter import CurrencyConverter
+from urllib3.util.retry import Retry
 
 # Local imports
-from src.ebay_rest import API, DateTime, Error, Reference
-from src.ebay_rest.token import ApplicationToken, UserToken
+from src.ebay_rest import (
+    API,
+    AsyncAPI,
+    Config,
+    DateTime,
+    Error,
+    FileTokenStore,
+    RateBudget,
+    Reference,
+    SQLiteRateBudget,
+    TokenStore,
+)
+from src.ebay_rest.token import ApplicationToken, UserToken, _OAuthToken
 
 
 class Credentials:
@@ -2051,6 +2074,1437 @@ class MultitonTests(unittest.TestCase):
                 thread.is_alive(), "Thread should complete without hanging"
             )
 
+    def test_keys(self):
+        """
+        Are instances found by the value of their parameters, even when those are dicts or lists?
+        """
+        from src.ebay_rest.multiton import Multiton
+
+        class TestKeyClass(metaclass=Multiton):
+            def __init__(self, *args, **kwargs):
+                pass
+
+        first = TestKeyClass({"a": [1, {"b": 2}], "c": 3}, flag=True)
+        self.assertIs(first, TestKeyClass({"c": 3, "a": [1, {"b": 2}]}, flag=True))
+        self.assertIsNot(first, TestKeyClass({"a": [1, {"b": 2}], "c": 4}, flag=True))
+        self.assertIsNot(first, TestKeyClass({"a": (1, {"b": 2}), "c": 3}, flag=True))
+        self.assertIsNot(first, TestKeyClass(flag=True))
+
+        # objects that can't be hashed are compared by identity
+        unhashable = bytearray(b"x")
+        second = TestKeyClass(unhashable)
+        self.assertIs(second, TestKeyClass(unhashable))
+        self.assertIsNot(second, TestKeyClass(bytearray(b"x")))
+
+    def test_single_flight(self):
+        """
+        Are different instances made in parallel, while threads that want the same one wait for a single build?
+        """
+        from src.ebay_rest.multiton import Multiton, _Flight
+
+        builds = []
+        waits = []
+        release = threading.Event()
+        wait = _Flight.wait
+
+        class TestSlowClass(metaclass=Multiton):
+            def __init__(self, value):
+                builds.append(value)
+                release.wait(5.0)
+                if value == "bad":
+                    raise ValueError(value)
+
+        def make(value, results):
+            try:
+                results.append(TestSlowClass(value))
+            except ValueError as e:
+                results.append(e)
+
+        def wait_for_flight(flight):
+            waits.append(flight)
+            return wait(flight)
+
+        values = ["a", "a", "a", "b", "c", "d", "bad", "bad"]
+        results = {value: [] for value in values}
+        threads = [threading.Thread(target=make, args=(v, results[v])) for v in values]
+        with mock.patch.object(_Flight, "wait", wait_for_flight):
+            for thread in threads:
+                thread.start()
+            # every build is under way at once, and the threads that want one already being made wait for it
+            deadline = time.monotonic() + 5.0
+            while (len(builds) < 5 or len(waits) < 3) and time.monotonic() < deadline:
+                time.sleep(0.001)
+            under_way, waiting = len(builds), len(waits)
+            release.set()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(under_way, 5)
+        self.assertEqual(waiting, 3)
+
+        self.assertEqual(sorted(builds), ["a", "b", "bad", "c", "d"])
+        self.assertIs(results["a"][0], results["a"][1])
+        self.assertIs(results["a"][1], results["a"][2])
+        self.assertTrue(all(isinstance(r, ValueError) for r in results["bad"]))
+
+
+class APIOfflineTests(unittest.TestCase):
+    """
+    API tests that need neither eBay nor real credentials; tokens are faked and nothing is sent.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.creds = Credentials(file="ebay_rest_EXAMPLE.json")
+
+    def make_api(self, api_class=API, **kwargs) -> API:
+        """
+        Helper, make a sandbox API object from the example credentials.
+        """
+        return api_class(
+            application=deepcopy(self.creds.get_application("sandbox_1")),
+            user=deepcopy(self.creds.get_user("sandbox_1")),
+            header=deepcopy(self.creds.get_header("US")),
+            **kwargs,
+        )
+
+    def test_api_client_reuse(self):
+        """
+        Are Swagger clients made once and then reused, with only the token swapped?
+        """
+        from src.ebay_rest.api import buy_browse
+
+        api = self.make_api()
+        args = (
+            buy_browse.Configuration,
+            "/buy/browse/v1",
+            buy_browse.ItemApi,
+            buy_browse.ApiClient,
+            "get_item",
+            False,
+            "v1|1|0",
+        )
+        with mock.patch.object(ApplicationToken, "get", return_value="token_1"):
+            first = api._get_swagger_method(*args)
+        with mock.patch.object(ApplicationToken, "get", return_value="token_2"):
+            second = api._get_swagger_method(*args)
+
+        api_client = second.__self__.api_client
+        self.assertIs(first.__self__.api_client, api_client)
+        self.assertEqual(api_client.configuration.access_token, "token_2")
+        self.assertEqual(
+            api_client.configuration.host, "https://api.sandbox.ebay.com/buy/browse/v1"
+        )
+        self.assertEqual(
+            api_client.default_headers["X-EBAY-C-MARKETPLACE-ID"], "EBAY_US"
+        )
+
+    def test_shared_transport(self):
+        """
+        Do the clients of different APIs share one pool of HTTP connections?
+        """
+        from src.ebay_rest.api import buy_browse, sell_inventory
+
+        api = self.make_api()
+        browse_client = api._get_api_client(
+            buy_browse.Configuration,
+            "/buy/browse/v1",
+            buy_browse.ApiClient,
+            False,
+            False,
+            "EBAY_US",
+        )
+        inventory_client = api._get_api_client(
+            sell_inventory.Configuration,
+            "/sell/inventory/v1",
+            sell_inventory.ApiClient,
+            True,
+            False,
+            "EBAY_US",
+        )
+        self.assertIsNot(browse_client, inventory_client)
+        self.assertIs(
+            browse_client.rest_client.pool_manager,
+            inventory_client.rest_client.pool_manager,
+        )
+
+        with self.assertRaises(Error) as context:
+            self.make_api(pool_maxsize=0)
+        self.assertEqual(context.exception.number, 99020)
+
+    def test_lazy_thread_pool(self):
+        """
+        Does a generated ApiClient start its ThreadPool only when an async request needs it?
+        """
+        from src.ebay_rest.api import commerce_taxonomy
+
+        client = commerce_taxonomy.ApiClient(commerce_taxonomy.Configuration())
+        self.assertIsNone(client._pool)
+        pool = client.pool
+        self.assertIsNotNone(pool)
+        self.assertIs(client.pool, pool)
+
+    def test_raw_json(self):
+        """
+        Does the raw JSON mode give what the Swagger models and _de_swagger give?
+        """
+        from src.ebay_rest.api import commerce_taxonomy
+
+        payload = {
+            "categorySuggestions": [
+                {
+                    "category": {"categoryId": "9355", "categoryName": "Phones"},
+                    "categoryTreeNodeAncestors": [
+                        {
+                            "categoryId": "15032",
+                            "categoryName": "Cell Phones",
+                            "categorySubtreeNodeHref": "https://example.com",
+                            "categoryTreeNodeLevel": 1,
+                        }
+                    ],
+                    "categoryTreeNodeLevel": 2,
+                    "relevancy": "HIGH",
+                }
+            ],
+            "categoryTreeId": "0",
+            "categoryTreeVersion": "130",
+        }
+        sparse_payload = {"categorySuggestions": [{"category": {"categoryId": "9355"}}]}
+
+        api = self.make_api()
+        swagger_client = commerce_taxonomy.ApiClient(commerce_taxonomy.Configuration())
+        raw_api = self.make_api(raw_json=True)
+        raw_client = raw_api._make_api_client(
+            commerce_taxonomy.Configuration,
+            "/commerce/taxonomy/v1",
+            commerce_taxonomy.ApiClient,
+            False,
+            "EBAY_US",
+        )
+        for data, response_type in (
+            (payload, "CategorySuggestionResponse"),
+            (sparse_payload, "CategorySuggestionResponse"),
+            ({"key": "value"}, "object"),
+        ):
+            with self.subTest(response_type=response_type):
+                response = mock.Mock(data=json_dumps(data))
+                expected = api._de_swagger(
+                    swagger_client.deserialize(response, response_type)
+                )
+                result = raw_client.deserialize(response, response_type)
+                self.assertEqual(result, expected)
+
+        # the generated tables know the response type of every generated method
+        import importlib
+        import re
+
+        api_path = os.path.dirname(os.path.dirname(commerce_taxonomy.__file__))
+        for package in sorted(os.listdir(api_path)):
+            if not os.path.isfile(os.path.join(api_path, package, "model_table.py")):
+                continue
+            table = importlib.import_module(f"src.ebay_rest.api.{package}.model_table")
+            for file in os.listdir(os.path.join(api_path, package, "api")):
+                if not file.endswith(".py"):
+                    continue
+                with open(os.path.join(api_path, package, "api", file)) as f:
+                    for response_type in re.findall(
+                        r"response_type='([^']+)'", f.read()
+                    ):
+                        self.assertIn(response_type, table.RESPONSE_TYPES, package)
+
+        with self.assertRaises(Error) as context:
+            self.make_api(raw_json="yes")
+        self.assertEqual(context.exception.number, 99022)
+
+    def test_async_api(self):
+        """
+        Can AsyncAPI methods be awaited, and can paged methods be iterated asynchronously?
+        """
+        api = self.make_api(AsyncAPI)
+        self.assertIsNot(api, self.make_api())
+        pages = [
+            {"href": None, "items": [{"id": 1}, {"id": 2}], "total": 201},
+            {"href": None, "items": [{"id": 3}], "total": 201},
+        ]
+
+        async def go():
+            single = await api.commerce_taxonomy_get_default_category_tree_id(
+                marketplace_id="EBAY_US"
+            )
+            paged = [record async for record in api.buy_browse_search(q="iPhone")]
+            return single, paged
+
+        with (
+            mock.patch.object(api, "_get_swagger_method"),
+            mock.patch.object(
+                api, "_call_swagger", side_effect=[{"category_tree_id": "0"}] + pages
+            ),
+        ):
+            single, paged = asyncio.run(go())
+
+        self.assertEqual(single, {"category_tree_id": "0"})
+        records = [record["record"]["id"] for record in paged if "record" in record]
+        self.assertEqual(records, [1, 2, 3])
+        self.assertEqual(
+            paged[-1], {"total": {"records_yielded": 3, "records_available": 201}}
+        )
+
+    def test_async_digital_signatures(self):
+        """
+        Can an AsyncAPI that signs its calls load its key pair, which takes a Key Management call?
+        """
+        from base64 import b64encode
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+            Ed25519PrivateKey,
+        )
+
+        private_key = Ed25519PrivateKey.generate().private_bytes(
+            serialization.Encoding.DER,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        key_pair = {
+            "private_key": b64encode(private_key).decode(),
+            "signing_key_id": "async-key",
+        }
+        api = self.make_api(AsyncAPI, digital_signatures=True, key_pair=key_pair)
+        now = int(time.time())
+        key = {
+            "creation_time": now,
+            "expiration_time": now + 3600,
+            "jwe": "jwe",
+            "private_key": None,
+            "public_key": "public",
+            "signing_key_cipher": "ED25519",
+            "signing_key_id": "async-key",
+        }
+
+        def call_swagger(swagger_method, *_args, **_kwargs):
+            if swagger_method.__name__ == "get_signing_key":
+                return key
+            return {"category_tree_id": "0"}
+
+        with (
+            mock.patch.object(ApplicationToken, "get", return_value="token"),
+            mock.patch.object(api, "_call_swagger", side_effect=call_swagger),
+        ):
+            single = asyncio.run(
+                api.commerce_taxonomy_get_default_category_tree_id(
+                    marketplace_id="EBAY_US"
+                )
+            )
+            self.assertEqual(single, {"category_tree_id": "0"})
+            self.assertEqual(api.get_digital_signature_key()["jwe"], "jwe")
+
+    def test_async_paged_cancel(self):
+        """
+        Does cancelling an AsyncAPI paged method, while a page is being fetched, raise the cancellation?
+        """
+        api = self.make_api(AsyncAPI)
+        fetching = threading.Event()
+        release = threading.Event()
+
+        def call_swagger(*_args, **_kwargs):
+            fetching.set()
+            release.wait(5)
+            return {"href": None, "items": [{"id": 1}], "total": 1}
+
+        async def consume():
+            return [record async for record in api.buy_browse_search(q="iPhone")]
+
+        with (
+            mock.patch.object(api, "_get_swagger_method"),
+            mock.patch.object(api, "_call_swagger", side_effect=call_swagger),
+        ):
+            with self.assertRaises(asyncio.TimeoutError):
+                asyncio.run(asyncio.wait_for(consume(), 0.2))
+            self.assertTrue(fetching.is_set())
+            release.set()
+
+    def test_prefetch(self):
+        """
+        With prefetch, are pages fetched in parallel, yet are records yielded in order and errors raised in place?
+        """
+        api = self.make_api(prefetch=3)
+        total = 650
+        calls = []
+
+        def call_swagger(_swagger_method, _params, kwargs, _exception, **_rates):
+            offset = kwargs["offset"]
+            calls.append(offset)
+            time.sleep(0.05 if offset == 200 else 0.0)  # make a page arrive late
+            if offset == 600 and fail:
+                raise Error(number=99500, reason="Internal Server Error")
+            records = range(offset, min(offset + kwargs["limit"], total))
+            return {"items": [{"id": i} for i in records], "total": total}
+
+        with (
+            mock.patch.object(api, "_get_swagger_method"),
+            mock.patch.object(api, "_call_swagger", side_effect=call_swagger),
+        ):
+            fail = False
+            records = [
+                record["record"]["id"]
+                for record in api.buy_browse_search(q="iPhone")
+                if "record" in record
+            ]
+            self.assertEqual(records, list(range(total)))
+            self.assertEqual(sorted(calls), [0, 200, 400, 600])
+
+            calls.clear()
+            records = list()
+            fail = True
+            with self.assertRaises(Error) as context:
+                for record in api.buy_browse_search(q="iPhone", limit=610):
+                    if "record" in record:
+                        records.append(record["record"]["id"])
+            self.assertEqual(context.exception.number, 99500)
+            self.assertEqual(records, list(range(600)))
+
+        with self.assertRaises(Error) as context:
+            self.make_api(prefetch=-1)
+        self.assertEqual(context.exception.number, 99023)
+
+    def test_paged_token(self):
+        """
+        Does each page of a paged method use the access token current when the page is fetched?
+        """
+        api = self.make_api()
+        total = 450
+        tokens = []
+
+        def call_swagger(swagger_method, _params, kwargs, _exception, **_rates):
+            tokens.append(swagger_method.__self__.api_client.configuration.access_token)
+            records = range(kwargs["offset"], min(kwargs["offset"] + 200, total))
+            return {"items": [{"id": i} for i in records], "total": total}
+
+        with (
+            mock.patch.object(
+                ApplicationToken, "get", side_effect=["first", "second", "third"]
+            ),
+            mock.patch.object(api, "_call_swagger", side_effect=call_swagger),
+        ):
+            records = [
+                record
+                for record in api.buy_browse_search(q="iPhone")
+                if "record" in record
+            ]
+        self.assertEqual(len(records), total)
+        self.assertEqual(tokens, ["first", "second", "third"])
+
+    def test_paged_non_records(self):
+        """
+        Is non-record information that repeats on every page yielded only once, and in order?
+        """
+        api = self.make_api()
+        corrections = {"q": "iPhone"}
+        pages = [
+            {"auto_corrections": corrections, "items": [{"id": 1}], "total": 201},
+            {"auto_corrections": dict(corrections), "items": [{"id": 2}], "total": 201},
+        ]
+        with (
+            mock.patch.object(api, "_get_swagger_method"),
+            mock.patch.object(api, "_call_swagger", side_effect=pages),
+        ):
+            results = list(api.buy_browse_search(q="iphone"))
+        self.assertEqual(
+            results,
+            [
+                {"auto_corrections": corrections},
+                {"record": {"id": 1}},
+                {"record": {"id": 2}},
+                {"total": {"records_yielded": 2, "records_available": 201}},
+            ],
+        )
+
+    def test_batched(self):
+        """
+        Does batched split ids into batches, keep their order, and report the ids that failed?
+        """
+        api = self.make_api()
+        async_api = self.make_api(AsyncAPI)
+        item_ids = [f"v1|{i}|0" for i in range(45)]
+
+        def get_items(_swagger_method, _params, kwargs, _exception, **_rates):
+            batch = kwargs["item_ids"].split(",")
+            if item_ids[40] in batch:
+                raise Error(number=99500, reason="Internal Server Error")
+            found = [
+                {"item_id": item_id} for item_id in batch if item_id != item_ids[3]
+            ]
+            return {"items": found, "warnings": [{"error_id": 11001}]}
+
+        async def collect():
+            return [
+                result
+                async for result in async_api.batched("buy_browse_get_items", item_ids)
+            ]
+
+        for name, run in (
+            ("API", lambda: list(api.batched(api.buy_browse_get_items, item_ids))),
+            ("AsyncAPI", lambda: asyncio.run(collect())),
+        ):
+            with self.subTest(name=name):
+                target = async_api if name == "AsyncAPI" else api
+                with (
+                    mock.patch.object(target, "_get_swagger_method"),
+                    mock.patch.object(
+                        target, "_call_swagger", side_effect=get_items
+                    ) as call_swagger,
+                ):
+                    results = run()
+                self.assertEqual(call_swagger.call_count, 3)
+                records = [r["record"]["item_id"] for r in results if "record" in r]
+                self.assertEqual(records, item_ids[:3] + item_ids[4:40])
+                errors = [r["error"] for r in results if "error" in r]
+                self.assertEqual(errors[0]["ids"], [item_ids[3]])
+                self.assertEqual(errors[0]["error"], [{"error_id": 11001}])
+                self.assertEqual(errors[1]["ids"], item_ids[40:])
+                self.assertEqual(errors[1]["error"].number, 99500)
+
+        responses = {
+            "responses": [
+                {"sku": "a", "status_code": 200, "inventory_item": {}},
+                {"sku": "b", "status_code": 404, "errors": [{"error_id": 25702}]},
+            ]
+        }
+        with (
+            mock.patch.object(api, "_get_swagger_method"),
+            mock.patch.object(
+                api, "_call_swagger", return_value=responses
+            ) as call_swagger,
+        ):
+            results = list(
+                api.batched("sell_inventory_bulk_get_inventory_item", ["a", "b"])
+            )
+        self.assertEqual(
+            call_swagger.call_args.args[1][0],
+            {"requests": [{"sku": "a"}, {"sku": "b"}]},
+        )
+        self.assertEqual(
+            results,
+            [
+                {"record": responses["responses"][0]},
+                {"error": {"ids": ["b"], "error": [{"error_id": 25702}]}},
+            ],
+        )
+
+        with self.assertRaises(Error) as context:
+            next(api.batched("buy_browse_search", item_ids))
+        self.assertEqual(context.exception.number, 99024)
+
+    def test_retry_policy(self):
+        """
+        With a retry policy, are transient failures retried, heeding Retry-After, until one succeeds?
+        """
+        from src.ebay_rest.transport import Transport
+
+        statuses = [503, 429, 200]
+        requests = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                requests.append(time.monotonic())
+                status = statuses[len(requests) - 1]
+                self.send_response(status)
+                if status == 429:
+                    self.send_header("Retry-After", "1")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            transport = Transport(
+                retry_policy={"backoff_factor": 0.0, "backoff_jitter": 0.0}
+            )
+            response = transport.pool_manager.request(
+                "GET", f"http://127.0.0.1:{server.server_port}/"
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertEqual(response.status, 200)
+        self.assertEqual(len(requests), 3)
+        self.assertGreaterEqual(
+            requests[2] - requests[1], 0.9
+        )  # waited for Retry-After
+
+        self.assertIs(
+            self.make_api()._transport.pool_manager.connection_pool_kw["retries"],
+            Retry.DEFAULT,
+        )
+        with self.assertRaises(Error) as context:
+            self.make_api(retry_policy={"tries": 3})
+        self.assertEqual(context.exception.number, 99026)
+
+    def test_call_swagger_records_response(self):
+        """
+        Does a call through the generated code work in the sandbox, and in production correct the call limits?
+        """
+        from src.ebay_rest.api import buy_browse
+
+        responses = [
+            (200, {}),
+            (200, {"X-RateLimit-Remaining": "7"}),
+            (429, {}),  # urllib3 retries one with a Retry-After header
+        ]
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                status, headers = responses.pop(0)
+                body = b'{"itemId": "v1|1|0"}' if status == 200 else b"{}"
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Connection", "close")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        def call(api):
+            api_client = api._get_api_client(
+                buy_browse.Configuration,
+                "/buy/browse/v1",
+                buy_browse.ApiClient,
+                False,
+                False,
+                "EBAY_US",
+            )
+            with (
+                mock.patch.object(ApplicationToken, "get", return_value="token"),
+                mock.patch.object(
+                    api_client.configuration,
+                    "host",
+                    f"http://127.0.0.1:{server.server_port}/buy/browse/v1",
+                ),
+            ):
+                return api.buy_browse_get_item("v1|1|0")
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            self.assertEqual(call(self.make_api())["item_id"], "v1|1|0")
+
+            production = API(
+                application=deepcopy(self.creds.get_application("production_1")),
+                user=deepcopy(self.creds.get_user("production_1")),
+                header=deepcopy(self.creds.get_header("US")),
+            )
+            reset = DateTime.to_string(DateTime.now() + datetime.timedelta(hours=12))
+            rate = {
+                "limit": 100,
+                "remaining": 100,
+                "reset": reset,
+                "time_window": 86400,
+            }
+            production._rates.refresh_developer_analytics(
+                [
+                    {
+                        "api_context": "buy",
+                        "api_name": "Browse",
+                        "api_version": "v1",
+                        "resources": [{"name": "buy.browse", "rates": [rate]}],
+                    }
+                ]
+            )
+            bucket = production._rates._find_bucket(
+                "/buy/browse/v1", ["buy.browse", "item"]
+            )
+            call(production)
+            self.assertEqual(bucket.remaining, 7)
+            with self.assertRaises(Error) as context:
+                call(production)
+            self.assertEqual(context.exception.number, 99429)
+            self.assertEqual(bucket.remaining, 0)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_lazy_packages(self):
+        """
+        Does importing ebay_rest leave the generated API packages unloaded until one is used?
+        """
+        code = (
+            "import sys\n"
+            "import src.ebay_rest as ebay_rest\n"
+            "from src.ebay_rest import a_p_i\n"
+            "assert not [m for m in sys.modules if m.startswith('src.ebay_rest.api.')]\n"
+            "assert a_p_i.buy_browse.ItemApi.__name__ == 'ItemApi'\n"
+            "assert 'src.ebay_rest.api.buy_browse' in sys.modules\n"
+            "assert 'src.ebay_rest.api.sell_marketing' not in sys.modules\n"
+        )
+        cwd = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=cwd, capture_output=True, text=True
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_application_scope_cache(self):
+        """
+        Are application scopes probed concurrently, then remembered on disk for other processes?
+        """
+        denied = list(Reference.get_application_scopes())[1]
+        failed = list(Reference.get_application_scopes())[2]
+        probes = []
+        running = [0, 0]  # the probes running now, and the most that ran at once
+        lock = threading.Lock()
+
+        def get_application_token(oauth2api, scopes):
+            with lock:
+                probes.append(threading.current_thread().name)
+                running[0] += 1
+                running[1] = max(running)
+            time.sleep(0.1)
+            with lock:
+                running[0] -= 1
+            if scopes == [denied]:
+                return _OAuthToken(
+                    error="invalid_scope: The requested scope is invalid"
+                )
+            if scopes == [failed] and oauth2api._client_id == "scope-cache-failure":
+                return _OAuthToken(error="Connection refused")
+            return _OAuthToken(access_token="token")
+
+        with (
+            tempfile.TemporaryDirectory() as cache_home,
+            mock.patch.dict(os.environ, {"XDG_CACHE_HOME": cache_home}),
+            mock.patch(
+                "src.ebay_rest.token._OAuth2Api.get_application_token",
+                get_application_token,
+            ),
+        ):
+            expected = [s for s in Reference.get_application_scopes() if s != denied]
+            token = ApplicationToken(False, "scope-cache-test", "secret-1")
+            start = time.perf_counter()
+            token._determine_application_scopes()
+            self.assertLess(time.perf_counter() - start, 0.1 * len(probes) / 2)
+            self.assertEqual(token._application_scopes, expected)
+            self.assertGreater(len(set(probes)), 1)
+            self.assertLessEqual(running[1], 4)
+
+            path = os.path.join(cache_home, "ebay_rest", "application_scopes.json")
+            self.assertEqual(os.stat(path).st_mode & 0o777, 0o600)
+
+            # another process, simulated by different credentials, skips the probes
+            probes.clear()
+            token = ApplicationToken(False, "scope-cache-test", "secret-2")
+            token._determine_application_scopes()
+            self.assertEqual(token._application_scopes, expected)
+            self.assertEqual(probes, [])
+
+            # when a probe fails, it isn't known whether the scope is granted, so nothing is remembered
+            token = ApplicationToken(False, "scope-cache-failure", "secret-1")
+            token._determine_application_scopes()
+            self.assertNotIn(failed, token._application_scopes)
+            with open(path, encoding="utf-8") as file:
+                self.assertNotIn("scope-cache-failure", json_load(file))
+
+    def test_file_token_store(self):
+        """
+        Do API objects that share a FileTokenStore mint one application token between them?
+        """
+        mints = []
+
+        def get_application_token(_oauth2api, scopes):
+            mints.append(scopes)
+            time.sleep(0.1)  # give the other threads time to pile up on the lock
+            expiry = DateTime.now() + datetime.timedelta(hours=2)
+            return _OAuthToken(access_token=f"token-{len(mints)}", token_expiry=expiry)
+
+        with (
+            tempfile.TemporaryDirectory() as directory,
+            mock.patch(
+                "src.ebay_rest.token._OAuth2Api.get_application_token",
+                get_application_token,
+            ),
+        ):
+            path = os.path.join(directory, "tokens.json")
+            store = FileTokenStore(path)
+            # different secrets make different ApplicationTokens, which stand in for other processes
+            tokens = [
+                ApplicationToken(False, "store-test", f"secret-{i}", None, ["s"], store)
+                for i in range(8)
+            ]
+            results = [None] * len(tokens)
+
+            def get(index):
+                results[index] = tokens[index].get()
+
+            threads = [threading.Thread(target=get, args=(i,)) for i in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual(mints, [["s"]])
+            self.assertEqual(results, ["token-1"] * len(tokens))
+            self.assertEqual(os.stat(path).st_mode & 0o777, 0o600)
+
+        with self.assertRaises(Error) as context:
+            self.make_api(token_store=path)
+        self.assertEqual(context.exception.number, 99027)
+
+        # stores of the same file are equal, so the API objects that use them are one
+        relative = os.path.relpath(path)
+        self.assertEqual(FileTokenStore(relative), FileTokenStore(path))
+        self.assertIs(
+            self.make_api(token_store=FileTokenStore(relative)),
+            self.make_api(token_store=FileTokenStore(path)),
+        )
+        with self.assertRaises(TypeError):
+            TokenStore()  # abstract
+
+    def test_background_token_refresh(self):
+        """
+        Does the background refresher renew a token before it gets stale, without blocking get()?
+        """
+        expiries = [datetime.timedelta(minutes=12), datetime.timedelta(hours=2)]
+        minted = []
+
+        def get_application_token(_oauth2api, scopes):
+            expiry = DateTime.now() + expiries[len(minted)]
+            minted.append(expiry)
+            if len(minted) > 1:
+                time.sleep(0.2)  # a slow renewal, which get() must not wait for
+            return _OAuthToken(access_token=f"token-{len(minted)}", token_expiry=expiry)
+
+        with mock.patch(
+            "src.ebay_rest.token._OAuth2Api.get_application_token",
+            get_application_token,
+        ):
+            token = ApplicationToken(False, "refresher-test", "secret", None, ["s"])
+            self.assertEqual(token.get(), "token-1")  # not stale yet, 12 minutes left
+            token.refresh_in_background()
+            deadline = time.perf_counter() + 5.0
+            while len(minted) < 2 and time.perf_counter() < deadline:
+                time.sleep(0.01)
+            start = time.perf_counter()
+            self.assertEqual(token.get(), "token-1")  # mid renewal
+            self.assertLess(time.perf_counter() - start, 0.1)
+            while token.get() == "token-1" and time.perf_counter() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(token.get(), "token-2")
+            self.assertEqual(len(minted), 2)
+
+    def test_background_token_refresh_idle(self):
+        """
+        Does the background refresher leave idle tokens to get(), and forget tokens that nothing uses?
+        """
+        import gc
+        from src.ebay_rest.multiton import Multiton
+        from src.ebay_rest.token import _TokenRefresher
+
+        minted = []
+
+        def get_application_token(_oauth2api, scopes):
+            minted.append(scopes)
+            expiry = DateTime.now() + datetime.timedelta(minutes=12)  # due for renewal
+            return _OAuthToken(access_token=f"token-{len(minted)}", token_expiry=expiry)
+
+        with (
+            mock.patch(
+                "src.ebay_rest.token._OAuth2Api.get_application_token",
+                get_application_token,
+            ),
+            _TokenRefresher._condition,  # keep the refresher's thread out of the way
+        ):
+            token = ApplicationToken(
+                False, "refresher-idle-test", "secret", None, ["s"]
+            )
+            token.refresh_in_background()
+            self.assertIn(token, _TokenRefresher._tokens)
+            token.get()
+            token._renew_ahead()
+            self.assertEqual(len(minted), 2)
+            token._renew_ahead()  # get() hasn't used the renewed token
+            self.assertEqual(len(minted), 2)
+            token.get()
+            token._renew_ahead()
+            self.assertEqual(len(minted), 3)
+
+            # once the Multiton has evicted it, and nothing else uses it, it is forgotten
+            pool = Multiton._pools[ApplicationToken]
+            for key in [key for key, entry in pool.items() if entry[0] is token]:
+                del pool[key]
+            del token
+            gc.collect()
+            self.assertNotIn(
+                "refresher-idle-test",
+                [token._client_id for token in _TokenRefresher._tokens],
+            )
+
+    def test_rate_buckets(self):
+        """
+        Does each resource have its own bucket, found by the method's rate keys?
+        """
+        from src.ebay_rest.rates import Rates
+
+        reset = DateTime.to_string(DateTime.now() + datetime.timedelta(hours=12))
+        rate = {"limit": 100, "remaining": 100, "reset": reset, "time_window": 86400}
+        rates = Rates(app_id="test_rate_buckets")
+        rates.refresh_developer_analytics(
+            [
+                {
+                    "api_context": "buy",
+                    "api_name": "Browse",
+                    "api_version": "v1",
+                    "resources": [
+                        {"name": "buy.browse", "rates": [dict(rate)]},
+                        {"name": "buy.browse.item", "rates": [dict(rate)]},
+                    ],
+                }
+            ]
+        )
+        rates.decrement_rate("/buy/browse/v1", ["buy.browse", ".item"])
+        rates.decrement_rate_throttled("/buy/browse/v1", ["buy.browse", ".item"], -1.0)
+        browse = rates._find_bucket("/buy/browse/v1", ["buy.browse", ""])
+        self.assertEqual(browse.remaining, 98)
+        self.assertIs(
+            rates._find_bucket("/buy/browse/v1", ["buy.browse", ".x"]), browse
+        )
+        self.assertIsNone(rates._find_bucket("/buy/deal/v1", ["buy.deal", ""]))
+
+    @staticmethod
+    def record_takes(bucket) -> list:
+        """
+        Record the names of the threads that take calls from a rate bucket, in the order that they take them.
+        """
+        takes = []
+
+        class Waiters(deque):
+            def popleft(self):
+                takes.append(threading.current_thread().name)
+                return super().popleft()
+
+        bucket.waiters = Waiters(bucket.waiters)
+        return takes
+
+    def test_throttle_fifo(self):
+        """
+        Do throttled threads and tasks get their calls in the order they asked, and give up on time?
+        """
+        from src.ebay_rest.rates import Rates, _Waiter
+
+        reset = DateTime.to_string(DateTime.now() + datetime.timedelta(hours=12))
+
+        def limits(remaining):
+            rate = {
+                "limit": 100,
+                "remaining": remaining,
+                "reset": reset,
+                "time_window": 86400,
+            }
+            return [
+                {
+                    "api_context": "buy",
+                    "api_name": "Browse",
+                    "api_version": "v1",
+                    "resources": [{"name": "buy.browse", "rates": [rate]}],
+                }
+            ]
+
+        keys = ["buy.browse", ""]
+        rates = Rates(app_id="test_throttle_fifo")
+        rates.refresh_developer_analytics(limits(0))
+        bucket = rates._find_bucket("/buy/browse/v1", keys)
+
+        with self.assertRaises(Error) as context:
+            rates.decrement_rate_throttled("/buy/browse/v1", keys, 0.1)
+        self.assertEqual(context.exception.number, 97001)
+        self.assertEqual(len(bucket.waiters), 0)
+
+        takes = self.record_takes(bucket)
+        threads = []
+        for number in range(4):
+            threads.append(
+                threading.Thread(
+                    target=rates.decrement_rate_throttled,
+                    args=("/buy/browse/v1", keys, 10.0),
+                    name=str(number),
+                )
+            )
+            threads[-1].start()
+            while len(bucket.waiters) <= number:
+                time.sleep(0.001)
+        rates.refresh_developer_analytics(limits(100))
+        for thread in threads:
+            thread.join()
+        self.assertEqual(takes, ["0", "1", "2", "3"])
+        self.assertEqual(bucket.remaining, 96)
+
+        order = []
+
+        async def call_async(number):
+            await rates.decrement_rate_throttled_async("/buy/browse/v1", keys, 10.0)
+            order.append(number)
+
+        async def main():
+            rates.refresh_developer_analytics(limits(0))
+            tasks = []
+            for number in range(4):
+                tasks.append(asyncio.ensure_future(call_async(number)))
+                await asyncio.sleep(0)
+            self.assertEqual(len(bucket.waiters), 4)
+            rates.refresh_developer_analytics(limits(100))
+            await asyncio.gather(*tasks)
+
+        asyncio.run(main())
+        self.assertEqual(order, [0, 1, 2, 3])
+
+        async def wake_early():
+            # the task ahead can leave, and wake this one, before this one first prepares to wait
+            waiter = _Waiter(Rates.PRIORITIES["normal"], asyncio.get_running_loop())
+            waiter.wake()
+            waiter.prepare()
+            await waiter.wait_async(float("inf"))
+
+        asyncio.run(asyncio.wait_for(wake_early(), 1.0))
+
+    def test_throttle_priority(self):
+        """
+        Do lower priority calls stop short of the calls that higher ones may use, and queue behind them?
+        """
+        from src.ebay_rest.rates import Rates
+
+        reset = DateTime.to_string(DateTime.now() + datetime.timedelta(hours=12))
+
+        def limits(remaining):
+            rate = {
+                "limit": 100,
+                "remaining": remaining,
+                "reset": reset,
+                "time_window": 86400,
+            }
+            return [
+                {
+                    "api_context": "buy",
+                    "api_name": "Browse",
+                    "api_version": "v1",
+                    "resources": [{"name": "buy.browse", "rates": [rate]}],
+                }
+            ]
+
+        keys = ["buy.browse", ""]
+        rates = Rates(app_id="test_throttle_priority")
+        # halfway through the window, the prorated threshold is 50 calls
+        rates.refresh_developer_analytics(limits(30))
+        with self.assertRaises(Error) as context:
+            rates.decrement_rate_throttled("/buy/browse/v1", keys, 0.05, "low")
+        self.assertEqual(context.exception.number, 97001)
+        rates.decrement_rate_throttled("/buy/browse/v1", keys, 0.05, "normal")
+        rates.refresh_developer_analytics(limits(2))
+        rates.decrement_rate_throttled("/buy/browse/v1", keys, 0.05, "high")
+
+        rates.refresh_developer_analytics(limits(0))
+        bucket = rates._find_bucket("/buy/browse/v1", keys)
+        takes = self.record_takes(bucket)
+        threads = []
+        for priority in ("low", "normal", "low", "high"):
+            threads.append(
+                threading.Thread(
+                    target=rates.decrement_rate_throttled,
+                    args=("/buy/browse/v1", keys, 10.0, priority),
+                    name=priority,
+                )
+            )
+            threads[-1].start()
+            while len(bucket.waiters) < len(threads):
+                time.sleep(0.001)
+        rates.refresh_developer_analytics(limits(100))
+        for thread in threads:
+            thread.join()
+        self.assertEqual(takes, ["high", "normal", "low", "low"])
+
+        for priority in ("urgent", ["high"]):
+            with self.assertRaises(Error) as context:
+                self.make_api(priority=priority)
+            self.assertEqual(context.exception.number, 99031)
+
+    def test_rates_refresh(self):
+        """
+        Does only one caller refresh the rates, and only the first refresh hold callers up?
+        """
+        from src.ebay_rest.rates import Rates
+
+        reset = DateTime.to_string(DateTime.now() + datetime.timedelta(hours=12))
+        rate = {"limit": 100, "remaining": 100, "reset": reset, "time_window": 86400}
+        limits = [
+            {
+                "api_context": "buy",
+                "api_name": "Browse",
+                "api_version": "v1",
+                "resources": [{"name": "buy.browse", "rates": [rate]}],
+            }
+        ]
+        calls = []
+        release = threading.Event()
+
+        def get_rate_limits():
+            calls.append(threading.current_thread())
+            release.wait()
+            return deepcopy(limits)
+
+        rates = Rates(app_id="test_rates_refresh")
+        threads = [
+            threading.Thread(target=rates.refresh, args=(get_rate_limits,))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        while not calls:
+            time.sleep(0.001)
+        self.assertTrue(all(thread.is_alive() for thread in threads))
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertFalse(rates.need_refresh())
+
+        # when due again, callers carry on with the stale rates
+        release.clear()
+        rates._refresh_date_time = DateTime.now() - datetime.timedelta(seconds=1)
+        for _ in range(8):
+            rates.refresh(get_rate_limits)
+        while len(calls) < 2:
+            time.sleep(0.001)
+        self.assertEqual(len(calls), 2)
+        self.assertIsNot(calls[-1], threading.current_thread())
+        self.assertIsNotNone(rates._find_bucket("/buy/browse/v1", ["buy.browse", ""]))
+        release.set()
+        while rates._refreshing is not None:
+            time.sleep(0.001)
+        self.assertFalse(rates.need_refresh())
+
+        # when a background refresh fails, even unexpectedly, it is retried a little later
+        def get_bad_rate_limits():
+            calls.append(threading.current_thread())
+            return [{"api_context": "buy"}]  # a KeyError, not an Error
+
+        rates._refresh_date_time = DateTime.now() - datetime.timedelta(seconds=1)
+        with self.assertLogs(level="WARNING"):
+            rates.refresh(get_bad_rate_limits)
+            while len(calls) < 3 or rates._refreshing is not None:
+                time.sleep(0.001)
+        self.assertFalse(rates.need_refresh())
+        self.assertGreater(
+            rates._refresh_date_time,
+            DateTime.now() + datetime.timedelta(seconds=30),
+        )
+
+    def test_rates_record_response(self):
+        """
+        Do responses correct the remaining count of calls?
+        """
+        from src.ebay_rest.rates import Rates
+
+        reset = DateTime.to_string(DateTime.now() + datetime.timedelta(hours=12))
+        rate = {"limit": 100, "remaining": 100, "reset": reset, "time_window": 86400}
+        rates = Rates(app_id="test_rates_record_response")
+        rates.refresh_developer_analytics(
+            [
+                {
+                    "api_context": "buy",
+                    "api_name": "Browse",
+                    "api_version": "v1",
+                    "resources": [{"name": "buy.browse", "rates": [rate]}],
+                }
+            ]
+        )
+        keys = ["buy.browse", ""]
+        bucket = rates._find_bucket("/buy/browse/v1", keys)
+
+        rates.record_response("/buy/browse/v1", keys, 200, {})
+        self.assertEqual(bucket.remaining, 100)
+        rates.record_response(
+            "/buy/browse/v1",
+            keys,
+            200,
+            {"x-ratelimit-remaining": "7", "X-RateLimit-Reset": "x"},
+        )
+        self.assertEqual(bucket.remaining, 7)
+
+        rates.record_response("/buy/browse/v1", keys, 429, {"Retry-After": "30"})
+        self.assertEqual(bucket.remaining, 0)
+        self.assertFalse(rates.need_refresh())
+        self.assertLessEqual(
+            rates._refresh_date_time, DateTime.now() + datetime.timedelta(seconds=30)
+        )
+        rates.record_response("/buy/deal/v1", ["buy.deal", ""], 429, None)
+
+    def test_sqlite_rate_budget(self):
+        """
+        Do Rates objects that share an SQLiteRateBudget take calls from one count?
+        """
+        from src.ebay_rest.rates import Rates
+
+        reset = DateTime.to_string(DateTime.now() + datetime.timedelta(minutes=1))
+        rate = {"limit": 100, "remaining": 10, "reset": reset, "time_window": 86400}
+        limits = [
+            {
+                "api_context": "buy",
+                "api_name": "Browse",
+                "api_version": "v1",
+                "resources": [{"name": "buy.browse", "rates": [rate]}],
+            }
+        ]
+        keys = ["buy.browse", ""]
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rates.sqlite")
+            # Rates with budgets of their own, on the same file, stand in for other processes
+            processes = [
+                Rates(
+                    app_id="test_sqlite_rate_budget", rate_budget=SQLiteRateBudget(path)
+                )
+                for _ in range(4)
+            ]
+            for rates in processes:
+                rates.refresh_developer_analytics(deepcopy(limits))
+            self.assertIsNone(SQLiteRateBudget(path).take("unknown", 0))
+
+            taken = []
+
+            def take(rates):
+                for _ in range(5):
+                    try:
+                        rates.decrement_rate_throttled("/buy/browse/v1", keys, 0.05)
+                    except Error as error:
+                        self.assertEqual(error.number, 97001)
+                    else:
+                        taken.append(rates)
+
+            threads = [
+                threading.Thread(target=take, args=(rates,)) for rates in processes
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(len(taken), 10)
+
+            # a task's shared take can wait for other processes, so it isn't done on the event loop's thread
+            take_threads = []
+            take = SQLiteRateBudget.take
+
+            def record_take(budget, key, minimum):
+                take_threads.append(threading.current_thread())
+                return take(budget, key, minimum)
+
+            async def call_async(rates):
+                await rates.decrement_rate_throttled_async("/buy/browse/v1", keys, 0.05)
+                await rates.decrement_rate_async("/buy/browse/v1", keys)
+                return threading.current_thread()
+
+            with mock.patch.object(SQLiteRateBudget, "take", record_take):
+                processes[0].refresh_developer_analytics(deepcopy(limits))
+                loop_thread = asyncio.run(call_async(processes[0]))
+            self.assertEqual(len(take_threads), 2)
+            self.assertNotIn(loop_thread, take_threads)
+
+            # budgets on the same file are equal, so the API objects that use them are one
+            relative = os.path.relpath(path)
+            self.assertEqual(SQLiteRateBudget(relative), SQLiteRateBudget(path))
+            self.assertIs(
+                self.make_api(rate_budget=SQLiteRateBudget(relative)),
+                self.make_api(rate_budget=SQLiteRateBudget(path)),
+            )
+
+        with self.assertRaises(Error) as context:
+            self.make_api(rate_budget=path)
+        self.assertEqual(context.exception.number, 99030)
+        with self.assertRaises(TypeError):
+            RateBudget()  # abstract
+
+    def test_buy_feed_download(self):
+        """
+        Is a feed file downloaded in chunks, resumed after failures, and readable row by row?
+        """
+        from src.ebay_rest.api.buy_feed.rest import ApiException
+        from src.ebay_rest.feed_download import FeedDownload
+        import urllib3
+
+        rows = [{"itemId": f"v1|{i}|0", "title": f"Item {i}"} for i in range(2000)]
+        lines = ["itemId\ttitle"] + [f"{r['itemId']}\t{r['title']}" for r in rows]
+        data = gzip.compress(("\n".join(lines) + "\n").encode(), compresslevel=0)
+        chunk_size = 4096
+        requests = []
+        failing = set()
+        flaky = {}  # how many more times a chunk fails, by index
+        content_range = "bytes {first}-{last}/{total}"
+
+        class Broken(io.BytesIO):
+            def read(self, size=-1):
+                if self.tell() >= 1000:
+                    raise OSError("Connection reset by peer")
+                return super().read(min(size, 1000 - self.tell()))
+
+        def download_file(file_id, marketplace_id, range, _preload_content):
+            self.assertEqual((file_id, marketplace_id), ("f1", "EBAY_US"))
+            self.assertFalse(_preload_content)
+            first, last = (int(i) for i in range[len("bytes=") :].split("-"))
+            last = min(last, len(data) - 1)
+            requests.append(first)
+            if flaky.get(first // chunk_size):
+                flaky[first // chunk_size] -= 1
+                raise ApiException(status=500, reason="Internal Server Error")
+            if first // chunk_size in failing:
+                raise ApiException(status=500, reason="Internal Server Error")
+            body = Broken if first == chunk_size else io.BytesIO
+            return urllib3.HTTPResponse(
+                body=body(data[first : last + 1]),
+                headers={
+                    "Content-Range": content_range.format(
+                        first=first, last=last, total=len(data)
+                    )
+                },
+                status=206,
+                preload_content=False,
+            )
+
+        api = self.make_api()
+        with (
+            tempfile.TemporaryDirectory() as directory,
+            mock.patch.object(api, "_get_swagger_method", return_value=download_file),
+            mock.patch.object(FeedDownload, "_READ_SIZE", 1000),
+        ):
+            path = os.path.join(directory, "feed.gz")
+            # a chunk fails every time, so the download fails, having saved the other chunks
+            failing.add(5)
+            with self.assertRaises(Error) as context:
+                api.buy_feed_download("f1", path, chunk_size=chunk_size, parallel=3)
+            self.assertEqual(context.exception.number, 95001)
+            self.assertEqual(requests.count(5 * chunk_size), 4)
+            # the connection that broke after 1000 bytes resumed from the next one
+            self.assertIn(chunk_size + 1000, requests)
+
+            # resume, only getting the missing chunk
+            failing.clear()
+            requests.clear()
+            api.buy_feed_download("f1", path, chunk_size=chunk_size, parallel=3)
+            self.assertEqual(requests, [5 * chunk_size])
+            self.assertEqual(sorted(os.listdir(directory)), ["feed.gz"])
+            with open(path, "rb") as file:
+                self.assertEqual(file.read(), data)
+            self.assertEqual(list(api.buy_feed_rows(path)), rows)
+
+            # the first request, which finds the file's size, is retried too
+            os.remove(path)
+            requests.clear()
+            flaky[0] = 2
+            # and like other calls, each tells Rates what its response says about the call limit
+            with mock.patch.object(api, "_rates") as rates:
+                api.buy_feed_download("f1", path, chunk_size=chunk_size)
+            statuses = [call.args[2] for call in rates.record_response.call_args_list]
+            self.assertEqual(statuses[:3], [500, 500, 206])
+            self.assertEqual(len(statuses), len(requests))
+            self.assertEqual(requests[:3], [0, 0, 0])
+            self.assertEqual(requests.count(0), 3)
+            with open(path, "rb") as file:
+                self.assertEqual(file.read(), data)
+
+            # a bad Content-Range fails the download, and releases the connection
+            os.remove(path)
+            content_range = "bytes */{total}"
+            with (
+                mock.patch.object(
+                    urllib3.HTTPResponse, "release_conn", autospec=True
+                ) as release_conn,
+                self.assertRaises(Error) as context,
+            ):
+                api.buy_feed_download("f1", path, chunk_size=chunk_size)
+            self.assertEqual(context.exception.number, 95002)
+            release_conn.assert_called_once()
+
+            requests.clear()
+            for number, bad in (
+                (95004, {"chunk_size": 0}),
+                (95005, {"parallel": 0}),
+                (95005, {"parallel": 2.0}),
+                (95006, {"retries": -1}),
+                (95006, {"retries": True}),
+            ):
+                with self.assertRaises(Error) as context:
+                    api.buy_feed_download("f1", path, **bad)
+                self.assertEqual(context.exception.number, number)
+            self.assertEqual(requests, [])
+
+    def test_config(self):
+        """
+        Is a Config checked once, equal to others made from equal parameters, and usable by API?
+        """
+        kwargs = {
+            "application": deepcopy(self.creds.get_application("sandbox_1")),
+            "user": deepcopy(self.creds.get_user("sandbox_1")),
+            "header": deepcopy(self.creds.get_header("US")),
+        }
+        config = Config(**kwargs)
+        self.assertEqual(config, Config(**deepcopy(kwargs)))
+        self.assertEqual(hash(config), hash(Config(**deepcopy(kwargs))))
+        self.assertTrue(config.sandbox)
+        with self.assertRaises(TypeError):
+            config.header["marketplace_id"] = "EBAY_GB"
+
+        api = API(config=config)
+        self.assertIs(api, API(config=Config(**deepcopy(kwargs))))
+        self.assertEqual(api._header["marketplace_id"], "EBAY_US")
+
+        with self.assertRaises(Error) as context:
+            API(config=config, header="US")
+        self.assertEqual(context.exception.number, 99029)
+        with self.assertRaises(Error) as context:
+            Config(**dict(kwargs, header={"marketplace_id": "EBAY_XX"}))
+        self.assertEqual(context.exception.number, 99009)
+
+        # repr doesn't hide the Error of an __init__ that raised before setting the attributes
+        app_id = kwargs["application"]["app_id"]
+        self.assertIn(f"app_id={app_id}", repr(config))
+        self.assertEqual(repr(Config.__new__(Config)), "<Config app_id=None user=None>")
+
+    def test_config_file_cache(self):
+        """
+        Is a configuration file parsed once, and again only after it changes?
+        """
+        contents = {
+            "applications": {"a": self.creds.get_application("sandbox_1")},
+            "users": {"u": self.creds.get_user("sandbox_1")},
+            "headers": {"h": self.creds.get_header("US")},
+        }
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "ebay_rest.json")
+            with open(path, "w") as f:
+                f.write(json_dumps(contents))
+            with mock.patch(
+                "src.ebay_rest.config.loads", side_effect=json_loads
+            ) as loads:
+                self.assertEqual(
+                    Config(path=directory).header["marketplace_id"], "EBAY_US"
+                )
+                Config(path=directory)
+                self.assertEqual(loads.call_count, 1)
+
+                contents["headers"]["h"] = dict(
+                    contents["headers"]["h"], marketplace_id="EBAY_GB"
+                )
+                with open(path, "w") as f:
+                    f.write(json_dumps(contents))
+                os.utime(
+                    path, ns=(0, 0)
+                )  # a different modification time, however fast the file system
+                self.assertEqual(
+                    Config(path=directory).header["marketplace_id"], "EBAY_GB"
+                )
+                self.assertEqual(loads.call_count, 2)
+
 
 class ReferenceTests(unittest.TestCase):
     def test_get_application_scopes(self):
@@ -2084,6 +3538,28 @@ class ReferenceTests(unittest.TestCase):
             Reference.get_user_scopes(), msg="Failed to load user scopes."
         )
 
+    def test_frozen(self):
+        """
+        Are frozen views read-only and shared, while the default copies are mutable and independent?
+        """
+        frozen = Reference.get_marketplace_id_values(frozen=True)
+        self.assertIs(frozen, Reference.get_marketplace_id_values(frozen=True))
+        with self.assertRaises(TypeError):
+            frozen["EBAY_US"] = None
+
+        copy = Reference.get_marketplace_id_values()
+        self.assertEqual(list(copy), list(frozen))
+        self.assertEqual(list(copy["EBAY_US"][1]), list(frozen["EBAY_US"][1]))
+        copy["EBAY_US"][1]["xx-XX"] = []
+        self.assertNotIn("xx-XX", Reference.get_marketplace_id_values()["EBAY_US"][1])
+
+    def test_valid_values(self):
+        self.assertIn("EBAY_US", Reference.get_valid_marketplace_ids())
+        self.assertIn("en-US", Reference.get_valid_languages())
+        self.assertIn("US", Reference.get_valid_country_codes())
+        self.assertIn("USD", Reference.get_valid_currency_codes())
+        self.assertIsInstance(Reference.get_valid_languages(), frozenset)
+
 
 if __name__ == "__main__":
     unittest.main()